@@ -209,41 +209,136 @@ def cli_main():
 
 
 @cli_main.command()
-@click_wrap.option("--project", help="AYON project name", type=str, required=True)
-@click_wrap.option("--sg-project-id", help="Shotgrid project ID", type=int, required=True)
-@click_wrap.option("--output", help="Output file path", type=str, required=False)
-def fetch_project(project, sg_project_id, output):
-    """Fetch project data from Shotgrid."""
-    logger.info(f"CLI fetch_project: project={project}, sg_project_id={sg_project_id}")
-
-    app = QtWidgets.QApplication.instance()
-    if app is None:
-        app = QtWidgets.QApplication(sys.argv)
-
-    progress = QtWidgets.QProgressDialog(
-        "Fetching data from Shotgrid...",
-        "Cancel", 0, 100
-    )
-    progress.setWindowTitle("Data Package Creation")
-    progress.setWindowModality(QtCore.Qt.WindowModal)
-    progress.show()
+@click_wrap.option("--rfq-id", help="Shotgrid RFQ ID", type=int, required=True)
+@click_wrap.option("--package", "packages", help="Package name to build (repeatable, default: all packages of the RFQ)",
+                   type=str, multiple=True)
+@click_wrap.option("--output", help="Output directory", type=str, required=False)
+@click_wrap.option("--zip", "create_zip", help="Also write a zip archive per package", is_flag=True, default=False)
+@click_wrap.option("--jobs", help="Packages built at the same time", type=int, default=2)
+@click_wrap.option("--download-workers", help="Concurrent downloads per package", type=int, required=False)
+@click_wrap.option("--sg-url", help="Shotgrid URL (default: SG_URL)", type=str, required=False)
+@click_wrap.option("--sg-script-name", help="Shotgrid script name (default: SG_SCRIPT)", type=str, required=False)
+@click_wrap.option("--sg-api-key", help="Shotgrid API key (default: SG_KEY)", type=str, required=False)
+def build_packages(rfq_id, packages, output, create_zip, jobs, download_workers,
+                   sg_url, sg_script_name, sg_api_key):
+    """Build the packages of an RFQ without the GUI.
+
+    Progress is printed to stdout as JSON lines:
+
+        {"event": "progress", "package": ..., "stage": ..., "percent": ..., ...}
+        {"event": "finished", "package_name": ..., "error": null, ...}
+        {"event": "summary", "built": 3, "failed": 0, "cancelled": 0}
+
+    A package counts as failed if it raised an error or any of its files
+    failed to download. The exit code is non-zero if any package failed or
+    was cancelled.
+    """
+    import json
+    import threading
+    import time
+
+    from .package_builder import build_packages as run_builds
+    from .shotgrid import ShotgridClient
+
+    logger.info(f"CLI build_packages: rfq_id={rfq_id}, packages={packages}, jobs={jobs}")
+
+    output_lock = threading.Lock()
+    last_progress = {}
+
+    def emit(event):
+        with output_lock:
+            sys.stdout.write(json.dumps(event, default=str) + "\n")
+            sys.stdout.flush()
+
+    def on_progress(event):
+        # At most one line per package and stage every half second
+        now = time.monotonic()
+        key = (event["package"], event["stage"])
+        with output_lock:
+            if now - last_progress.get(key, 0.0) < 0.5:
+                return
+            last_progress[key] = now
+        emit(dict(event, event="progress"))
 
     try:
-        logger.info(f"Fetching SG project {sg_project_id} for AYON project: {project}")
-        progress.setValue(100)
-
-        QtWidgets.QMessageBox.information(
-            None, "Success",
-            f"Data package created for project: {project}"
+        client = ShotgridClient(site_url=sg_url, script_name=sg_script_name, api_key=sg_api_key)
+        sg_rfq = client.sg.find_one(
+            "CustomEntity04", [["id", "is", rfq_id]], ["id", "code", "project"]
+        )
+        if not sg_rfq:
+            raise ValueError(f"RFQ {rfq_id} not found")
+        sg_project = client.sg.find_one(
+            "Project", [["id", "is", sg_rfq["project"]["id"]]], ["id", "code", "name"]
         )
+
+        sg_packages = client.get_packages_for_rfq(rfq_id)
+        if packages:
+            missing = set(packages) - {package["code"] for package in sg_packages}
+            if missing:
+                raise ValueError(f"Packages not found on RFQ {sg_rfq['code']}: {', '.join(sorted(missing))}")
+            sg_packages = [package for package in sg_packages if package["code"] in packages]
+
+        output_dir = Path(output) if output else Path.home() / "shotgrid_packages"
+        output_dir.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         logger.error(f"CLI Error: {e}", exc_info=True)
-        QtWidgets.QMessageBox.critical(
-            None, "Error",
-            f"Failed to create package: {str(e)}"
+        emit({"event": "error", "error": str(e)})
+        sys.exit(1)
+
+    try:
+        results = run_builds(
+            client, sg_packages, sg_project, sg_rfq, output_dir,
+            max_parallel=jobs, download_workers=download_workers, create_zip=create_zip,
+            progress_callback=on_progress,
+            result_callback=lambda result: emit(dict(result, event="finished"))
         )
-    finally:
-        progress.close()
+    except KeyboardInterrupt:
+        emit({"event": "error", "error": "interrupted"})
+        sys.exit(130)
+
+    cancelled = [result for result in results if result.get("cancelled")]
+    # A package with failed downloads is incomplete even though it was written
+    failed = [
+        result for result in results
+        if not result.get("cancelled") and (result.get("error") or result.get("failed"))
+    ]
+    emit({
+        "event": "summary",
+        "built": len(results) - len(failed) - len(cancelled),
+        "failed": len(failed),
+        "cancelled": len(cancelled),
+    })
+    sys.exit(1 if failed or cancelled else 0)
+
+
+@cli_main.command()
+@click_wrap.option("--prune", help="Remove orphaned, old and over-budget files", is_flag=True, default=False)
+@click_wrap.option("--max-gb", help="Size budget in GB (default: from settings)", type=float, required=False)
+@click_wrap.option("--max-age-days", help="With --prune, remove files unused for this many days",
+                   type=float, required=False)
+@click_wrap.option("--verify", help="With --prune, re-hash every file and remove corrupt ones",
+                   is_flag=True, default=False)
+def media_store(prune, max_gb, max_age_days, verify):
+    """Report (and optionally prune) the shared media store.
+
+    Prints one JSON object with the store usage, and the prune results
+    when --prune is given.
+    """
+    import json
+
+    from .media_store import get_media_store
+
+    store = get_media_store()
+    if store is None:
+        sys.stdout.write(json.dumps({"enabled": False}) + "\n")
+        return
+
+    report = {"enabled": True, "usage": store.usage()}
+    if prune:
+        max_bytes = int(max_gb * 1024 ** 3) if max_gb is not None else None
+        report["pruned"] = store.prune(max_bytes=max_bytes, max_age_days=max_age_days, verify=verify)
+        report["usage"] = store.usage()
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
 
 
 @cli_main.command()
@@ -1928,11 +1928,21 @@ class PackageManagerApp(QtWidgets.QMainWindow):
                 if project:
                     self._load_rfqs(project['id'])
 
-                QtWidgets.QMessageBox.information(
-                    self,
-                    "Success",
-                    f"RFQ '{rfq.get('code', 'N/A')}' and related elements removed successfully.\n\nDeleted items:\n{summary_text}"
-                )
+                if deleted_summary.get("failed"):
+                    QtWidgets.QMessageBox.warning(
+                        self,
+                        "RFQ Partially Removed",
+                        f"{len(deleted_summary['failed'])} item(s) of RFQ '{rfq.get('code', 'N/A')}' could not be deleted"
+                        f" and {deleted_summary.get('pending', 0)} item(s) were left in place.\n\n"
+                        f"Deleted items:\n{summary_text}\n\n"
+                        f"Remove the RFQ again to retry. Check the logs for details."
+                    )
+                else:
+                    QtWidgets.QMessageBox.information(
+                        self,
+                        "Success",
+                        f"RFQ '{rfq.get('code', 'N/A')}' and related elements removed successfully.\n\nDeleted items:\n{summary_text}"
+                    )
             else:
                 # Delete only the RFQ
                 self.sg_session.delete_rfq(rfq['id'])
@@ -2027,9 +2037,9 @@ class PackageManagerApp(QtWidgets.QMainWindow):
         try:
             print("  Calling _load_package_tracking_for_vendors...")
             logger.info("  Calling _load_package_tracking_for_vendors...")
-            self.delivery_tab._load_package_tracking_for_vendors()
-            print("  Package tracking statuses refreshed successfully")
-            logger.info("  Package tracking statuses refreshed successfully")
+            self.delivery_tab._load_package_tracking_for_vendors(refresh_access=True)
+            print("  Package tracking status refresh started")
+            logger.info("  Package tracking status refresh started")
         except Exception as e:
             print(f"  Error refreshing package tracking statuses: {e}")
             logger.error(f"  Error refreshing package tracking statuses: {e}", exc_info=True)
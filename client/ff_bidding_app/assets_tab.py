@@ -503,7 +503,7 @@ class AssetsTab(QtWidgets.QWidget):
         """Fetch the schema for CustomEntity07 (Asset items) from ShotGrid."""
         try:
             # Get schema for CustomEntity07
-            schema = self.sg_session.sg.schema_field_read("CustomEntity07")
+            schema = self.sg_session.get_entity_schema("CustomEntity07")
 
             # Build field schema dictionary for allowlisted fields only
             for field_name in self.asset_field_allowlist:
@@ -633,9 +633,9 @@ class AssetsTab(QtWidgets.QWidget):
 
         try:
             # Query the Bid to get its Price List (sg_price_list)
-            bid_data = self.sg_session.sg.find_one(
+            bid_data = self.sg_session.get_entity_by_id(
                 "CustomEntity06",
-                [["id", "is", self.current_bid_id]],
+                self.current_bid_id,
                 ["sg_price_list"]
             )
 
@@ -647,9 +647,9 @@ class AssetsTab(QtWidgets.QWidget):
 
             # Query the Price List to get its linked Line Items
             # Line Items are linked via the Price List's sg_line_items field (multi-entity)
-            price_list_data = self.sg_session.sg.find_one(
+            price_list_data = self.sg_session.get_entity_by_id(
                 "CustomEntity10",
-                [["id", "is", price_list_id]],
+                price_list_id,
                 ["sg_line_items"]
             )
 
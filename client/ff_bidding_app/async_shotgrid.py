@@ -0,0 +1,311 @@
+"""Asynchronous facade for ShotgridClient.
+
+Widgets call ShotgridClient from the GUI thread, which freezes the UI for the
+duration of every network round-trip. AsyncShotgridClient runs the same
+methods on a bounded thread pool and returns futures instead:
+
+    async_sg = get_async_client(self.sg_session)
+
+    # concurrent.futures style
+    future = async_sg.get_vendors_by_ids(vendor_ids, timeout=30)
+
+    # several independent queries at once
+    vendors, tracking = async_sg.gather(
+        async_sg.get_vendors_by_ids(vendor_ids),
+        async_sg.get_package_tracking_for_rfq(rfq_id),
+    )
+
+    # asyncio
+    vendors = await async_sg.call("get_vendors_by_ids", vendor_ids, timeout=30)
+
+    # Qt: callbacks run on the GUI thread
+    async_sg.call_qt(
+        "get_vendors_by_ids", vendor_ids,
+        on_result=self._on_vendors_loaded, on_error=self._on_vendors_failed,
+    )
+
+The executor never holds more ShotGrid sessions than the client's connection
+pool allows; extra workers simply wait for a pooled connection.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import weakref
+from typing import Any, Callable, List, Optional
+
+from PySide6 import QtCore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncShotgridClient:
+    """Future-returning counterpart of ShotgridClient."""
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, client, max_workers: Optional[int] = None,
+                 default_timeout: Optional[float] = None):
+        """Initialize the async facade.
+
+        Args:
+            client: ShotgridClient to run calls on
+            max_workers: Size of the worker pool. Defaults to the client's
+                max_connections so workers never wait for a connection
+            default_timeout: Timeout in seconds for calls that don't pass one
+        """
+        self.client = client
+        self.default_timeout = default_timeout
+        max_workers = max_workers or getattr(client, "max_connections", None) or self.DEFAULT_MAX_WORKERS
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="sg-async"
+        )
+
+    def __getattr__(self, name):
+        """Expose every public client method as a future-returning method.
+
+        The returned callable accepts an extra ``timeout`` keyword argument.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            raise AttributeError(f"{name} is not a ShotgridClient method")
+
+        def submit_method(*args, timeout=None, **kwargs):
+            return self.submit(attr, *args, timeout=timeout, **kwargs)
+
+        submit_method.__name__ = name
+        return submit_method
+
+    def submit(self, func, *args, timeout: Optional[float] = None, **kwargs) -> concurrent.futures.Future:
+        """Run a callable (or the name of a client method) on the worker pool.
+
+        Args:
+            func: Callable, or name of a ShotgridClient method
+            *args: Positional arguments for func
+            timeout: Seconds after which the returned future fails with
+                concurrent.futures.TimeoutError. A call that already started
+                keeps running in its worker but its result is dropped.
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            concurrent.futures.Future. Cancelling it cancels the call if it has
+            not started yet.
+        """
+        if isinstance(func, str):
+            func = getattr(self.client, func)
+        timeout = self.default_timeout if timeout is None else timeout
+
+        inner = self._executor.submit(func, *args, **kwargs)
+        if timeout is None:
+            return inner
+
+        # outer stays PENDING until resolved, so callers can always cancel() it
+        outer = concurrent.futures.Future()
+
+        def on_timeout():
+            if inner.cancel() or not inner.done():
+                _resolve(outer, exception=concurrent.futures.TimeoutError(
+                    f"{getattr(func, '__name__', func)} timed out after {timeout}s"
+                ))
+
+        timer = threading.Timer(timeout, on_timeout)
+        timer.daemon = True
+
+        def on_inner_done(done_future):
+            timer.cancel()
+            if done_future.cancelled():
+                _resolve(outer, exception=concurrent.futures.CancelledError())
+            elif done_future.exception() is not None:
+                _resolve(outer, exception=done_future.exception())
+            else:
+                _resolve(outer, result=done_future.result())
+
+        def on_outer_done(done_future):
+            if done_future.cancelled():
+                inner.cancel()
+                timer.cancel()
+
+        outer.add_done_callback(on_outer_done)
+        inner.add_done_callback(on_inner_done)
+        timer.start()
+        return outer
+
+    def gather(self, *futures: concurrent.futures.Future, timeout: Optional[float] = None,
+               return_exceptions: bool = False) -> List[Any]:
+        """Wait for several futures and return their results in order.
+
+        Args:
+            *futures: Futures returned by this client
+            timeout: Overall timeout in seconds; pending futures are cancelled
+                when it expires
+            return_exceptions: Return exceptions in place of results instead of
+                raising the first one
+
+        Returns:
+            List of results, in the order of the futures
+        """
+        done, pending = concurrent.futures.wait(futures, timeout=timeout)
+        if pending:
+            for future in pending:
+                future.cancel()
+            raise concurrent.futures.TimeoutError(f"{len(pending)} call(s) did not finish within {timeout}s")
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except BaseException as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    async def call(self, func, *args, timeout: Optional[float] = None, **kwargs):
+        """Await a client call from asyncio code.
+
+        Cancelling the awaiting task cancels the call if it has not started.
+
+        Args:
+            func: Callable, or name of a ShotgridClient method
+            timeout: Seconds before asyncio.TimeoutError is raised
+        """
+        future = asyncio.wrap_future(self.submit(func, *args, **kwargs))
+        timeout = self.default_timeout if timeout is None else timeout
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout)
+
+    async def gather_async(self, *calls, return_exceptions: bool = False):
+        """asyncio.gather over several call() coroutines."""
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    def call_qt(self, func, *args, on_result: Optional[Callable[[Any], None]] = None,
+                on_error: Optional[Callable[[BaseException], None]] = None,
+                timeout: Optional[float] = None, parent: Optional[QtCore.QObject] = None,
+                **kwargs) -> "ShotgridRequest":
+        """Run a client call and deliver its outcome on the GUI thread.
+
+        Must be called from the GUI thread.
+
+        Args:
+            func: Callable, or name of a ShotgridClient method
+            on_result: Called with the result on the GUI thread
+            on_error: Called with the exception on the GUI thread (not called
+                when the request is cancelled)
+            timeout: Seconds before the call fails with TimeoutError
+            parent: Optional QObject owning the request; results are dropped
+                once it is destroyed
+
+        Returns:
+            ShotgridRequest exposing succeeded/failed signals and cancel()
+        """
+        request = ShotgridRequest(parent)
+        if on_result:
+            request.succeeded.connect(on_result)
+        if on_error:
+            request.failed.connect(on_error)
+        request.attach(self.submit(func, *args, timeout=timeout, **kwargs))
+        return request
+
+    def shutdown(self, wait: bool = False):
+        """Stop the worker pool, cancelling calls that have not started."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ShotgridRequest(QtCore.QObject):
+    """Qt bridge for one asynchronous ShotgridClient call.
+
+    The worker thread hands the outcome to this object through a queued
+    signal, so succeeded/failed are always emitted on the thread the request
+    was created on (the GUI thread).
+    """
+
+    succeeded = QtCore.Signal(object)  # result
+    failed = QtCore.Signal(object)  # exception
+
+    _deliver = QtCore.Signal(object, object)  # (result, exception)
+
+    # Requests awaiting delivery, so callers don't need to keep a reference
+    _active = set()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.future = None
+        self._cancelled = False
+        self._deliver.connect(self._on_deliver, QtCore.Qt.QueuedConnection)
+
+    def attach(self, future: concurrent.futures.Future):
+        """Start listening to a future from AsyncShotgridClient.submit()."""
+        self.future = future
+        ShotgridRequest._active.add(self)
+        self_ref = weakref.ref(self)
+
+        def on_done(done_future):
+            request = self_ref()
+            if request is None or done_future.cancelled():
+                return
+            try:
+                request._deliver.emit(done_future.result(), None)
+            except RuntimeError:
+                # Underlying C++ object already deleted
+                pass
+            except BaseException as e:
+                try:
+                    request._deliver.emit(None, e)
+                except RuntimeError:
+                    pass
+
+        future.add_done_callback(on_done)
+
+    def cancel(self):
+        """Cancel the call; no signal is emitted afterwards."""
+        self._cancelled = True
+        ShotgridRequest._active.discard(self)
+        if self.future is not None:
+            self.future.cancel()
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def _on_deliver(self, result, error):
+        ShotgridRequest._active.discard(self)
+        if self._cancelled:
+            return
+        if error is not None:
+            logger.debug(f"Async ShotGrid call failed: {error}")
+            self.failed.emit(error)
+        else:
+            self.succeeded.emit(result)
+
+
+_async_clients = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+
+def get_async_client(client) -> AsyncShotgridClient:
+    """Get or create the shared AsyncShotgridClient for a ShotgridClient.
+
+    Sharing one facade per client keeps the total number of worker threads
+    bounded across all widgets.
+    """
+    with _async_clients_lock:
+        async_client = _async_clients.get(client)
+        if async_client is None:
+            async_client = AsyncShotgridClient(client)
+            _async_clients[client] = async_client
+        return async_client
+
+
+def _resolve(future: concurrent.futures.Future, result=None, exception=None):
+    """Set a future's outcome unless it is already done."""
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except concurrent.futures.InvalidStateError:
+        pass
@@ -1802,13 +1802,7 @@ class ColumnMappingDialog(QtWidgets.QDialog):
         """
         try:
             # Get ALL fields for the entity
-            if project_id:
-                fields = self.sg_session.sg.schema_field_read(
-                    entity_name,
-                    project_entity={'type': 'Project', 'id': project_id}
-                )
-            else:
-                fields = self.sg_session.sg.schema_field_read(entity_name)
+            fields = self.sg_session.get_entity_schema(entity_name, project_id=project_id)
 
             # Build the result dictionary with only the requested fields
             result = {}
@@ -3464,9 +3458,9 @@ class BidSelectorWidget(QtWidgets.QWidget):
         if price_list and isinstance(price_list, dict) and price_list.get("id"):
             try:
                 # Query the price list to get its rate card
-                price_list_data = self.sg_session.sg.find_one(
+                price_list_data = self.sg_session.get_entity_by_id(
                     "CustomEntity10",
-                    [["id", "is", price_list["id"]]],
+                    price_list["id"],
                     ["sg_rate_card"]
                 )
                 if price_list_data and price_list_data.get("sg_rate_card"):
@@ -4273,7 +4267,7 @@ class BidSelectorWidget(QtWidgets.QWidget):
             list: List of field names ending with '_mandays'
         """
         try:
-            schema = self.sg_session.sg.schema_field_read("CustomEntity03")
+            schema = self.sg_session.get_entity_schema("CustomEntity03")
             return [f for f in schema.keys() if f.endswith("_mandays")]
         except Exception as e:
             logger.error(f"Failed to get Line Item schema: {e}")
@@ -5280,7 +5274,7 @@ class BidSelectorWidget(QtWidgets.QWidget):
 
         # Step 1: Fetch schema for CustomEntity03 (Line Items) to auto-discover fields
         try:
-            schema = self.sg_session.sg.schema_field_read("CustomEntity03")
+            schema = self.sg_session.get_entity_schema("CustomEntity03")
             logger.info(f"Fetched schema for CustomEntity03 (Line Items)")
 
             # Build field allowlist: find all fields ending with "_mandays"
@@ -0,0 +1,260 @@
+"""Bounded pool of ShotGrid connections.
+
+shotgun_api3 connections are not thread-safe, so each call needs exclusive
+use of a connection. Instead of keeping one connection per thread forever,
+ShotgridClient checks a connection out of this pool for the duration of a
+single API call and returns it afterwards. The number of live sessions is
+capped at ``max_size`` no matter how many worker threads the UI spawns.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(RuntimeError):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+class ShotgunConnectionPool:
+    """Thread-safe, bounded pool with idle eviction and health checks."""
+
+    DEFAULT_MAX_SIZE = 4
+    # Idle connections older than this are closed
+    DEFAULT_IDLE_TIMEOUT = 300.0
+    # Connections idle longer than this are health-checked before reuse
+    DEFAULT_HEALTH_CHECK_AFTER = 60.0
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        health_check_after: float = DEFAULT_HEALTH_CHECK_AFTER,
+        health_check: Optional[Callable[[Any], None]] = None,
+        recoverable_errors: Tuple[Type[BaseException], ...] = (),
+    ):
+        """Initialize the pool.
+
+        Args:
+            factory: Callable creating a new connection
+            max_size: Maximum number of live connections
+            idle_timeout: Seconds after which an idle connection is closed
+            health_check_after: Seconds of idleness after which a connection is
+                checked with health_check before being handed out
+            health_check: Callable(connection) raising if the connection is
+                unusable. Defaults to calling connection.info()
+            recoverable_errors: Exception types raised by API calls that leave the
+                connection usable (e.g. server-side faults). Any other exception
+                discards the connection.
+        """
+        self._factory = factory
+        self.max_size = max(1, int(max_size))
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self._health_check = health_check or (lambda connection: connection.info())
+        self.recoverable_errors = recoverable_errors
+
+        self._condition = threading.Condition()
+        # Idle connections as (connection, last_used) pairs, most recently used last
+        self._idle: List[Tuple[Any, float]] = []
+        self._size = 0
+
+        self.created = 0
+        self.discarded = 0
+        self.checkouts = 0
+        self.waits = 0
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Check out a connection for the duration of a with-block.
+
+        The connection is returned to the pool on exit, or discarded if the
+        block raised an error that is not in recoverable_errors.
+
+        Args:
+            timeout: Seconds to wait for a free connection (None waits forever)
+        """
+        connection = self.checkout(timeout)
+        try:
+            yield connection
+        except self.recoverable_errors:
+            self.checkin(connection)
+            raise
+        except BaseException:
+            self.checkin(connection, discard=True)
+            raise
+        else:
+            self.checkin(connection)
+
+    def checkout(self, timeout: Optional[float] = None):
+        """Take a connection out of the pool, creating one if below max_size.
+
+        Args:
+            timeout: Seconds to wait for a free connection (None waits forever)
+
+        Returns:
+            A connection for exclusive use until checkin()
+
+        Raises:
+            PoolTimeoutError: If no connection became available in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._evict_idle_locked()
+            while not self._idle and self._size >= self.max_size:
+                self.waits += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"No ShotGrid connection available after {timeout}s "
+                        f"(pool size {self.max_size})"
+                    )
+                self._condition.wait(remaining)
+                self._evict_idle_locked()
+
+            self.checkouts += 1
+            if self._idle:
+                connection, last_used = self._idle.pop()
+            else:
+                connection, last_used = None, None
+                # Reserve the slot before creating outside the lock
+                self._size += 1
+
+        if connection is None:
+            return self._create()
+
+        if time.monotonic() - last_used > self.health_check_after:
+            try:
+                self._health_check(connection)
+            except Exception as e:
+                logger.debug(f"Replacing unhealthy ShotGrid connection: {e}")
+                # Keep the slot reserved for the replacement connection
+                with self._condition:
+                    self.discarded += 1
+                self._close(connection)
+                return self._create()
+        return connection
+
+    def checkin(self, connection, discard: bool = False):
+        """Return a checked-out connection to the pool.
+
+        Args:
+            connection: Connection obtained from checkout()
+            discard: Close the connection instead of reusing it
+        """
+        if discard:
+            self._discard(connection)
+            return
+        with self._condition:
+            self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+    def close_idle(self):
+        """Close every connection that is currently idle."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for connection, _ in idle:
+            self._close(connection)
+        return len(idle)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return pool counters (size, idle, in_use, created, discarded, checkouts, waits)."""
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size,
+                "created": self.created,
+                "discarded": self.discarded,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+            }
+
+    def _create(self):
+        """Create a connection for a slot already reserved in _size."""
+        try:
+            connection = self._factory()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.created += 1
+        logger.debug(f"Created ShotGrid connection ({self._size}/{self.max_size})")
+        return connection
+
+    def _discard(self, connection):
+        """Drop a checked-out connection and free its slot."""
+        with self._condition:
+            self._size -= 1
+            self.discarded += 1
+            self._condition.notify()
+        self._close(connection)
+
+    def _evict_idle_locked(self):
+        """Close idle connections past idle_timeout. Caller holds the lock."""
+        if not self._idle:
+            return
+        now = time.monotonic()
+        expired = [item for item in self._idle if now - item[1] > self.idle_timeout]
+        if not expired:
+            return
+        self._idle = [item for item in self._idle if now - item[1] <= self.idle_timeout]
+        self._size -= len(expired)
+        for connection, _ in expired:
+            self._close(connection)
+        logger.debug(f"Evicted {len(expired)} idle ShotGrid connection(s)")
+
+    @staticmethod
+    def _close(connection):
+        """Close a connection's HTTP session if it exposes one."""
+        try:
+            close = getattr(connection, "close", None)
+            if callable(close):
+                close()
+        except Exception as e:
+            logger.debug(f"Error closing ShotGrid connection: {e}")
+
+
+class PooledConnection:
+    """Connection-like proxy that runs every call on a pooled connection.
+
+    ``client.sg.find(...)`` checks a connection out, performs the call and
+    returns it, so code written against a plain Shotgun instance keeps working
+    while the pool bounds the number of sessions.
+    """
+
+    def __init__(self, pool: ShotgunConnectionPool):
+        self._pool = pool
+        self._callable_names: Dict[str, bool] = {}
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        is_callable = self._callable_names.get(name)
+        if is_callable is None or not is_callable:
+            with self._pool.connection() as connection:
+                value = getattr(connection, name)
+            is_callable = callable(value)
+            self._callable_names[name] = is_callable
+            if not is_callable:
+                return value
+
+        pool = self._pool
+
+        def pooled_call(*args, **kwargs):
+            with pool.connection() as connection:
+                return getattr(connection, name)(*args, **kwargs)
+
+        pooled_call.__name__ = name
+        return pooled_call
@@ -968,9 +968,9 @@ class CostsTab(QtWidgets.QMainWindow):
             if vfx_breakdown and isinstance(vfx_breakdown, dict) and vfx_breakdown.get("id"):
                 # Fetch the VFX Breakdown entity to get its code/name
                 try:
-                    breakdown_data = self.sg_session.sg.find_one(
+                    breakdown_data = self.sg_session.get_entity_by_id(
                         vfx_breakdown.get("type", "CustomEntity01"),
-                        [["id", "is", vfx_breakdown["id"]]],
+                        vfx_breakdown["id"],
                         ["code", "id"]
                     )
                     self.shots_cost_widget.set_readonly_linked_entity(breakdown_data)
@@ -985,9 +985,9 @@ class CostsTab(QtWidgets.QMainWindow):
             if bid_assets and isinstance(bid_assets, dict) and bid_assets.get("id"):
                 # Fetch the Bid Assets entity to get its code/name
                 try:
-                    assets_data = self.sg_session.sg.find_one(
+                    assets_data = self.sg_session.get_entity_by_id(
                         bid_assets.get("type", "CustomEntity08"),
-                        [["id", "is", bid_assets["id"]]],
+                        bid_assets["id"],
                         ["code", "id"]
                     )
                     self.asset_cost_widget.set_readonly_linked_entity(assets_data)
@@ -1196,7 +1196,7 @@ class CostsTab(QtWidgets.QMainWindow):
             logger.info(f"  Fetching bidding scenes where sg_parent = VFX Breakdown {breakdown_id}...")
 
             # Get field schema for CustomEntity02 (Bidding Scenes)
-            raw_schema = self.sg_session.sg.schema_field_read("CustomEntity02")
+            raw_schema = self.sg_session.get_entity_schema("CustomEntity02")
 
             # Build field_schema dict and display_names dict (like VFXBreakdownTab does)
             field_schema = {}
@@ -1412,9 +1412,9 @@ class CostsTab(QtWidgets.QMainWindow):
             bid_id = self.current_bid_data['id']
 
             # Query the Bid to get its Price List (sg_price_list)
-            bid_data = self.sg_session.sg.find_one(
+            bid_data = self.sg_session.get_entity_by_id(
                 "CustomEntity06",
-                [["id", "is", bid_id]],
+                bid_id,
                 ["sg_price_list"]
             )
 
@@ -1426,9 +1426,9 @@ class CostsTab(QtWidgets.QMainWindow):
             price_list_id = bid_data["sg_price_list"]["id"]
 
             # Query the Price List to get its linked Line Items
-            price_list_data = self.sg_session.sg.find_one(
+            price_list_data = self.sg_session.get_entity_by_id(
                 "CustomEntity10",
-                [["id", "is", price_list_id]],
+                price_list_id,
                 ["sg_line_items"]
             )
 
@@ -1487,9 +1487,9 @@ class CostsTab(QtWidgets.QMainWindow):
             bid_id = self.current_bid_data['id']
 
             # Query the Bid to get its Price List (sg_price_list)
-            bid_data = self.sg_session.sg.find_one(
+            bid_data = self.sg_session.get_entity_by_id(
                 "CustomEntity06",
-                [["id", "is", bid_id]],
+                bid_id,
                 ["sg_price_list"]
             )
 
@@ -1500,9 +1500,9 @@ class CostsTab(QtWidgets.QMainWindow):
             price_list_id = bid_data["sg_price_list"]["id"]
 
             # Query the Price List to get its linked Line Items and Rate Card
-            price_list_data = self.sg_session.sg.find_one(
+            price_list_data = self.sg_session.get_entity_by_id(
                 "CustomEntity10",
-                [["id", "is", price_list_id]],
+                price_list_id,
                 ["sg_line_items", "sg_rate_card"]
             )
 
@@ -1523,7 +1523,7 @@ class CostsTab(QtWidgets.QMainWindow):
                 return
 
             # Get all mandays fields from schema
-            schema = self.sg_session.sg.schema_field_read("CustomEntity03")
+            schema = self.sg_session.get_entity_schema("CustomEntity03")
             mandays_fields = [field for field in schema.keys() if field.endswith("_mandays")]
 
             # Query Line Items with all mandays fields
@@ -1553,13 +1553,13 @@ class CostsTab(QtWidgets.QMainWindow):
                 rate_card_id = price_list_data["sg_rate_card"]["id"]
                 rate_fields = [field for field in schema.keys() if field.endswith("_rate")]
 
-                rate_card_schema = self.sg_session.sg.schema_field_read("CustomEntity04")
+                rate_card_schema = self.sg_session.get_entity_schema("CustomEntity04")
                 rate_fields = [field for field in rate_card_schema.keys() if field.endswith("_rate")]
 
                 if rate_fields:
-                    rate_card_data = self.sg_session.sg.find_one(
+                    rate_card_data = self.sg_session.get_entity_by_id(
                         "CustomEntity04",
-                        [["id", "is", rate_card_id]],
+                        rate_card_id,
                         rate_fields
                     )
                     logger.info(f"Loaded Rate Card {rate_card_id} with {len(rate_fields)} rate fields")
@@ -1690,7 +1690,7 @@ class CostsTab(QtWidgets.QMainWindow):
 
         try:
             # Get field schema for CustomEntity07 (Asset items)
-            raw_schema = self.sg_session.sg.schema_field_read("CustomEntity07")
+            raw_schema = self.sg_session.get_entity_schema("CustomEntity07")
 
             # Build field_schema dict and display_names dict
             field_schema = {}
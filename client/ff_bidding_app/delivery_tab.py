@@ -3,77 +3,343 @@ from PySide6 import QtWidgets, QtCore, QtGui
 from pathlib import Path
 import logging
 import json
-import zipfile
-import os
+import shutil
+import tempfile
+import time
 
 try:
     from .logger import logger
     from .bid_selector_widget import CollapsibleGroupBox
     from .settings import AppSettings
     from .gdrive_service import get_gdrive_service, GOOGLE_API_AVAILABLE
+    from .async_shotgrid import get_async_client
+    from .zip_writer import ZipCancelled, collect_files, write_zip
+    from .upload_manager import get_upload_manager
+    from .file_hashing import HashingCancelled
+    from .package_delta import (
+        FILE_INDEX_KEY, build_file_index, compute_delta, delta_members, delta_size, load_file_index,
+        EXCLUDED_FILES as PACKAGE_EXCLUDED_FILES
+    )
 except ImportError:
     logger = logging.getLogger("FFPackageManager")
     from bid_selector_widget import CollapsibleGroupBox
     from settings import AppSettings
     from gdrive_service import get_gdrive_service, GOOGLE_API_AVAILABLE
+    from async_shotgrid import get_async_client
+    from zip_writer import ZipCancelled, collect_files, write_zip
+    from upload_manager import get_upload_manager
+    from file_hashing import HashingCancelled
+    from package_delta import (
+        FILE_INDEX_KEY, build_file_index, compute_delta, delta_members, delta_size, load_file_index,
+        EXCLUDED_FILES as PACKAGE_EXCLUDED_FILES
+    )
 
 
 class ZipWorker(QtCore.QThread):
-    """Worker thread for zipping package directories."""
+    """Worker thread for zipping package directories.
+
+    Already-compressed media is stored as-is and the remaining files are
+    deflated in parallel (see zip_writer).
+    """
 
     progress = QtCore.Signal(int, str)  # (percent, current_file)
+    bytes_progress = QtCore.Signal(object, object)  # (bytes_done, bytes_total)
     finished = QtCore.Signal(str)  # zip_path
     error = QtCore.Signal(str)  # error_message
 
-    def __init__(self, source_dir, zip_path, parent=None):
+    # Minimum interval between two progress signals
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, source_dir, zip_path, parent=None, delta=None):
         """Initialize the zip worker.
 
         Args:
             source_dir: Path to the directory to zip
             zip_path: Path for the output zip file
             parent: Parent QObject
+            delta: Optional delta share dict ('delta', 'base_package'); only
+                added/changed files and a deletion list are archived
         """
         super().__init__(parent)
         self.source_dir = Path(source_dir)
         self.zip_path = Path(zip_path)
+        self.delta = delta
+        self._cancelled = False
+        self._last_progress = 0.0
 
     # Files to exclude from the zip (keep in original folder but don't send to vendor)
-    EXCLUDED_FILES = {'manifest.json'}
+    EXCLUDED_FILES = PACKAGE_EXCLUDED_FILES
+
+    @classmethod
+    def collect_members(cls, source_dir, staging_dir, delta=None):
+        """List the archive members of a full or delta package.
+
+        Args:
+            source_dir: Package directory
+            staging_dir: Temporary folder for the delta's deletion list
+            delta: Optional delta share dict ('delta', 'base_package')
+
+        Returns:
+            List of member dicts for write_zip
+        """
+        if not delta:
+            return collect_files(source_dir, cls.EXCLUDED_FILES)
+        return delta_members(
+            source_dir, delta['delta'], staging_dir,
+            base_package=delta['base_package'],
+            package_name=Path(source_dir).name,
+            excluded=cls.EXCLUDED_FILES
+        )
+
+    def cancel(self):
+        """Stop zipping at the next chunk; error is emitted with "Cancelled"."""
+        self._cancelled = True
 
     def run(self):
         """Execute the zipping process."""
+        staging_dir = tempfile.mkdtemp(prefix="ff_delta_") if self.delta else None
         try:
-            # Count total files for progress (excluding manifest.json)
-            all_files = []
-            for root, dirs, files in os.walk(self.source_dir):
-                for file in files:
-                    if file not in self.EXCLUDED_FILES:
-                        all_files.append(os.path.join(root, file))
-
-            total_files = len(all_files)
-            if total_files == 0:
+            members = self.collect_members(self.source_dir, staging_dir, self.delta)
+            if not members:
                 self.error.emit("No files to zip")
                 return
 
-            # Create zip file
-            with zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for idx, file_path in enumerate(all_files):
-                    # Calculate relative path for archive
-                    rel_path = os.path.relpath(file_path, self.source_dir)
+            with open(self.zip_path, 'wb') as f:
+                summary = write_zip(
+                    members, f,
+                    progress_callback=self._emit_progress,
+                    is_cancelled=lambda: self._cancelled
+                )
+            logger.info(
+                f"Zipped {summary['files']} files ({summary['stored']} stored, "
+                f"{summary['deflated']} deflated): {summary['bytes']} -> {summary['archive_bytes']} bytes"
+            )
+
+            self.finished.emit(str(self.zip_path))
 
-                    # Update progress
-                    percent = int((idx + 1) / total_files * 100)
-                    self.progress.emit(percent, os.path.basename(file_path))
+        except ZipCancelled:
+            self.zip_path.unlink(missing_ok=True)
+            self.error.emit("Cancelled")
+        except Exception as e:
+            self.zip_path.unlink(missing_ok=True)
+            self.error.emit(str(e))
+        finally:
+            if staging_dir:
+                shutil.rmtree(staging_dir, ignore_errors=True)
 
-                    # Add file to archive
-                    zipf.write(file_path, rel_path)
+    def _emit_progress(self, bytes_done, bytes_total, current_file):
+        """Emit byte-based progress, throttled to PROGRESS_INTERVAL."""
+        now = time.monotonic()
+        if bytes_done < bytes_total and now - self._last_progress < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        percent = int(bytes_done / bytes_total * 100) if bytes_total else 100
+        self.progress.emit(percent, current_file)
+        self.bytes_progress.emit(bytes_done, bytes_total)
+
+
+class ZipUploadWorker(QtCore.QThread):
+    """Worker thread zipping a package straight into a Google Drive upload.
+
+    The archive is produced chunk by chunk and fed into a resumable upload
+    session, so compression and network transfer overlap and no archive is
+    written to local disk.
+    """
+
+    progress = QtCore.Signal(int, str)  # (percent, current_file)
+    bytes_progress = QtCore.Signal(object, object)  # (bytes_done, bytes_total) of the package
+    upload_progress = QtCore.Signal(object)  # bytes received by Google Drive
+    finished = QtCore.Signal(dict)  # uploaded file info ('id', 'name', 'webViewLink')
+    error = QtCore.Signal(str)  # error_message
+
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, gdrive, source_dir, archive_name, parent=None, delta=None):
+        """Initialize the worker.
+
+        Args:
+            gdrive: Authenticated GoogleDriveService
+            source_dir: Path to the directory to zip
+            archive_name: File name of the archive on Google Drive
+            parent: Parent QObject
+            delta: Optional delta share dict (see ZipWorker)
+        """
+        super().__init__(parent)
+        self.gdrive = gdrive
+        self.source_dir = Path(source_dir)
+        self.archive_name = archive_name
+        self.delta = delta
+        self._cancelled = False
+        self._last_progress = 0.0
+
+    def cancel(self):
+        """Stop zipping and abort the upload session."""
+        self._cancelled = True
+
+    def run(self):
+        """Zip and upload the package."""
+        stream = None
+        staging_dir = tempfile.mkdtemp(prefix="ff_delta_") if self.delta else None
+        try:
+            members = ZipWorker.collect_members(self.source_dir, staging_dir, self.delta)
+            if not members:
+                self.error.emit("No files to zip")
+                return
+
+            stream = self.gdrive.open_upload_stream(
+                self.archive_name,
+                progress_callback=self.upload_progress.emit
+            )
+            summary = write_zip(
+                members, stream,
+                progress_callback=self._emit_progress,
+                is_cancelled=lambda: self._cancelled
+            )
+            result = stream.close()
+            logger.info(
+                f"Streamed {summary['files']} files to Google Drive as {self.archive_name} "
+                f"({summary['archive_bytes']} bytes)"
+            )
+            self.finished.emit(result or {})
+
+        except ZipCancelled:
+            stream.abort()
+            self.error.emit("Cancelled")
+        except Exception as e:
+            if stream is not None:
+                stream.abort()
+            self.error.emit(str(e))
+        finally:
+            if staging_dir:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _emit_progress(self, bytes_done, bytes_total, current_file):
+        """Emit byte-based progress, throttled to PROGRESS_INTERVAL."""
+        now = time.monotonic()
+        if bytes_done < bytes_total and now - self._last_progress < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        percent = int(bytes_done / bytes_total * 100) if bytes_total else 100
+        self.progress.emit(percent, current_file)
+        self.bytes_progress.emit(bytes_done, bytes_total)
 
-            self.finished.emit(str(self.zip_path))
 
+class FileIndexWorker(QtCore.QThread):
+    """Worker thread building the file index of a package folder.
+
+    Hashes of files whose size and modification time match the previous
+    index are reused, so re-indexing an unchanged package only stats its
+    files (see package_delta.build_file_index).
+    """
+
+    progress = QtCore.Signal(int, int)  # (files_hashed, files_to_hash)
+    finished = QtCore.Signal(dict)  # file index
+    error = QtCore.Signal(str)  # error_message
+
+    def __init__(self, package_dir, previous_index=None, parent=None):
+        """Initialize the worker.
+
+        Args:
+            package_dir: Path to the package directory
+            previous_index: File index recorded in the package manifest, if any
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.package_dir = Path(package_dir)
+        self.previous_index = previous_index
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop hashing after the files in progress; error is emitted with "Cancelled"."""
+        self._cancelled = True
+
+    def run(self):
+        """Index the package files."""
+        try:
+            index = build_file_index(
+                self.package_dir, ZipWorker.EXCLUDED_FILES,
+                previous_index=self.previous_index,
+                progress_callback=self.progress.emit,
+                is_cancelled=lambda: self._cancelled
+            )
+            self.finished.emit(index)
+        except HashingCancelled:
+            self.error.emit("Cancelled")
         except Exception as e:
             self.error.emit(str(e))
 
 
+class VendorShareDialog(QtWidgets.QDialog):
+    """Dialog for picking the vendors a package is shared with."""
+
+    def __init__(self, vendors_list, parent=None):
+        """Initialize the dialog.
+
+        Args:
+            vendors_list: List of vendor dictionaries from ShotGrid
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.vendors_list = vendors_list
+
+        self.setWindowTitle("Share with Vendors")
+        self.setModal(True)
+        self.setMinimumWidth(350)
+        self._build_ui()
+
+    def _build_ui(self):
+        """Build the dialog UI."""
+        layout = QtWidgets.QVBoxLayout(self)
+
+        desc_label = QtWidgets.QLabel(
+            "The package is uploaded once and shared with every selected vendor."
+        )
+        desc_label.setWordWrap(True)
+        desc_label.setStyleSheet("color: #888888; font-size: 11px;")
+        layout.addWidget(desc_label)
+
+        self.vendor_list = QtWidgets.QListWidget()
+        for vendor in self.vendors_list:
+            item = QtWidgets.QListWidgetItem(vendor.get('code', f"Vendor {vendor.get('id', '?')}"))
+            item.setData(QtCore.Qt.UserRole, vendor)
+            item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
+            item.setCheckState(QtCore.Qt.Unchecked)
+            self.vendor_list.addItem(item)
+        layout.addWidget(self.vendor_list)
+
+        select_layout = QtWidgets.QHBoxLayout()
+        select_all_btn = QtWidgets.QPushButton("Select All")
+        select_all_btn.clicked.connect(lambda: self._set_all_checked(True))
+        select_layout.addWidget(select_all_btn)
+        select_none_btn = QtWidgets.QPushButton("Select None")
+        select_none_btn.clicked.connect(lambda: self._set_all_checked(False))
+        select_layout.addWidget(select_none_btn)
+        select_layout.addStretch()
+        layout.addLayout(select_layout)
+
+        button_box = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel
+        )
+        button_box.button(QtWidgets.QDialogButtonBox.Ok).setText("Share")
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def _set_all_checked(self, checked):
+        """Check or uncheck every vendor."""
+        state = QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked
+        for row in range(self.vendor_list.count()):
+            self.vendor_list.item(row).setCheckState(state)
+
+    def get_selected_vendors(self):
+        """Return the checked vendor dictionaries."""
+        return [
+            self.vendor_list.item(row).data(QtCore.Qt.UserRole)
+            for row in range(self.vendor_list.count())
+            if self.vendor_list.item(row).checkState() == QtCore.Qt.Checked
+        ]
+
+
 class PackageShareWidget(QtWidgets.QWidget):
     """
     Widget for sharing packages with vendors.
@@ -88,8 +354,19 @@ class PackageShareWidget(QtWidgets.QWidget):
         super().__init__(parent)
 
         self.packages_list = []
+        self.vendors_list = []
         self.current_package = None
 
+        # Vendors of the multi-vendor share waiting for its zip (see _share_package)
+        self._pending_vendor_shares = None
+
+        # Package indexing in progress before a share (see _index_package)
+        self._index_worker = None
+
+        # Background uploads: job_id -> {'config', 'sent', 'total', 'rate'}
+        self._upload_jobs = {}
+        self._upload_signals_connected = False
+
         self._setup_ui()
         self._connect_signals()
 
@@ -168,6 +445,34 @@ class PackageShareWidget(QtWidgets.QWidget):
         self.link_check.setChecked(True)
         delivery_layout.addWidget(self.link_check)
 
+        # Streaming upload: zip directly into Google Drive without a local archive
+        self.stream_upload_check = QtWidgets.QCheckBox(
+            "Stream zip directly to Google Drive (no local archive)"
+        )
+        self.stream_upload_check.setToolTip(
+            "Compress and upload at the same time. Needs no extra disk space,\n"
+            "but the archive is not kept locally for re-sharing."
+        )
+        self.stream_upload_check.setChecked(bool(AppSettings().get("delivery_stream_upload", False)))
+        self.stream_upload_check.toggled.connect(
+            lambda checked: AppSettings().set("delivery_stream_upload", checked)
+        )
+        delivery_layout.addWidget(self.stream_upload_check)
+
+        # Delta packages: only send what changed since the vendor's last delivery
+        self.delta_check = QtWidgets.QCheckBox(
+            "Send only changes since the vendor's last delivery (delta package)"
+        )
+        self.delta_check.setToolTip(
+            "Compare the package with the last package delivered to the selected vendor\n"
+            "and send only added or changed files, plus a list of files to delete."
+        )
+        self.delta_check.setChecked(bool(AppSettings().get("delivery_delta_packages", False)))
+        self.delta_check.toggled.connect(
+            lambda checked: AppSettings().set("delivery_delta_packages", checked)
+        )
+        delivery_layout.addWidget(self.delta_check)
+
         # Notification message
         delivery_layout.addWidget(QtWidgets.QLabel("Notification message (optional):"))
         self.message_edit = QtWidgets.QTextEdit()
@@ -198,6 +503,13 @@ class PackageShareWidget(QtWidgets.QWidget):
         self.share_btn.setMinimumWidth(130)
         btn_layout.addWidget(self.share_btn)
 
+        self.multi_share_btn = QtWidgets.QPushButton("Share with Vendors...")
+        self.multi_share_btn.setEnabled(False)
+        self.multi_share_btn.setToolTip(
+            "Upload the package once and share it with several vendors"
+        )
+        btn_layout.addWidget(self.multi_share_btn)
+
         layout.addLayout(btn_layout)
 
         # Result display
@@ -223,6 +535,7 @@ class PackageShareWidget(QtWidgets.QWidget):
         self.email_edit.textChanged.connect(self._update_buttons)
         self.link_check.toggled.connect(self._update_buttons)
         self.share_btn.clicked.connect(self._on_share_clicked)
+        self.multi_share_btn.clicked.connect(self._on_multi_share_clicked)
         self.copy_link_btn.clicked.connect(self._copy_link)
 
     def set_packages(self, packages_list):
@@ -255,6 +568,7 @@ class PackageShareWidget(QtWidgets.QWidget):
         Args:
             vendors_list: List of vendor dictionaries from ShotGrid
         """
+        self.vendors_list = vendors_list
         self.vendor_combo.blockSignals(True)
         self.vendor_combo.clear()
         self.vendor_combo.addItem("-- Select a vendor --", None)
@@ -356,6 +670,7 @@ class PackageShareWidget(QtWidgets.QWidget):
         has_target = bool(self.email_edit.text().strip()) or self.link_check.isChecked()
 
         self.share_btn.setEnabled(has_package and has_target)
+        self.multi_share_btn.setEnabled(has_package and bool(self.vendors_list))
 
     def _on_share_clicked(self):
         """Handle share button click.
@@ -371,24 +686,345 @@ class PackageShareWidget(QtWidgets.QWidget):
         if self._check_duplicate_share():
             return  # Already shown warning to user
 
+        vendor = self.vendor_combo.currentData()
+        delta_vendor = vendor if self.delta_check.isChecked() and vendor else None
+        self._index_package(lambda: self._share_indexed_package(delta_vendor))
+
+    def _share_indexed_package(self, delta_vendor=None):
+        """Share the current package once its file index is up to date.
+
+        Args:
+            delta_vendor: Vendor to send a delta package to, or None for the
+                full package
+        """
+        delta = None
+        if delta_vendor:
+            delta = self._prepare_delta_share(delta_vendor)
+            if delta is False:
+                return  # Cancelled by user
+
+        self._share_package(delta=delta)
+
+    def _on_multi_share_clicked(self):
+        """Share the selected package with several vendors at once.
+
+        The package is zipped and uploaded a single time; every vendor then
+        gets its own Drive permission and PackageTracking record.
+        """
+        if not self.current_package:
+            return
+
+        dialog = VendorShareDialog(self.vendors_list, self)
+        if dialog.exec() != QtWidgets.QDialog.Accepted:
+            return
+        vendors = dialog.get_selected_vendors()
+        if not vendors:
+            return
+
+        vendors = self._exclude_already_shared(vendors)
+        if not vendors:
+            return
+
+        vendor_shares = self._resolve_vendor_shares(vendors)
+        if not vendor_shares:
+            return
+
+        self._index_package(lambda: self._share_package(vendor_shares))
+
+    def _exclude_already_shared(self, vendors):
+        """Drop vendors that already received the current package.
+
+        Uses a single query for the whole RFQ instead of one per vendor.
+
+        Args:
+            vendors: List of vendor dicts
+
+        Returns:
+            Vendors the package can still be shared with
+        """
+        package_name = self.current_package.get('code')
+        delivery_tab = self._get_delivery_tab()
+        if not package_name or not delivery_tab or not delivery_tab.current_rfq:
+            return vendors
+
+        try:
+            tracking_records = delivery_tab.sg_session.get_package_tracking_for_rfq(
+                delivery_tab.current_rfq['id']
+            )
+        except Exception as e:
+            logger.error(f"Error checking for duplicate shares: {e}", exc_info=True)
+            # Don't block on error, proceed with share
+            return vendors
+
+        shared_ids = {
+            (record.get('sg_recipient') or {}).get('id')
+            for record in tracking_records if record.get('code') == package_name
+        }
+        already_shared = [v.get('code', 'Unknown') for v in vendors if v.get('id') in shared_ids]
+        if not already_shared:
+            return vendors
+
+        remaining = [v for v in vendors if v.get('id') not in shared_ids]
+        logger.info(f"Skipping vendors that already received '{package_name}': {already_shared}")
+        QtWidgets.QMessageBox.information(
+            self,
+            "Package Already Shared",
+            f"The package '{package_name}' has already been shared with:\n\n"
+            f"{', '.join(already_shared)}\n\n"
+            + (f"It will only be shared with the remaining {len(remaining)} vendor(s)."
+               if remaining else "There are no vendors left to share it with.")
+        )
+        return remaining
+
+    def _resolve_vendor_shares(self, vendors):
+        """Look up the member email addresses of several vendors in one query.
+
+        Args:
+            vendors: List of vendor dicts with sg_members
+
+        Returns:
+            List of {'vendor', 'emails'} dicts, or an empty list if nothing can
+            be shared
+        """
+        members_by_vendor = {
+            vendor['id']: [
+                member['id'] for member in (vendor.get('sg_members') or [])
+                if isinstance(member, dict) and member.get('id')
+            ]
+            for vendor in vendors
+        }
+        member_ids = sorted({mid for ids in members_by_vendor.values() for mid in ids})
+
+        emails_by_member = {}
+        delivery_tab = self._get_delivery_tab()
+        if member_ids and delivery_tab:
+            try:
+                client_users = delivery_tab.sg_session.get_client_users(member_ids)
+                emails_by_member = {u['id']: u.get('email') for u in client_users if u.get('email')}
+            except Exception as e:
+                logger.warning(f"Could not fetch client user emails: {e}")
+
+        vendor_shares = []
+        no_recipients = []
+        for vendor in vendors:
+            emails = [
+                emails_by_member[mid] for mid in members_by_vendor[vendor['id']]
+                if mid in emails_by_member
+            ]
+            if not emails and not self.link_check.isChecked():
+                no_recipients.append(vendor.get('code', 'Unknown'))
+                continue
+            vendor_shares.append({'vendor': vendor, 'emails': emails})
+
+        if no_recipients:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "No Recipients",
+                f"These vendors have no members with an email address and link "
+                f"sharing is off, so they will be skipped:\n\n{', '.join(no_recipients)}"
+            )
+        return vendor_shares
+
+    def _share_package(self, vendor_shares=None, delta=None):
+        """Zip (if needed), upload and share the current package.
+
+        Args:
+            vendor_shares: List of {'vendor', 'emails'} dicts to share with
+                several vendors; None shares with the options in the form
+            delta: Optional delta share dict from _prepare_delta_share
+        """
         package_path = self.current_package.get('path')
         if not package_path:
             logger.warning("No package path available")
             return
 
         package_dir = Path(package_path)
-        zip_path = package_dir.with_suffix('.zip')
+        if delta:
+            zip_path = package_dir.parent / f"{package_dir.name}_delta_from_{delta['base_package']}.zip"
+        else:
+            zip_path = package_dir.with_suffix('.zip')
 
         # Upload manifest to ShotGrid and set status to closed
         self._update_package_in_shotgrid()
 
-        # Check if zip already exists
-        if zip_path.exists():
+        # Check if zip already exists (delta archives depend on the vendor, so they are always rebuilt)
+        if zip_path.exists() and not delta:
             logger.info(f"Zip file already exists: {zip_path}")
-            self._complete_share(zip_path)
+            self._complete_share(zip_path, vendor_shares)
+        elif self.stream_upload_check.isChecked():
+            self._start_streaming_share(package_dir, zip_path.name, vendor_shares, delta)
         else:
             # Need to create zip file
-            self._start_zipping(package_dir, zip_path)
+            self._pending_vendor_shares = vendor_shares
+            self._start_zipping(package_dir, zip_path, delta)
+
+    def _prepare_delta_share(self, vendor):
+        """Diff the current package against the last package delivered to a vendor.
+
+        Args:
+            vendor: Vendor dict the package is shared with
+
+        Returns:
+            Delta share dict ('delta', 'base_package') to send a delta package,
+            None to send the full package, or False if the user cancelled
+        """
+        delivery_tab = self._get_delivery_tab()
+        if not delivery_tab or not delivery_tab.current_rfq:
+            return None
+
+        package_name = self.current_package.get('code')
+        sg_session = delivery_tab.sg_session
+        try:
+            tracking_records = sg_session.get_package_tracking_for_vendor_and_rfq(
+                vendor_id=vendor['id'],
+                rfq_id=delivery_tab.current_rfq['id'],
+                fields=["id", "code", "sg_file_index", "created_at"]
+            )
+        except Exception as e:
+            logger.error(f"Could not look up previous deliveries: {e}", exc_info=True)
+            return None
+
+        # Records are sorted newest first; the vendor has what the newest one delivered
+        if not tracking_records:
+            logger.info(f"No previous delivery to '{vendor.get('code')}', sending the full package")
+            return None
+        last_delivery = tracking_records[0]
+        base_package = last_delivery.get('code')
+
+        previous_index = sg_session.get_package_tracking_file_index(last_delivery)
+        if previous_index is None:
+            QtWidgets.QMessageBox.information(
+                self,
+                "Delta Package",
+                f"No file list was recorded when '{base_package}' was delivered to "
+                f"{vendor.get('code', 'this vendor')}.\n\n"
+                f"The full package will be sent."
+            )
+            return None
+
+        # Built by _index_package before the share started
+        current_index = load_file_index(self.current_package.get('manifest'))
+        if current_index is None:
+            return None
+
+        delta = compute_delta(previous_index, current_index)
+        mb = 1024 * 1024
+        delta_mb = delta_size(delta, current_index) / mb
+        full_mb = sum(info['size'] for info in current_index.values()) / mb
+
+        answer = QtWidgets.QMessageBox.question(
+            self,
+            "Delta Package",
+            f"{vendor.get('code', 'The vendor')} already received '{base_package}'.\n\n"
+            f"  Added: {len(delta['added'])}\n"
+            f"  Changed: {len(delta['changed'])}\n"
+            f"  Removed: {len(delta['removed'])}\n"
+            f"  Unchanged: {len(delta['unchanged'])}\n\n"
+            f"Send only the changes ({delta_mb:.1f} MB instead of {full_mb:.1f} MB)?\n"
+            f"Choose No to send the full package.",
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Cancel,
+            QtWidgets.QMessageBox.Yes
+        )
+        if answer == QtWidgets.QMessageBox.Cancel:
+            return False
+        if answer != QtWidgets.QMessageBox.Yes:
+            return None
+
+        logger.info(
+            f"Delta of '{package_name}' against '{base_package}': {len(delta['added'])} added, "
+            f"{len(delta['changed'])} changed, {len(delta['removed'])} removed"
+        )
+        return {'delta': delta, 'base_package': base_package}
+
+    def _index_package(self, callback):
+        """Bring the file index of the current package up to date, then call callback.
+
+        The index is what later delta packages are compared against. It is
+        built in a FileIndexWorker behind a cancellable progress dialog and
+        stored in the package's manifest.json before the manifest is
+        uploaded to ShotGrid. Cancelling the dialog cancels the share; if
+        indexing fails the share goes ahead without an index.
+
+        Args:
+            callback: Called without arguments once the index is recorded
+        """
+        package = self.current_package
+        manifest_data = package.get('manifest')
+        package_path = package.get('path')
+        if not manifest_data or not package_path:
+            callback()
+            return
+
+        progress = QtWidgets.QProgressDialog(
+            "Indexing package files...", "Cancel", 0, 100, self
+        )
+        progress.setWindowTitle("Share Package")
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+
+        worker = FileIndexWorker(package_path, load_file_index(manifest_data), self)
+        worker.progress.connect(
+            lambda done, total: progress.setValue(int(done / total * 100) if total else 100)
+        )
+        worker.finished.connect(
+            lambda index: self._on_index_finished(package, index, progress, callback)
+        )
+        worker.error.connect(
+            lambda error_msg: self._on_index_error(package, error_msg, progress, callback)
+        )
+        progress.canceled.connect(worker.cancel)
+        self._index_worker = worker
+
+        self.share_btn.setEnabled(False)
+        self.multi_share_btn.setEnabled(False)
+        worker.start()
+
+    def _on_index_finished(self, package, index, progress, callback):
+        """Record a finished file index in the package manifest and continue the share.
+
+        Args:
+            package: Package dict the index was built for
+            index: {relative path: {"size", "mtime_ns", "sha256"}}
+            progress: QProgressDialog of the indexing
+            callback: Continuation passed to _index_package
+        """
+        progress.close()
+        self._index_worker = None
+        self._update_buttons()
+
+        manifest_data = package['manifest']
+        manifest_data[FILE_INDEX_KEY] = index
+        manifest_path = Path(package['path']) / "manifest.json"
+        try:
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest_data, f, indent=2, default=str)
+        except Exception as e:
+            logger.warning(f"Could not save file index to {manifest_path}: {e}")
+
+        if package is self.current_package:
+            callback()
+
+    def _on_index_error(self, package, error_msg, progress, callback):
+        """Handle a failed or cancelled file index build.
+
+        Args:
+            package: Package dict the index was built for
+            error_msg: Error message, "Cancelled" if the user cancelled
+            progress: QProgressDialog of the indexing
+            callback: Continuation passed to _index_package
+        """
+        progress.close()
+        self._index_worker = None
+        self._update_buttons()
+
+        if error_msg == "Cancelled":
+            logger.info(f"Share of '{package.get('code')}' cancelled while indexing")
+            return
+        logger.warning(f"Could not index package files: {error_msg}")
+        if package is self.current_package:
+            callback()
 
     def _check_duplicate_share(self):
         """Check if the package has already been shared to the selected vendor.
@@ -489,6 +1125,7 @@ class PackageShareWidget(QtWidgets.QWidget):
                 return
 
             logger.info(f"Found package in ShotGrid with ID: {sg_package['id']}")
+
             logger.info(f"Uploading manifest ({len(json.dumps(manifest_data))} bytes) and setting status to closed")
 
             # Update the package with manifest and status
@@ -506,22 +1143,25 @@ class PackageShareWidget(QtWidgets.QWidget):
         except Exception as e:
             logger.error(f"Failed to update package in ShotGrid: {e}", exc_info=True)
 
-    def _start_zipping(self, package_dir, zip_path):
+    def _start_zipping(self, package_dir, zip_path, delta=None):
         """Start the zipping process in a worker thread.
 
         Args:
             package_dir: Path to the package directory
             zip_path: Path for the output zip file
+            delta: Optional delta share dict from _prepare_delta_share
         """
         # Show progress UI
         self.progress_group.setVisible(True)
         self.progress_label.setText(f"Zipping {package_dir.name}...")
         self.progress_bar.setValue(0)
         self.share_btn.setEnabled(False)
+        self.multi_share_btn.setEnabled(False)
 
         # Create and start worker thread
-        self.zip_worker = ZipWorker(package_dir, zip_path)
+        self.zip_worker = ZipWorker(package_dir, zip_path, delta=delta)
         self.zip_worker.progress.connect(self._on_zip_progress)
+        self.zip_worker.bytes_progress.connect(self._on_zip_bytes_progress)
         self.zip_worker.finished.connect(self._on_zip_finished)
         self.zip_worker.error.connect(self._on_zip_error)
         self.zip_worker.start()
@@ -536,6 +1176,16 @@ class PackageShareWidget(QtWidgets.QWidget):
         self.progress_bar.setValue(percent)
         self.progress_label.setText(f"Zipping: {current_file}")
 
+    def _on_zip_bytes_progress(self, bytes_done, bytes_total):
+        """Show how much of the package has been zipped.
+
+        Args:
+            bytes_done: Source bytes archived so far
+            bytes_total: Total source bytes
+        """
+        mb = 1024 * 1024
+        self.progress_bar.setFormat(f"%p%  ({bytes_done / mb:.0f} / {bytes_total / mb:.0f} MB)")
+
     def _on_zip_finished(self, zip_path):
         """Handle zip completion.
 
@@ -543,13 +1193,15 @@ class PackageShareWidget(QtWidgets.QWidget):
             zip_path: Path to the created zip file
         """
         self.progress_label.setText("Zipping complete!")
+        self.progress_bar.setFormat("%p%")
         self.progress_bar.setValue(100)
         self._update_buttons()
 
-        # Hide progress after a short delay
-        QtCore.QTimer.singleShot(1500, lambda: self.progress_group.setVisible(False))
+        # Hide progress after a short delay unless an upload is showing in it
+        QtCore.QTimer.singleShot(1500, lambda: self.progress_group.setVisible(bool(self._upload_jobs)))
 
-        self._complete_share(Path(zip_path))
+        vendor_shares, self._pending_vendor_shares = self._pending_vendor_shares, None
+        self._complete_share(Path(zip_path), vendor_shares)
 
     def _on_zip_error(self, error_msg):
         """Handle zip error.
@@ -557,84 +1209,288 @@ class PackageShareWidget(QtWidgets.QWidget):
         Args:
             error_msg: Error message
         """
+        self._pending_vendor_shares = None
         self.progress_label.setText(f"Error: {error_msg}")
+        self.progress_bar.setFormat("%p%")
         self._update_buttons()
         logger.error(f"Zip error: {error_msg}")
 
         # Hide progress after a delay
         QtCore.QTimer.singleShot(3000, lambda: self.progress_group.setVisible(False))
 
-    def _complete_share(self, zip_path):
-        """Complete the share process after zip is ready.
+    def _start_streaming_share(self, package_dir, archive_name, vendor_shares=None, delta=None):
+        """Zip the package straight into a Google Drive upload in a worker thread.
 
         Args:
-            zip_path: Path to the zip file
+            package_dir: Path to the package directory
+            archive_name: File name of the archive on Google Drive
+            vendor_shares: List of {'vendor', 'emails'} dicts for a multi-vendor share
+            delta: Optional delta share dict from _prepare_delta_share
+        """
+        gdrive = get_gdrive_service()
+        if not self._check_gdrive_available(gdrive):
+            return
+        # Authenticate on the GUI thread; this may open the OAuth consent page
+        if gdrive.get_service() is None:
+            QtWidgets.QMessageBox.warning(
+                self, "Google Drive Error",
+                "Google Drive authentication failed. Check the logs for details."
+            )
+            return
+
+        config = self._build_share_config(None, vendor_shares)
+        self.shareRequested.emit(config)
+
+        self.progress_group.setVisible(True)
+        self.progress_label.setText(f"Zipping and uploading {package_dir.name}...")
+        self.progress_bar.setValue(0)
+        self.share_btn.setEnabled(False)
+        self.multi_share_btn.setEnabled(False)
+
+        self.upload_worker = ZipUploadWorker(gdrive, package_dir, archive_name, self, delta=delta)
+        self.upload_worker.progress.connect(self._on_zip_progress)
+        self.upload_worker.bytes_progress.connect(self._on_zip_bytes_progress)
+        self.upload_worker.finished.connect(
+            lambda result: self._on_streaming_upload_finished(config, result)
+        )
+        self.upload_worker.error.connect(self._on_zip_error)
+        self.upload_worker.start()
+
+    def _on_streaming_upload_finished(self, config, result):
+        """Share the streamed archive once the upload is complete.
+
+        Args:
+            config: Share configuration dictionary
+            result: Uploaded file info from ZipUploadWorker
+        """
+        self.progress_bar.setFormat("%p%")
+        self.progress_label.setText("Sharing...")
+        self.progress_bar.setRange(0, 0)
+        QtWidgets.QApplication.processEvents()
+
+        try:
+            file_id = result.get('id')
+            if file_id and config.get('vendor_shares'):
+                share_result = get_gdrive_service().share_file_with_many(
+                    file_id,
+                    self._vendor_share_emails(config['vendor_shares']),
+                    role=config['permission'],
+                    link_sharing=config['link_sharing']
+                )
+                if share_result:
+                    result['webViewLink'] = share_result.get('webViewLink')
+                    result['share_failures'] = share_result.get('failed', {})
+            elif file_id:
+                share_result = get_gdrive_service().share_file(
+                    file_id,
+                    email=config['email'],
+                    role=config['permission'],
+                    link_sharing=config['link_sharing']
+                )
+                if share_result:
+                    result['webViewLink'] = share_result.get('webViewLink')
+            self._show_share_result(config, result)
+        finally:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(100)
+            self._update_buttons()
+            QtCore.QTimer.singleShot(2000, lambda: self.progress_group.setVisible(False))
+
+    def _build_share_config(self, zip_path, vendor_shares=None):
+        """Collect the share options from the UI.
+
+        Args:
+            zip_path: Path to the zip file, or None when streaming
+            vendor_shares: List of {'vendor', 'emails'} dicts for a multi-vendor
+                share; replaces the vendor and email fields of the form
+
+        Returns:
+            Share configuration dictionary
         """
-        config = {
+        delivery_tab = self._get_delivery_tab()
+        return {
             'package': self.current_package,
-            'zip_path': str(zip_path),
-            'email': self.email_edit.text().strip() or None,
+            'zip_path': str(zip_path) if zip_path else None,
+            'email': None if vendor_shares else (self.email_edit.text().strip() or None),
             'permission': self._get_permission_value(),
             'link_sharing': self.link_check.isChecked(),
             'message': self.message_edit.toPlainText().strip() or None,
-            'vendor': self.vendor_combo.currentData()
+            'vendor': None if vendor_shares else self.vendor_combo.currentData(),
+            'vendor_shares': vendor_shares,
+            # Snapshot recorded on the PackageTracking records for later deltas
+            'file_index': load_file_index(self.current_package.get('manifest')),
+            # Taken now: the user may switch RFQs while the upload runs
+            'project_id': delivery_tab.current_project_id if delivery_tab else None,
+            'rfq': delivery_tab.current_rfq if delivery_tab else None,
         }
 
-        self.shareRequested.emit(config)
+    @staticmethod
+    def _vendor_share_emails(vendor_shares):
+        """Return the email addresses of all vendors of a multi-vendor share."""
+        return [email for share in vendor_shares for email in share['emails']]
 
-        # Upload to Google Drive
-        gdrive = get_gdrive_service()
+    def _check_gdrive_available(self, gdrive):
+        """Warn if the Google API libraries are missing.
+
+        Returns:
+            True if Google Drive can be used
+        """
         if not gdrive.is_available:
             QtWidgets.QMessageBox.warning(
                 self, "Google Drive Error",
                 "Google API libraries not installed.\n\n"
                 "Run: pip install google-auth google-auth-oauthlib google-api-python-client"
             )
+            return False
+        return True
+
+    def _show_share_result(self, config, result):
+        """Display the share link and record the delivery.
+
+        Args:
+            config: Share configuration dictionary
+            result: Uploaded file info, with 'webViewLink' when shared
+        """
+        if result and result.get('webViewLink'):
+            share_link = result['webViewLink']
+            self.result_link.setText(share_link)
+            self.copy_link_btn.setEnabled(True)
+            self.result_group.setVisible(True)
+            self.progress_label.setText("Upload complete!")
+            logger.info(f"File shared successfully: {share_link}")
+
+            # Create PackageTracking entity in ShotGrid
+            if config.get('vendor_shares'):
+                self._create_package_trackings(config, share_link, result.get('share_failures') or {})
+            else:
+                self._create_package_tracking(config, share_link)
+        else:
+            self.progress_label.setText("Upload failed - check logs")
+            QtWidgets.QMessageBox.warning(
+                self, "Upload Failed",
+                "Failed to upload file to Google Drive. Check the logs for details."
+            )
+
+    def _complete_share(self, zip_path, vendor_shares=None):
+        """Complete the share process after zip is ready.
+
+        The upload runs in the background upload manager; several shares can
+        be in flight at once.
+
+        Args:
+            zip_path: Path to the zip file
+            vendor_shares: List of {'vendor', 'emails'} dicts; the file is
+                uploaded once and shared with all of them
+        """
+        config = self._build_share_config(zip_path, vendor_shares)
+
+        self.shareRequested.emit(config)
+
+        # Upload to Google Drive
+        gdrive = get_gdrive_service()
+        if not self._check_gdrive_available(gdrive):
             return
 
-        # Show progress
-        self.progress_group.setVisible(True)
-        self.progress_label.setText("Uploading to Google Drive...")
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
-        self.share_btn.setEnabled(False)
-        QtWidgets.QApplication.processEvents()
+        manager = get_upload_manager()
+        if not self._upload_signals_connected:
+            manager.progress.connect(self._on_upload_progress)
+            manager.finished.connect(self._on_upload_finished)
+            manager.failed.connect(self._on_upload_failed)
+            self._upload_signals_connected = True
 
         try:
-            result = gdrive.upload_and_share(
-                file_path=str(zip_path),
+            job_id = manager.submit(
+                zip_path,
                 email=config['email'],
                 role=config['permission'],
-                link_sharing=config['link_sharing']
+                link_sharing=config['link_sharing'],
+                emails=self._vendor_share_emails(vendor_shares) if vendor_shares else None
             )
-
-            if result and result.get('webViewLink'):
-                share_link = result['webViewLink']
-                self.result_link.setText(share_link)
-                self.copy_link_btn.setEnabled(True)
-                self.result_group.setVisible(True)
-                self.progress_label.setText("Upload complete!")
-                logger.info(f"File shared successfully: {share_link}")
-
-                # Create PackageTracking entity in ShotGrid
-                self._create_package_tracking(config, share_link)
-            else:
-                self.progress_label.setText("Upload failed - check logs")
-                QtWidgets.QMessageBox.warning(
-                    self, "Upload Failed",
-                    "Failed to upload file to Google Drive. Check the logs for details."
-                )
         except Exception as e:
             logger.error(f"Google Drive upload error: {e}")
-            self.progress_label.setText(f"Error: {str(e)[:50]}")
             QtWidgets.QMessageBox.critical(
                 self, "Upload Error",
                 f"Error uploading to Google Drive:\n\n{str(e)}"
             )
-        finally:
-            self.progress_bar.setRange(0, 100)
-            self.progress_bar.setValue(100)
-            self._update_buttons()
-            QtCore.QTimer.singleShot(2000, lambda: self.progress_group.setVisible(False))
+            return
+
+        self._upload_jobs[job_id] = {'config': config, 'sent': 0, 'total': 0, 'rate': 0.0}
+
+        # Show progress
+        self.progress_group.setVisible(True)
+        self.progress_bar.setRange(0, 100)
+        self._refresh_upload_progress()
+
+    def _on_upload_progress(self, job_id, bytes_sent, bytes_total, bytes_per_sec):
+        """Track the progress of a background upload.
+
+        Args:
+            job_id: Upload manager job ID
+            bytes_sent: Bytes received by Google Drive
+            bytes_total: Size of the file
+            bytes_per_sec: Current throughput
+        """
+        job = self._upload_jobs.get(job_id)
+        if job is None:
+            return
+        job.update(sent=bytes_sent, total=bytes_total, rate=bytes_per_sec)
+        self._refresh_upload_progress()
+
+    def _on_upload_finished(self, job_id, result):
+        """Show the share link of a finished upload.
+
+        Args:
+            job_id: Upload manager job ID
+            result: Uploaded file info with 'webViewLink'
+        """
+        job = self._upload_jobs.pop(job_id, None)
+        if job is None:
+            return
+        self._show_share_result(job['config'], result)
+        self._refresh_upload_progress()
+
+    def _on_upload_failed(self, job_id, error_msg):
+        """Report a failed upload.
+
+        Args:
+            job_id: Upload manager job ID
+            error_msg: Error message
+        """
+        job = self._upload_jobs.pop(job_id, None)
+        if job is None:
+            return
+        package_name = (job['config'].get('package') or {}).get('code', 'package')
+        logger.error(f"Google Drive upload of {package_name} failed: {error_msg}")
+        self.progress_label.setText(f"Error: {error_msg[:50]}")
+        if error_msg != "Cancelled":
+            QtWidgets.QMessageBox.critical(
+                self, "Upload Error",
+                f"Error uploading {package_name} to Google Drive:\n\n{error_msg}\n\n"
+                f"Share the package again to resume the upload."
+            )
+        self._refresh_upload_progress()
+
+    def _refresh_upload_progress(self):
+        """Show the combined progress of all running uploads."""
+        if not self._upload_jobs:
+            self.progress_bar.setFormat("%p%")
+            QtCore.QTimer.singleShot(2000, lambda: self.progress_group.setVisible(
+                bool(self._upload_jobs)
+            ))
+            return
+
+        sent = sum(job['sent'] for job in self._upload_jobs.values())
+        total = sum(job['total'] for job in self._upload_jobs.values())
+        rate = sum(job['rate'] for job in self._upload_jobs.values())
+        mb = 1024 * 1024
+
+        count = len(self._upload_jobs)
+        self.progress_label.setText(
+            f"Uploading {count} package{'s' if count > 1 else ''} to Google Drive... "
+            f"{rate / mb:.1f} MB/s"
+        )
+        self.progress_bar.setValue(int(sent / total * 100) if total else 0)
+        self.progress_bar.setFormat(f"%p%  ({sent / mb:.0f} / {total / mb:.0f} MB)")
 
     def _create_package_tracking(self, config, share_link):
         """Create a PackageTracking entity in ShotGrid after successful share.
@@ -658,8 +1514,8 @@ class PackageShareWidget(QtWidgets.QWidget):
                 return
 
             sg_session = delivery_tab.sg_session
-            project_id = delivery_tab.current_project_id
-            current_rfq = delivery_tab.current_rfq
+            project_id = config.get('project_id')
+            current_rfq = config.get('rfq')
 
             if not project_id or not current_rfq:
                 logger.warning("Missing project_id or current_rfq for PackageTracking creation")
@@ -673,7 +1529,8 @@ class PackageShareWidget(QtWidgets.QWidget):
                 share_link=share_link,
                 vendor=vendor,
                 rfq=current_rfq,
-                status="dlvr"  # Delivered
+                status="dlvr",  # Delivered
+                file_index=config.get('file_index')
             )
 
             if tracking:
@@ -686,6 +1543,74 @@ class PackageShareWidget(QtWidgets.QWidget):
         except Exception as e:
             logger.error(f"Failed to create PackageTracking: {e}", exc_info=True)
 
+    def _create_package_trackings(self, config, share_link, share_failures):
+        """Create the PackageTracking entities of a multi-vendor share in one batch.
+
+        Vendors for which a Drive permission could not be granted get no
+        record, so the package can be shared with them again.
+
+        Args:
+            config: Share configuration dictionary with 'vendor_shares'
+            share_link: Google Drive share link
+            share_failures: {email: error message} of permissions that failed
+        """
+        package = config.get('package', {})
+        package_name = package.get('code', 'Unknown Package')
+
+        shared_vendors = []
+        failed_vendors = []
+        for share in config['vendor_shares']:
+            if any(email in share_failures for email in share['emails']):
+                failed_vendors.append(share['vendor'].get('code', 'Unknown'))
+            else:
+                shared_vendors.append(share['vendor'])
+
+        if failed_vendors:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Sharing Incomplete",
+                f"'{package_name}' could not be shared with some members of:\n\n"
+                f"{', '.join(failed_vendors)}\n\n"
+                f"These vendors were not marked as delivered. Check the logs for details."
+            )
+
+        if not shared_vendors:
+            return
+
+        try:
+            delivery_tab = self._get_delivery_tab()
+            if not delivery_tab:
+                logger.warning("Could not access DeliveryTab for PackageTracking creation")
+                return
+
+            project_id = config.get('project_id')
+            current_rfq = config.get('rfq')
+            if not project_id or not current_rfq:
+                logger.warning("Missing project_id or current_rfq for PackageTracking creation")
+                return
+
+            # Status codes: 'dlvr' = Delivered, 'dwnld' = Downloaded
+            outcome = delivery_tab.sg_session.create_package_trackings(
+                project_id=project_id,
+                package_name=package_name,
+                share_link=share_link,
+                vendors=shared_vendors,
+                rfq=current_rfq,
+                status="dlvr",  # Delivered
+                file_index=config.get('file_index')
+            )
+            for failure in outcome["failed"]:
+                logger.error(f"Failed to create PackageTracking for vendor '{failure['label']}': {failure['error']}")
+
+            self.progress_label.setText(
+                f"Shared with {len(shared_vendors)} vendor{'s' if len(shared_vendors) > 1 else ''}!"
+            )
+            # Refresh the vendor view to show the new tracking records
+            delivery_tab._load_package_tracking_for_vendors()
+
+        except Exception as e:
+            logger.error(f"Failed to create PackageTracking records: {e}", exc_info=True)
+
     def _get_permission_value(self):
         """Get the permission value from the combo box."""
         mapping = {
@@ -1406,6 +2331,11 @@ class DeliveryTab(QtWidgets.QWidget):
         self.packages_list = []
         self.vendors_list = []
 
+        # Pending background vendor query (see _load_vendors_for_rfq)
+        self._vendor_request = None
+        # Pending background tracking/access check (see _load_package_tracking_for_vendors)
+        self._tracking_request = None
+
         self._build_ui()
 
     def _build_ui(self):
@@ -1471,6 +2401,11 @@ class DeliveryTab(QtWidgets.QWidget):
         self.current_rfq = rfq
 
         if not rfq:
+            # Drop the result of a vendor load still running for the old RFQ
+            if self._vendor_request is not None:
+                self._vendor_request.cancel()
+                self._vendor_request = None
+            self.vendors_list = []
             self.package_share_widget.set_packages([])
             self.vendor_category_view.set_vendors([])
             self.package_share_widget.set_vendors([])
@@ -1599,9 +2534,17 @@ class DeliveryTab(QtWidgets.QWidget):
     def _load_vendors_for_rfq(self, rfq):
         """Load vendors assigned to the RFQ.
 
+        Vendor details are fetched in the background; the views are updated
+        when the query returns.
+
         Args:
             rfq: RFQ data dict with sg_vendors field
         """
+        # Drop the result of a load still running for a previously selected RFQ
+        if self._vendor_request is not None:
+            self._vendor_request.cancel()
+            self._vendor_request = None
+
         if not rfq:
             self.vendors_list = []
             self.vendor_category_view.set_vendors([])
@@ -1620,193 +2563,250 @@ class DeliveryTab(QtWidgets.QWidget):
                 logger.info(f"No vendors assigned to RFQ {rfq.get('code', 'Unknown')}")
                 return
 
-            # Fetch full vendor data for the assigned vendors
-            self.vendors_list = self.sg_session.get_vendors_by_ids(vendor_ids)
-            self.vendor_category_view.set_vendors(self.vendors_list)
-            self.package_share_widget.set_vendors(self.vendors_list)
-            logger.info(f"Loaded {len(self.vendors_list)} vendors for RFQ {rfq.get('code', 'Unknown')}")
+            # Fetch full vendor data for the assigned vendors off the GUI thread
+            self._vendor_request = get_async_client(self.sg_session).call_qt(
+                "get_vendors_by_ids", vendor_ids,
+                on_result=lambda vendors: self._on_vendors_loaded(rfq, vendors),
+                on_error=self._on_vendors_load_failed,
+                parent=self
+            )
+        except Exception as e:
+            self._on_vendors_load_failed(e)
+
+    def _on_vendors_loaded(self, rfq, vendors):
+        """Apply vendors fetched by _load_vendors_for_rfq.
 
-            # Load package tracking records for each vendor
+        Args:
+            rfq: RFQ the vendors were requested for
+            vendors: List of vendor dicts
+        """
+        if not self.current_rfq or self.current_rfq.get('id') != rfq.get('id'):
+            # Arrived after the user switched to another RFQ
+            logger.debug(f"Ignoring vendors loaded for RFQ {rfq.get('code', 'Unknown')}")
+            return
+        self._vendor_request = None
+        self.vendors_list = vendors
+        self.vendor_category_view.set_vendors(self.vendors_list)
+        self.package_share_widget.set_vendors(self.vendors_list)
+        logger.info(f"Loaded {len(self.vendors_list)} vendors for RFQ {rfq.get('code', 'Unknown')}")
+
+        # Load package tracking records for each vendor
+        try:
             self._load_package_tracking_for_vendors()
         except Exception as e:
-            logger.error(f"Error loading vendors for RFQ: {e}", exc_info=True)
-            self.vendors_list = []
-            self.vendor_category_view.set_vendors([])
-            self.package_share_widget.set_vendors([])
+            logger.error(f"Error loading package tracking for vendors: {e}", exc_info=True)
 
-    def _load_package_tracking_for_vendors(self):
+    def _on_vendors_load_failed(self, error):
+        """Reset the vendor views after a failed vendor load."""
+        self._vendor_request = None
+        logger.error(f"Error loading vendors for RFQ: {error}", exc_info=error)
+        self.vendors_list = []
+        self.vendor_category_view.set_vendors([])
+        self.package_share_widget.set_vendors([])
+
+    def _load_package_tracking_for_vendors(self, refresh_access=False):
         """Load PackageTracking records for each vendor and the current RFQ.
 
         This populates the vendor view with package cards that have been
         shared with each vendor, loaded from ShotGrid.
         Also checks Google Drive access and updates status to 'acc' if accessed.
+
+        The records of all vendors are fetched with a single query, and the
+        Drive checks and status updates run in the background; the vendor view
+        is filled in when they finish.
+
+        Args:
+            refresh_access: Ignore cached Google Drive access results
         """
-        print("=== _load_package_tracking_for_vendors called ===")
-        print(f"  current_rfq: {self.current_rfq}")
-        print(f"  vendors_list count: {len(self.vendors_list) if self.vendors_list else 0}")
         logger.info("=== _load_package_tracking_for_vendors called ===")
         logger.info(f"  current_rfq: {self.current_rfq}")
         logger.info(f"  vendors_list count: {len(self.vendors_list) if self.vendors_list else 0}")
 
+        # Drop the result of a load still running for a previously selected RFQ
+        if self._tracking_request is not None:
+            self._tracking_request.cancel()
+            self._tracking_request = None
+
         if not self.current_rfq or not self.vendors_list:
-            print("  Returning early: no current_rfq or no vendors_list")
             logger.warning("  Returning early: no current_rfq or no vendors_list")
             return
 
         rfq_id = self.current_rfq.get('id')
-        print(f"  rfq_id: {rfq_id}")
         logger.info(f"  rfq_id: {rfq_id}")
         if not rfq_id:
-            print("  Returning early: no rfq_id")
             logger.warning("  Returning early: no rfq_id")
             return
 
+        vendor_codes = {
+            vendor['id']: vendor.get('code', 'Unknown')
+            for vendor in self.vendors_list if vendor.get('id')
+        }
+
+        # Authenticate on the GUI thread: it may open the OAuth consent page
+        gdrive = get_gdrive_service()
+        if gdrive and gdrive.is_available and gdrive.get_activity_service() is None:
+            gdrive = None
+
         try:
-            # Clear existing tracking data
-            self.vendor_category_view.clear_all_tracking()
+            self._tracking_request = get_async_client(self.sg_session).call_qt(
+                self._fetch_package_tracking, rfq_id, vendor_codes, gdrive, refresh_access,
+                on_result=lambda tracking: self._on_package_tracking_loaded(rfq_id, tracking),
+                on_error=self._on_package_tracking_load_failed,
+                parent=self
+            )
+        except Exception as e:
+            self._on_package_tracking_load_failed(e)
 
-            # Get Google Drive service for access checking
-            gdrive = get_gdrive_service()
+    def _fetch_package_tracking(self, rfq_id, vendor_codes, gdrive, refresh_access=False):
+        """Fetch the RFQ's tracking records and group them by vendor (worker thread).
 
-            # Load tracking records for each vendor
-            for vendor in self.vendors_list:
-                vendor_id = vendor.get('id')
-                vendor_code = vendor.get('code', 'Unknown')
+        Args:
+            rfq_id: RFQ ID
+            vendor_codes: {vendor_id: vendor code} of the vendors shown in the view
+            gdrive: GoogleDriveService used for access checks, or None
+            refresh_access: Ignore cached Google Drive access results
 
-                if not vendor_id:
-                    continue
+        Returns:
+            dict: {vendor_code: [tracking records]}
+        """
+        tracking_records = self.sg_session.get_package_tracking_for_rfq(rfq_id)
+        tracking_records = self._check_and_update_access_status(
+            tracking_records, gdrive, refresh_access=refresh_access
+        )
 
-                # Get package tracking records for this vendor and RFQ
-                tracking_records = self.sg_session.get_package_tracking_for_vendor_and_rfq(
-                    vendor_id=vendor_id,
-                    rfq_id=rfq_id
-                )
+        tracking_by_vendor = {}
+        for record in tracking_records:
+            recipient = record.get('sg_recipient') or {}
+            vendor_code = vendor_codes.get(recipient.get('id'))
+            if vendor_code:
+                tracking_by_vendor.setdefault(vendor_code, []).append(record)
+        return tracking_by_vendor
 
-                if tracking_records:
-                    # Check Google Drive access for each record and update status if needed
-                    updated_records = self._check_and_update_access_status(
-                        tracking_records, gdrive
-                    )
-                    logger.info(f"Loaded {len(updated_records)} tracking records for vendor '{vendor_code}'")
-                    self.vendor_category_view.set_package_tracking_for_vendor(vendor_code, updated_records)
+    def _on_package_tracking_loaded(self, rfq_id, tracking_by_vendor):
+        """Show tracking records fetched by _load_package_tracking_for_vendors.
 
-        except Exception as e:
-            logger.error(f"Error loading package tracking records: {e}", exc_info=True)
+        Args:
+            rfq_id: RFQ the records were requested for
+            tracking_by_vendor: {vendor_code: [tracking records]}
+        """
+        self._tracking_request = None
+        if not self.current_rfq or self.current_rfq.get('id') != rfq_id:
+            return
 
-    def _check_and_update_access_status(self, tracking_records, gdrive):
+        self.vendor_category_view.clear_all_tracking()
+        for vendor_code, records in tracking_by_vendor.items():
+            logger.info(f"Loaded {len(records)} tracking records for vendor '{vendor_code}'")
+            self.vendor_category_view.set_package_tracking_for_vendor(vendor_code, records)
+
+    def _on_package_tracking_load_failed(self, error):
+        """Log a failed tracking load; the vendor view keeps its current cards."""
+        self._tracking_request = None
+        logger.error(f"Error loading package tracking records: {error}", exc_info=error)
+
+    def _check_and_update_access_status(self, tracking_records, gdrive, refresh_access=False):
         """Check Google Drive access for tracking records and update status.
 
         For each record with status 'dlvr' (Delivered), checks if the shared
         file has been accessed via Google Drive API. If accessed, updates
         the status to 'acc' (Accessed) in ShotGrid.
 
+        The Drive checks run in parallel (with cached results reused) and all
+        status changes are written back in one ShotGrid batch. Safe to call
+        from a worker thread.
+
         Args:
             tracking_records: List of PackageTracking dictionaries
             gdrive: GoogleDriveService instance
+            refresh_access: Ignore cached Google Drive access results
 
         Returns:
             List of tracking records with potentially updated statuses
         """
-        print(f"=== Checking Google Drive access for {len(tracking_records)} tracking records ===")
         logger.info(f"=== Checking Google Drive access for {len(tracking_records)} tracking records ===")
 
         if not gdrive:
-            print("Google Drive service is None")
             logger.warning("Google Drive service is None")
             return tracking_records
 
         if not gdrive.is_available:
-            print("Google Drive service not available (libraries not installed)")
             logger.warning("Google Drive service not available (libraries not installed)")
             return tracking_records
 
-        print(f"Google Drive service available: {gdrive.is_available}")
-        print(f"Google Drive authenticated: {gdrive.is_authenticated}")
-        logger.info(f"Google Drive service available: {gdrive.is_available}")
-        logger.info(f"Google Drive authenticated: {gdrive.is_authenticated}")
-
-        updated_records = []
-
-        for record in tracking_records:
-            package_name = record.get('code', 'Unknown')
-            current_status = record.get('sg_status_list', '')
-            print(f"--- Checking package '{package_name}' (current status: {current_status}) ---")
-            logger.info(f"--- Checking package '{package_name}' (current status: {current_status}) ---")
-
-            # Only check access for 'dlvr' (Delivered) status
-            # Don't re-check records that are already 'acc' or 'dwnld'
-            if current_status != 'dlvr':
-                print(f"  Skipping: status is not 'dlvr' (is '{current_status}')")
-                logger.info(f"  Skipping: status is not 'dlvr' (is '{current_status}')")
-                updated_records.append(record)
+        # Only check access for 'dlvr' (Delivered) status
+        # Don't re-check records that are already 'acc' or 'dwnld'
+        file_ids = {}
+        for index, record in enumerate(tracking_records):
+            if record.get('sg_status_list', '') != 'dlvr':
                 continue
 
-            # Extract share link URL
+            package_name = record.get('code', 'Unknown')
             share_link_data = record.get('sg_share_link', {})
-            print(f"  Share link data: {share_link_data}")
-            logger.info(f"  Share link data: {share_link_data}")
             if isinstance(share_link_data, dict):
                 share_url = share_link_data.get('url', '')
             else:
                 share_url = share_link_data or ''
 
             if not share_url:
-                print(f"  No share URL found for package '{package_name}'")
                 logger.warning(f"  No share URL found for package '{package_name}'")
-                updated_records.append(record)
                 continue
 
-            print(f"  Share URL: {share_url}")
-            logger.info(f"  Share URL: {share_url}")
-
-            # Extract file ID from URL
             file_id = gdrive.extract_file_id_from_url(share_url)
             if not file_id:
-                print(f"  Could not extract file ID from share link for record {record.get('id')}")
                 logger.warning(f"  Could not extract file ID from share link for record {record.get('id')}")
-                updated_records.append(record)
                 continue
+            file_ids[index] = file_id
 
-            print(f"  Extracted file ID: {file_id}")
-            logger.info(f"  Extracted file ID: {file_id}")
+        if not file_ids:
+            return tracking_records
 
-            # Check if file has been accessed
-            try:
-                print(f"  Calling check_file_accessed({file_id})...")
-                logger.info(f"  Calling check_file_accessed({file_id})...")
-                access_info = gdrive.check_file_accessed(file_id)
-                print(f"  Access check result: {access_info}")
-                logger.info(f"  Access check result: {access_info}")
-
-                if access_info and access_info.get('accessed'):
-                    # Update status to 'acc' (Accessed) in ShotGrid
-                    tracking_id = record.get('id')
-
-                    logger.info(f"  Package '{package_name}' HAS BEEN ACCESSED!")
-                    logger.info(f"    Access count: {access_info.get('access_count', 0)}")
-                    logger.info(f"    Last access time: {access_info.get('access_time')}")
-                    logger.info(f"  Updating ShotGrid status to 'acc'...")
-
-                    try:
-                        self.sg_session.update_package_tracking(
-                            tracking_id,
-                            {'sg_status_list': 'acc'}
-                        )
-                        # Update the local record to reflect the new status
-                        record = dict(record)  # Make a copy to avoid modifying original
-                        record['sg_status_list'] = 'acc'
-                        logger.info(f"  SUCCESS: Updated tracking record {tracking_id} status to 'acc'")
-                    except Exception as e:
-                        logger.error(f"  FAILED to update tracking status in ShotGrid: {e}")
-                else:
-                    logger.info(f"  Package '{package_name}' has NOT been accessed yet")
+        access_results = gdrive.check_files_accessed(
+            file_ids.values(), max_age=0 if refresh_access else None
+        )
 
-            except Exception as e:
-                logger.error(f"  ERROR checking Google Drive access for file {file_id}: {e}", exc_info=True)
+        accessed = []
+        for index, file_id in file_ids.items():
+            access_info = access_results.get(file_id)
+            if access_info is None:
+                logger.warning(f"  Could not check Google Drive access for file {file_id}")
+            elif access_info.get('accessed'):
+                record = tracking_records[index]
+                logger.info(f"  Package '{record.get('code', 'Unknown')}' HAS BEEN ACCESSED "
+                            f"({access_info.get('access_count', 0)} times, "
+                            f"last at {access_info.get('access_time')})")
+                accessed.append(index)
+
+        if not accessed:
+            logger.info("=== Finished checking Google Drive access: no new access ===")
+            return tracking_records
 
-            updated_records.append(record)
+        requests = [
+            {
+                "request_type": "update",
+                "entity_type": "CustomEntity14",
+                "entity_id": int(tracking_records[index]['id']),
+                "data": {'sg_status_list': 'acc'},
+            }
+            for index in accessed
+        ]
+        labels = [tracking_records[index].get('code') for index in accessed]
+        try:
+            outcome = self.sg_session.batch_write(requests, labels=labels)
+        except Exception as e:
+            logger.error(f"  FAILED to update tracking statuses in ShotGrid: {e}")
+            return tracking_records
+        failed = {failure["index"] for failure in outcome["failed"]}
+
+        updated_records = list(tracking_records)
+        for position, index in enumerate(accessed):
+            if position in failed:
+                continue
+            # Update the local record to reflect the new status
+            record = dict(updated_records[index])  # Make a copy to avoid modifying original
+            record['sg_status_list'] = 'acc'
+            updated_records[index] = record
 
-        logger.info(f"=== Finished checking Google Drive access ===")
+        logger.info(f"=== Finished checking Google Drive access: "
+                    f"{len(accessed) - len(failed)} record(s) updated to 'acc' ===")
         return updated_records
 
     def _load_vendors_for_project(self, project_id):
@@ -1863,6 +2863,12 @@ class DeliveryTab(QtWidgets.QWidget):
             self.vendor_category_view.add_package_to_vendor(package_id, package_name, vendor_code)
             self.status_label.setText(f"Assigned '{package_name}' to vendor '{vendor_code}'")
             logger.info(f"Package {package_id} assigned to vendor {vendor_code}")
+        elif config.get('vendor_shares'):
+            vendor_codes = [share['vendor'].get('code', 'Unknown') for share in config['vendor_shares']]
+            for vendor_code in vendor_codes:
+                self.vendor_category_view.add_package_to_vendor(package_id, package_name, vendor_code)
+            self.status_label.setText(f"Assigned '{package_name}' to {len(vendor_codes)} vendors")
+            logger.info(f"Package {package_id} assigned to vendors {vendor_codes}")
         else:
             self.status_label.setText(f"Share requested for package: {package_name}")
             logger.info(f"Share requested: {config}")
@@ -1919,6 +2925,12 @@ class DeliveryTab(QtWidgets.QWidget):
 
     def clear(self):
         """Clear the delivery tab data."""
+        if self._vendor_request is not None:
+            self._vendor_request.cancel()
+            self._vendor_request = None
+        if self._tracking_request is not None:
+            self._tracking_request.cancel()
+            self._tracking_request = None
         self.packages_list = []
         self.vendors_list = []
         self.package_share_widget.set_packages([])
@@ -7,9 +7,11 @@ import os
 try:
     from .logger import logger
     from .bid_selector_widget import CollapsibleGroupBox
+    from .thumbnail_cache import entity_version_token, get_thumbnail_cache, thumbnail_pixmap_key
 except (ImportError, ValueError, SystemError):
     logger = logging.getLogger("FFPackageManager")
     from bid_selector_widget import CollapsibleGroupBox
+    from thumbnail_cache import entity_version_token, get_thumbnail_cache, thumbnail_pixmap_key
 
 
 def create_trash_icon(size=24, color=QtGui.QColor(255, 255, 255, 200)):
@@ -66,56 +68,66 @@ class DocumentLoader(QtCore.QObject):
         """Clear the loading queue and reset loading keys."""
         self.load_queue.clear()
 
-    def load_image(self, url, cache_key, width, height):
-        """Queue an image for loading."""
+    def load_image(self, url, cache_key, width, height, version_id=None, version_token=None):
+        """Queue an image for loading.
+
+        With a version_id, the image is read from and saved to the disk
+        thumbnail cache under the version's identity and version_token.
+        """
         if cache_key in self.loading_keys:
             return
 
         self.loading_keys.add(cache_key)
-        self.load_queue.append((url, cache_key, width, height))
+        self.load_queue.append((url, cache_key, width, height, version_id, version_token))
         self._process_queue()
 
     def _process_queue(self):
         """Process the next items in the queue up to max_concurrent."""
         while self.load_queue and self.active_loads < self.max_concurrent:
             self.active_loads += 1
-            url, cache_key, width, height = self.load_queue.pop(0)
+            args = self.load_queue.pop(0)
 
-            thread = Thread(target=self._load_in_thread, args=(url, cache_key, width, height))
+            thread = Thread(target=self._load_in_thread, args=args)
             thread.daemon = True
             thread.start()
 
             self.active_threads.append(thread)
             self.active_threads = [t for t in self.active_threads if t.is_alive()]
 
-    def _load_in_thread(self, url, cache_key, width, height):
+    def _load_in_thread(self, url, cache_key, width, height, version_id=None, version_token=None):
         """Load image in background thread."""
         try:
-            with urllib.request.urlopen(url, timeout=5) as response:
-                image_bytes = response.read()
-                pixmap = QtGui.QPixmap()
-                pixmap.loadFromData(image_bytes)
-
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(
-                        width, height,
-                        QtCore.Qt.KeepAspectRatio,
-                        QtCore.Qt.SmoothTransformation
-                    )
-                    QtCore.QMetaObject.invokeMethod(
-                        self,
-                        "_emit_loaded",
-                        QtCore.Qt.QueuedConnection,
-                        QtCore.Q_ARG(str, cache_key),
-                        QtCore.Q_ARG(QtGui.QPixmap, scaled_pixmap)
-                    )
-                else:
-                    QtCore.QMetaObject.invokeMethod(
-                        self,
-                        "_emit_failed",
-                        QtCore.Qt.QueuedConnection,
-                        QtCore.Q_ARG(str, cache_key)
-                    )
+            cache = get_thumbnail_cache() if version_id else None
+            image_bytes = cache.get_cached_data(version_id, version=version_token) if cache else None
+            if image_bytes is None:
+                with urllib.request.urlopen(url, timeout=5) as response:
+                    image_bytes = response.read()
+                if cache:
+                    cache.cache_thumbnail(version_id, image_bytes, version=version_token)
+
+            pixmap = QtGui.QPixmap()
+            pixmap.loadFromData(image_bytes)
+
+            if not pixmap.isNull():
+                scaled_pixmap = pixmap.scaled(
+                    width, height,
+                    QtCore.Qt.KeepAspectRatio,
+                    QtCore.Qt.SmoothTransformation
+                )
+                QtCore.QMetaObject.invokeMethod(
+                    self,
+                    "_emit_loaded",
+                    QtCore.Qt.QueuedConnection,
+                    QtCore.Q_ARG(str, cache_key),
+                    QtCore.Q_ARG(QtGui.QPixmap, scaled_pixmap)
+                )
+            else:
+                QtCore.QMetaObject.invokeMethod(
+                    self,
+                    "_emit_failed",
+                    QtCore.Qt.QueuedConnection,
+                    QtCore.Q_ARG(str, cache_key)
+                )
         except Exception as e:
             logger.warning(f"Failed to load image from {url}: {e}")
             QtCore.QMetaObject.invokeMethod(
@@ -554,7 +566,7 @@ class DocumentFolderDetailView(QtWidgets.QWidget):
                     url = image_data.get('url') or image_data.get('local_path')
 
                 if url:
-                    cache_key = f"{url}_{width}x{height}"
+                    cache_key = thumbnail_pixmap_key(version, url, width, height)
                     if cache_key in self.image_cache:
                         label.setPixmap(self.image_cache[cache_key])
                         return
@@ -563,7 +575,10 @@ class DocumentFolderDetailView(QtWidgets.QWidget):
                     if cache_key not in self.label_cache:
                         self.label_cache[cache_key] = []
                     self.label_cache[cache_key].append(label)
-                    self.document_loader.load_image(url, cache_key, width, height)
+                    self.document_loader.load_image(
+                        url, cache_key, width, height,
+                        version.get('id'), entity_version_token(version)
+                    )
                     return
 
             self._show_document_icon(label, ext)
@@ -1179,7 +1194,7 @@ class DocumentFolderPaneWidget(QtWidgets.QWidget):
                     url = image_data.get('url') or image_data.get('local_path')
 
                 if url:
-                    cache_key = f"{url}_{width}x{height}"
+                    cache_key = thumbnail_pixmap_key(version, url, width, height)
                     if cache_key in self.shared_image_cache:
                         label.setPixmap(self.shared_image_cache[cache_key])
                         return
@@ -1188,7 +1203,10 @@ class DocumentFolderPaneWidget(QtWidgets.QWidget):
                     if cache_key not in self.label_cache:
                         self.label_cache[cache_key] = []
                     self.label_cache[cache_key].append(label)
-                    self.shared_document_loader.load_image(url, cache_key, width, height)
+                    self.shared_document_loader.load_image(
+                        url, cache_key, width, height,
+                        version.get('id'), entity_version_token(version)
+                    )
                     return
 
             self._show_document_icon(label, ext)
@@ -7,15 +7,13 @@ try:
     from .logger import logger
     from .sliding_overlay_panel import SlidingOverlayPanel
     from .bid_selector_widget import CollapsibleGroupBox
-    from .thumbnail_cache import ThumbnailCache
-    from .settings import AppSettings
+    from .thumbnail_cache import get_thumbnail_cache, reset_thumbnail_cache
     from .document_folder_pane_widget import DocumentFolderPaneWidget
 except (ImportError, ValueError, SystemError):
     logger = logging.getLogger("FFPackageManager")
     from sliding_overlay_panel import SlidingOverlayPanel
     from bid_selector_widget import CollapsibleGroupBox
-    from thumbnail_cache import ThumbnailCache
-    from settings import AppSettings
+    from thumbnail_cache import get_thumbnail_cache, reset_thumbnail_cache
     from document_folder_pane_widget import DocumentFolderPaneWidget
 
 
@@ -42,25 +40,19 @@ class SGWorker(QtCore.QObject):
             self.finished.emit(False, str(e))
 
 
-# Global document cache instance (shared across all widgets)
-_document_cache = None
-
-
 def get_document_cache():
-    """Get or create the global document cache instance."""
-    global _document_cache
-    if _document_cache is None:
-        settings = AppSettings()
-        cache_path = settings.get_thumbnail_cache_path()
-        max_age = settings.get_thumbnail_cache_max_age_days()
-        _document_cache = ThumbnailCache(cache_path, max_age)
-    return _document_cache
+    """Get the cache for document thumbnails.
+
+    Documents share the global thumbnail cache: a second instance on the same
+    folder would keep its own index and disk budget, and evict files the
+    other one still lists.
+    """
+    return get_thumbnail_cache()
 
 
 def reset_document_cache():
-    """Reset the global document cache instance."""
-    global _document_cache
-    _document_cache = None
+    """Reset the document cache (the global thumbnail cache)."""
+    reset_thumbnail_cache()
 
 
 class UploadDocumentTypeDialog(QtWidgets.QDialog):
@@ -182,7 +174,7 @@ class DocumentPoller(QtCore.QObject):
                 version_data = self.sg_session.sg.find_one(
                     'Version',
                     [['id', 'is', version_id]],
-                    ['code', 'image', 'sg_version_type', 'created_at', 'project', 'sg_uploaded_movie']
+                    ['code', 'image', 'sg_version_type', 'created_at', 'updated_at', 'project', 'sg_uploaded_movie']
                 )
 
                 if version_data:
@@ -2588,7 +2580,7 @@ class DocumentViewerWidget(QtWidgets.QWidget):
             version = self.sg_session.sg.find_one(
                 'Version',
                 [['id', 'is', version['id']]],
-                ['code', 'image', 'sg_version_type', 'created_at', 'project', 'sg_uploaded_movie']
+                ['code', 'image', 'sg_version_type', 'created_at', 'updated_at', 'project', 'sg_uploaded_movie']
             )
 
             progress.close()
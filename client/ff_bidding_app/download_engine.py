@@ -0,0 +1,550 @@
+"""Concurrent download engine for package version attachments.
+
+Downloads ShotGrid version attachments on a pool of worker threads instead of
+one after another on the GUI thread:
+
+    engine = PackageDownloadEngine(sg_session, max_workers=4)
+    engine.add(version_id, package_folder / "plates")
+    engine.add(version_id, package_folder / "reference")   # same file, second folder
+    result = engine.run(progress_callback=on_progress)
+
+- Each (version, attachment field) pair is downloaded once. Further target
+  folders receive a hardlink (or a copy when linking is not possible) after
+  the first download finishes.
+- Files are streamed into ``<name>.<version id>.part`` and renamed on
+  completion, so versions with the same attachment name never share a partial
+  file. A retry, or a later run, resumes a partial file with an HTTP Range
+  request, as long as ``<name>.<version id>.part.json`` shows it belongs to the same attachment version
+  (and the server confirms it with If-Range). Completed files are checked
+  against the attachment size before they are renamed.
+- Failed downloads are retried with exponential backoff. Bytes counted by a
+  failed attempt are taken back out of the progress totals before the retry.
+- cancel() stops all workers at the next chunk boundary; partial files are
+  kept so the next run resumes them.
+- With a DownloadManifest, attachments that are unchanged on ShotGrid since
+  the last build are reused from disk instead of downloaded again.
+- With a MediaStore, attachments already downloaded for another package are
+  placed from the store, and new downloads are added to it.
+- The progress callback receives aggregate byte counts, throughput and ETA.
+
+The engine has no Qt dependency; PackagesTab drives it from a QThread.
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import shutil
+import threading
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+try:
+    from .download_manifest import DownloadManifest
+    from .file_hashing import sha256_file
+except ImportError:
+    from download_manifest import DownloadManifest
+    from file_hashing import sha256_file
+
+logger = logging.getLogger(__name__)
+
+
+class DownloadCancelled(RuntimeError):
+    """Raised inside a worker when the engine was cancelled."""
+
+
+class PackageDownloadEngine:
+    """Downloads version attachments concurrently into package folders."""
+
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_MAX_RETRIES = 3
+    # Delay before the first retry; doubled for every further attempt
+    DEFAULT_BACKOFF_SECONDS = 1.0
+    CHUNK_SIZE = 1024 * 1024
+    PART_SUFFIX = ".part"
+    # Next to a .part file: the attachment signature and HTTP validators it
+    # was downloaded with
+    PART_META_SUFFIX = ".part.json"
+    # Minimum interval between two progress callbacks
+    PROGRESS_INTERVAL = 0.25
+    REQUEST_TIMEOUT = 60
+
+    LINK_MODES = ("hardlink", "copy")
+
+    def __init__(self, client, max_workers: Optional[int] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+                 link_mode: Optional[str] = None,
+                 manifest: Optional[DownloadManifest] = None,
+                 store=None):
+        """Initialize the engine.
+
+        Args:
+            client: ShotgridClient used to resolve attachments
+            max_workers: Number of concurrent downloads. Defaults to
+                FF_DOWNLOAD_WORKERS or DEFAULT_MAX_WORKERS
+            max_retries: Retries per file after the first attempt fails
+            backoff_seconds: Delay before the first retry
+            link_mode: How extra target folders are populated, "hardlink"
+                (falls back to copy) or "copy". Defaults to
+                FF_DOWNLOAD_LINK_MODE or "hardlink"
+            manifest: Optional DownloadManifest of the package folder. Unchanged
+                attachments are reused from disk and the manifest is updated
+                and saved at the end of run()
+            store: Optional MediaStore shared between packages. Attachments
+                found in it are not downloaded; new downloads are added to it
+                and its size budget is enforced at the end of run()
+        """
+        self.client = client
+        if max_workers is None:
+            max_workers = int(os.environ.get("FF_DOWNLOAD_WORKERS", self.DEFAULT_MAX_WORKERS))
+        self.max_workers = max(1, int(max_workers))
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_seconds = backoff_seconds
+        link_mode = link_mode or os.environ.get("FF_DOWNLOAD_LINK_MODE", "hardlink")
+        if link_mode not in self.LINK_MODES:
+            raise ValueError(f"Invalid link mode {link_mode!r}, expected one of {self.LINK_MODES}")
+        self.link_mode = link_mode
+        self.manifest = manifest
+        self.store = store
+
+        # {(version_id, field_name): [target_dir, ...]} in insertion order
+        self._jobs: Dict[tuple, List[Path]] = {}
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._progress_callback = None
+        self._last_progress = 0.0
+        self._stats: Dict[str, Any] = {}
+
+    def add(self, version_id: int, target_dir, field_name: str = "sg_uploaded_movie"):
+        """Queue a version attachment for download into a folder.
+
+        Adding the same version and field again only adds another target folder.
+
+        Args:
+            version_id: Version ID
+            target_dir: Folder the file should end up in
+            field_name: Attachment field on the Version
+        """
+        targets = self._jobs.setdefault((int(version_id), field_name), [])
+        target_dir = Path(target_dir)
+        if target_dir not in targets:
+            targets.append(target_dir)
+
+    def cancel(self):
+        """Stop all downloads at the next chunk boundary."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self, progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Download every queued attachment and place it in its target folders.
+
+        Args:
+            progress_callback: Called from worker threads with a stats dict
+                (files_done, files_total, bytes_done, bytes_total,
+                bytes_resumed, bytes_per_sec, eta_seconds, current_file)
+
+        Returns:
+            dict with:
+                files: {version_id: path of the first placed file}
+                placed: {version_id: [every placed path]}
+                skipped: number of attachments reused from disk
+                from_store: number of attachments placed from the media store
+                failed: [{version_id, field_name, error}]
+                bytes_downloaded, elapsed, cancelled
+        """
+        self._progress_callback = progress_callback
+        started_at = time.monotonic()
+        self._stats = {
+            "files_done": 0,
+            "files_total": len(self._jobs),
+            "bytes_done": 0,
+            "bytes_total": 0,
+            "bytes_resumed": 0,
+            "bytes_per_sec": 0.0,
+            "eta_seconds": None,
+            "current_file": "",
+            "started_at": started_at,
+        }
+
+        result = {"files": {}, "placed": {}, "skipped": 0, "from_store": 0, "failed": [],
+                  "bytes_downloaded": 0, "elapsed": 0.0, "cancelled": False}
+        if not self._jobs:
+            return result
+
+        attachments = self._resolve_attachments()
+        with self._lock:
+            self._stats["bytes_total"] = sum(
+                (attachment or {}).get("size") or 0 for attachment in attachments.values()
+            )
+        self._report(force=True)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pkg-download"
+        ) as executor:
+            futures = {
+                executor.submit(self._run_job, key, targets, attachments.get(key)): key
+                for key, targets in self._jobs.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                version_id, field_name = futures[future]
+                try:
+                    paths, origin = future.result()
+                except DownloadCancelled:
+                    continue
+                except Exception as e:
+                    logger.error(f"Download of version {version_id} ({field_name}) failed: {e}")
+                    result["failed"].append({
+                        "version_id": version_id,
+                        "field_name": field_name,
+                        "error": str(e),
+                    })
+                    continue
+                if origin == "package":
+                    result["skipped"] += 1
+                elif origin == "store":
+                    result["from_store"] += 1
+                result["files"].setdefault(version_id, str(paths[0]))
+                result["placed"].setdefault(version_id, []).extend(str(path) for path in paths)
+
+        result["bytes_downloaded"] = self._stats["bytes_done"] - self._stats["bytes_resumed"]
+        result["elapsed"] = time.monotonic() - started_at
+        result["cancelled"] = self.is_cancelled()
+        if self.manifest is not None:
+            self.manifest.retain(DownloadManifest.make_key(*key) for key in self._jobs)
+            self.manifest.save()
+        if self.store is not None:
+            self.store.evict()
+            self.store.save()
+        self._report(force=True)
+        logger.info(
+            f"Placed {len(result['files'])}/{len(self._jobs)} attachment(s) "
+            f"({result['skipped']} unchanged, {result['from_store']} from media store), "
+            f"{result['bytes_downloaded']} bytes in {result['elapsed']:.1f}s"
+            f"{' (cancelled)' if result['cancelled'] else ''}"
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _resolve_attachments(self) -> Dict[tuple, Optional[Dict[str, Any]]]:
+        """Fetch the attachment dicts of all queued jobs, one query per field."""
+        by_field: Dict[str, List[int]] = {}
+        for version_id, field_name in self._jobs:
+            by_field.setdefault(field_name, []).append(version_id)
+
+        attachments = {}
+        for field_name, version_ids in by_field.items():
+            found = self.client.get_version_attachments(version_ids, field_name, with_details=True)
+            for version_id in version_ids:
+                attachments[(version_id, field_name)] = found.get(version_id)
+        return attachments
+
+    def _run_job(self, key, targets: List[Path], attachment: Optional[Dict[str, Any]]):
+        """Download one attachment and place it in all its target folders.
+
+        Returns:
+            Tuple of (placed paths, origin): origin is "package" when an
+            unchanged copy from the last build was reused, "store" when the
+            file came from the media store and None when it was downloaded
+        """
+        version_id, field_name = key
+        if self.is_cancelled():
+            raise DownloadCancelled()
+        if not attachment:
+            raise RuntimeError(f"No attachment in field {field_name}")
+
+        filename = attachment.get("name") or f"version_{version_id}_{field_name}"
+        first_path = Path(targets[0]) / filename
+
+        source = None
+        origin = None
+        if self.manifest is not None:
+            source = self.manifest.find_local_copy(version_id, field_name, attachment)
+            origin = "package" if source is not None else None
+        if source is None and self.store is not None:
+            source = self.store.lookup(attachment)
+            origin = "store" if source is not None else None
+        reused = source is not None
+
+        sha256 = None
+        if reused:
+            logger.debug(f"Unchanged since last build, reusing {source}")
+            if origin == "store":
+                sha256 = self.store.sha256_of(attachment)
+            size = source.stat().st_size
+            with self._lock:
+                self._stats["bytes_resumed"] += size
+            self._add_bytes(size, filename, count_total=not attachment.get("size"))
+        else:
+            attempt = 0
+            while True:
+                counted = {"bytes_done": 0, "bytes_resumed": 0, "bytes_total": 0}
+                try:
+                    sha256 = self._download(attachment, first_path, version_id, counted)
+                    break
+                except DownloadCancelled:
+                    raise
+                except Exception as e:
+                    self._uncount(counted)
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = self.backoff_seconds * (2 ** attempt)
+                    attempt += 1
+                    logger.warning(
+                        f"Download of {filename} failed ({e}), retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                    )
+                    if self._cancel_event.wait(delay):
+                        raise DownloadCancelled()
+            source = first_path
+            if self.store is not None:
+                self.store.add(attachment, first_path, sha256)
+
+        placed = []
+        for target_dir in targets:
+            dest_path = Path(target_dir) / filename
+            if origin == "store":
+                self.store.place(source, dest_path)
+            elif dest_path != source:
+                # A fresh download replaces whatever an older build left behind
+                self._place_copy(source, dest_path, replace=not reused)
+            placed.append(dest_path)
+
+        if self.manifest is not None:
+            self.manifest.record(version_id, field_name, attachment, sha256, placed)
+
+        with self._lock:
+            self._stats["files_done"] += 1
+            self._stats["current_file"] = filename
+        self._report(force=True)
+        return placed, origin
+
+    def _download(self, attachment: Dict[str, Any], file_path: Path, version_id: int,
+                  counted: Dict[str, int]) -> str:
+        """Download an attachment to file_path through a resumable .part file.
+
+        Args:
+            attachment: Attachment dict of the version
+            file_path: Final path of the file
+            version_id: Version the attachment belongs to; keeps the .part
+                files of same-named attachments apart
+            counted: Progress counts added by this attempt, for _uncount()
+
+        Returns:
+            SHA-256 hex digest of the downloaded file
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = file_path.with_name(f"{file_path.name}.{version_id}{self.PART_SUFFIX}")
+
+        sha256 = None
+        local_path = attachment.get("local_path")
+        if attachment.get("link_type") == "local" and local_path:
+            shutil.copy2(local_path, part_path)
+            self._add_bytes(os.path.getsize(part_path), file_path.name, counted=counted)
+        else:
+            url = self.client.get_attachment_download_url(attachment)
+            if url:
+                sha256 = self._stream(url, part_path, attachment, counted)
+            else:
+                # No direct URL; let shotgun_api3 download it in one go
+                self.client.sg.download_attachment(attachment, file_path=str(part_path))
+                self._add_bytes(os.path.getsize(part_path), file_path.name, counted=counted)
+
+        expected_size = attachment.get("size")
+        actual_size = part_path.stat().st_size
+        if expected_size and actual_size != expected_size:
+            self._discard_part(part_path)
+            raise RuntimeError(
+                f"Downloaded {file_path.name} has {actual_size} bytes, expected {expected_size}"
+            )
+
+        if sha256 is None:
+            sha256 = sha256_file(part_path)
+        os.replace(part_path, file_path)
+        self._part_meta_path(part_path).unlink(missing_ok=True)
+        return sha256
+
+    def _part_meta_path(self, part_path: Path) -> Path:
+        return part_path.with_name(part_path.name[:-len(self.PART_SUFFIX)] + self.PART_META_SUFFIX)
+
+    def _read_part_meta(self, part_path: Path) -> Optional[Dict[str, Any]]:
+        """Return what a .part file was downloaded from, or None if unknown."""
+        try:
+            with open(self._part_meta_path(part_path), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_part_meta(self, part_path: Path, meta: Dict[str, Any]):
+        try:
+            with open(self._part_meta_path(part_path), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except OSError as e:
+            logger.debug(f"Could not write {self._part_meta_path(part_path)}: {e}")
+
+    def _discard_part(self, part_path: Path):
+        """Delete a partial download and its metadata."""
+        part_path.unlink(missing_ok=True)
+        self._part_meta_path(part_path).unlink(missing_ok=True)
+
+    def _stream(self, url: str, part_path: Path, attachment: Dict[str, Any],
+                counted: Dict[str, int]) -> Optional[str]:
+        """Stream url into part_path, resuming from its current size.
+
+        Returns:
+            SHA-256 hex digest of the complete file, or None if it was not
+            computed while streaming
+        """
+        signature = DownloadManifest.attachment_signature(attachment)
+        meta = self._read_part_meta(part_path)
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        if offset and (meta is None or meta.get("signature") != signature):
+            # Left behind by another version of the attachment (or by an
+            # older build that didn't record one); resuming it would splice
+            # two different files together
+            logger.info(f"Discarding stale partial download {part_path.name}")
+            self._discard_part(part_path)
+            offset = 0
+
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            # The server sends the whole file instead if it changed since
+            etag = meta.get("etag")
+            validator = etag if etag and not etag.startswith("W/") else meta.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+        cookies = self.client.get_download_cookies()
+
+        with requests.get(url, headers=headers, cookies=cookies, stream=True,
+                          timeout=self.REQUEST_TIMEOUT) as response:
+            if response.status_code == 416 and offset:
+                # Nothing left to fetch: the part file is already complete
+                total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                if total.isdigit() and int(total) == offset:
+                    return None
+                self._discard_part(part_path)
+                raise RuntimeError("Partial file does not match the server copy, restarting")
+            response.raise_for_status()
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+            digest = hashlib.sha256()
+            if offset and response.status_code == 206:
+                mode = "ab"
+                with open(part_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                with self._lock:
+                    self._stats["bytes_resumed"] += offset
+                    counted["bytes_resumed"] += offset
+                self._add_bytes(offset, part_path.name, count_total=not attachment.get("size"),
+                                counted=counted)
+            else:
+                # Server ignored the Range header (or If-Range failed); start over
+                mode = "wb"
+                offset = 0
+                self._write_part_meta(part_path, {
+                    "signature": signature,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                })
+
+            if not attachment.get("size"):
+                length = response.headers.get("Content-Length")
+                if length and length.isdigit():
+                    with self._lock:
+                        self._stats["bytes_total"] += int(length)
+                        counted["bytes_total"] += int(length)
+
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    if self.is_cancelled():
+                        raise DownloadCancelled()
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+                        self._add_bytes(len(chunk), part_path.name, counted=counted)
+        return digest.hexdigest()
+
+    def _place_copy(self, source: Path, dest_path: Path, replace: bool = True):
+        """Put an already downloaded file into another folder.
+
+        Args:
+            source: Downloaded file
+            dest_path: Path the file should also appear at
+            replace: Overwrite an existing dest_path. When False, an existing
+                file of the same size is kept
+        """
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        if dest_path.exists():
+            if os.path.samefile(source, dest_path):
+                return
+            if not replace and dest_path.stat().st_size == source.stat().st_size:
+                return
+            dest_path.unlink()
+        if self.link_mode == "hardlink":
+            try:
+                os.link(source, dest_path)
+                return
+            except OSError as e:
+                logger.debug(f"Hardlink failed for {dest_path} ({e}), copying instead")
+        shutil.copy2(source, dest_path)
+
+    # ------------------------------------------------------------------
+    # Progress
+    # ------------------------------------------------------------------
+
+    def _add_bytes(self, count: int, current_file: str, count_total: bool = False,
+                   counted: Optional[Dict[str, int]] = None):
+        with self._lock:
+            self._stats["bytes_done"] += count
+            if count_total:
+                self._stats["bytes_total"] += count
+            if counted is not None:
+                counted["bytes_done"] += count
+                if count_total:
+                    counted["bytes_total"] += count
+            self._stats["current_file"] = current_file
+        self._report()
+
+    def _uncount(self, counted: Dict[str, int]):
+        """Take the progress counts of a failed attempt back out.
+
+        The retry counts the file again from scratch (resumed bytes included),
+        so leaving them in would count them twice.
+        """
+        with self._lock:
+            for name, count in counted.items():
+                self._stats[name] -= count
+
+    def _report(self, force: bool = False):
+        """Call the progress callback, throttled to PROGRESS_INTERVAL."""
+        if self._progress_callback is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_progress < self.PROGRESS_INTERVAL:
+                return
+            self._last_progress = now
+            stats = dict(self._stats)
+
+        elapsed = max(now - stats.pop("started_at"), 1e-6)
+        # Bytes already on disk from an earlier attempt don't count towards throughput
+        stats["bytes_per_sec"] = (stats["bytes_done"] - stats["bytes_resumed"]) / elapsed
+        remaining = stats["bytes_total"] - stats["bytes_done"]
+        if stats["bytes_per_sec"] > 0 and remaining > 0:
+            stats["eta_seconds"] = remaining / stats["bytes_per_sec"]
+        try:
+            self._progress_callback(stats)
+        except Exception as e:
+            logger.debug(f"Download progress callback failed: {e}")
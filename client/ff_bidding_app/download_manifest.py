@@ -0,0 +1,207 @@
+"""Local download manifest for incremental package rebuilds.
+
+Records, for every attachment downloaded into a package folder, which
+ShotGrid attachment it came from (attachment id, size, updated_at), its
+SHA-256, where it was placed and the modification time of each placed
+copy. When the package is rebuilt, PackageDownloadEngine asks the manifest
+for an up-to-date local copy before downloading, so only new or changed files
+are fetched again.
+
+The manifest lives inside the package folder as ``.ff_download_manifest.json``
+and is excluded from delivery archives.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DownloadManifest:
+    """Thread-safe record of the attachments downloaded into a package folder."""
+
+    FILENAME = ".ff_download_manifest.json"
+    FORMAT_VERSION = 1
+
+    def __init__(self, package_folder):
+        """Initialize the manifest and load it from the package folder.
+
+        Args:
+            package_folder: Root folder of the package
+        """
+        self.package_folder = Path(package_folder)
+        self.path = self.package_folder / self.FILENAME
+
+        self._lock = threading.Lock()
+        # {"<version_id>:<field_name>": entry dict}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def make_key(version_id: int, field_name: str) -> str:
+        """Create the manifest key for a version attachment field."""
+        return f"{int(version_id)}:{field_name}"
+
+    @staticmethod
+    def attachment_signature(attachment: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the attachment properties that identify its content."""
+        updated_at = attachment.get("updated_at")
+        if isinstance(updated_at, datetime):
+            updated_at = updated_at.isoformat()
+        return {
+            "attachment_id": attachment.get("id"),
+            "size": attachment.get("size"),
+            "updated_at": updated_at,
+        }
+
+    def get(self, version_id: int, field_name: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the entry for a version attachment, or None."""
+        with self._lock:
+            entry = self._entries.get(self.make_key(version_id, field_name))
+            return dict(entry) if entry else None
+
+    def find_local_copy(self, version_id: int, field_name: str,
+                        attachment: Dict[str, Any]) -> Optional[Path]:
+        """Find a local file that is still identical to the attachment on ShotGrid.
+
+        Args:
+            version_id: Version ID
+            field_name: Attachment field on the Version
+            attachment: Current attachment dict (with size/updated_at)
+
+        Returns:
+            Path of an existing, unchanged local copy, or None if the file must
+            be downloaded
+        """
+        entry = self.get(version_id, field_name)
+        if not entry or attachment.get("id") is None:
+            return None
+        for key, value in self.attachment_signature(attachment).items():
+            if entry.get(key) != value:
+                return None
+
+        for rel_path in entry.get("paths", []):
+            local_path = self.package_folder / rel_path
+            try:
+                if entry.get("size") is None or local_path.stat().st_size == entry["size"]:
+                    return local_path
+            except OSError:
+                continue
+        return None
+
+    def record(self, version_id: int, field_name: str, attachment: Dict[str, Any],
+               sha256: Optional[str], paths: Iterable[Path]):
+        """Record a downloaded (or reused) attachment and where it was placed.
+
+        Args:
+            version_id: Version ID
+            field_name: Attachment field on the Version
+            attachment: Attachment dict the file was downloaded from
+            sha256: Content hash, or None to keep the previously recorded one
+            paths: Every local path the file was placed at
+        """
+        key = self.make_key(version_id, field_name)
+        rel_paths = [self._relative(path) for path in paths]
+        entry = {
+            "version_id": int(version_id),
+            "field_name": field_name,
+            "name": attachment.get("name"),
+            "paths": rel_paths,
+            "recorded_at": datetime.now().isoformat(),
+        }
+        entry.update(self.attachment_signature(attachment))
+        if entry["size"] is None and rel_paths:
+            try:
+                entry["size"] = (self.package_folder / rel_paths[0]).stat().st_size
+            except OSError:
+                pass
+        with self._lock:
+            previous = self._entries.get(key) or {}
+            entry["sha256"] = sha256 or previous.get("sha256")
+            if sha256:
+                entry["mtime_ns"] = self._mtimes(rel_paths)
+            else:
+                # The kept hash only vouches for copies unchanged since it was taken
+                previous_mtimes = previous.get("mtime_ns") or {}
+                entry["mtime_ns"] = {rel_path: previous_mtimes[rel_path]
+                                     for rel_path in rel_paths if rel_path in previous_mtimes}
+            self._entries[key] = entry
+
+    def retain(self, keys: Iterable[str]) -> List[Dict[str, Any]]:
+        """Drop entries whose key is not in keys.
+
+        Args:
+            keys: Manifest keys still part of the package
+
+        Returns:
+            The dropped entries
+        """
+        keys = set(keys)
+        with self._lock:
+            dropped = [entry for key, entry in self._entries.items() if key not in keys]
+            self._entries = {key: entry for key, entry in self._entries.items() if key in keys}
+        return dropped
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Return copies of all entries."""
+        with self._lock:
+            return [dict(entry) for entry in self._entries.values()]
+
+    def paths(self) -> List[Path]:
+        """Return every local path recorded in the manifest."""
+        with self._lock:
+            return [
+                self.package_folder / rel_path
+                for entry in self._entries.values()
+                for rel_path in entry.get("paths", [])
+            ]
+
+    def save(self):
+        """Persist the manifest, replacing the file atomically."""
+        with self._lock:
+            document = {"version": self.FORMAT_VERSION, "entries": self._entries}
+            try:
+                self.package_folder.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(document, f, indent=2, default=str)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.warning(f"Failed to save download manifest: {e}")
+
+    def _load(self):
+        """Load the manifest from the package folder."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            if document.get("version") == self.FORMAT_VERSION:
+                self._entries = document.get("entries", {})
+                logger.debug(f"Loaded {len(self._entries)} download manifest entries from {self.path}")
+        except Exception as e:
+            logger.warning(f"Failed to load download manifest: {e}")
+            self._entries = {}
+
+    def _mtimes(self, rel_paths: Iterable[str]) -> Dict[str, int]:
+        """Return {rel_path: st_mtime_ns} of the files that exist."""
+        mtimes = {}
+        for rel_path in rel_paths:
+            try:
+                mtimes[rel_path] = (self.package_folder / rel_path).stat().st_mtime_ns
+            except OSError:
+                pass
+        return mtimes
+
+    def _relative(self, path) -> str:
+        """Return path relative to the package folder, in POSIX form."""
+        path = Path(path)
+        try:
+            return path.relative_to(self.package_folder).as_posix()
+        except ValueError:
+            return path.as_posix()
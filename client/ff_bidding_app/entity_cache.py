@@ -0,0 +1,201 @@
+"""Read-through entity cache for ShotgridClient.
+
+Caches single-entity reads keyed by (entity type, id, field set) with a TTL
+and LRU eviction. Writes made through the client's connection invalidate the
+written entity, the entities its data links to, and any cached entity whose
+fields link back to it, so cached reads never outlive a local change.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _iter_links(value):
+    """Yield (type, id) for every entity link dict found in a field value."""
+    if isinstance(value, dict):
+        if value.get("type") and value.get("id") is not None:
+            yield value["type"], value["id"]
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_links(item)
+
+
+class EntityCache:
+    """Thread-safe LRU cache of ShotGrid entity dicts with TTL and hit/miss counters."""
+
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_TTL_SECONDS = 300
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """Initialize the entity cache.
+
+        Args:
+            max_entries: Maximum number of cached reads before the least
+                recently used one is evicted
+            ttl_seconds: Maximum age of a cached read
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        # {(entity_type, entity_id, fields): (stored_at, entity_dict)}
+        self._entries: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(entity_type: str, entity_id: int, fields: Optional[Iterable[str]]) -> Tuple:
+        """Create the cache key for a read of the given fields of an entity."""
+        return entity_type, int(entity_id), tuple(sorted(set(fields or ())))
+
+    def get(self, entity_type: str, entity_id: int, fields: Optional[Iterable[str]]):
+        """Return a copy of the cached entity, or None on a miss.
+
+        Updates the hit/miss counters.
+        """
+        key = self.make_key(entity_type, entity_id, fields)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[0] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, entity_type: str, entity_id: int, fields: Optional[Iterable[str]],
+            entity: Optional[Dict[str, Any]]):
+        """Store the result of a read. None results are not cached."""
+        if entity is None:
+            return
+        key = self.make_key(entity_type, entity_id, fields)
+        with self._lock:
+            self._entries[key] = (time.time(), copy.deepcopy(entity))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_write(self, entity_type: str, entity_id: Optional[int] = None,
+                         data: Optional[Dict[str, Any]] = None):
+        """Drop every cached read affected by a create/update/delete.
+
+        Args:
+            entity_type: Type of the written entity
+            entity_id: ID of the written entity (None for creates)
+            data: Field values sent with the write; entities linked from
+                them may have reverse fields that changed
+        """
+        self.invalidate_writes([(entity_type, entity_id, data)])
+
+    def invalidate_writes(self, writes: Iterable[Tuple[str, Optional[int], Optional[Dict[str, Any]]]]):
+        """Invalidate several writes with a single pass over the cache.
+
+        Args:
+            writes: Iterable of (entity_type, entity_id, data) tuples, see invalidate_write()
+        """
+        # Entities whose own cached reads are stale
+        targets = set()
+        # Written entities; cached entities linking to them may show stale links
+        written = set()
+        for entity_type, entity_id, data in writes:
+            if entity_id is not None:
+                targets.add((entity_type, int(entity_id)))
+                written.add((entity_type, int(entity_id)))
+            for value in (data or {}).values():
+                targets.update((link_type, int(link_id)) for link_type, link_id in _iter_links(value))
+        if not targets:
+            return
+
+        with self._lock:
+            stale = [
+                key for key, (_, entity) in self._entries.items()
+                if key[:2] in targets or (written and any(
+                    (link_type, link_id) in written
+                    for value in entity.values()
+                    for link_type, link_id in _iter_links(value)
+                ))
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        """Drop all cached reads (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            dict with entries, hits, misses, hit_rate, evictions and invalidations
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class CacheInvalidatingConnection:
+    """Wraps a Shotgun connection so its writes invalidate an EntityCache.
+
+    Every attribute other than the write methods is delegated unchanged, so
+    callers (including tabs that use ``sg_session.sg`` directly) keep the
+    regular shotgun_api3 API.
+    """
+
+    def __init__(self, connection, cache: EntityCache):
+        self._connection = connection
+        self._cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def create(self, entity_type, data, *args, **kwargs):
+        result = self._connection.create(entity_type, data, *args, **kwargs)
+        self._cache.invalidate_write(entity_type, None, data)
+        return result
+
+    def update(self, entity_type, entity_id, data, *args, **kwargs):
+        result = self._connection.update(entity_type, entity_id, data, *args, **kwargs)
+        self._cache.invalidate_write(entity_type, entity_id, data)
+        return result
+
+    def delete(self, entity_type, entity_id):
+        result = self._connection.delete(entity_type, entity_id)
+        self._cache.invalidate_write(entity_type, entity_id)
+        return result
+
+    def revive(self, entity_type, entity_id):
+        result = self._connection.revive(entity_type, entity_id)
+        self._cache.invalidate_write(entity_type, entity_id)
+        return result
+
+    def batch(self, requests):
+        try:
+            return self._connection.batch(requests)
+        finally:
+            # A failed batch is rolled back, but invalidating is always safe
+            self._cache.invalidate_writes(
+                (request["entity_type"], request.get("entity_id"), request.get("data"))
+                for request in requests
+            )
@@ -0,0 +1,101 @@
+"""Parallel SHA-256 hashing of package files.
+
+hashlib releases the GIL while digesting large buffers, so hashing files on
+a thread pool scales with the number of cores (or the disk, whichever is
+slower). Small files are read with one large reusable buffer; big files
+are memory-mapped so their pages go straight from the page cache into the
+digest without being copied into Python bytes objects.
+"""
+
+import concurrent.futures
+import hashlib
+import logging
+import mmap
+import os
+from typing import Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Read size for buffered hashing
+HASH_BUFFER_SIZE = 8 * 1024 * 1024
+# Files at least this large are memory-mapped
+MMAP_MIN_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class HashingCancelled(RuntimeError):
+    """Raised when hash_files is cancelled."""
+
+
+def sha256_file(path) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_MIN_SIZE:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        for offset in range(0, size, HASH_BUFFER_SIZE):
+                            digest.update(view[offset:offset + HASH_BUFFER_SIZE])
+                    finally:
+                        view.release()
+                return digest.hexdigest()
+            except (OSError, ValueError) as e:
+                # Some file systems don't support mapping; fall back to reading
+                logger.debug(f"Could not memory-map {path}, reading instead: {e}")
+                digest = hashlib.sha256()
+                f.seek(0)
+
+        buffer = bytearray(min(HASH_BUFFER_SIZE, max(size, 1)))
+        view = memoryview(buffer)
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            digest.update(view[:count])
+    return digest.hexdigest()
+
+
+def hash_files(paths: Iterable, max_workers: Optional[int] = None,
+               progress_callback: Optional[Callable[[int, int], None]] = None,
+               is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, str]:
+    """Hash several files on a thread pool.
+
+    Args:
+        paths: Files to hash
+        max_workers: Hashing threads (default: DEFAULT_MAX_WORKERS)
+        progress_callback: Called with (files_done, files_total) after each file
+        is_cancelled: Callable checked after each file; hashing stops with
+            HashingCancelled when it returns True
+
+    Returns:
+        dict: {str(path): sha256 hex digest}. Files that could not be read
+        are left out and logged.
+    """
+    paths = [str(path) for path in paths]
+    results = {}
+    if not paths:
+        return results
+
+    max_workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(paths)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                               thread_name_prefix="sha256") as pool:
+        futures = {pool.submit(sha256_file, path): path for path in paths}
+        try:
+            for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except OSError as e:
+                    logger.error(f"Could not hash {path}: {e}")
+                if progress_callback:
+                    progress_callback(done, len(paths))
+                if is_cancelled and is_cancelled():
+                    raise HashingCancelled()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
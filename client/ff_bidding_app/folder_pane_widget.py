@@ -6,9 +6,11 @@ from threading import Thread
 try:
     from .logger import logger
     from .bid_selector_widget import CollapsibleGroupBox
+    from .thumbnail_cache import entity_version_token, get_thumbnail_cache, thumbnail_pixmap_key
 except (ImportError, ValueError, SystemError):
     logger = logging.getLogger("FFPackageManager")
     from bid_selector_widget import CollapsibleGroupBox
+    from thumbnail_cache import entity_version_token, get_thumbnail_cache, thumbnail_pixmap_key
 
 
 def create_trash_icon(size=24, color=QtGui.QColor(255, 255, 255, 200)):
@@ -66,7 +68,7 @@ class ImageLoader(QtCore.QObject):
         self.load_queue.clear()
         # Don't clear loading_keys for active loads, they'll clear themselves
 
-    def load_image(self, url, cache_key, width, height):
+    def load_image(self, url, cache_key, width, height, version_id=None, version_token=None):
         """Queue an image for loading.
 
         Args:
@@ -74,23 +76,26 @@ class ImageLoader(QtCore.QObject):
             cache_key: Unique key for caching
             width: Target width for scaling
             height: Target height for scaling
+            version_id: ShotGrid version ID; when given, the image is read
+                from and saved to the disk thumbnail cache
+            version_token: Version token of the image (see entity_version_token)
         """
         # Skip if already loading or queued
         if cache_key in self.loading_keys:
             return
 
         self.loading_keys.add(cache_key)
-        self.load_queue.append((url, cache_key, width, height))
+        self.load_queue.append((url, cache_key, width, height, version_id, version_token))
         self._process_queue()
 
     def _process_queue(self):
         """Process the next items in the queue up to max_concurrent."""
         while self.load_queue and self.active_loads < self.max_concurrent:
             self.active_loads += 1
-            url, cache_key, width, height = self.load_queue.pop(0)
+            args = self.load_queue.pop(0)
 
             # Load in background thread
-            thread = Thread(target=self._load_in_thread, args=(url, cache_key, width, height))
+            thread = Thread(target=self._load_in_thread, args=args)
             thread.daemon = True
             thread.start()
 
@@ -100,36 +105,42 @@ class ImageLoader(QtCore.QObject):
             # Clean up dead threads periodically
             self.active_threads = [t for t in self.active_threads if t.is_alive()]
 
-    def _load_in_thread(self, url, cache_key, width, height):
+    def _load_in_thread(self, url, cache_key, width, height, version_id=None, version_token=None):
         """Load image in background thread."""
         try:
-            with urllib.request.urlopen(url, timeout=5) as response:
-                image_bytes = response.read()
-                pixmap = QtGui.QPixmap()
-                pixmap.loadFromData(image_bytes)
-
-                if not pixmap.isNull():
-                    # Scale to fit
-                    scaled_pixmap = pixmap.scaled(
-                        width, height,
-                        QtCore.Qt.KeepAspectRatio,
-                        QtCore.Qt.SmoothTransformation
-                    )
-                    # Emit signal on main thread
-                    QtCore.QMetaObject.invokeMethod(
-                        self,
-                        "_emit_loaded",
-                        QtCore.Qt.QueuedConnection,
-                        QtCore.Q_ARG(str, cache_key),
-                        QtCore.Q_ARG(QtGui.QPixmap, scaled_pixmap)
-                    )
-                else:
-                    QtCore.QMetaObject.invokeMethod(
-                        self,
-                        "_emit_failed",
-                        QtCore.Qt.QueuedConnection,
-                        QtCore.Q_ARG(str, cache_key)
-                    )
+            cache = get_thumbnail_cache() if version_id else None
+            image_bytes = cache.get_cached_data(version_id, version=version_token) if cache else None
+            if image_bytes is None:
+                with urllib.request.urlopen(url, timeout=5) as response:
+                    image_bytes = response.read()
+                if cache:
+                    cache.cache_thumbnail(version_id, image_bytes, version=version_token)
+
+            pixmap = QtGui.QPixmap()
+            pixmap.loadFromData(image_bytes)
+
+            if not pixmap.isNull():
+                # Scale to fit
+                scaled_pixmap = pixmap.scaled(
+                    width, height,
+                    QtCore.Qt.KeepAspectRatio,
+                    QtCore.Qt.SmoothTransformation
+                )
+                # Emit signal on main thread
+                QtCore.QMetaObject.invokeMethod(
+                    self,
+                    "_emit_loaded",
+                    QtCore.Qt.QueuedConnection,
+                    QtCore.Q_ARG(str, cache_key),
+                    QtCore.Q_ARG(QtGui.QPixmap, scaled_pixmap)
+                )
+            else:
+                QtCore.QMetaObject.invokeMethod(
+                    self,
+                    "_emit_failed",
+                    QtCore.Qt.QueuedConnection,
+                    QtCore.Q_ARG(str, cache_key)
+                )
         except Exception as e:
             logger.warning(f"Failed to load image from {url}: {e}")
             QtCore.QMetaObject.invokeMethod(
@@ -697,8 +708,8 @@ class FolderDetailView(QtWidgets.QWidget):
                 label.setStyleSheet(label.styleSheet() + "color: #888; font-size: 10px;")
                 return
 
-            # Create cache key from URL and size
-            cache_key = f"{url}_{width}x{height}"
+            # Create cache key from the version's identity and size
+            cache_key = thumbnail_pixmap_key(version, url, width, height)
 
             # Check if already cached
             if cache_key in self.image_cache:
@@ -715,7 +726,10 @@ class FolderDetailView(QtWidgets.QWidget):
             self.label_cache[cache_key].append(label)
 
             # Queue for async loading
-            self.image_loader.load_image(url, cache_key, width, height)
+            self.image_loader.load_image(
+                url, cache_key, width, height,
+                version.get('id'), entity_version_token(version)
+            )
 
         except Exception as e:
             logger.error(f"Error loading thumbnail: {e}", exc_info=True)
@@ -816,14 +830,17 @@ class FolderDetailView(QtWidgets.QWidget):
                 continue
 
             # Create cache key
-            cache_key = f"{url}_{thumb_width - 4}x{thumb_height - 4}"
+            cache_key = thumbnail_pixmap_key(version, url, thumb_width - 4, thumb_height - 4)
 
             # Skip if already cached
             if cache_key in self.image_cache:
                 continue
 
             # Queue for background loading
-            self.image_loader.load_image(url, cache_key, thumb_width - 4, thumb_height - 4)
+            self.image_loader.load_image(
+                url, cache_key, thumb_width - 4, thumb_height - 4,
+                version.get('id'), entity_version_token(version)
+            )
 
     def _get_version_type(self, version):
         """Get the type category for a version."""
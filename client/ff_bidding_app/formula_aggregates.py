@@ -0,0 +1,193 @@
+"""
+Formula Aggregates
+Running SUM/COUNT/MIN/MAX aggregates over large ranges.
+
+Totals like =SUM('Shot Costs'!Y1:Y5000) would otherwise read every cell of
+the range on each recalculation. On the native fast path (see
+formula_fastpath) the evaluator keeps a RunningAggregate per large range:
+the range's values are read once, changed cells are marked as they change
+and folded in by delta on the next read, so a total costs O(changed cells)
+instead of O(range):
+
+    aggregate = RunningAggregate(0, 24, 4999, 24, read)
+    aggregate.mark(9, 24)
+    aggregate.refresh(read)     # re-reads Y10 only
+    aggregate.total
+
+read(row, col) returns the numeric value of a cell. The minimum and maximum
+are kept up to date too; when the current minimum (or maximum) is replaced
+by a larger (smaller) value they are recomputed from the stored values on
+next use.
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Ranges smaller than this are cheap to read and aren't cached
+RUNNING_AGGREGATE_MIN_CELLS = 64
+
+
+class RunningAggregate:
+    """Sum, count, minimum and maximum of a range, updated by deltas."""
+
+    def __init__(self, start_row: int, start_col: int, end_row: int, end_col: int,
+                 read: Callable[[int, int], float]):
+        """Read the range's values.
+
+        Args:
+            start_row: First row of the range (0-based)
+            start_col: First column of the range (0-based)
+            end_row: Last row of the range
+            end_col: Last column of the range
+            read: Function returning the numeric value of (row, col)
+        """
+        self.start_row = start_row
+        self.start_col = start_col
+        self.end_row = end_row
+        self.end_col = end_col
+        self._width = end_col - start_col + 1
+        self.values: List[float] = [
+            read(row, col)
+            for row in range(start_row, end_row + 1)
+            for col in range(start_col, end_col + 1)
+        ]
+        self._pending = set()
+        self._total = None
+        self._minimum = None
+        self._maximum = None
+        # Deltas applied since the total was last summed from scratch
+        self._updates = 0
+
+    def __contains__(self, cell):
+        row, col = cell
+        return self.start_row <= row <= self.end_row and self.start_col <= col <= self.end_col
+
+    @property
+    def count(self) -> int:
+        """Number of values (empty cells count as 0, as in _get_range_values)."""
+        return len(self.values)
+
+    @property
+    def total(self) -> float:
+        """Sum of the values."""
+        if self._total is None:
+            self._total = sum(self.values)
+            self._updates = 0
+        return self._total
+
+    def minimum(self) -> Optional[float]:
+        """Smallest value, or None for an empty range."""
+        if self._minimum is None and self.values:
+            self._minimum = min(self.values)
+        return self._minimum
+
+    def maximum(self) -> Optional[float]:
+        """Largest value, or None for an empty range."""
+        if self._maximum is None and self.values:
+            self._maximum = max(self.values)
+        return self._maximum
+
+    def mark(self, row: int, col: int):
+        """Mark a cell as changed; it is re-read on the next refresh."""
+        if (row, col) in self:
+            self._pending.add((row, col))
+
+    def refresh(self, read: Callable[[int, int], float]):
+        """Re-read the changed cells and update the aggregates by delta."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, set()
+        for row, col in pending:
+            position = (row - self.start_row) * self._width + (col - self.start_col)
+            self._update(position, read(row, col))
+
+    def _update(self, position: int, new):
+        old = self.values[position]
+        if old == new:
+            return
+        self.values[position] = new
+
+        if self._total is not None:
+            if not (math.isfinite(old) and math.isfinite(new)):
+                self._total = None
+            else:
+                self._total += new - old
+                self._updates += 1
+                # Re-sum now and then so float error from deltas can't build up
+                if self._updates > len(self.values):
+                    self._total = None
+
+        if self._minimum is not None:
+            if new <= self._minimum:
+                self._minimum = new
+            elif old == self._minimum:
+                self._minimum = None
+        if self._maximum is not None:
+            if new >= self._maximum:
+                self._maximum = new
+            elif old == self._maximum:
+                self._maximum = None
+
+
+class RunningAggregateCache:
+    """RunningAggregates of one evaluator, keyed by range.
+
+    Keys are (sheet, start_row, start_col, end_row, end_col) with sheet None
+    for the evaluator's own sheet, as in formula_lookup.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._aggregates: Dict[tuple, RunningAggregate] = {}
+        self.builds = 0
+        self.hits = 0
+
+    def __len__(self):
+        return len(self._aggregates)
+
+    def get(self, key: tuple) -> Optional[RunningAggregate]:
+        """Return the aggregate of a range, or None if it isn't built."""
+        aggregate = self._aggregates.get(key)
+        if aggregate is not None:
+            self.hits += 1
+        return aggregate
+
+    def put(self, key: tuple, aggregate: RunningAggregate):
+        """Store the aggregate of a range."""
+        self._aggregates[key] = aggregate
+        self.builds += 1
+
+    def mark(self, sheet: Optional[str], cells: List[Tuple[int, int]]):
+        """Mark changed cells in every aggregate of a sheet.
+
+        Args:
+            sheet: Sheet of the cells (None for the evaluator's own sheet)
+            cells: (row, col) of the changed cells
+        """
+        if not self._aggregates or not cells:
+            return
+        for key, aggregate in self._aggregates.items():
+            if key[0] == sheet:
+                for row, col in cells:
+                    aggregate.mark(row, col)
+
+    def mark_region(self, sheet: Optional[str], top: int, left: int, bottom: int, right: int):
+        """Mark a changed rectangle of a sheet (e.g. from dataChanged).
+
+        Aggregates mostly covered by the rectangle are dropped and rebuilt
+        instead.
+        """
+        for key in [key for key in self._aggregates if key[0] == sheet]:
+            aggregate = self._aggregates[key]
+            rows = range(max(top, aggregate.start_row), min(bottom, aggregate.end_row) + 1)
+            cols = range(max(left, aggregate.start_col), min(right, aggregate.end_col) + 1)
+            if len(rows) * len(cols) * 2 > aggregate.count:
+                del self._aggregates[key]
+                continue
+            for row in rows:
+                for col in cols:
+                    aggregate.mark(row, col)
+
+    def clear(self):
+        """Drop every aggregate."""
+        self._aggregates.clear()
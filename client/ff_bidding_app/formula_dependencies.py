@@ -0,0 +1,256 @@
+"""
+Formula Dependencies
+Dependency graph between spreadsheet formulas and the cells they read.
+
+FormulaEvaluator parses every formula once into its precedents (the cells and
+ranges it reads) and records them here. The graph keeps the reverse index
+(which formulas read a given cell), so an edit only recalculates the formulas
+downstream of it, in dependency order:
+
+    graph.set_precedents((4, 2), precedents)
+    order, cyclic = graph.recalculation_order([(None, 0, 2)])
+
+Formula cells are (row, col) tuples of the evaluator's own sheet. Precedents
+are keyed by (sheet, row, col), where sheet is None for the evaluator's own
+sheet and the sheet name for cross-sheet references. Precedents are dicts:
+
+    {
+        "cells": {(sheet, row, col), ...},
+        "ranges": [(sheet, start_row, start_col, end_row, end_col), ...],
+        "volatile": bool,
+    }
+
+end_row is None for whole-column ranges (e.g. Y:Y). Volatile formulas (e.g.
+INDIRECT) can read any cell and are recalculated on every change.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Ranges up to this many cells are indexed cell by cell; larger ones (totals
+# over whole columns) are indexed per column and checked by row span
+RANGE_EXPAND_LIMIT = 256
+
+
+def new_precedents() -> dict:
+    """Return an empty precedents dict."""
+    return {"cells": set(), "ranges": [], "volatile": False}
+
+
+class FormulaDependencyGraph:
+    """Precedents of every formula of a sheet, with a reverse index of dependents."""
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        # (row, col) -> precedents dict
+        self._precedents: Dict[Tuple[int, int], dict] = {}
+        # (sheet, row, col) -> {(row, col) of formulas reading it}
+        self._cell_dependents: Dict[tuple, Set[Tuple[int, int]]] = {}
+        # (sheet, col) -> {(row, col) of formula: [(start_row, end_row), ...]}
+        self._column_spans: Dict[tuple, Dict[Tuple[int, int], list]] = {}
+        self._volatile: Set[Tuple[int, int]] = set()
+        # Cells on a reference cycle; None until computed
+        self._cyclic: Optional[Set[Tuple[int, int]]] = None
+
+    def __len__(self):
+        return len(self._precedents)
+
+    def __contains__(self, cell):
+        return cell in self._precedents
+
+    def clear(self):
+        """Remove every formula from the graph."""
+        self._precedents.clear()
+        self._cell_dependents.clear()
+        self._column_spans.clear()
+        self._volatile.clear()
+        self._cyclic = None
+
+    def precedents(self, cell: Tuple[int, int]) -> Optional[dict]:
+        """Return the precedents recorded for a formula cell, or None."""
+        return self._precedents.get(cell)
+
+    def set_precedents(self, cell: Tuple[int, int], precedents: dict):
+        """Record (or replace) the precedents of a formula cell.
+
+        Args:
+            cell: (row, col) of the formula
+            precedents: Precedents dict (see module docstring)
+        """
+        self.remove(cell)
+        self._precedents[cell] = precedents
+
+        for key in precedents["cells"]:
+            self._cell_dependents.setdefault(key, set()).add(cell)
+
+        for sheet, start_row, start_col, end_row, end_col in precedents["ranges"]:
+            size = None if end_row is None else (end_row - start_row + 1) * (end_col - start_col + 1)
+            if size is not None and size <= RANGE_EXPAND_LIMIT:
+                for row in range(start_row, end_row + 1):
+                    for col in range(start_col, end_col + 1):
+                        self._cell_dependents.setdefault((sheet, row, col), set()).add(cell)
+            else:
+                for col in range(start_col, end_col + 1):
+                    spans = self._column_spans.setdefault((sheet, col), {})
+                    spans.setdefault(cell, []).append((start_row, end_row))
+
+        if precedents["volatile"]:
+            self._volatile.add(cell)
+        self._cyclic = None
+
+    def remove(self, cell: Tuple[int, int]):
+        """Remove a formula cell from the graph (no-op if it isn't in it)."""
+        precedents = self._precedents.pop(cell, None)
+        if precedents is None:
+            return
+
+        for key in precedents["cells"]:
+            self._discard_cell_dependent(key, cell)
+
+        for sheet, start_row, start_col, end_row, end_col in precedents["ranges"]:
+            size = None if end_row is None else (end_row - start_row + 1) * (end_col - start_col + 1)
+            if size is not None and size <= RANGE_EXPAND_LIMIT:
+                for row in range(start_row, end_row + 1):
+                    for col in range(start_col, end_col + 1):
+                        self._discard_cell_dependent((sheet, row, col), cell)
+            else:
+                for col in range(start_col, end_col + 1):
+                    spans = self._column_spans.get((sheet, col))
+                    if spans is not None:
+                        spans.pop(cell, None)
+                        if not spans:
+                            del self._column_spans[(sheet, col)]
+
+        self._volatile.discard(cell)
+        self._cyclic = None
+
+    def _discard_cell_dependent(self, key, cell):
+        dependents = self._cell_dependents.get(key)
+        if dependents is not None:
+            dependents.discard(cell)
+            if not dependents:
+                del self._cell_dependents[key]
+
+    def direct_dependents(self, sheet: Optional[str], row: int, col: int) -> Set[Tuple[int, int]]:
+        """Return the formula cells that read a cell directly.
+
+        Volatile formulas are not included.
+
+        Args:
+            sheet: Sheet of the cell (None for this graph's own sheet)
+            row: Row index of the cell
+            col: Column index of the cell
+
+        Returns:
+            Set of (row, col) formula cells
+        """
+        dependents = set(self._cell_dependents.get((sheet, row, col), ()))
+        for cell, spans in self._column_spans.get((sheet, col), {}).items():
+            for start_row, end_row in spans:
+                if start_row <= row and (end_row is None or row <= end_row):
+                    dependents.add(cell)
+                    break
+        return dependents
+
+    def recalculation_order(self, changed: Iterable[tuple]) -> Tuple[List[Tuple[int, int]], Set[Tuple[int, int]]]:
+        """Return the formulas to recalculate after cells changed.
+
+        Args:
+            changed: (sheet, row, col) of the changed cells. Changed formula
+                cells of this sheet are included in the result themselves.
+
+        Returns:
+            (order, cyclic): the affected formula cells with every formula
+            after the formulas it reads, and the subset of them that is part
+            of a reference cycle
+        """
+        seeds = set(self._volatile)
+        for sheet, row, col in changed:
+            if sheet is None and (row, col) in self._precedents:
+                seeds.add((row, col))
+            seeds |= self.direct_dependents(sheet, row, col)
+
+        # Depth-first search over dependents; reversed post-order is a
+        # topological order of the dirty subgraph
+        order = []
+        visited = set()
+        for seed in seeds:
+            if seed in visited:
+                continue
+            visited.add(seed)
+            stack = [(seed, iter(self.direct_dependents(None, *seed)))]
+            while stack:
+                cell, dependents = stack[-1]
+                for dependent in dependents:
+                    if dependent not in visited:
+                        visited.add(dependent)
+                        stack.append((dependent, iter(self.direct_dependents(None, *dependent))))
+                        break
+                else:
+                    stack.pop()
+                    order.append(cell)
+        order.reverse()
+
+        cyclic = self.cyclic_cells()
+        return order, {cell for cell in order if cell in cyclic} if cyclic else set()
+
+    def is_cyclic(self, cell: Tuple[int, int]) -> bool:
+        """Return True if a formula cell is part of a reference cycle."""
+        return cell in self.cyclic_cells()
+
+    def cyclic_cells(self) -> Set[Tuple[int, int]]:
+        """Return every formula cell that is part of a reference cycle."""
+        if self._cyclic is None:
+            self._cyclic = self._find_cycles()
+        return self._cyclic
+
+    def _find_cycles(self) -> Set[Tuple[int, int]]:
+        """Find the cells on reference cycles (iterative Tarjan SCC)."""
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        cyclic = set()
+        counter = 0
+
+        for root in self._precedents:
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.direct_dependents(None, *root)))]
+
+            while work:
+                cell, dependents = work[-1]
+                descended = False
+                for dependent in dependents:
+                    if dependent not in index:
+                        index[dependent] = low[dependent] = counter
+                        counter += 1
+                        stack.append(dependent)
+                        on_stack.add(dependent)
+                        work.append((dependent, iter(self.direct_dependents(None, *dependent))))
+                        descended = True
+                        break
+                    if dependent in on_stack:
+                        low[cell] = min(low[cell], index[dependent])
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[cell])
+                if low[cell] == index[cell]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == cell:
+                            break
+                    if len(component) > 1 or cell in self.direct_dependents(None, *cell):
+                        cyclic.update(component)
+
+        return cyclic
@@ -1,11 +1,16 @@
 """
 Formula Evaluator
 Evaluates Google Sheets/Excel-style formulas for calculated fields in tables.
-Uses the 'formulas' library for full Excel formula compatibility.
+Uses the 'formulas' library for full Excel formula compatibility; common
+formulas are evaluated natively first (see formula_fastpath).
 """
 
+import math
+import os
 import re
-from typing import Any, Dict, Optional, Set, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from PySide6 import QtCore
 
 try:
@@ -19,6 +24,238 @@ except ImportError:
     import logging
     logger = logging.getLogger("FFPackageManager")
 
+try:
+    from .formula_dependencies import FormulaDependencyGraph, new_precedents
+except ImportError:
+    from formula_dependencies import FormulaDependencyGraph, new_precedents
+
+try:
+    from .formula_fastpath import NativeFallback, compile_native_formula
+except ImportError:
+    from formula_fastpath import NativeFallback, compile_native_formula
+
+try:
+    from .formula_lookup import LookupIndex, LookupIndexCache
+except ImportError:
+    from formula_lookup import LookupIndex, LookupIndexCache
+
+try:
+    from .formula_aggregates import RUNNING_AGGREGATE_MIN_CELLS, RunningAggregate, RunningAggregateCache
+except ImportError:
+    from formula_aggregates import RUNNING_AGGREGATE_MIN_CELLS, RunningAggregate, RunningAggregateCache
+
+
+# Reference patterns used to extract a formula's precedents. Like
+# _preprocess_formula, they are applied from most to least specific and each
+# match is blanked out so later patterns don't see it again.
+_STRING_LITERAL_RE = re.compile(r'"[^"]*"')
+_SHEET_RANGE_QUOTED_RE = re.compile(r"'([^']+)'!\$?([A-Z]+)\$?(\d*):\$?([A-Z]+)\$?(\d*)")
+_SHEET_RANGE_UNQUOTED_RE = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)!\$?([A-Z]+)\$?(\d*):\$?([A-Z]+)\$?(\d*)")
+_SHEET_REF_QUOTED_RE = re.compile(r"'([^']+)'!(\$?[A-Z]+\$?\d+|[a-zA-Z_][a-zA-Z0-9_]*(?:\.\d+)?)\b")
+_SHEET_REF_UNQUOTED_RE = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)!(\$?[A-Z]+\$?\d+|[a-zA-Z_][a-zA-Z0-9_]*(?:\.\d+)?)\b")
+_RANGE_RE = re.compile(r"(?<![A-Za-z0-9_.!'])\$?([A-Z]+)\$?(\d*):\$?([A-Z]+)\$?(\d*)(?![A-Za-z0-9_(])")
+_CELL_REF_RE = re.compile(r"(?<![A-Za-z0-9_.!'])\$?([A-Z]+)\$?(\d+)(?![A-Za-z0-9_(.])")
+_HEADER_ROW_REF_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\.(\d+)\b')
+_FIELD_ONLY_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b(?!\s*[\(\.])')
+# Functions whose result can depend on any cell. ROW() and COLUMN() are not
+# listed: _preprocess_formula replaces them with the formula's own position.
+_VOLATILE_RE = re.compile(r'\b(INDIRECT|OFFSET|NOW|TODAY|RAND|RANDBETWEEN)\s*\(', re.IGNORECASE)
+
+# A1 cell reference or range in a preprocessed formula (not part of a name,
+# sheet reference or function call)
+_NORMALIZE_REF_RE = re.compile(
+    r"(?<![A-Za-z0-9_.!'$])(\$?[A-Z]{1,3}\$?\d+)(?::(\$?[A-Z]{1,3}\$?\d+))?(?![A-Za-z0-9_(!])"
+)
+
+
+class CompiledFormulaCache:
+    """LRU cache of formulas compiled by the 'formulas' library.
+
+    Keys are normalized formulas (see FormulaEvaluator._normalize_formula), so
+    the same formula used on thousands of rows is parsed and compiled once.
+    """
+
+    def __init__(self, max_size=2048):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of compiled formulas kept
+        """
+        self.max_size = max_size
+        self._compiled = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._compiled)
+
+    def get(self, key):
+        """Return (found, compiled) for a normalized formula.
+
+        compiled is None for formulas that failed to parse.
+        """
+        if key in self._compiled:
+            self._compiled.move_to_end(key)
+            self.hits += 1
+            return True, self._compiled[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key, compiled):
+        """Store a compiled formula (None for a parse failure)."""
+        self._compiled[key] = compiled
+        self._compiled.move_to_end(key)
+        while len(self._compiled) > self.max_size:
+            self._compiled.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all compiled formulas and reset the counters."""
+        self._compiled.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit-rate counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._compiled),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared by all evaluators: compiled formulas don't depend on the sheet
+_compiled_formula_cache = None
+
+
+def get_compiled_formula_cache() -> CompiledFormulaCache:
+    """Get the shared compiled formula cache.
+
+    FF_FORMULA_CACHE_SIZE overrides its size.
+    """
+    global _compiled_formula_cache
+    if _compiled_formula_cache is None:
+        try:
+            max_size = int(os.environ.get("FF_FORMULA_CACHE_SIZE", 2048))
+        except ValueError:
+            max_size = 2048
+        _compiled_formula_cache = CompiledFormulaCache(max_size)
+    return _compiled_formula_cache
+
+
+# Cells being evaluated on this thread, across all evaluators. A formula
+# reading another sheet evaluates that sheet's formulas through its own
+# evaluator, so cycles running through several sheets are invisible to each
+# sheet's dependency graph; this catches them (see FormulaEvaluator.evaluate).
+_evaluation_state = threading.local()
+
+
+def _get_evaluation_state():
+    """Return this thread's evaluation stack and set of cells found on a cycle."""
+    if not hasattr(_evaluation_state, 'stack'):
+        _evaluation_state.stack = []
+        _evaluation_state.circular = set()
+    return _evaluation_state
+
+
+class _NativeContext:
+    """Cell access for formula_fastpath programs.
+
+    Mirrors what _preprocess_formula and _get_range_values feed the 'formulas'
+    library, and raises NativeFallback wherever they would produce an error
+    or a text marker.
+    """
+
+    __slots__ = ("evaluator", "row")
+
+    def __init__(self, evaluator, row):
+        self.evaluator = evaluator
+        self.row = row
+
+    def _sheet_model(self, sheet):
+        _, model = self.evaluator._get_sheet_model_case_insensitive(sheet)
+        if model is None:
+            raise NativeFallback(f"Sheet not found: {sheet}")
+        return model
+
+    def cell(self, sheet, ref):
+        if sheet is None:
+            return self.evaluator.get_cell_value(ref)
+        value = self.evaluator._get_cell_value_from_model(ref, self._sheet_model(sheet))
+        if value is None or value == "":
+            return 0
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                raise NativeFallback(f"Text value in {sheet}!{ref}")
+        return value
+
+    def header(self, sheet, field, row_number):
+        if self.row is None:
+            # Header references are only resolved for a known cell
+            raise NativeFallback("Header reference without a current row")
+        model = self.evaluator.table_model if sheet is None else self._sheet_model(sheet)
+        ref = field if row_number is None else f"{field}.{row_number}"
+        standard_ref = self.evaluator.resolve_header_reference(ref, current_row=self.row, model=model)
+        if not standard_ref:
+            raise NativeFallback(f"Could not resolve {ref}")
+        return self.cell(sheet, standard_ref)
+
+    def _range_model(self, sheet):
+        # Ranges look sheets up by exact name, like _get_range_values
+        model = self.evaluator.table_model if sheet is None else self.evaluator.sheet_models.get(sheet)
+        if model is None:
+            raise NativeFallback(f"Sheet not found: {sheet}")
+        return model
+
+    def aggregate(self, sheet, start_row, start_col, end_row, end_col):
+        evaluator = self.evaluator
+        model = self._range_model(sheet)
+        if end_row is None:
+            end_row = model.rowCount() - 1
+
+        def read(row, col):
+            return evaluator._get_cell_value_for_range(evaluator.get_cell_reference(row, col), model, sheet)
+
+        if (end_row - start_row + 1) * (end_col - start_col + 1) < RUNNING_AGGREGATE_MIN_CELLS:
+            return RunningAggregate(start_row, start_col, end_row, end_col, read)
+
+        key = (sheet, start_row, start_col, end_row, end_col)
+        aggregate = evaluator.running_aggregates.get(key)
+        if aggregate is None:
+            evaluator._watch_model(model)
+            aggregate = RunningAggregate(start_row, start_col, end_row, end_col, read)
+            evaluator.running_aggregates.put(key, aggregate)
+        else:
+            aggregate.refresh(read)
+        return aggregate
+
+    def lookup_index(self, sheet, start_row, start_col, end_row, end_col):
+        evaluator = self.evaluator
+        model = self._range_model(sheet)
+        if end_row is None:
+            end_row = model.rowCount() - 1
+        key = (sheet, start_row, start_col, end_row, end_col)
+        index = evaluator.lookup_indexes.get(key)
+        if index is None:
+            evaluator._watch_model(model)
+            index = LookupIndex([
+                evaluator._get_lookup_cell_value(model, row, col)
+                for row in range(start_row, end_row + 1)
+                for col in range(start_col, end_col + 1)
+            ])
+            evaluator.lookup_indexes.put(key, index)
+        return index
+
+    def value(self, sheet, row, col):
+        value = self.evaluator._get_lookup_cell_value(self._range_model(sheet), row, col)
+        return 0 if value is None else value
+
 
 class FormulaEvaluator:
     """Evaluates formulas using Excel-compatible formulas library."""
@@ -36,7 +273,22 @@ class FormulaEvaluator:
         self.table_model = table_model
         self.sheet_models = sheet_models or {}  # Map sheet names to models
         self.parser = formulas.Parser() if formulas else None
-        self.calculating = set()  # Track cells being calculated to detect circular references
+
+        # Formula precedents and dependents, built on first use (see
+        # _ensure_dependency_graph) and used to detect circular references
+        self.dependency_graph = FormulaDependencyGraph()
+        self._dependency_signature = None
+        # Indexes over VLOOKUP/MATCH ranges, dropped when a cell in them
+        # changes, and running totals of large SUM/COUNT/MIN/MAX ranges,
+        # updated as cells change
+        self.lookup_indexes = LookupIndexCache()
+        self.running_aggregates = RunningAggregateCache()
+        self._watched_models = set()
+        for signal_name in ('modelReset', 'layoutChanged', 'rowsInserted', 'rowsRemoved',
+                            'columnsInserted', 'columnsRemoved'):
+            signal = getattr(table_model, signal_name, None)
+            if signal is not None:
+                signal.connect(self.invalidate_dependencies)
 
         # Log available sheets for debugging
         if self.sheet_models:
@@ -441,6 +693,32 @@ class FormulaEvaluator:
         except (ValueError, TypeError):
             return 0
 
+    def _get_lookup_cell_value(self, model, row: int, col: int) -> Any:
+        """Get a cell value for lookup tables.
+
+        Unlike _get_cell_value_for_range, text is kept so rows can be looked
+        up by name.
+
+        Args:
+            model: The table model to fetch from
+            row: Row index (0-based)
+            col: Column index (0-based)
+
+        Returns:
+            Number, text, or None for empty cells
+        """
+        value = self._get_raw_cell_value_from_model(self.get_cell_reference(row, col), model)
+        if value is None or value == "":
+            return None
+        if isinstance(value, str):
+            try:
+                if value.endswith('%'):
+                    return float(value[:-1]) / 100
+                return float(value.replace(',', '').replace('$', '').replace('€', '').replace('£', '').strip())
+            except ValueError:
+                return value
+        return value
+
     def _get_simple_sheet_reference_value(self, formula: str, current_row: int = None) -> Any:
         """Check if formula is a simple sheet reference and return its raw value.
 
@@ -718,6 +996,30 @@ class FormulaEvaluator:
         Returns:
             The calculated value or error message
         """
+        if row is None or col is None:
+            return self._evaluate_formula(formula, row, col)
+
+        # Backstop for cycles through other sheets: the cell is already being
+        # evaluated further up the stack
+        state = _get_evaluation_state()
+        key = (id(self), row, col)
+        if key in state.stack:
+            state.circular.update(state.stack[state.stack.index(key):])
+            return "#CIRCULAR!"
+
+        state.stack.append(key)
+        try:
+            result = self._evaluate_formula(formula, row, col)
+        finally:
+            state.stack.pop()
+        if key in state.circular:
+            # Every cell on the cycle reports it, not just the one closing it
+            state.circular.discard(key)
+            return "#CIRCULAR!"
+        return result
+
+    def _evaluate_formula(self, formula: str, row: int = None, col: int = None) -> Any:
+        """Evaluate a formula; see evaluate."""
         if not formula:
             return ""
 
@@ -734,6 +1036,16 @@ class FormulaEvaluator:
         if simple_ref is not None:
             return simple_ref
 
+        # Check for circular reference
+        if row is not None and col is not None:
+            if self._ensure_dependency_graph().is_cyclic((row, col)):
+                return "#CIRCULAR!"
+
+        # Common formulas are evaluated natively, without the formulas library
+        native_result = self._evaluate_native(formula, row)
+        if native_result is not None:
+            return native_result
+
         # Check if it's a cross-sheet function (e.g., =SUM('Shots Cost'!Y1:Y5))
         # Handle these manually since the formulas library may not support sheet references
         cross_sheet_result = self._evaluate_cross_sheet_function(formula)
@@ -748,24 +1060,14 @@ class FormulaEvaluator:
         if row is not None and col is not None:
             formula = self._preprocess_formula(formula, row, col)
 
-        # Check for circular reference
-        if row is not None and col is not None:
-            cell_ref = self.get_cell_reference(row, col)
-            if cell_ref in self.calculating:
-                return "#CIRCULAR!"
-            self.calculating.add(cell_ref)
-
         try:
-            # Parse and compile the formula
-            parsed = self.parser.ast(formula)
-
-            if not parsed or len(parsed) <= 1:
+            # Parse and compile each formula shape once
+            compiled_formula, bindings = self._get_compiled_formula(formula)
+            if compiled_formula is None:
                 return "#PARSE_ERROR!"
 
-            compiled_formula = parsed[1].compile()
-
             # Get input cell references
-            inputs = list(compiled_formula.inputs)
+            inputs = [bindings.get(input_ref, input_ref) for input_ref in compiled_formula.inputs]
 
             # Get values for each input
             input_values = []
@@ -788,14 +1090,7 @@ class FormulaEvaluator:
                 if isinstance(result, list):
                     result = result[0] if result else 0
 
-                # Format the result
-                if isinstance(result, float):
-                    if abs(result - round(result)) < 1e-10:
-                        result = int(round(result))
-                    else:
-                        result = round(result, 10)
-
-                return result
+                return self._format_result(result)
 
             except NotImplementedError:
                 return "#NOT_SUPPORTED!"
@@ -804,11 +1099,122 @@ class FormulaEvaluator:
 
         except Exception as e:
             return "#PARSE_ERROR!"
-        finally:
-            # Remove from calculating set
-            if row is not None and col is not None:
-                cell_ref = self.get_cell_reference(row, col)
-                self.calculating.discard(cell_ref)
+
+    @staticmethod
+    def _format_result(result: Any) -> Any:
+        """Round float noise off a result (0.30000000000000004 -> 0.3, 3.0 -> 3)."""
+        if isinstance(result, float):
+            if abs(result - round(result)) < 1e-10:
+                return int(round(result))
+            return round(result, 10)
+        return result
+
+    def _evaluate_native(self, formula: str, row: int = None) -> Any:
+        """Evaluate a formula with the native fast path (see formula_fastpath).
+
+        Args:
+            formula: The formula string starting with =
+            row: The row index of the cell being calculated
+
+        Returns:
+            The calculated value, or None if the formula has to go through
+            the formulas library
+        """
+        program = compile_native_formula(formula)
+        if program is None:
+            return None
+        try:
+            result = program(_NativeContext(self, row))
+        except NativeFallback:
+            return None
+        except Exception as e:
+            logger.debug(f"Native evaluation of {formula} failed, falling back: {e}")
+            return None
+        if isinstance(result, float) and not math.isfinite(result):
+            return None
+        return self._format_result(result)
+
+    def _get_compiled_formula(self, formula: str):
+        """Return the compiled form of a preprocessed formula.
+
+        Args:
+            formula: Preprocessed formula
+
+        Returns:
+            (compiled, bindings): the compiled formula (None if it doesn't
+            parse) and the mapping from its input names to this formula's
+            cell references
+        """
+        key, bindings = self._normalize_formula(formula)
+        cache = get_compiled_formula_cache()
+        found, compiled = cache.get(key)
+        if not found:
+            compiled = None
+            try:
+                parsed = self.parser.ast(key)
+                if parsed and len(parsed) > 1:
+                    compiled = parsed[1].compile()
+            except Exception:
+                compiled = None
+            cache.put(key, compiled)
+        return compiled, bindings
+
+    @classmethod
+    def _normalize_formula(cls, formula: str):
+        """Replace a formula's cell references with positional placeholders.
+
+        "=C5*D5+$B$1" becomes "=A1*B1+C1" and "=SUM(E2:E9)" becomes
+        "=SUM(A1:A8)", so a formula filled down a column normalizes to the
+        same text on every row. Ranges keep their shape; text in string
+        literals is left alone.
+
+        Args:
+            formula: Preprocessed formula
+
+        Returns:
+            (normalized, bindings): the normalized formula and a dict mapping
+            each placeholder to the reference it replaces
+        """
+        placeholders = {}
+        bindings = {}
+        next_col = 0
+
+        def replace_ref(match):
+            nonlocal next_col
+            start = match.group(1).replace('$', '')
+            end = match.group(2).replace('$', '') if match.group(2) else None
+            actual = f"{start}:{end}" if end else start
+            placeholder = placeholders.get(actual)
+            if placeholder is None:
+                if end:
+                    start_row, start_col = cls._split_reference(start)
+                    end_row, end_col = cls._split_reference(end)
+                    height = abs(end_row - start_row) + 1
+                    width = abs(end_col - start_col) + 1
+                    placeholder = (f"{cls.col_index_to_letter(next_col)}1:"
+                                   f"{cls.col_index_to_letter(next_col + width - 1)}{height}")
+                else:
+                    width = 1
+                    placeholder = f"{cls.col_index_to_letter(next_col)}1"
+                next_col += width
+                placeholders[actual] = placeholder
+                bindings[placeholder] = actual
+            return placeholder
+
+        parts = []
+        position = 0
+        for literal in _STRING_LITERAL_RE.finditer(formula):
+            parts.append(_NORMALIZE_REF_RE.sub(replace_ref, formula[position:literal.start()]))
+            parts.append(literal.group(0))
+            position = literal.end()
+        parts.append(_NORMALIZE_REF_RE.sub(replace_ref, formula[position:]))
+        return "".join(parts), bindings
+
+    @classmethod
+    def _split_reference(cls, ref: str) -> Tuple[int, int]:
+        """Split an A1 reference without $ into 0-based (row, col)."""
+        match = re.match(r'^([A-Z]+)(\d+)$', ref)
+        return int(match.group(2)) - 1, cls.letter_to_col(match.group(1))
 
     def _preprocess_formula(self, formula: str, row: int, col: int) -> str:
         """Pre-process formula to replace ROW(), COLUMN(), and resolve INDIRECT().
@@ -1067,47 +1473,249 @@ class FormulaEvaluator:
         # Return as-is
         return arg
 
-    def _extract_short_field_names(self, field_name: str) -> list:
-        """Extract potential short field names from a full field name.
+    # ------------------------------------------------------------------
+    # Dependency tracking
+    # ------------------------------------------------------------------
 
-        For example:
-            sg_prep_mandays -> ['prep', 'prep_mandays', 'sg_prep_mandays']
-            sg_model_mandays -> ['model', 'model_mandays', 'sg_model_mandays']
-            _calc_price -> ['calc_price', 'price', '_calc_price']
+    def parse_precedents(self, formula: str, row: int, col: int) -> dict:
+        """Extract the cells and ranges a formula reads.
+
+        Resolves references the same way evaluation does: A1 refs and
+        ranges, header refs (field.3), same-row header refs (field),
+        cross-sheet refs ('Sheet'!A1, Sheet!field.3, 'Sheet'!Y:Y) and volatile
+        functions such as INDIRECT.
 
         Args:
-            field_name: Full field name
+            formula: The formula string starting with =
+            row: Row index of the formula cell
+            col: Column index of the formula cell
 
         Returns:
-            List of potential short names including the original
+            Precedents dict (see formula_dependencies)
+        """
+        precedents = new_precedents()
+        if _VOLATILE_RE.search(formula):
+            precedents["volatile"] = True
+        # Text in string literals is not a reference
+        expr = _STRING_LITERAL_RE.sub('""', formula[1:] if formula.startswith('=') else formula)
+
+        def add_range(sheet, start_col, start_row, end_col, end_row):
+            if bool(start_row) != bool(end_row):
+                return
+            first_col, last_col = sorted((self.letter_to_col(start_col), self.letter_to_col(end_col)))
+            if start_row:
+                first_row, last_row = sorted((int(start_row) - 1, int(end_row) - 1))
+            else:
+                # Whole column (Y:Y)
+                first_row, last_row = 0, None
+            precedents["ranges"].append((sheet, first_row, first_col, last_row, last_col))
+
+        def add_ref(sheet, ref, model):
+            if re.match(r'^\$?[A-Z]+\$?\d+$', ref):
+                standard_ref = ref.replace('$', '')
+            else:
+                standard_ref = self.resolve_header_reference(ref, current_row=row, model=model)
+            coords = self._parse_cell_reference_simple(standard_ref) if standard_ref else None
+            if coords:
+                precedents["cells"].add((sheet,) + coords)
+
+        def sheet_range(match):
+            sheet, model = self._dependency_sheet(match.group(1))
+            if model is not None:
+                add_range(sheet, match.group(2), match.group(3), match.group(4), match.group(5))
+            return " "
+
+        def sheet_ref(match):
+            sheet, model = self._dependency_sheet(match.group(1))
+            if model is not None:
+                add_ref(sheet, match.group(2), model)
+            return " "
+
+        def local_range(match):
+            add_range(None, *match.groups())
+            return " "
+
+        def local_cell(match):
+            precedents["cells"].add((None, int(match.group(2)) - 1, self.letter_to_col(match.group(1))))
+            return " "
+
+        def header_row_ref(match):
+            add_ref(None, match.group(0), self.table_model)
+            return " "
+
+        def field_only(match):
+            field_name = match.group(1)
+            # Same rules as replace_field_only in _preprocess_formula
+            if len(field_name) == 1 or self.get_column_index_by_field(field_name) is None:
+                return field_name
+            add_ref(None, field_name, self.table_model)
+            return " "
+
+        expr = _SHEET_RANGE_QUOTED_RE.sub(sheet_range, expr)
+        expr = _SHEET_RANGE_UNQUOTED_RE.sub(sheet_range, expr)
+        expr = _SHEET_REF_QUOTED_RE.sub(sheet_ref, expr)
+        expr = _SHEET_REF_UNQUOTED_RE.sub(sheet_ref, expr)
+        expr = _RANGE_RE.sub(local_range, expr)
+        expr = _CELL_REF_RE.sub(local_cell, expr)
+        expr = _HEADER_ROW_REF_RE.sub(header_row_ref, expr)
+        _FIELD_ONLY_RE.sub(field_only, expr)
+        return precedents
+
+    def _dependency_sheet(self, sheet_name: str):
+        """Resolve a referenced sheet to (graph sheet key, model).
+
+        The key is None for this evaluator's own sheet. The model is None if
+        the sheet doesn't exist.
         """
-        short_names = [field_name]  # Always include the original
+        actual_name, model = self._get_sheet_model_case_insensitive(sheet_name)
+        if model is not None and model is self.table_model:
+            return None, model
+        return actual_name, model
+
+    def _formula_at(self, row: int, col: int) -> Optional[str]:
+        """Return the formula stored in a cell of the table model, or None."""
+        formulas_by_cell = getattr(self.table_model, '_formulas', None)
+        if formulas_by_cell is not None:
+            return formulas_by_cell.get((row, col))
+        value = self.table_model.data(self.table_model.index(row, col), QtCore.Qt.EditRole)
+        if isinstance(value, str) and value.startswith('='):
+            return value
+        return None
+
+    def _iter_formulas(self):
+        """Yield ((row, col), formula) for every formula of the table model."""
+        formulas_by_cell = getattr(self.table_model, '_formulas', None)
+        if formulas_by_cell is not None:
+            yield from list(formulas_by_cell.items())
+            return
+        for row in range(self.table_model.rowCount()):
+            for col in range(self.table_model.columnCount()):
+                formula = self._formula_at(row, col)
+                if formula:
+                    yield (row, col), formula
+
+    def _get_dependency_signature(self):
+        """Return what the dependency graph's reference resolution depends on."""
+        model = self.table_model
+        return (
+            model.rowCount(),
+            model.columnCount(),
+            tuple(getattr(model, 'column_fields', None) or ()),
+            tuple(
+                (name, id(sheet_model), tuple(getattr(sheet_model, 'column_fields', None) or ()))
+                for name, sheet_model in self.sheet_models.items()
+            ),
+        )
 
-        # Remove sg_ prefix if present
-        if field_name.startswith('sg_'):
-            without_prefix = field_name[3:]  # Remove 'sg_'
-            short_names.append(without_prefix)
+    def _ensure_dependency_graph(self) -> FormulaDependencyGraph:
+        """Return the dependency graph, building it on first use."""
+        if self._dependency_signature is None and self.table_model is not None:
+            self.dependency_graph.clear()
+            for (row, col), formula in self._iter_formulas():
+                self.dependency_graph.set_precedents((row, col), self.parse_precedents(formula, row, col))
+            self._dependency_signature = self._get_dependency_signature()
+        return self.dependency_graph
 
-            # Remove common suffixes: _mandays, _rate, _hours, etc.
-            for suffix in ['_mandays', '_rate', '_hours', '_days', '_weeks']:
-                if without_prefix.endswith(suffix):
-                    short_names.append(without_prefix[:without_prefix.rfind(suffix)])
-                    break
+    def invalidate_dependencies(self, *args):
+        """Drop the dependency graph and cached lookups/aggregates; they are rebuilt on next use.
 
-        # Handle underscore-prefixed fields like _calc_price
-        if field_name.startswith('_'):
-            without_prefix = field_name[1:]  # Remove '_'
-            short_names.append(without_prefix)
+        Connected to the table model's reset, layout and row/column signals.
+        Call it after bulk changes to the model's formulas.
+        """
+        self._dependency_signature = None
+        self.lookup_indexes.clear()
+        self.running_aggregates.clear()
+
+    def _watch_model(self, model):
+        """Keep lookup indexes and running aggregates over a sheet current.
+
+        Models that report their changes through cells_changed
+        (reports_cell_changes) are kept current by cells_changed. Other
+        models, including this evaluator's own table model when it doesn't
+        report its changes (e.g. VFX breakdown sheets, which only call
+        cells_changed for some edits), are watched through their signals.
+        """
+        if id(model) in self._watched_models:
+            return
+        self._watched_models.add(id(model))
+
+        if not getattr(model, 'reports_cell_changes', False):
+            signal = getattr(model, 'dataChanged', None)
+            if signal is not None:
+                signal.connect(
+                    lambda top_left, bottom_right, roles=None, model=model:
+                    self._on_sheet_data_changed(model, top_left, bottom_right)
+                )
+        if model is self.table_model:
+            # Structure signals are connected in __init__
+            return
+        for signal_name in ('modelReset', 'layoutChanged', 'rowsInserted', 'rowsRemoved',
+                            'columnsInserted', 'columnsRemoved'):
+            signal = getattr(model, signal_name, None)
+            if signal is not None:
+                signal.connect(self.invalidate_dependencies)
+
+    def _on_sheet_data_changed(self, model, top_left, bottom_right):
+        """Update lookup indexes and running aggregates after a watched model changed."""
+        region = (top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())
+        if model is self.table_model:
+            self.lookup_indexes.invalidate_region(None, *region)
+            self.running_aggregates.mark_region(None, *region)
+        for name, sheet_model in self.sheet_models.items():
+            if sheet_model is model:
+                self.lookup_indexes.invalidate_region(name, *region)
+                self.running_aggregates.mark_region(name, *region)
+
+    def cells_changed(self, cells: Iterable[Tuple[int, int]], model=None) -> Tuple[List[Tuple[int, int]], Set[Tuple[int, int]]]:
+        """Update the dependency graph after cells changed.
 
-            # Also try removing calc_ or similar prefixes
-            if without_prefix.startswith('calc_'):
-                short_names.append(without_prefix[5:])  # Remove 'calc_'
+        Args:
+            cells: (row, col) of the changed cells
+            model: Model the cells belong to; None for this evaluator's
+                table model, whose changed formulas are re-parsed
 
-        return list(set(short_names))  # Remove duplicates
+        Returns:
+            (order, cyclic): formula cells of the table model to recalculate,
+            each after the formulas it reads, and those among them that are
+            part of a reference cycle
+        """
+        if self.table_model is None:
+            return [], set()
+        cells = list(cells)
+        if self._dependency_signature is not None and self._get_dependency_signature() != self._dependency_signature:
+            # Rows, columns or sheets changed without a model signal
+            self.invalidate_dependencies()
+        graph = self._ensure_dependency_graph()
+
+        if model is None or model is self.table_model:
+            keys = [(None, row, col) for row, col in cells]
+            for row, col in cells:
+                formula = self._formula_at(row, col)
+                if formula:
+                    graph.set_precedents((row, col), self.parse_precedents(formula, row, col))
+                else:
+                    graph.remove((row, col))
+            order, cyclic = graph.recalculation_order(keys)
+            # Recalculated formulas change value too
+            self.lookup_indexes.invalidate(None, cells + order)
+            self.running_aggregates.mark(None, cells + order)
+            return order, cyclic
+
+        names = [name for name, sheet_model in self.sheet_models.items() if sheet_model is model]
+        for name in names:
+            self.lookup_indexes.invalidate(name, cells)
+            self.running_aggregates.mark(name, cells)
+        keys = [(name, row, col) for name in names for row, col in cells]
+        if not keys:
+            return [], set()
+        return graph.recalculation_order(keys)
 
     def find_dependent_cells(self, changed_row: int, changed_col: int) -> Set[Tuple[int, int]]:
         """Find all cells that depend on the changed cell.
 
+        Includes indirect dependents (formulas reading formulas that read the
+        cell).
+
         Args:
             changed_row: Row index of the changed cell
             changed_col: Column index of the changed cell
@@ -1115,80 +1723,8 @@ class FormulaEvaluator:
         Returns:
             Set of (row, col) tuples that depend on the changed cell
         """
-        if not self.table_model:
-            return set()
-
-        changed_ref = self.get_cell_reference(changed_row, changed_col)
-        dependents = set()
-
-        # Get the field name for the changed cell
-        field_name = None
-        if hasattr(self.table_model, 'column_fields') and changed_col < len(self.table_model.column_fields):
-            field_name = self.table_model.column_fields[changed_col]
-
-        # Get all potential short names for this field
-        short_names = self._extract_short_field_names(field_name) if field_name else []
-
-        # Create patterns to match:
-        # 1. Standard cell ref: A1, B2, etc.
-        # 2. Explicit row header ref: field.1, field.2, etc. (including short names like prep.1)
-        # 3. Same-row header ref: field (without row number)
-        # 4. Sheet references: 'Sheet'!field.1, Sheet!field, etc.
-
-        changed_header_ref = f"{field_name}.{changed_row + 1}" if field_name else None
-        # Also create header refs for all short names
-        changed_header_refs = [f"{name}.{changed_row + 1}" for name in short_names]
-
-        # Scan all cells to find those with formulas referencing the changed cell
-        for row in range(self.table_model.rowCount()):
-            for col in range(self.table_model.columnCount()):
-                index = self.table_model.index(row, col)
-                value = self.table_model.data(index, QtCore.Qt.EditRole)
-
-                # Check if it's a formula
-                if isinstance(value, str) and value.startswith('='):
-                    formula_depends_on_changed = False
-
-                    # Check standard cell reference (A1, B2, etc.)
-                    if re.search(r'\b' + changed_ref + r'\b', value, re.IGNORECASE):
-                        formula_depends_on_changed = True
-
-                    # Check explicit row header reference (field.1, field.2, etc.)
-                    # Check all possible header refs including short names
-                    if not formula_depends_on_changed and changed_header_refs:
-                        for header_ref in changed_header_refs:
-                            if re.search(r'\b' + re.escape(header_ref) + r'\b', value, re.IGNORECASE):
-                                formula_depends_on_changed = True
-                                break
-
-                    # Check same-row header reference (field without row number)
-                    # This is only relevant if the formula is in the same row as the changed cell
-                    if not formula_depends_on_changed and field_name and row == changed_row:
-                        # Look for the field name (or any of its short versions) used without explicit row number
-                        # Pattern: field name not followed by a dot and number
-                        for name in short_names:
-                            pattern = r'\b' + re.escape(name) + r'\b(?!\s*\.)'
-                            if re.search(pattern, value, re.IGNORECASE):
-                                formula_depends_on_changed = True
-                                break
-
-                    # Check sheet references (e.g., 'Sheet'!field.1, Sheet!field)
-                    # This is a simple check - just see if the field name appears in a sheet reference
-                    # A more complete implementation would parse all sheet models
-                    elif field_name:
-                        # Check quoted sheet refs: 'AnySheet'!field.row or 'AnySheet'!field
-                        pattern = r"'[^']+'!" + re.escape(field_name) + r'\.?' + str(changed_row + 1) + r'\b'
-                        if re.search(pattern, value):
-                            formula_depends_on_changed = True
-                        # Check unquoted sheet refs: AnySheet!field.row or AnySheet!field
-                        pattern = r'\b[a-zA-Z_][a-zA-Z0-9_]+!' + re.escape(field_name) + r'\.?' + str(changed_row + 1) + r'\b'
-                        if re.search(pattern, value):
-                            formula_depends_on_changed = True
-
-                    if formula_depends_on_changed:
-                        dependents.add((row, col))
-
-        return dependents
+        order, _ = self.cells_changed([(changed_row, changed_col)])
+        return set(order) - {(changed_row, changed_col)}
 
     def recalculate_dependents(self, changed_row: int, changed_col: int):
         """Recalculate all cells that depend on the changed cell.
@@ -1197,12 +1733,12 @@ class FormulaEvaluator:
             changed_row: Row index of the changed cell
             changed_col: Column index of the changed cell
         """
-        dependents = self.find_dependent_cells(changed_row, changed_col)
+        order, _ = self.cells_changed([(changed_row, changed_col)])
 
-        for dep_row, dep_col in dependents:
+        # In dependency order, so each formula reads recalculated values
+        for dep_row, dep_col in order:
+            if (dep_row, dep_col) == (changed_row, changed_col):
+                continue
             index = self.table_model.index(dep_row, dep_col)
-            formula = self.table_model.data(index, QtCore.Qt.EditRole)
-
-            if isinstance(formula, str) and formula.startswith('='):
-                # Trigger recalculation by emitting dataChanged
-                self.table_model.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole])
+            # Trigger recalculation by emitting dataChanged
+            self.table_model.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole])
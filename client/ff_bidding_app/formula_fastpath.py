@@ -0,0 +1,579 @@
+"""
+Formula Fast Path
+Native evaluator for the formulas used on most cells of the cost sheets.
+
+Calling the 'formulas' library costs far more per cell than the arithmetic
+it performs. This module compiles the common subset of formulas (tokenizer ->
+AST -> Python closures) and FormulaEvaluator runs them directly against the
+model data:
+
+    program = compile_native_formula("=SUM(A1:A10)*rate")
+    if program is not None:
+        result = program(context)
+
+Supported: numbers, strings, TRUE/FALSE, + - * / ^ % and unary minus,
+comparisons (= <> < > <= >=), A1 references and ranges (including whole
+columns like Y:Y), header references (field.3 and same-row field),
+cross-sheet references ('Sheet Name'!A1, Sheet!field.3, 'Sheet'!Y1:Y50) and
+the functions SUM, AVERAGE, MIN, MAX, COUNT, IF, ROUND, VLOOKUP, MATCH and
+INDEX. Lookups go through indexes cached by the evaluator (see
+formula_lookup).
+
+compile_native_formula returns None for anything else, and programs raise
+NativeFallback when a value would need Excel's coercion rules (text in
+arithmetic, division by zero, ...). In both cases the caller falls back to
+the 'formulas' library. For numeric data the supported subset gives the
+same results as the 'formulas' path (test_formula_fastpath.py compares the
+two). Lookups are the exception: lookup tables are read with their text
+kept, so VLOOKUP and MATCH find rows by name, where the 'formulas' path
+reads text in ranges as 0.
+
+The context passed to a program provides:
+
+    cell(sheet, ref)                      value of an A1 reference
+    header(sheet, field, row_number)      value of field.row_number, or of
+                                          the same-row field if row_number
+                                          is None
+    aggregate(sheet, start_row, start_col, end_row, end_col)
+                                          object with total, count,
+                                          minimum() and maximum() of the
+                                          range (see formula_aggregates);
+                                          end_row is None for whole columns
+    lookup_index(sheet, start_row, start_col, end_row, end_col)
+                                          LookupIndex over a row or column
+    value(sheet, row, col)                value of a cell by position, text
+                                          kept (for lookup results)
+
+sheet is None for the formula's own sheet.
+"""
+
+import math
+import re
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+
+class NativeFallback(Exception):
+    """Raised by a native program when the 'formulas' library must decide."""
+
+
+class _Unsupported(Exception):
+    """Raised while compiling a formula the fast path doesn't handle."""
+
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<sheet>(?:'(?:[^']|'')+'|[A-Za-z_][A-Za-z0-9_]*)!)
+  | (?P<range>\$?[A-Z]{1,3}\$?\d+:\$?[A-Z]{1,3}\$?\d+(?![A-Za-z0-9_.(]))
+  | (?P<columns>\$?[A-Z]{1,3}:\$?[A-Z]{1,3}(?![A-Za-z0-9_.(]))
+  | (?P<ref>\$?[A-Z]{1,3}\$?\d+(?![A-Za-z0-9_.(]))
+  | (?P<header>[A-Za-z_][A-Za-z0-9_]*\.\d+(?![A-Za-z0-9_.]))
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<op><>|<=|>=|[-+*/^%=<>(),])
+""", re.VERBOSE)
+
+_COMPARISONS = {
+    '=': lambda a, b: a == b,
+    '<>': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '>': lambda a, b: a > b,
+    '<=': lambda a, b: a <= b,
+    '>=': lambda a, b: a >= b,
+}
+
+
+def _col_index(letters):
+    col = 0
+    for char in letters:
+        col = col * 26 + (ord(char) - 64)
+    return col - 1
+
+
+def _split_ref(ref):
+    """Split "$B$12" into 0-based (row, col)."""
+    match = re.match(r'^\$?([A-Z]+)\$?(\d+)$', ref)
+    return int(match.group(2)) - 1, _col_index(match.group(1))
+
+
+def tokenize(formula):
+    """Split a formula (without the leading =) into (kind, text) tokens.
+
+    Raises:
+        _Unsupported: On characters the fast path doesn't know
+    """
+    tokens = []
+    position = 0
+    while position < len(formula):
+        match = _TOKEN_RE.match(formula, position)
+        if not match:
+            raise _Unsupported(f"Unexpected character {formula[position]!r}")
+        kind = match.lastgroup
+        if kind != 'ws':
+            tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+# ----------------------------------------------------------------------
+# Parser: tokens -> AST (tuples)
+# ----------------------------------------------------------------------
+
+class _Parser:
+    """Recursive-descent parser with Excel operator precedence.
+
+    From loosest to tightest: comparisons, + -, * /, ^, unary minus, %.
+    As in Excel, unary minus binds tighter than ^ (-2^2 is 4).
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def expect(self, text):
+        kind, value = self.take()
+        if kind != 'op' or value != text:
+            raise _Unsupported(f"Expected {text!r}")
+
+    def parse(self):
+        node = self.comparison()
+        if self.position != len(self.tokens):
+            raise _Unsupported("Trailing tokens")
+        return node
+
+    def comparison(self):
+        node = self.additive()
+        while self.peek()[0] == 'op' and self.peek()[1] in _COMPARISONS:
+            op = self.take()[1]
+            node = ('compare', op, node, self.additive())
+        return node
+
+    def additive(self):
+        node = self.multiplicative()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            op = self.take()[1]
+            node = ('binary', op, node, self.multiplicative())
+        return node
+
+    def multiplicative(self):
+        node = self.power()
+        while self.peek() in (('op', '*'), ('op', '/')):
+            op = self.take()[1]
+            node = ('binary', op, node, self.power())
+        return node
+
+    def power(self):
+        node = self.unary()
+        while self.peek() == ('op', '^'):
+            self.take()
+            node = ('binary', '^', node, self.unary())
+        return node
+
+    def unary(self):
+        if self.peek() in (('op', '-'), ('op', '+')):
+            op = self.take()[1]
+            operand = self.unary()
+            return ('negate', operand) if op == '-' else ('plus', operand)
+        return self.postfix()
+
+    def postfix(self):
+        node = self.primary()
+        while self.peek() == ('op', '%'):
+            self.take()
+            node = ('percent', node)
+        return node
+
+    def primary(self):
+        kind, text = self.take()
+        if kind == 'number':
+            return ('value', float(text) if any(c in text for c in '.eE') else int(text))
+        if kind == 'string':
+            return ('value', text[1:-1].replace('""', '"'))
+        if kind == 'op' and text == '(':
+            node = self.comparison()
+            self.expect(')')
+            return node
+        if kind == 'sheet':
+            sheet = text[:-1]
+            if sheet.startswith("'"):
+                sheet = sheet[1:-1].replace("''", "'")
+            return self.reference(sheet, *self.take())
+        if kind == 'name':
+            if self.peek() == ('op', '('):
+                return self.call(text.upper())
+            if text.upper() in ('TRUE', 'FALSE'):
+                return ('value', text.upper() == 'TRUE')
+        if kind in ('ref', 'range', 'columns', 'header', 'name'):
+            return self.reference(None, kind, text)
+        raise _Unsupported(f"Unexpected token {text!r}")
+
+    def reference(self, sheet, kind, text):
+        if kind == 'ref':
+            return ('cell', sheet, text.replace('$', ''))
+        if kind == 'range':
+            start, end = text.split(':')
+            (start_row, start_col), (end_row, end_col) = _split_ref(start), _split_ref(end)
+            return ('range', sheet, min(start_row, end_row), min(start_col, end_col),
+                    max(start_row, end_row), max(start_col, end_col))
+        if kind == 'columns':
+            start, end = (_col_index(part.replace('$', '')) for part in text.split(':'))
+            return ('range', sheet, 0, min(start, end), None, max(start, end))
+        if kind == 'header':
+            field, row_number = text.rsplit('.', 1)
+            return ('header', sheet, field, int(row_number))
+        if kind == 'name':
+            # Same-row header reference; single letters are column names,
+            # which _preprocess_formula doesn't resolve either
+            if len(text) == 1:
+                raise _Unsupported(f"Bare column name {text!r}")
+            return ('header', sheet, text, None)
+        raise _Unsupported(f"Expected a reference after sheet {sheet!r}")
+
+    def call(self, name):
+        self.expect('(')
+        args = []
+        if self.peek() != ('op', ')'):
+            while True:
+                args.append(self.comparison())
+                if self.peek() == ('op', ','):
+                    self.take()
+                    continue
+                break
+        self.expect(')')
+        return ('call', name, args)
+
+
+# ----------------------------------------------------------------------
+# Compiler: AST -> closures
+# ----------------------------------------------------------------------
+
+def _number(value):
+    """Return value as a number for arithmetic, or fall back."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise NativeFallback(f"Non-numeric operand {value!r}")
+    return value
+
+
+def _excel_round(value, digits):
+    """Round half away from zero, like Excel's ROUND."""
+    quantum = Decimal(1).scaleb(-int(digits))
+    return float(Decimal(repr(float(value))).quantize(quantum, rounding=ROUND_HALF_UP))
+
+
+def _divide(a, b):
+    if b == 0:
+        raise NativeFallback("Division by zero")
+    return a / b
+
+
+def _power(a, b):
+    try:
+        result = float(a) ** b
+    except (ZeroDivisionError, OverflowError):
+        raise NativeFallback("Invalid power")
+    if isinstance(result, complex):
+        raise NativeFallback("Invalid power")
+    return result
+
+
+_ARITHMETIC = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    '/': _divide,
+    '^': _power,
+}
+
+
+def _compile_node(node):
+    """Compile an AST node into a closure taking the evaluation context."""
+    kind = node[0]
+
+    if kind == 'value':
+        value = node[1]
+        return lambda ctx: value
+
+    if kind == 'cell':
+        _, sheet, ref = node
+        return lambda ctx: ctx.cell(sheet, ref)
+
+    if kind == 'header':
+        _, sheet, field, row_number = node
+        return lambda ctx: ctx.header(sheet, field, row_number)
+
+    if kind == 'range':
+        raise _Unsupported("Range outside of an aggregate function")
+
+    if kind == 'negate':
+        operand = _compile_node(node[1])
+        return lambda ctx: -_number(operand(ctx))
+
+    if kind == 'plus':
+        operand = _compile_node(node[1])
+        return lambda ctx: _number(operand(ctx))
+
+    if kind == 'percent':
+        operand = _compile_node(node[1])
+        return lambda ctx: _number(operand(ctx)) / 100
+
+    if kind == 'binary':
+        _, op, left_node, right_node = node
+        left, right, apply = _compile_node(left_node), _compile_node(right_node), _ARITHMETIC[op]
+        return lambda ctx: apply(_number(left(ctx)), _number(right(ctx)))
+
+    if kind == 'compare':
+        _, op, left_node, right_node = node
+        left, right, apply = _compile_node(left_node), _compile_node(right_node), _COMPARISONS[op]
+
+        def compare(ctx):
+            a, b = left(ctx), right(ctx)
+            if isinstance(a, str) and isinstance(b, str):
+                return apply(a.lower(), b.lower())
+            # Excel orders numbers < text < booleans; leave mixed types to it
+            return apply(_number(a), _number(b))
+        return compare
+
+    if kind == 'call':
+        return _compile_call(node[1], node[2])
+
+    raise _Unsupported(f"Unknown node {kind!r}")
+
+
+def _compile_summaries(args):
+    """Compile aggregate function arguments into a closure returning summaries.
+
+    Each summary is (total, count, minimum, maximum); minimum and maximum are
+    None for empty ranges and only computed when wanted.
+    """
+    getters = []
+    for arg in args:
+        if arg[0] == 'range':
+            getters.append((True, arg[1:]))
+        else:
+            getters.append((False, _compile_node(arg)))
+
+    def summaries(ctx, extremes):
+        result = []
+        for is_range, getter in getters:
+            if is_range:
+                aggregate = ctx.aggregate(*getter)
+                if extremes:
+                    result.append((aggregate.total, aggregate.count, aggregate.minimum(), aggregate.maximum()))
+                else:
+                    result.append((aggregate.total, aggregate.count, None, None))
+            else:
+                value = _number(getter(ctx))
+                result.append((value, 1, value, value))
+        return result
+    return summaries
+
+
+def _sum(summaries):
+    return sum(total for total, _, _, _ in summaries)
+
+
+def _count(summaries):
+    return sum(count for _, count, _, _ in summaries)
+
+
+def _average(summaries):
+    count = _count(summaries)
+    if not count:
+        raise NativeFallback("AVERAGE of no values")
+    return _sum(summaries) / count
+
+
+def _minimum(summaries):
+    values = [minimum for _, count, minimum, _ in summaries if count]
+    return min(values) if values else 0
+
+
+def _maximum(summaries):
+    values = [maximum for _, count, _, maximum in summaries if count]
+    return max(values) if values else 0
+
+
+# name -> (function of the summaries, whether it needs minimum/maximum)
+_AGGREGATES = {
+    'SUM': (_sum, False),
+    'AVERAGE': (_average, False),
+    'MIN': (_minimum, True),
+    'MAX': (_maximum, True),
+    'COUNT': (_count, False),
+}
+
+
+def _compile_call(name, args):
+    if name in _AGGREGATES:
+        if not args:
+            raise _Unsupported(f"{name} without arguments")
+        summaries = _compile_summaries(args)
+        aggregate, extremes = _AGGREGATES[name]
+        return lambda ctx: aggregate(summaries(ctx, extremes))
+
+    if name == 'IF':
+        if len(args) not in (2, 3):
+            raise _Unsupported("IF takes 2 or 3 arguments")
+        condition = _compile_node(args[0])
+        if_true = _compile_node(args[1])
+        if_false = _compile_node(args[2]) if len(args) == 3 else (lambda ctx: False)
+
+        def if_(ctx):
+            value = condition(ctx)
+            if not isinstance(value, (bool, int, float)):
+                raise NativeFallback(f"IF condition {value!r}")
+            return if_true(ctx) if value else if_false(ctx)
+        return if_
+
+    if name == 'ROUND':
+        # The 'formulas' library requires num_digits, unlike Excel
+        if len(args) != 2:
+            raise _Unsupported("ROUND takes 2 arguments")
+        number = _compile_node(args[0])
+        digits = _compile_node(args[1])
+
+        def round_(ctx):
+            value, places = _number(number(ctx)), _number(digits(ctx))
+            if not math.isfinite(value):
+                raise NativeFallback("ROUND of a non-finite number")
+            return _excel_round(value, math.trunc(places))
+        return round_
+
+    if name in _LOOKUPS:
+        return _LOOKUPS[name](args)
+
+    raise _Unsupported(f"Function {name} is not supported natively")
+
+
+def _range_arg(node, name):
+    if node[0] != 'range':
+        raise _Unsupported(f"{name} needs a range argument")
+    return node[1:]
+
+
+def _truthy(value):
+    if not isinstance(value, (bool, int, float)):
+        raise NativeFallback(f"Non-boolean argument {value!r}")
+    return bool(value)
+
+
+def _find(index, lookup_value, approximate):
+    """Return the position of lookup_value in a LookupIndex, or fall back."""
+    if approximate:
+        try:
+            position = index.find_approximate(lookup_value)
+        except ValueError:
+            raise NativeFallback("Approximate lookup in unsorted data")
+    else:
+        if isinstance(lookup_value, str) and any(char in lookup_value for char in '*?~'):
+            raise NativeFallback("Wildcard lookup")
+        position = index.find_exact(lookup_value)
+    if position is None:
+        # #N/A; let the formulas library produce the error
+        raise NativeFallback(f"{lookup_value!r} not found")
+    return position
+
+
+def _compile_vlookup(args):
+    if len(args) not in (3, 4):
+        raise _Unsupported("VLOOKUP takes 3 or 4 arguments")
+    value = _compile_node(args[0])
+    sheet, start_row, start_col, end_row, end_col = _range_arg(args[1], 'VLOOKUP')
+    column = _compile_node(args[2])
+    approximate = _compile_node(args[3]) if len(args) == 4 else (lambda ctx: True)
+    width = end_col - start_col + 1
+
+    def vlookup(ctx):
+        col_number = math.trunc(_number(column(ctx)))
+        if not 1 <= col_number <= width:
+            raise NativeFallback("VLOOKUP column out of range")
+        index = ctx.lookup_index(sheet, start_row, start_col, end_row, start_col)
+        position = _find(index, value(ctx), _truthy(approximate(ctx)))
+        return ctx.value(sheet, start_row + position, start_col + col_number - 1)
+    return vlookup
+
+
+def _compile_match(args):
+    if len(args) not in (2, 3):
+        raise _Unsupported("MATCH takes 2 or 3 arguments")
+    value = _compile_node(args[0])
+    sheet, start_row, start_col, end_row, end_col = _range_arg(args[1], 'MATCH')
+    if start_col != end_col and start_row != end_row:
+        raise _Unsupported("MATCH needs a single row or column")
+    match_type = _compile_node(args[2]) if len(args) == 3 else (lambda ctx: 1)
+
+    def match(ctx):
+        kind = _number(match_type(ctx))
+        if kind < 0:
+            raise NativeFallback("Descending MATCH")
+        index = ctx.lookup_index(sheet, start_row, start_col, end_row, end_col)
+        return _find(index, value(ctx), kind > 0) + 1
+    return match
+
+
+def _compile_index(args):
+    if len(args) not in (2, 3):
+        raise _Unsupported("INDEX takes 2 or 3 arguments")
+    sheet, start_row, start_col, end_row, end_col = _range_arg(args[0], 'INDEX')
+    row_arg = _compile_node(args[1])
+    col_arg = _compile_node(args[2]) if len(args) == 3 else None
+    height = None if end_row is None else end_row - start_row + 1
+    width = end_col - start_col + 1
+
+    def index_(ctx):
+        row_number = math.trunc(_number(row_arg(ctx)))
+        if col_arg is not None:
+            col_number = math.trunc(_number(col_arg(ctx)))
+        elif width == 1:
+            col_number = 1
+        elif height == 1:
+            row_number, col_number = 1, row_number
+        else:
+            raise NativeFallback("INDEX of a whole row")
+        if row_number < 1 or not 1 <= col_number <= width or (height is not None and row_number > height):
+            raise NativeFallback("INDEX out of range")
+        return ctx.value(sheet, start_row + row_number - 1, start_col + col_number - 1)
+    return index_
+
+
+_LOOKUPS = {
+    'VLOOKUP': _compile_vlookup,
+    'MATCH': _compile_match,
+    'INDEX': _compile_index,
+}
+
+
+@lru_cache(maxsize=4096)
+def compile_native_formula(formula):
+    """Compile a formula for the fast path.
+
+    Cached: a formula filled down a column is compiled once, since header and
+    same-row references are resolved at evaluation time.
+
+    Args:
+        formula: Formula text starting with =
+
+    Returns:
+        Callable taking the evaluation context, or None if the formula needs
+        the 'formulas' library
+    """
+    if not formula.startswith('='):
+        return None
+    try:
+        return _compile_node(_Parser(tokenize(formula[1:])).parse())
+    except (_Unsupported, RecursionError):
+        return None
+    except Exception:
+        # Malformed formula; let the 'formulas' library report the error
+        return None
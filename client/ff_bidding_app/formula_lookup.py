@@ -0,0 +1,149 @@
+"""
+Formula Lookup Indexes
+Hash and sorted indexes over the ranges used as lookup tables.
+
+VLOOKUP and MATCH on the native fast path (see formula_fastpath) search the
+same range for every formula that reads it, e.g. a rate looked up by line
+item name on each row of a cost sheet. The evaluator builds a LookupIndex
+over the range's values once and keeps it in a LookupIndexCache until a cell
+inside the range changes:
+
+    index = LookupIndex(["Comp", "Roto", "Prep"])
+    index.find_exact("roto")        # -> 1
+    LookupIndex([0, 100, 500]).find_approximate(250)  # -> 1
+
+Exact matches are answered from a dict in O(1), approximate matches by
+binary search in O(log n). Like Excel, text matches ignore case.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+
+def _lookup_key(value) -> Optional[tuple]:
+    """Return the comparable key of a value, or None for empty cells.
+
+    Numbers, text and booleans never match each other.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return (2, value)
+    if isinstance(value, (int, float)):
+        return (0, float(value))
+    if isinstance(value, str):
+        return (1, value.lower())
+    return None
+
+
+class LookupIndex:
+    """Index over the values of a lookup vector (one column or row)."""
+
+    def __init__(self, values: List):
+        """Build the index.
+
+        Args:
+            values: Cell values in vector order; None or "" for empty cells
+        """
+        self.size = len(values)
+        # key -> position of its first occurrence
+        self._exact: Dict[tuple, int] = {}
+        for position, value in enumerate(values):
+            key = _lookup_key(value)
+            if key is not None:
+                self._exact.setdefault(key, position)
+
+        # Approximate matches assume ascending data, as in Excel. Only
+        # vectors that really are sorted (one type, non-decreasing) get a
+        # sorted index; on others Excel's result depends on its search
+        # order, so those lookups are left to the formulas library.
+        entries = [(key, position) for position, key in enumerate(map(_lookup_key, values)) if key is not None]
+        self._sorted_keys: Optional[List[tuple]] = None
+        self._sorted_positions: Optional[List[int]] = None
+        if entries and len({key[0] for key, _ in entries}) == 1:
+            keys = [key for key, _ in entries]
+            if all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1)):
+                self._sorted_keys = keys
+                self._sorted_positions = [position for _, position in entries]
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether approximate lookups can be answered."""
+        return self._sorted_keys is not None
+
+    def find_exact(self, value) -> Optional[int]:
+        """Return the position of the first value equal to value, or None."""
+        key = _lookup_key(value)
+        if key is None:
+            return None
+        return self._exact.get(key)
+
+    def find_approximate(self, value) -> Optional[int]:
+        """Return the position of the largest value <= value, or None.
+
+        Raises:
+            ValueError: If the vector isn't sorted or holds another type
+        """
+        key = _lookup_key(value)
+        if key is None or not self.is_sorted or key[0] != self._sorted_keys[0][0]:
+            raise ValueError("No sorted index for this lookup")
+        position = bisect_right(self._sorted_keys, key) - 1
+        if position < 0:
+            return None
+        return self._sorted_positions[position]
+
+
+class LookupIndexCache:
+    """LookupIndexes of one evaluator, keyed by range.
+
+    Keys are (sheet, start_row, start_col, end_row, end_col) with sheet None
+    for the evaluator's own sheet, as in formula_dependencies.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._indexes: Dict[tuple, LookupIndex] = {}
+        self.builds = 0
+        self.hits = 0
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def get(self, key: tuple) -> Optional[LookupIndex]:
+        """Return the index of a range, or None if it isn't built."""
+        index = self._indexes.get(key)
+        if index is not None:
+            self.hits += 1
+        return index
+
+    def put(self, key: tuple, index: LookupIndex):
+        """Store the index of a range."""
+        self._indexes[key] = index
+        self.builds += 1
+
+    def invalidate(self, sheet: Optional[str], cells: List[Tuple[int, int]]):
+        """Drop the indexes of ranges containing any of the given cells.
+
+        Args:
+            sheet: Sheet of the cells (None for the evaluator's own sheet)
+            cells: (row, col) of the changed cells
+        """
+        if not self._indexes or not cells:
+            return
+        for key in [key for key in self._indexes if key[0] == sheet]:
+            _, start_row, start_col, end_row, end_col = key
+            for row, col in cells:
+                if start_row <= row <= end_row and start_col <= col <= end_col:
+                    del self._indexes[key]
+                    break
+
+    def invalidate_region(self, sheet: Optional[str], top: int, left: int, bottom: int, right: int):
+        """Drop the indexes of ranges overlapping a changed rectangle of a sheet."""
+        for key in [key for key in self._indexes if key[0] == sheet]:
+            _, start_row, start_col, end_row, end_col = key
+            if start_row <= bottom and top <= end_row and start_col <= right and left <= end_col:
+                del self._indexes[key]
+
+    def clear(self):
+        """Drop every index."""
+        self._indexes.clear()
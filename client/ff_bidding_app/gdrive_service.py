@@ -1,13 +1,19 @@
 """Google Drive service for uploading and sharing files."""
 import os
+import json
+import hashlib
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logger = logging.getLogger("FFPackageManager")
 
 # Google API imports
 try:
-    from google.auth.transport.requests import Request
+    from google.auth.transport.requests import Request, AuthorizedSession
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
@@ -23,6 +29,103 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive.activity.readonly'
 ]
 
+# Endpoint for resumable upload sessions
+UPLOAD_URL = "https://www.googleapis.com/upload/drive/v3/files"
+
+# Every chunk of a resumable upload except the last must be a multiple of this
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+DEFAULT_UPLOAD_CHUNK_SIZE = 32 * UPLOAD_CHUNK_ALIGNMENT  # 8 MB
+
+# Retries for a failed upload request
+UPLOAD_MAX_RETRIES = 5
+# Delay before the first retry; doubled for every further attempt
+UPLOAD_RETRY_BACKOFF_SECONDS = 1.0
+
+# How long a "not accessed yet" activity result is reused before asking Drive again.
+# "Accessed" results never change, so they are kept for the whole session.
+ACCESS_CACHE_TTL_SECONDS = 300
+# Parallel Drive Activity queries in check_files_accessed
+ACCESS_CHECK_MAX_WORKERS = 8
+
+
+class UploadSessionStore:
+    """Persists resumable upload session URIs on disk.
+
+    Sharing the same file again resumes its interrupted upload instead of
+    starting over, also in a later app session. Nothing resumes uploads on
+    its own. Sessions are keyed by file path, size, modification time and target
+    folder, so a file that changed since the session was started is uploaded
+    from scratch. Google Drive expires session URIs after a week.
+    """
+
+    MAX_AGE_SECONDS = 6 * 24 * 60 * 60
+
+    def __init__(self, store_file=None):
+        """Initialize the store.
+
+        Args:
+            store_file: JSON file to persist sessions in.
+                Defaults to ~/.ff_bidding_app/upload_sessions.json
+        """
+        if store_file is None:
+            store_file = Path.home() / ".ff_bidding_app" / "upload_sessions.json"
+        self.store_file = Path(store_file)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(file_path, folder_id=None):
+        """Create the session key for a file in its current state."""
+        file_path = Path(file_path).resolve()
+        st = file_path.stat()
+        raw = f"{file_path}|{st.st_size}|{int(st.st_mtime)}|{folder_id or ''}"
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the saved session URI for a key, or None."""
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and time.time() - entry.get("created_at", 0) < self.MAX_AGE_SECONDS:
+            return entry.get("session_uri")
+        return None
+
+    def set(self, key, session_uri, file_path):
+        """Save the session URI of an upload that has started."""
+        with self._lock:
+            entries = self._load()
+            entries[key] = {
+                "session_uri": session_uri,
+                "file_path": str(file_path),
+                "created_at": time.time(),
+            }
+            self._save(entries)
+
+    def remove(self, key):
+        """Forget a finished or abandoned session."""
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._save(entries)
+
+    def _load(self):
+        if not self.store_file.exists():
+            return {}
+        try:
+            with open(self.store_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load upload sessions: {e}")
+            return {}
+
+    def _save(self, entries):
+        try:
+            self.store_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.store_file.with_suffix(".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_file, self.store_file)
+        except Exception as e:
+            logger.warning(f"Failed to save upload sessions: {e}")
+
 
 class GoogleDriveService:
     """Service for interacting with Google Drive API."""
@@ -42,6 +145,13 @@ class GoogleDriveService:
         self._service = None
         self._activity_service = None
         self._creds = None
+        self.upload_sessions = UploadSessionStore()
+
+        # {file_id: (checked_at, access info)} from check_file_accessed
+        self._access_cache = {}
+        self._access_cache_lock = threading.Lock()
+        # Activity API clients of the check_files_accessed worker threads
+        self._thread_local = threading.local()
 
         # Debug logging
         logger.info(f"GoogleDriveService initialized")
@@ -169,13 +279,16 @@ class GoogleDriveService:
                 return None
         return self._activity_service
 
-    def check_file_accessed(self, file_id):
+    def check_file_accessed(self, file_id, max_age=None):
         """Check if a file has been accessed (viewed or downloaded) by anyone.
 
         Uses the Drive Activity API to check for view/download activity on the file.
+        Results are cached, see check_files_accessed.
 
         Args:
             file_id: Google Drive file ID.
+            max_age: Seconds a cached "not accessed" result stays valid.
+                Defaults to ACCESS_CACHE_TTL_SECONDS; 0 always queries Drive.
 
         Returns:
             dict with:
@@ -184,11 +297,122 @@ class GoogleDriveService:
                 'access_count': int - Number of access events
             Returns None on error.
         """
+        cached = self._get_cached_access(file_id, max_age)
+        if cached is not None:
+            return cached
+
         activity_service = self.get_activity_service()
         if not activity_service:
             logger.warning("Drive Activity service not available")
             return None
 
+        return self._query_file_access(activity_service, file_id)
+
+    def check_files_accessed(self, file_ids, max_workers=None, max_age=None):
+        """Check the access status of several files with parallel Activity queries.
+
+        Files with a fresh cached result are not queried again. The Google API
+        client is not thread-safe, so every worker thread uses its own
+        Activity service built from the shared credentials.
+
+        Call get_activity_service() on the GUI thread first: authentication
+        may open the OAuth consent page, which can't happen on a worker thread.
+
+        Args:
+            file_ids: Iterable of Google Drive file IDs
+            max_workers: Parallel queries (default: ACCESS_CHECK_MAX_WORKERS)
+            max_age: Seconds a cached "not accessed" result stays valid.
+                Defaults to ACCESS_CACHE_TTL_SECONDS; 0 always queries Drive.
+
+        Returns:
+            dict: {file_id: access info dict as returned by check_file_accessed,
+                   or None if the check failed}
+        """
+        results = {}
+        to_check = []
+        for file_id in dict.fromkeys(file_ids):
+            cached = self._get_cached_access(file_id, max_age)
+            if cached is not None:
+                results[file_id] = cached
+            else:
+                to_check.append(file_id)
+
+        if not to_check:
+            return results
+
+        if self._creds is None and not self.authenticate():
+            logger.warning("Drive Activity service not available")
+            results.update((file_id, None) for file_id in to_check)
+            return results
+
+        logger.info(f"Checking Google Drive access for {len(to_check)} file(s) "
+                    f"({len(results)} cached)")
+        max_workers = max(1, min(int(max_workers or ACCESS_CHECK_MAX_WORKERS), len(to_check)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="drive-activity") as executor:
+            checked = executor.map(self._check_file_accessed_in_thread, to_check)
+            results.update(zip(to_check, checked))
+        return results
+
+    def invalidate_access_cache(self, file_ids=None):
+        """Forget cached access results.
+
+        Args:
+            file_ids: File IDs to forget; None clears the whole cache
+        """
+        with self._access_cache_lock:
+            if file_ids is None:
+                self._access_cache.clear()
+            else:
+                for file_id in file_ids:
+                    self._access_cache.pop(file_id, None)
+
+    def _get_cached_access(self, file_id, max_age=None):
+        """Return the cached access info of a file, or None if missing or stale."""
+        max_age = ACCESS_CACHE_TTL_SECONDS if max_age is None else max_age
+        with self._access_cache_lock:
+            cached = self._access_cache.get(file_id)
+        if not cached:
+            return None
+        checked_at, info = cached
+        if info.get('accessed') or time.monotonic() - checked_at < max_age:
+            return dict(info)
+        return None
+
+    def _get_thread_service(self, api_name, api_version):
+        """Return an API client owned by the calling thread.
+
+        Google API clients are not thread-safe; worker threads build their own
+        from the shared credentials. Authenticate before calling this.
+
+        Returns:
+            Service object, or None if it could not be built
+        """
+        attr = f"{api_name}_{api_version}"
+        service = getattr(self._thread_local, attr, None)
+        if service is None:
+            try:
+                service = build(api_name, api_version, credentials=self._creds, cache_discovery=False)
+            except Exception as e:
+                logger.error(f"Failed to build {api_name} {api_version} service: {e}")
+                return None
+            setattr(self._thread_local, attr, service)
+        return service
+
+    def _check_file_accessed_in_thread(self, file_id):
+        """Query one file's access status with this thread's Activity service."""
+        activity_service = self._get_thread_service('driveactivity', 'v2')
+        if activity_service is None:
+            return None
+        return self._query_file_access(activity_service, file_id)
+
+    def _query_file_access(self, activity_service, file_id):
+        """Query the Drive Activity API for view/download activity on a file.
+
+        Successful results are stored in the access cache.
+
+        Returns:
+            Access info dict (see check_file_accessed), or None on error
+        """
         try:
             # Query for activity on this specific file
             # We look for any action that indicates the file was accessed
@@ -203,42 +427,52 @@ class GoogleDriveService:
 
             if not activities:
                 logger.debug(f"No access activity found for file {file_id}")
-                return {
+                info = {
                     'accessed': False,
                     'access_time': None,
                     'access_count': 0
                 }
-
-            # Parse the activities to get access info
-            access_count = len(activities)
-            most_recent_time = None
-
-            for activity in activities:
-                # Get timestamp from the activity
-                timestamp = activity.get('timestamp')
-                if timestamp:
-                    from datetime import datetime
-                    try:
-                        # Parse ISO format timestamp
-                        if timestamp.endswith('Z'):
-                            timestamp = timestamp[:-1] + '+00:00'
-                        activity_time = datetime.fromisoformat(timestamp)
-                        if most_recent_time is None or activity_time > most_recent_time:
-                            most_recent_time = activity_time
-                    except (ValueError, TypeError) as e:
-                        logger.debug(f"Could not parse timestamp {timestamp}: {e}")
-
-            logger.info(f"File {file_id} has been accessed {access_count} times, most recent: {most_recent_time}")
-            return {
-                'accessed': True,
-                'access_time': most_recent_time,
-                'access_count': access_count
-            }
+            else:
+                info = self._parse_access_activities(file_id, activities)
 
         except Exception as e:
             logger.error(f"Failed to check file access: {e}")
             return None
 
+        with self._access_cache_lock:
+            self._access_cache[file_id] = (time.monotonic(), info)
+        return dict(info)
+
+    @staticmethod
+    def _parse_access_activities(file_id, activities):
+        """Summarize Drive Activity results into an access info dict."""
+        from datetime import datetime
+
+        # Parse the activities to get access info
+        access_count = len(activities)
+        most_recent_time = None
+
+        for activity in activities:
+            # Get timestamp from the activity
+            timestamp = activity.get('timestamp')
+            if timestamp:
+                try:
+                    # Parse ISO format timestamp
+                    if timestamp.endswith('Z'):
+                        timestamp = timestamp[:-1] + '+00:00'
+                    activity_time = datetime.fromisoformat(timestamp)
+                    if most_recent_time is None or activity_time > most_recent_time:
+                        most_recent_time = activity_time
+                except (ValueError, TypeError) as e:
+                    logger.debug(f"Could not parse timestamp {timestamp}: {e}")
+
+        logger.info(f"File {file_id} has been accessed {access_count} times, most recent: {most_recent_time}")
+        return {
+            'accessed': True,
+            'access_time': most_recent_time,
+            'access_count': access_count
+        }
+
     def extract_file_id_from_url(self, share_url):
         """Extract the Google Drive file ID from a share URL.
 
@@ -269,19 +503,30 @@ class GoogleDriveService:
         logger.warning(f"Could not extract file ID from URL: {share_url}")
         return None
 
-    def upload_file(self, file_path, folder_id=None, mime_type=None):
-        """Upload a file to Google Drive.
+    def upload_file(self, file_path, folder_id=None, mime_type=None, chunk_size=None,
+                    progress_callback=None, is_cancelled=None):
+        """Upload a file to Google Drive in chunks through a resumable session.
+
+        The session URI is persisted (see UploadSessionStore), so uploading
+        the same unchanged file again continues where the interrupted upload
+        stopped. Failed chunks are retried.
 
         Args:
             file_path: Path to the file to upload.
             folder_id: Optional Google Drive folder ID to upload to.
             mime_type: Optional MIME type. Auto-detected if not provided.
+            chunk_size: Bytes per request (rounded up to UPLOAD_CHUNK_ALIGNMENT).
+                Defaults to DEFAULT_UPLOAD_CHUNK_SIZE.
+            progress_callback: Called with (bytes_uploaded, bytes_total) after
+                every chunk.
+            is_cancelled: Callable checked between chunks. A cancelled upload
+                returns None and can be resumed later.
 
         Returns:
             dict with 'id', 'name', 'webViewLink' on success, None on failure.
         """
-        service = self.get_service()
-        if not service:
+        session = self.get_authorized_session()
+        if not session:
             return None
 
         file_path = Path(file_path)
@@ -289,6 +534,10 @@ class GoogleDriveService:
             logger.error(f"File not found: {file_path}")
             return None
 
+        chunk_size = chunk_size or DEFAULT_UPLOAD_CHUNK_SIZE
+        chunk_size = max(UPLOAD_CHUNK_ALIGNMENT,
+                         -(-chunk_size // UPLOAD_CHUNK_ALIGNMENT) * UPLOAD_CHUNK_ALIGNMENT)
+
         try:
             # Auto-detect mime type
             if mime_type is None:
@@ -297,19 +546,48 @@ class GoogleDriveService:
                 else:
                     mime_type = 'application/octet-stream'
 
-            file_metadata = {'name': file_path.name}
-            if folder_id:
-                file_metadata['parents'] = [folder_id]
-
-            media = MediaFileUpload(str(file_path), mimetype=mime_type, resumable=True)
+            size = file_path.stat().st_size
+            session_key = self.upload_sessions.make_key(file_path, folder_id)
+            offset = 0
+            session_uri = self.upload_sessions.get(session_key)
+            if session_uri:
+                try:
+                    offset, file = self.get_upload_status(session_uri, total=size, session=session)
+                    logger.info(f"Resuming upload of {file_path.name} at {offset}/{size} bytes")
+                    if file is not None:
+                        self.upload_sessions.remove(session_key)
+                        return file
+                except Exception as e:
+                    logger.info(f"Saved upload session for {file_path.name} is no longer valid: {e}")
+                    self.upload_sessions.remove(session_key)
+                    session_uri = None
+                    offset = 0
+
+            if not session_uri:
+                session_uri = self.create_upload_session(
+                    file_path.name, mime_type, folder_id, size=size, session=session
+                )
+                self.upload_sessions.set(session_key, session_uri, file_path)
 
             logger.info(f"Uploading {file_path.name} to Google Drive...")
-            file = service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name, webViewLink'
-            ).execute()
+            if progress_callback:
+                progress_callback(offset, size)
+            with open(file_path, 'rb') as f:
+                while True:
+                    if is_cancelled and is_cancelled():
+                        logger.info(f"Upload of {file_path.name} paused at {offset}/{size} bytes")
+                        return None
+                    f.seek(offset)
+                    data = f.read(chunk_size)
+                    offset, file = self.upload_chunk_with_retry(
+                        session_uri, data, offset, total=size, session=session
+                    )
+                    if progress_callback:
+                        progress_callback(size if file is not None else offset, size)
+                    if file is not None:
+                        break
 
+            self.upload_sessions.remove(session_key)
             logger.info(f"File uploaded successfully: {file.get('name')} (ID: {file.get('id')})")
             return file
 
@@ -317,6 +595,145 @@ class GoogleDriveService:
             logger.error(f"Failed to upload file to Google Drive: {e}")
             return None
 
+    def get_authorized_session(self):
+        """Get an authorized HTTP session for raw Drive requests.
+
+        Returns:
+            google.auth AuthorizedSession, or None if authentication fails.
+        """
+        if self.get_service() is None:
+            return None
+        return AuthorizedSession(self._creds)
+
+    def create_upload_session(self, name, mime_type='application/zip', folder_id=None,
+                              size=None, session=None):
+        """Start a resumable upload session.
+
+        Args:
+            name: File name on Google Drive.
+            mime_type: MIME type of the uploaded content.
+            folder_id: Optional Google Drive folder ID to upload to.
+            size: Total size in bytes, if known in advance.
+            session: Optional AuthorizedSession to reuse.
+
+        Returns:
+            Session URI to send the content to.
+        """
+        session = session or self.get_authorized_session()
+        if session is None:
+            raise RuntimeError("Google Drive authentication failed")
+
+        metadata = {'name': name}
+        if folder_id:
+            metadata['parents'] = [folder_id]
+        headers = {'X-Upload-Content-Type': mime_type}
+        if size is not None:
+            headers['X-Upload-Content-Length'] = str(size)
+
+        response = session.post(
+            UPLOAD_URL,
+            params={'uploadType': 'resumable', 'fields': 'id, name, webViewLink'},
+            json=metadata,
+            headers=headers
+        )
+        response.raise_for_status()
+        return response.headers['Location']
+
+    def upload_chunk(self, session_uri, data, offset, total=None, session=None):
+        """Send one chunk of a resumable upload.
+
+        Args:
+            session_uri: URI returned by create_upload_session.
+            data: Chunk bytes. Must be a multiple of UPLOAD_CHUNK_ALIGNMENT
+                unless it is the last chunk.
+            offset: Position of the chunk in the file.
+            total: Total file size; pass it with the last chunk.
+            session: Optional AuthorizedSession to reuse.
+
+        Returns:
+            Tuple of (bytes received by Drive so far, file dict once the
+            upload is complete or None).
+        """
+        session = session or self.get_authorized_session()
+        total_str = str(total) if total is not None else '*'
+        if data:
+            content_range = f"bytes {offset}-{offset + len(data) - 1}/{total_str}"
+        else:
+            content_range = f"bytes */{total_str}"
+        response = session.put(session_uri, data=data, headers={'Content-Range': content_range})
+        return self._parse_upload_response(response)
+
+    def get_upload_status(self, session_uri, total=None, session=None):
+        """Ask Drive how much of a resumable upload it has received.
+
+        Args:
+            session_uri: URI returned by create_upload_session.
+            total: Total file size, if known.
+            session: Optional AuthorizedSession to reuse.
+
+        Returns:
+            Tuple of (bytes received, file dict if the upload is complete or None).
+        """
+        return self.upload_chunk(session_uri, b'', 0, total=total, session=session)
+
+    def upload_chunk_with_retry(self, session_uri, data, offset, total=None, session=None,
+                                max_retries=UPLOAD_MAX_RETRIES):
+        """Send a chunk, retrying failed requests with exponential backoff.
+
+        After a failure Drive is asked how much it received, so the returned
+        position may fall inside the chunk; callers continue from there.
+
+        Returns:
+            Same as upload_chunk.
+        """
+        attempt = 0
+        query_status = False
+        while True:
+            try:
+                if query_status:
+                    return self.get_upload_status(session_uri, total=total, session=session)
+                return self.upload_chunk(session_uri, data, offset, total=total, session=session)
+            except Exception as e:
+                if attempt >= max_retries:
+                    raise
+                delay = UPLOAD_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+                attempt += 1
+                logger.warning(f"Upload request failed ({e}), retry {attempt}/{max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+                query_status = True
+
+    @staticmethod
+    def _parse_upload_response(response):
+        """Interpret the response to a resumable upload request."""
+        if response.status_code == 308:
+            received = response.headers.get('Range')
+            if received:
+                return int(received.rpartition('-')[2]) + 1, None
+            return 0, None
+        response.raise_for_status()
+        file = response.json()
+        return int(file.get('size', 0) or 0), file
+
+    def open_upload_stream(self, name, mime_type='application/zip', folder_id=None,
+                           chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE, progress_callback=None):
+        """Open a write-only stream that uploads to Google Drive as it is written.
+
+        Args:
+            name: File name on Google Drive.
+            mime_type: MIME type of the uploaded content.
+            folder_id: Optional Google Drive folder ID to upload to.
+            chunk_size: Bytes per upload request (rounded up to UPLOAD_CHUNK_ALIGNMENT).
+            progress_callback: Called with the number of bytes Drive has received.
+
+        Returns:
+            DriveUploadStream; call close() to finish the upload.
+        """
+        session = self.get_authorized_session()
+        if session is None:
+            raise RuntimeError("Google Drive authentication failed")
+        session_uri = self.create_upload_session(name, mime_type, folder_id, session=session)
+        return DriveUploadStream(self, session, session_uri, chunk_size, progress_callback)
+
     def share_file(self, file_id, email=None, role='reader', link_sharing=True):
         """Share a file on Google Drive.
 
@@ -372,6 +789,65 @@ class GoogleDriveService:
             logger.error(f"Failed to share file: {e}")
             return None
 
+    def share_file_with_many(self, file_id, emails, role='reader', link_sharing=True, max_workers=None):
+        """Share a file with several recipients, granting their permissions in parallel.
+
+        Link sharing is enabled once; each email address then gets its own
+        permission, created concurrently with per-thread Drive clients.
+
+        Args:
+            file_id: Google Drive file ID.
+            emails: Email addresses to share with.
+            role: Permission role ('reader', 'commenter', 'writer').
+            link_sharing: If True, enable "anyone with link" sharing.
+            max_workers: Parallel permission requests (default: ACCESS_CHECK_MAX_WORKERS)
+
+        Returns:
+            dict with 'webViewLink' and 'failed' ({email: error message}) on
+            success, None if the file could not be shared at all.
+        """
+        result = self.share_file(file_id, role=role, link_sharing=link_sharing)
+        if not result:
+            return None
+
+        emails = list(dict.fromkeys(email for email in emails if email))
+        failed = {}
+        if emails:
+            max_workers = max(1, min(int(max_workers or ACCESS_CHECK_MAX_WORKERS), len(emails)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="drive-share") as executor:
+                errors = executor.map(
+                    lambda email: self._grant_permission_in_thread(file_id, email, role), emails
+                )
+                failed = {email: error for email, error in zip(emails, errors) if error}
+            logger.info(f"Shared file {file_id} with {len(emails) - len(failed)} of {len(emails)} recipient(s)")
+
+        return {'webViewLink': result.get('webViewLink'), 'failed': failed}
+
+    def _grant_permission_in_thread(self, file_id, email, role):
+        """Give one email address access to a file with this thread's Drive client.
+
+        Returns:
+            None on success, otherwise the error message
+        """
+        service = self._get_thread_service('drive', 'v3')
+        if service is None:
+            return "Google Drive service not available"
+        try:
+            permission = {
+                'type': 'user',
+                'role': role,
+                'emailAddress': email
+            }
+            service.permissions().create(
+                fileId=file_id,
+                body=permission,
+                sendNotificationEmail=True
+            ).execute()
+            return None
+        except Exception as e:
+            logger.error(f"Failed to share file {file_id} with {email}: {e}")
+            return str(e)
+
     def upload_and_share(self, file_path, email=None, role='reader', link_sharing=True, folder_id=None):
         """Upload a file and share it in one operation.
 
@@ -400,6 +876,158 @@ class GoogleDriveService:
         return result
 
 
+class DriveUploadStream:
+    """File-like object that streams its content into a resumable Drive upload.
+
+    write() only buffers data; full chunks are handed to a background thread
+    that sends them, so the producer (e.g. the zip writer) and the network
+    transfer run concurrently. At most ``max_pending`` chunks are held in
+    memory; write() blocks when the upload falls behind.
+
+    A failed request is retried after asking Drive how much of the chunk it
+    received (see GoogleDriveService.upload_chunk_with_retry), so transient
+    network errors do not restart the upload.
+    """
+
+    def __init__(self, gdrive, session, session_uri, chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE,
+                 progress_callback=None, max_pending=2):
+        """Initialize the stream.
+
+        Args:
+            gdrive: GoogleDriveService that created the session
+            session: AuthorizedSession used for all requests
+            session_uri: Resumable session URI
+            chunk_size: Bytes per upload request
+            progress_callback: Called with the number of bytes Drive has received
+            max_pending: Full chunks buffered ahead of the upload thread
+        """
+        self.gdrive = gdrive
+        self.session = session
+        self.session_uri = session_uri
+        self.chunk_size = max(UPLOAD_CHUNK_ALIGNMENT,
+                              -(-chunk_size // UPLOAD_CHUNK_ALIGNMENT) * UPLOAD_CHUNK_ALIGNMENT)
+        self.progress_callback = progress_callback
+
+        self._buffer = bytearray()
+        self._written = 0
+        self._uploaded = 0
+        self._result = None
+        self._error = None
+        self._closed = False
+        self._chunks = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._upload_loop, name="drive-upload", daemon=True)
+        self._thread.start()
+
+    @property
+    def bytes_uploaded(self):
+        """Number of bytes Drive has acknowledged."""
+        return self._uploaded
+
+    def write(self, data):
+        """Buffer data and queue every full chunk for upload."""
+        if self._closed:
+            raise ValueError("Upload stream is closed")
+        self._raise_upload_error()
+        self._buffer += data
+        while len(self._buffer) >= self.chunk_size:
+            chunk = bytes(self._buffer[:self.chunk_size])
+            del self._buffer[:self.chunk_size]
+            self._put((self._written, chunk, None))
+            self._written += len(chunk)
+        return len(data)
+
+    def close(self):
+        """Send the remaining data and finish the upload.
+
+        Returns:
+            File dict ('id', 'name', 'webViewLink') of the uploaded file.
+        """
+        if not self._closed:
+            self._closed = True
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            total = self._written + len(chunk)
+            self._put((self._written, chunk, total))
+            self._written = total
+            self._put(None)
+        self._thread.join()
+        self._raise_upload_error()
+        return self._result
+
+    def abort(self):
+        """Stop uploading and discard the session."""
+        self._closed = True
+        self._error = self._error or RuntimeError("Upload aborted")
+        # Unblock the upload thread
+        try:
+            while True:
+                self._chunks.get_nowait()
+        except queue.Empty:
+            pass
+        self._chunks.put(None)
+        self._thread.join()
+        try:
+            self.session.delete(self.session_uri)
+        except Exception as e:
+            logger.debug(f"Could not cancel upload session: {e}")
+
+    def _put(self, item):
+        """Queue an item, failing fast if the upload thread died."""
+        while True:
+            self._raise_upload_error()
+            try:
+                self._chunks.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _raise_upload_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _upload_loop(self):
+        """Upload queued chunks until the end marker."""
+        while True:
+            item = self._chunks.get()
+            if item is None or self._error is not None:
+                return
+            offset, chunk, total = item
+            try:
+                self._send(offset, chunk, total)
+            except Exception as e:
+                logger.error(f"Google Drive upload failed: {e}")
+                self._error = e
+                return
+
+    def _send(self, offset, chunk, total):
+        """Send one chunk, resuming from what Drive received after a failure."""
+        position = offset
+        while True:
+            received, file = self.gdrive.upload_chunk_with_retry(
+                self.session_uri, chunk[position - offset:], position,
+                total=total, session=self.session
+            )
+            if file is not None:
+                self._uploaded = total if total is not None else received
+                self._result = file
+                self._notify()
+                return
+            self._uploaded = received
+            self._notify()
+            if total is None and received >= offset + len(chunk):
+                return
+            # Drive kept only part of the chunk (or has not finalized the
+            # file yet); send the rest
+            position = max(received, offset)
+
+    def _notify(self):
+        if self.progress_callback:
+            try:
+                self.progress_callback(self._uploaded)
+            except Exception as e:
+                logger.debug(f"Upload progress callback failed: {e}")
+
+
 # Singleton instance
 _gdrive_service = None
 
@@ -7,15 +7,13 @@ try:
     from .folder_pane_widget import FolderPaneWidget
     from .sliding_overlay_panel import SlidingOverlayPanel
     from .bid_selector_widget import CollapsibleGroupBox
-    from .thumbnail_cache import ThumbnailCache
-    from .settings import AppSettings
+    from .thumbnail_cache import KIND_FULL, entity_version_token, get_thumbnail_cache, reset_thumbnail_cache
 except (ImportError, ValueError, SystemError):
     logger = logging.getLogger("FFPackageManager")
     from folder_pane_widget import FolderPaneWidget
     from sliding_overlay_panel import SlidingOverlayPanel
     from bid_selector_widget import CollapsibleGroupBox
-    from thumbnail_cache import ThumbnailCache
-    from settings import AppSettings
+    from thumbnail_cache import KIND_FULL, entity_version_token, get_thumbnail_cache, reset_thumbnail_cache
 
 
 class SGWorker(QtCore.QObject):
@@ -41,27 +39,6 @@ class SGWorker(QtCore.QObject):
             self.finished.emit(False, str(e))
 
 
-# Global thumbnail cache instance (shared across all widgets)
-_thumbnail_cache = None
-
-
-def get_thumbnail_cache():
-    """Get or create the global thumbnail cache instance."""
-    global _thumbnail_cache
-    if _thumbnail_cache is None:
-        settings = AppSettings()
-        cache_path = settings.get_thumbnail_cache_path()
-        max_age = settings.get_thumbnail_cache_max_age_days()
-        _thumbnail_cache = ThumbnailCache(cache_path, max_age)
-    return _thumbnail_cache
-
-
-def reset_thumbnail_cache():
-    """Reset the global thumbnail cache instance (e.g., after settings change)."""
-    global _thumbnail_cache
-    _thumbnail_cache = None
-
-
 class UploadTypeDialog(QtWidgets.QDialog):
     """Dialog for selecting the type of image to upload."""
 
@@ -323,7 +300,7 @@ class UploadThumbnailWidget(QtWidgets.QWidget):
             version = self.sg_session.sg.find_one(
                 'Version',
                 [['id', 'is', version['id']]],
-                ['code', 'image', 'sg_version_type', 'created_at', 'project']
+                ['code', 'image', 'sg_version_type', 'created_at', 'updated_at', 'project']
             )
 
             progress.close()
@@ -394,7 +371,7 @@ class ThumbnailPoller(QtCore.QObject):
                 version_data = self.sg_session.sg.find_one(
                     'Version',
                     [['id', 'is', version_id]],
-                    ['code', 'image', 'sg_version_type', 'created_at', 'project']
+                    ['code', 'image', 'sg_version_type', 'created_at', 'updated_at', 'project']
                 )
 
                 if version_data:
@@ -661,9 +638,10 @@ class ImageViewerDialog(QtWidgets.QDialog):
 
             # Check cache first
             version_id = self.version_data.get('id')
+            version_token = entity_version_token(self.version_data)
             cache = get_thumbnail_cache()
-            if version_id and cache.is_cached(version_id):
-                cached_data = cache.get_cached_data(version_id)
+            if version_id and cache.is_cached(version_id, version=version_token, kind=KIND_FULL):
+                cached_data = cache.get_cached_data(version_id, version=version_token, kind=KIND_FULL)
                 if cached_data:
                     self._on_image_loaded(cached_data)
                     return
@@ -676,10 +654,11 @@ class ImageViewerDialog(QtWidgets.QDialog):
                 finished = Signal(bytes)
                 error = Signal(str)
 
-                def __init__(self, url, version_id, cache):
+                def __init__(self, url, version_id, version_token, cache):
                     super().__init__()
                     self.url = url
                     self.version_id = version_id
+                    self.version_token = version_token
                     self.cache = cache
 
                 def run(self):
@@ -689,7 +668,10 @@ class ImageViewerDialog(QtWidgets.QDialog):
                             image_data = response.content
                             # Cache the downloaded image
                             if self.version_id and self.cache:
-                                self.cache.cache_thumbnail(self.version_id, image_data)
+                                self.cache.cache_thumbnail(
+                                    self.version_id, image_data,
+                                    version=self.version_token, kind=KIND_FULL
+                                )
                             self.finished.emit(image_data)
                         else:
                             self.error.emit(f"HTTP {response.status_code}")
@@ -697,7 +679,7 @@ class ImageViewerDialog(QtWidgets.QDialog):
                         logger.error(f"Failed to download image: {e}")
                         self.error.emit(str(e))
 
-            self.loader = ImageLoader(image_url, version_id, cache)
+            self.loader = ImageLoader(image_url, version_id, version_token, cache)
             self.loader_thread = QThread()
             self.loader.moveToThread(self.loader_thread)
             self.loader_thread.started.connect(self.loader.run)
@@ -840,6 +822,9 @@ class ThumbnailWidget(QtWidgets.QWidget):
     clicked = QtCore.Signal(dict)  # Emits version data when clicked
     deleteRequested = QtCore.Signal(dict)  # Emits version data when delete is requested
 
+    # Size the thumbnail is scaled to; also the variant key in the memory cache
+    THUMBNAIL_SIZE = (170, 140)
+
     def __init__(self, version_data, sg_session=None, parent=None):
         super().__init__(parent)
         self.version_data = version_data
@@ -929,10 +914,19 @@ class ThumbnailWidget(QtWidgets.QWidget):
                     elif isinstance(uploaded_movie, dict):
                         thumbnail_url = uploaded_movie.get('url')
 
-            # Check cache first (even if we have a URL, cached data is faster)
+            # Check cache first. Keys use the version's identity, not the
+            # signed URL, which changes on every query.
+            self._version_token = entity_version_token(self.version_data)
             cache = get_thumbnail_cache()
-            if version_id and cache.is_cached(version_id):
-                cached_data = cache.get_cached_data(version_id)
+            scaled_pixmap = cache.get_image(
+                version_id, self.THUMBNAIL_SIZE, version=self._version_token
+            ) if version_id else None
+            if scaled_pixmap is not None:
+                self.thumbnail_label.setPixmap(scaled_pixmap)
+                self.thumbnail_label.setText("")
+                return
+            if version_id and cache.is_cached(version_id, version=self._version_token):
+                cached_data = cache.get_cached_data(version_id, version=self._version_token)
                 if cached_data:
                     self._on_thumbnail_loaded(cached_data, from_cache=True)
                     return
@@ -959,10 +953,11 @@ class ThumbnailWidget(QtWidgets.QWidget):
                 finished = Signal(bytes)
                 error = Signal()
 
-                def __init__(self, url, version_id, cache):
+                def __init__(self, url, version_id, version_token, cache):
                     super().__init__()
                     self.url = url
                     self.version_id = version_id
+                    self.version_token = version_token
                     self.cache = cache
 
                 def run(self):
@@ -972,7 +967,9 @@ class ThumbnailWidget(QtWidgets.QWidget):
                             image_data = response.content
                             # Cache the downloaded image
                             if self.version_id and self.cache:
-                                self.cache.cache_thumbnail(self.version_id, image_data)
+                                self.cache.cache_thumbnail(
+                                    self.version_id, image_data, version=self.version_token
+                                )
                             self.finished.emit(image_data)
                         else:
                             self.error.emit()
@@ -981,7 +978,7 @@ class ThumbnailWidget(QtWidgets.QWidget):
                         self.error.emit()
 
             # Load thumbnail in background
-            self.loader = ThumbnailLoader(thumbnail_url, version_id, cache)
+            self.loader = ThumbnailLoader(thumbnail_url, version_id, self._version_token, cache)
             self.loader_thread = QThread()
             self.loader.moveToThread(self.loader_thread)
             self.loader_thread.started.connect(self.loader.run)
@@ -1006,10 +1003,11 @@ class ThumbnailWidget(QtWidgets.QWidget):
             finished = Signal(bytes)
             error = Signal()
 
-            def __init__(self, sg_session, version_id, cache):
+            def __init__(self, sg_session, version_id, version_token, cache):
                 super().__init__()
                 self.sg_session = sg_session
                 self.version_id = version_id
+                self.version_token = version_token
                 self.cache = cache
 
             def run(self):
@@ -1030,7 +1028,9 @@ class ThumbnailWidget(QtWidgets.QWidget):
                                 image_data = response.content
                                 # Cache the downloaded image
                                 if self.cache:
-                                    self.cache.cache_thumbnail(self.version_id, image_data)
+                                    self.cache.cache_thumbnail(
+                                        self.version_id, image_data, version=self.version_token
+                                    )
                                 self.finished.emit(image_data)
                                 return
 
@@ -1040,7 +1040,7 @@ class ThumbnailWidget(QtWidgets.QWidget):
                     self.error.emit()
 
         cache = get_thumbnail_cache()
-        self.sg_loader = SGThumbnailLoader(self.sg_session, version_id, cache)
+        self.sg_loader = SGThumbnailLoader(self.sg_session, version_id, self._version_token, cache)
         self.sg_loader_thread = QThread()
         self.sg_loader.moveToThread(self.sg_loader_thread)
         self.sg_loader_thread.started.connect(self.sg_loader.run)
@@ -1056,6 +1056,9 @@ class ThumbnailWidget(QtWidgets.QWidget):
         """
         logger.info(f"Refreshing thumbnail for {self.version_data.get('code')}")
         self.version_data = updated_version_data
+        if updated_version_data.get('id'):
+            # The image changed; don't serve the old one from the cache
+            get_thumbnail_cache().invalidate(updated_version_data['id'])
         self._load_thumbnail()
 
     def _on_thumbnail_loaded(self, image_data, from_cache=False):
@@ -1073,10 +1076,17 @@ class ThumbnailWidget(QtWidgets.QWidget):
             if not pixmap.isNull():
                 # Scale to fit label while maintaining aspect ratio
                 scaled_pixmap = pixmap.scaled(
-                    170, 140,
+                    *self.THUMBNAIL_SIZE,
                     QtCore.Qt.KeepAspectRatio,
                     QtCore.Qt.SmoothTransformation
                 )
+                version_id = self.version_data.get('id')
+                if version_id:
+                    get_thumbnail_cache().put_image(
+                        version_id, scaled_pixmap,
+                        scaled_pixmap.width() * scaled_pixmap.height() * scaled_pixmap.depth() // 8,
+                        self.THUMBNAIL_SIZE, version=self._version_token
+                    )
                 self.thumbnail_label.setPixmap(scaled_pixmap)
                 self.thumbnail_label.setText("")
             else:
@@ -2117,7 +2127,7 @@ class ImageViewerWidget(QtWidgets.QWidget):
             version = self.sg_session.sg.find_one(
                 'Version',
                 [['id', 'is', version['id']]],
-                ['code', 'image', 'sg_version_type', 'created_at', 'project']
+                ['code', 'image', 'sg_version_type', 'created_at', 'updated_at', 'project']
             )
 
             progress.close()
@@ -0,0 +1,524 @@
+"""Content-addressed local store for downloaded version attachments.
+
+The same concept art or script PDF usually ends up in several packages and
+is rebuilt many times. Instead of downloading it again for every package,
+PackageDownloadEngine keeps one copy of each attachment here and populates
+package folders from it:
+
+    store = get_media_store()
+    blob = store.lookup(attachment)          # None if not stored yet
+    if blob is None:
+        ...download to path...
+        store.add(attachment, path, sha256)
+    else:
+        store.place(blob, package_folder / attachment["name"])
+
+Layout under the store root (default ~/.ff_bidding_app/media_store):
+
+    objects/<sha256[:2]>/<sha256>    file contents, one per distinct hash
+    index.json                       attachment key -> sha256, blob sizes,
+                                     modification times and last-use times
+
+- Attachments are keyed by ShotGrid attachment id + updated_at, so a
+  re-uploaded file gets a new entry. Blobs are keyed by SHA-256, so two
+  attachments with identical content share one blob.
+- place() uses a copy-on-write clone (reflink) where the file system
+  supports it, then a hardlink, then a plain copy (FF_MEDIA_STORE_LINK_MODE
+  restricts this to "reflink", "hardlink" or "copy").
+- A hardlinked blob changes when its package copy is edited in place, so
+  lookup() re-hashes a blob whose size or modification time no longer
+  matches the index and drops it if its content changed.
+- evict() removes least recently used blobs once the store exceeds its size
+  budget; files already placed in packages are unaffected (they are links
+  or copies).
+- prune() additionally drops blobs unused for a number of days, removes
+  orphaned objects and, with verify=True, re-hashes every blob and removes
+  the corrupt ones.
+
+The store has no Qt dependency. Use `ayon ... ff_bidding_app media_store`
+to report and prune usage from the command line.
+"""
+
+import errno
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from .download_manifest import DownloadManifest
+    from .file_hashing import sha256_file
+    from .settings import AppSettings
+except ImportError:
+    from download_manifest import DownloadManifest
+    from file_hashing import sha256_file
+    from settings import AppSettings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl cloning a whole file (copy-on-write) on btrfs, XFS, ...
+FICLONE = 0x40049409
+
+
+def _reflink(source, dest_path):
+    """Clone source to dest_path without copying data, or raise OSError."""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "reflink not supported on this platform")
+    with open(source, "rb") as src, open(dest_path, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.unlink(dest_path)
+            raise
+
+
+class MediaStore:
+    """Thread-safe content-addressed store of downloaded attachments."""
+
+    INDEX_FILENAME = "index.json"
+    OBJECTS_DIRNAME = "objects"
+    FORMAT_VERSION = 1
+    LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+
+    def __init__(self, root, max_bytes: Optional[int] = None, link_mode: Optional[str] = None):
+        """Initialize the store and load its index.
+
+        Args:
+            root: Store folder
+            max_bytes: Size budget enforced by evict(); None for unlimited
+            link_mode: How place() populates package folders, one of
+                LINK_MODES. Defaults to FF_MEDIA_STORE_LINK_MODE or "auto"
+                (reflink, then hardlink, then copy)
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / self.OBJECTS_DIRNAME
+        self.index_path = self.root / self.INDEX_FILENAME
+        self.max_bytes = max_bytes
+
+        link_mode = link_mode or os.environ.get("FF_MEDIA_STORE_LINK_MODE", "auto")
+        if link_mode not in self.LINK_MODES:
+            raise ValueError(f"Invalid link mode {link_mode!r}, expected one of {self.LINK_MODES}")
+        self.link_mode = link_mode
+
+        self._lock = threading.RLock()
+        # {"<attachment_id>:<updated_at>": {"sha256", "name", "added_at"}}
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        # {sha256: {"size", "mtime_ns", "last_used"}}
+        self._blobs: Dict[str, Dict[str, Any]] = {}
+        # Removed in this session; not re-added from disk when saving
+        self._removed_keys = set()
+        self._removed_blobs = set()
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def make_key(attachment: Dict[str, Any]) -> Optional[str]:
+        """Return the store key of an attachment, or None if it can't be stored.
+
+        Attachments without an id or updated_at (e.g. local file links)
+        can't be told apart from a later re-upload and are not stored.
+        """
+        signature = DownloadManifest.attachment_signature(attachment)
+        if signature["attachment_id"] is None or not signature["updated_at"]:
+            return None
+        return f"{signature['attachment_id']}:{signature['updated_at']}"
+
+    def blob_path(self, sha256: str) -> Path:
+        """Return the path of the blob with the given hash."""
+        return self.objects_dir / sha256[:2] / sha256
+
+    # ------------------------------------------------------------------
+    # Lookup and insertion
+    # ------------------------------------------------------------------
+
+    def lookup(self, attachment: Dict[str, Any]) -> Optional[Path]:
+        """Return the stored copy of an attachment and mark it as used.
+
+        Args:
+            attachment: Attachment dict with id, updated_at (and size)
+
+        Returns:
+            Blob path, or None if the attachment is not stored
+        """
+        key = self.make_key(attachment)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._keys.get(key)
+            if not entry:
+                return None
+            sha256 = entry["sha256"]
+            blob = self._blobs.get(sha256)
+        if blob is None or not self._blob_intact(sha256, blob, attachment.get("size")):
+            logger.warning(f"Stored copy of attachment {key} is missing or was modified, dropping it")
+            with self._lock:
+                self._drop_blob(sha256)
+            return None
+        with self._lock:
+            blob["last_used"] = time.time()
+            self._dirty = True
+        return self.blob_path(sha256)
+
+    def _blob_intact(self, sha256: str, blob: Dict[str, Any], expected_size: Optional[int] = None) -> bool:
+        """Check that a blob still has the content its hash names.
+
+        The size and modification time are compared with the index first;
+        only when the modification time differs is the blob re-hashed. If the
+        content is unchanged, the new modification time is recorded.
+
+        Args:
+            sha256: Hash of the blob
+            blob: Index entry of the blob ({} if unknown)
+            expected_size: Size the blob must have (default: recorded size)
+
+        Returns:
+            True if the blob exists and is intact
+        """
+        path = self.blob_path(sha256)
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        expected_size = expected_size or blob.get("size")
+        if expected_size is not None and stat.st_size != expected_size:
+            return False
+        if blob.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        try:
+            if sha256_file(path) != sha256:
+                return False
+        except OSError:
+            return False
+        with self._lock:
+            blob["mtime_ns"] = stat.st_mtime_ns
+            self._dirty = True
+        return True
+
+    def sha256_of(self, attachment: Dict[str, Any]) -> Optional[str]:
+        """Return the recorded hash of a stored attachment, or None."""
+        key = self.make_key(attachment)
+        with self._lock:
+            entry = self._keys.get(key) if key else None
+            return entry["sha256"] if entry else None
+
+    def add(self, attachment: Dict[str, Any], path, sha256: Optional[str] = None) -> Optional[Path]:
+        """Store a downloaded attachment.
+
+        The file is linked (or copied) into the store; path itself is left
+        in place.
+
+        Args:
+            attachment: Attachment dict the file was downloaded from
+            path: Downloaded file
+            sha256: Hash computed while downloading; the file is hashed when
+                omitted
+
+        Returns:
+            Blob path, or None if the attachment can't be stored
+        """
+        key = self.make_key(attachment)
+        if key is None:
+            return None
+        path = Path(path)
+        try:
+            size = path.stat().st_size
+            if sha256 is None:
+                sha256 = sha256_file(path)
+        except OSError as e:
+            logger.warning(f"Could not store {path}: {e}")
+            return None
+
+        blob_path = self.blob_path(sha256)
+        with self._lock:
+            blob = self._blobs.get(sha256)
+            if blob_path.exists() and not self._blob_intact(sha256, blob or {}, size):
+                logger.warning(f"Media store: blob {sha256} was modified, replacing it")
+                stale = True
+            else:
+                stale = False
+            if stale or not blob_path.exists():
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = blob_path.with_name(f"{sha256}.{threading.get_ident()}.tmp")
+                try:
+                    self._link_or_copy(path, tmp_path)
+                    os.replace(tmp_path, blob_path)
+                except OSError as e:
+                    logger.warning(f"Could not store {path}: {e}")
+                    tmp_path.unlink(missing_ok=True)
+                    return None
+
+            self._keys[key] = {
+                "sha256": sha256,
+                "name": attachment.get("name"),
+                "added_at": datetime.now().isoformat(),
+            }
+            try:
+                mtime_ns = blob_path.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            self._blobs[sha256] = {"size": size, "mtime_ns": mtime_ns, "last_used": time.time()}
+            self._removed_keys.discard(key)
+            self._removed_blobs.discard(sha256)
+            self._dirty = True
+        return blob_path
+
+    def place(self, blob_path, dest_path):
+        """Put a stored file at dest_path, replacing any existing file.
+
+        Args:
+            blob_path: Path returned by lookup() or add()
+            dest_path: Path in a package folder
+        """
+        dest_path = Path(dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        if dest_path.exists():
+            if os.path.samefile(blob_path, dest_path):
+                return
+            dest_path.unlink()
+        self._link_or_copy(blob_path, dest_path)
+
+    def _link_or_copy(self, source, dest_path):
+        """Reflink, hardlink or copy source to dest_path, per link_mode."""
+        if self.link_mode in ("auto", "reflink"):
+            try:
+                _reflink(source, dest_path)
+                return
+            except OSError as e:
+                if self.link_mode == "reflink":
+                    raise
+                logger.debug(f"Reflink failed for {dest_path} ({e})")
+        if self.link_mode in ("auto", "hardlink"):
+            try:
+                os.link(source, dest_path)
+                return
+            except OSError as e:
+                logger.debug(f"Hardlink failed for {dest_path} ({e}), copying instead")
+        shutil.copy2(source, dest_path)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def usage(self) -> Dict[str, Any]:
+        """Report the size of the store.
+
+        Returns:
+            dict with root, attachments, blobs, bytes, max_bytes and
+            shared_bytes (blobs also linked from package folders; evicting
+            them frees no disk space until the packages are removed)
+        """
+        with self._lock:
+            blobs = dict(self._blobs)
+            attachments = len(self._keys)
+        shared_bytes = 0
+        for sha256, blob in blobs.items():
+            try:
+                if self.blob_path(sha256).stat().st_nlink > 1:
+                    shared_bytes += blob["size"]
+            except OSError:
+                continue
+        return {
+            "root": str(self.root),
+            "attachments": attachments,
+            "blobs": len(blobs),
+            "bytes": sum(blob["size"] for blob in blobs.values()),
+            "max_bytes": self.max_bytes,
+            "shared_bytes": shared_bytes,
+        }
+
+    def evict(self, max_bytes: Optional[int] = None) -> Dict[str, int]:
+        """Remove least recently used blobs until the store fits its budget.
+
+        Args:
+            max_bytes: Budget to enforce (default: self.max_bytes)
+
+        Returns:
+            dict with removed (blob count) and freed_bytes
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        removed = freed = 0
+        if max_bytes is None:
+            return {"removed": removed, "freed_bytes": freed}
+
+        with self._lock:
+            total = sum(blob["size"] for blob in self._blobs.values())
+            if total > max_bytes:
+                for sha256, blob in sorted(self._blobs.items(), key=lambda item: item[1]["last_used"]):
+                    if total <= max_bytes:
+                        break
+                    self._drop_blob(sha256)
+                    total -= blob["size"]
+                    removed += 1
+                    freed += blob["size"]
+        if removed:
+            logger.info(f"Media store: evicted {removed} blob(s), {freed} bytes")
+        return {"removed": removed, "freed_bytes": freed}
+
+    def prune(self, max_bytes: Optional[int] = None, max_age_days: Optional[float] = None,
+              verify: bool = False) -> Dict[str, int]:
+        """Clean up the store.
+
+        Removes orphaned objects and index entries, blobs unused for
+        max_age_days and, with verify, blobs whose content no longer matches
+        their hash. Then enforces the size budget with evict().
+
+        Args:
+            max_bytes: Budget to enforce (default: self.max_bytes)
+            max_age_days: Remove blobs not used for this many days
+            verify: Re-hash every blob (reads the whole store)
+
+        Returns:
+            dict with removed, freed_bytes, orphans and corrupt counts
+        """
+        report = {"removed": 0, "freed_bytes": 0, "orphans": 0, "corrupt": 0}
+
+        with self._lock:
+            # Objects on disk the index doesn't know about (e.g. interrupted writes)
+            if self.objects_dir.exists():
+                for path in self.objects_dir.glob("*/*"):
+                    if path.is_file() and path.name not in self._blobs:
+                        try:
+                            report["freed_bytes"] += path.stat().st_size
+                            path.unlink()
+                            report["orphans"] += 1
+                        except OSError as e:
+                            logger.warning(f"Could not remove {path}: {e}")
+
+            # Index entries whose object is gone
+            for sha256 in [sha256 for sha256 in self._blobs if not self.blob_path(sha256).exists()]:
+                self._drop_blob(sha256)
+                report["orphans"] += 1
+
+            if max_age_days is not None:
+                cutoff = time.time() - max_age_days * 86400
+                for sha256, blob in list(self._blobs.items()):
+                    if blob["last_used"] < cutoff:
+                        self._drop_blob(sha256)
+                        report["removed"] += 1
+                        report["freed_bytes"] += blob["size"]
+            blobs = list(self._blobs.items())
+
+        if verify:
+            for sha256, blob in blobs:
+                try:
+                    intact = sha256_file(self.blob_path(sha256)) == sha256
+                except OSError:
+                    intact = False
+                if not intact:
+                    logger.warning(f"Media store: blob {sha256} is corrupt, removing it")
+                    with self._lock:
+                        self._drop_blob(sha256)
+                    report["corrupt"] += 1
+                    report["freed_bytes"] += blob["size"]
+
+        evicted = self.evict(max_bytes)
+        report["removed"] += evicted["removed"]
+        report["freed_bytes"] += evicted["freed_bytes"]
+        self.save()
+        return report
+
+    def _drop_blob(self, sha256: str):
+        """Remove a blob and every key pointing at it. Caller holds the lock."""
+        try:
+            self.blob_path(sha256).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not remove blob {sha256}: {e}")
+        self._blobs.pop(sha256, None)
+        self._removed_blobs.add(sha256)
+        for key in [key for key, entry in self._keys.items() if entry["sha256"] == sha256]:
+            del self._keys[key]
+            self._removed_keys.add(key)
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self):
+        """Persist the index, merging entries written by other processes."""
+        with self._lock:
+            if not self._dirty:
+                return
+            keys, blobs = self._read_index()
+            for key, entry in keys.items():
+                if key not in self._keys and key not in self._removed_keys \
+                        and entry.get("sha256") not in self._removed_blobs:
+                    self._keys[key] = entry
+            for sha256, blob in blobs.items():
+                if sha256 in self._removed_blobs:
+                    continue
+                current = self._blobs.get(sha256)
+                if current is None:
+                    self._blobs[sha256] = blob
+                else:
+                    current["last_used"] = max(current["last_used"], blob.get("last_used", 0))
+
+            document = {"version": self.FORMAT_VERSION, "keys": self._keys, "blobs": self._blobs}
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(document, f, indent=2)
+                os.replace(tmp_path, self.index_path)
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"Failed to save media store index: {e}")
+
+    def _load(self):
+        """Load the index from the store folder."""
+        self._keys, self._blobs = self._read_index()
+        if self._keys:
+            logger.debug(f"Loaded {len(self._keys)} media store entries from {self.index_path}")
+
+    def _read_index(self):
+        """Read (keys, blobs) from index.json; empty dicts if missing or invalid."""
+        if not self.index_path.exists():
+            return {}, {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            if document.get("version") == self.FORMAT_VERSION:
+                return document.get("keys", {}), document.get("blobs", {})
+        except Exception as e:
+            logger.warning(f"Failed to load media store index: {e}")
+        return {}, {}
+
+
+# Singleton instance
+_media_store = None
+_media_store_lock = threading.Lock()
+
+
+def get_media_store() -> Optional[MediaStore]:
+    """Get the shared MediaStore, configured from AppSettings.
+
+    FF_MEDIA_STORE overrides the store folder; set it to "off" to disable
+    the store.
+
+    Returns:
+        MediaStore, or None if the store is disabled
+    """
+    global _media_store
+    with _media_store_lock:
+        if _media_store is None:
+            settings = AppSettings()
+            root = os.environ.get("FF_MEDIA_STORE") or settings.get_media_store_path()
+            if str(root).lower() in ("off", "0", "false", "none"):
+                return None
+            max_gb = settings.get_media_store_max_gb()
+            _media_store = MediaStore(
+                root,
+                max_bytes=int(max_gb * 1024 ** 3) if max_gb else None
+            )
+        return _media_store
@@ -0,0 +1,771 @@
+"""Headless package builder.
+
+Builds a delivery package folder (and optionally its zip archive) from a
+package manifest without any Qt dependency, so the same pipeline serves the
+Packages tab and batch jobs run from the command line:
+
+    builder = PackageBuilder(sg_session, output_dir)
+    result = builder.build(package_name, sg_project, sg_rfq, manifest,
+                           active_versions, sg_package_id=package_id,
+                           create_zip=True, progress_callback=print)
+
+    # or straight from a ShotGrid Package
+    result = builder.build_from_shotgrid(package, sg_project, sg_rfq)
+
+Stages: download (PackageDownloadEngine) -> cleanup of files no longer in
+the package -> README.txt -> checksums -> manifest.json -> zip. Progress is
+reported as plain dicts:
+
+    {"package": "RFQ-v001", "stage": "download", "percent": 42.0,
+     "message": "...", ...stage specific stats}
+
+build_packages() builds several packages concurrently on a thread pool;
+downloading, hashing and deflating all release the GIL.
+"""
+
+import concurrent.futures
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from .download_engine import PackageDownloadEngine
+    from .download_manifest import DownloadManifest
+    from .file_hashing import HashingCancelled
+    from .media_store import get_media_store
+    from .package_delta import EXCLUDED_FILES, FILE_INDEX_KEY, build_file_index, load_file_index
+    from .zip_writer import ZipCancelled, collect_files, write_zip
+except ImportError:
+    from download_engine import PackageDownloadEngine
+    from download_manifest import DownloadManifest
+    from file_hashing import HashingCancelled
+    from media_store import get_media_store
+    from package_delta import EXCLUDED_FILES, FILE_INDEX_KEY, build_file_index, load_file_index
+    from zip_writer import ZipCancelled, collect_files, write_zip
+
+logger = logging.getLogger(__name__)
+
+# Files written by the builder itself; never removed by the cleanup stage
+PROTECTED_FILES = ("manifest.json", "README.txt", DownloadManifest.FILENAME)
+
+# Share of the overall progress taken by each stage, without and with a zip
+STAGE_WEIGHTS = {
+    False: {"download": 90, "cleanup": 1, "hash": 8, "manifest": 1},
+    True: {"download": 65, "cleanup": 1, "hash": 6, "manifest": 1, "zip": 27},
+}
+
+ENTITY_CATEGORIES = ("vfx_breakdown", "script", "concept_art", "storyboard")
+
+
+class PackageBuildCancelled(RuntimeError):
+    """Raised internally when a build is cancelled."""
+
+
+def sanitize_package_name(name: str) -> str:
+    """Return the folder name used for a package (spaces and underscores become hyphens)."""
+    return name.replace(' ', '-').replace('_', '-')
+
+
+def serialize_for_json(obj):
+    """
+    Recursively convert objects to JSON-serializable format.
+    Handles datetime objects and other non-serializable types.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON-serializable object
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    elif isinstance(obj, dict):
+        return {key: serialize_for_json(value) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [serialize_for_json(item) for item in obj]
+    else:
+        return obj
+
+
+def _version_type_name(version: Dict[str, Any]) -> str:
+    """Return the lower-case sg_version_type name of a version."""
+    sg_version_type = version.get('sg_version_type') or ''
+    if isinstance(sg_version_type, dict):
+        return (sg_version_type.get('name') or '').lower()
+    return str(sg_version_type).lower()
+
+
+def is_bid_tracker(version: Dict[str, Any]) -> bool:
+    """Return True for Bid Tracker versions (see find_bid_tracker_versions_in_package)."""
+    version_type = _version_type_name(version)
+    return "bid" in version_type or "tracker" in version_type
+
+
+def categorize_versions(versions: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Organize versions by category (vfx_breakdown, script, concept_art, storyboard).
+
+    Args:
+        versions: Version dictionaries
+
+    Returns:
+        dict: {category: [version dicts]}
+    """
+    entities = {category: [] for category in ENTITY_CATEGORIES}
+
+    for version_data in versions:
+        # Determine category based on version type
+        version_type_name = _version_type_name(version_data)
+
+        # Categorize the version
+        if 'vfx' in version_type_name or 'breakdown' in version_type_name:
+            entities["vfx_breakdown"].append(version_data)
+        elif 'script' in version_type_name:
+            entities["script"].append(version_data)
+        elif 'concept' in version_type_name or 'art' in version_type_name:
+            entities["concept_art"].append(version_data)
+        elif 'storyboard' in version_type_name:
+            entities["storyboard"].append(version_data)
+        else:
+            # Fallback: try to categorize by code/task
+            code = (version_data.get('code') or '').lower()
+            if 'script' in code:
+                entities["script"].append(version_data)
+            elif 'concept' in code:
+                entities["concept_art"].append(version_data)
+            elif 'storyboard' in code:
+                entities["storyboard"].append(version_data)
+            else:
+                # Default to vfx_breakdown if unsure
+                entities["vfx_breakdown"].append(version_data)
+
+    return entities
+
+
+def manifest_from_versions(versions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a package manifest from versions with '_package_folders'.
+
+    Produces the same structure as PackageTreeView.get_package_manifest(),
+    from the folder assignments stored on the Package's items
+    (ShotgridClient.get_package_versions_with_folders).
+
+    Args:
+        versions: Version dictionaries with a '_package_folders' string
+            (folder paths separated by ";")
+
+    Returns:
+        Manifest dict with folders, root_files and summary
+    """
+    manifest = {
+        "folders": {},
+        "root_files": [],
+        "summary": {
+            "total_folders": 0,
+            "total_files": 0
+        }
+    }
+
+    for version_data in versions:
+        file_info = {
+            "id": version_data.get("id"),
+            "code": version_data.get("code"),
+            "name": version_data.get("code", "Unknown"),
+            "status": version_data.get("sg_status_list", ""),
+            "type": version_data.get("type", "Version"),
+            "description": version_data.get("description", ""),
+            "sg_uploaded_movie": version_data.get("sg_uploaded_movie"),
+            "sg_path_to_movie": version_data.get("sg_path_to_movie"),
+            "sg_path_to_frames": version_data.get("sg_path_to_frames"),
+            "created_at": version_data.get("created_at"),
+            "user": version_data.get("user"),
+        }
+
+        folders_str = version_data.get("_package_folders") or ""
+        folder_paths = [f.strip() for f in folders_str.split(";") if f.strip()]
+        if folder_paths:
+            for folder_path in folder_paths:
+                files = manifest["folders"].setdefault(folder_path, {"files": []})["files"]
+                if file_info["id"] not in [f["id"] for f in files]:
+                    files.append(file_info)
+        elif file_info["id"] not in [f["id"] for f in manifest["root_files"]]:
+            manifest["root_files"].append(file_info)
+
+    manifest["summary"]["total_folders"] = len(manifest["folders"])
+    manifest["summary"]["total_files"] = (
+        sum(len(folder["files"]) for folder in manifest["folders"].values())
+        + len(manifest["root_files"])
+    )
+    return manifest
+
+
+def write_text_manifest(file_path, package_name, sg_project, sg_rfq, manifest, downloaded_files):
+    """Write a plain text manifest file for vendors.
+
+    Args:
+        file_path: Path to write the text file
+        package_name: Name of the package
+        sg_project: ShotGrid project data
+        sg_rfq: ShotGrid RFQ data
+        manifest: Package manifest dictionary
+        downloaded_files: Dict mapping version_id to downloaded file path
+    """
+    lines = []
+
+    # Header
+    lines.append("=" * 70)
+    lines.append(f"DATA PACKAGE: {package_name}")
+    lines.append("=" * 70)
+    lines.append("")
+
+    # Package Information
+    lines.append("PACKAGE INFORMATION")
+    lines.append("-" * 70)
+    lines.append(f"  Package Name:    {package_name}")
+    lines.append(f"  Project:         {sg_project.get('code', 'N/A')}")
+    lines.append(f"  RFQ:             {sg_rfq.get('code', 'N/A')}")
+    lines.append(f"  Created:         {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"  Created By:      FF Package Manager")
+    lines.append("")
+
+    # Summary
+    lines.append("SUMMARY")
+    lines.append("-" * 70)
+    lines.append(f"  Total Folders:   {manifest['summary']['total_folders']}")
+    lines.append(f"  Total Files:     {manifest['summary']['total_files']}")
+    lines.append("")
+
+    # Contents by Section (Folders)
+    lines.append("CONTENTS")
+    lines.append("-" * 70)
+
+    # Sort folders for consistent output - only include folders with files
+    sorted_folders = sorted(
+        [fp for fp, fd in manifest["folders"].items() if fd.get("files")]
+    )
+
+    for folder_path in sorted_folders:
+        folder_data = manifest["folders"][folder_path]
+        files = folder_data.get("files", [])
+
+        # Section header with folder path
+        clean_path = folder_path.lstrip("/") or "(Root)"
+        lines.append("")
+        lines.append(f"  [{clean_path}]")
+        lines.append(f"  " + "~" * (len(clean_path) + 2))
+
+        for file_info in files:
+            file_name = file_info.get("code", "Unknown")
+            status = file_info.get("status", "")
+            description = file_info.get("description", "")
+
+            # Get actual downloaded filename if available
+            version_id = file_info.get("id")
+            if version_id and version_id in downloaded_files:
+                actual_file = Path(downloaded_files[version_id]).name
+                lines.append(f"    - {actual_file}")
+            else:
+                lines.append(f"    - {file_name}")
+
+            # Add status if available
+            if status:
+                lines.append(f"      Status: {status}")
+
+            # Add description if available (truncate if too long)
+            if description:
+                desc = description[:100] + "..." if len(description) > 100 else description
+                lines.append(f"      Description: {desc}")
+
+    # Root files section
+    root_files = manifest.get("root_files", [])
+    if root_files:
+        lines.append("")
+        lines.append("  [Root Level Files]")
+        lines.append("  " + "~" * 18)
+
+        for file_info in root_files:
+            file_name = file_info.get("code", "Unknown")
+            status = file_info.get("status", "")
+
+            version_id = file_info.get("id")
+            if version_id and version_id in downloaded_files:
+                actual_file = Path(downloaded_files[version_id]).name
+                lines.append(f"    - {actual_file}")
+            else:
+                lines.append(f"    - {file_name}")
+
+            if status:
+                lines.append(f"      Status: {status}")
+
+    # Footer
+    lines.append("")
+    lines.append("=" * 70)
+    lines.append("END OF MANIFEST")
+    lines.append("=" * 70)
+
+    # Write to file
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines))
+
+
+class PackageBuilder:
+    """Builds package folders (and zip archives) from package manifests."""
+
+    def __init__(self, sg_session, output_dir, download_workers: Optional[int] = None,
+                 media_store=None):
+        """Initialize the builder.
+
+        Args:
+            sg_session: ShotgridClient
+            output_dir: Folder the package folders are created in
+            download_workers: Concurrent downloads per package (see PackageDownloadEngine)
+            media_store: MediaStore shared between packages. Defaults to
+                get_media_store()
+        """
+        self.sg_session = sg_session
+        self.output_dir = Path(output_dir)
+        self.download_workers = download_workers
+        self.media_store = media_store if media_store is not None else get_media_store()
+
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._engines = []
+
+    def cancel(self):
+        """Stop all running builds after their current step."""
+        self._cancelled.set()
+        with self._lock:
+            for engine in self._engines:
+                engine.cancel()
+
+    def is_cancelled(self) -> bool:
+        """Return True once cancel() was called."""
+        return self._cancelled.is_set()
+
+    def build_from_shotgrid(self, package: Dict[str, Any], sg_project: Dict[str, Any],
+                            sg_rfq: Dict[str, Any], create_zip: bool = False,
+                            progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+                            ) -> Dict[str, Any]:
+        """Build a package from its ShotGrid Package entity.
+
+        Every version of the package is included, in the folders assigned to
+        it on the package's items.
+
+        Args:
+            package: Package (CustomEntity12) dict with id and code
+            sg_project: Project dict with id and code
+            sg_rfq: RFQ dict with id and code
+            create_zip: Also write <package>.zip next to the folder
+            progress_callback: Called with progress dicts
+
+        Returns:
+            Build result dict (see build)
+        """
+        versions = self.sg_session.get_package_versions_with_folders(package["id"])
+        # Bid trackers are added to their own folder by build()
+        versions = [version for version in versions if not is_bid_tracker(version)]
+
+        return self.build(
+            sanitize_package_name(package["code"]),
+            sg_project,
+            sg_rfq,
+            manifest_from_versions(versions),
+            versions,
+            sg_package_id=package["id"],
+            create_zip=create_zip,
+            progress_callback=progress_callback
+        )
+
+    def build(self, package_name: str, sg_project: Dict[str, Any], sg_rfq: Dict[str, Any],
+              manifest: Dict[str, Any], active_versions: List[Dict[str, Any]],
+              data_types: Optional[List[str]] = None, sg_package_id: Optional[int] = None,
+              create_zip: bool = False,
+              progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Create or update a package folder.
+
+        Files unchanged since the last build are kept, new and changed files
+        are downloaded and files no longer in the package are removed.
+
+        Args:
+            package_name: Folder name of the package
+            sg_project: Project dict with id and code
+            sg_rfq: RFQ dict with id and code
+            manifest: Package manifest (folders, root_files, summary)
+            active_versions: Versions included in the package
+            data_types: Data type names recorded in manifest.json. Defaults to
+                the categories that have versions
+            sg_package_id: Package ID, used to add its Bid Tracker versions
+            create_zip: Also write <package>.zip next to the folder
+            progress_callback: Called with progress dicts, from worker threads
+
+        Returns:
+            dict with package_name, package_folder, zip_path, is_update,
+            downloaded, unchanged, from_store, failed (list), removed, files (indexed
+            file count), entities, cancelled, error and elapsed
+        """
+        started_at = time.monotonic()
+        package_folder = self.output_dir / package_name
+        weights = STAGE_WEIGHTS[bool(create_zip)]
+        result = {
+            "package_name": package_name,
+            "package_folder": str(package_folder),
+            "zip_path": None,
+            "is_update": package_folder.exists(),
+            "downloaded": 0,
+            "unchanged": 0,
+            "from_store": 0,
+            "failed": [],
+            "removed": 0,
+            "files": 0,
+            "entities": {},
+            "cancelled": False,
+            "error": None,
+            "elapsed": 0.0,
+        }
+
+        def report(stage, fraction, message, **stats):
+            if not progress_callback:
+                return
+            percent = 0.0
+            for name, weight in weights.items():
+                if name == stage:
+                    percent += weight * min(max(fraction, 0.0), 1.0)
+                    break
+                percent += weight
+            progress_callback(dict(stats, package=package_name, stage=stage,
+                                   percent=round(percent, 1), message=message))
+
+        engine = None
+        try:
+            entities = categorize_versions(active_versions)
+            result["entities"] = {k: len(v) for k, v in entities.items() if v}
+            if data_types is None:
+                data_types = [category for category, versions in entities.items() if versions]
+
+            logger.info(f"Building package {package_name}: {manifest['summary']['total_folders']} folders, "
+                        f"{manifest['summary']['total_files']} files")
+            engine = self._prepare_downloads(package_folder, manifest, sg_package_id)
+
+            # Downloads
+            self._check_cancelled()
+
+            def on_download_progress(stats):
+                bytes_total = stats.get("bytes_total", 0)
+                if bytes_total:
+                    fraction = stats.get("bytes_done", 0) / bytes_total
+                else:
+                    fraction = stats.get("files_done", 0) / max(stats.get("files_total", 0), 1)
+                report("download", fraction,
+                       f"Downloading files... ({stats.get('files_done', 0)}/{stats.get('files_total', 0)})",
+                       **stats)
+
+            download = engine.run(progress_callback=on_download_progress)
+            if download.get("cancelled"):
+                raise PackageBuildCancelled()
+
+            downloaded_files = dict(download["files"])
+            result["downloaded"] = len(download["files"]) - download["skipped"] - download["from_store"]
+            result["unchanged"] = download["skipped"]
+            result["from_store"] = download["from_store"]
+            result["failed"] = download["failed"]
+
+            # Cleanup
+            if result["is_update"]:
+                report("cleanup", 0.0, "Cleaning up removed files...")
+                kept = dict(download["placed"])
+                # A failed download leaves the copy from the last build in place
+                for failure in download["failed"]:
+                    entry = engine.manifest.get(failure["version_id"], failure["field_name"]) or {}
+                    kept.setdefault(failure["version_id"], []).extend(
+                        str(package_folder / rel_path) for rel_path in entry.get("paths", [])
+                    )
+                result["removed"] = self._remove_obsolete_files(package_folder, kept)
+
+            # README.txt, written before hashing so its checksum is recorded
+            report("manifest", 0.0, "Writing manifest...")
+            write_text_manifest(package_folder / "README.txt", package_name,
+                                sg_project, sg_rfq, manifest, downloaded_files)
+
+            # Checksums. When cancelled here, manifest.json is still rewritten
+            # (without checksums) so it never keeps the index of a previous build
+            try:
+                file_index = self._hash_files(package_folder, result["is_update"], report)
+                result["files"] = len(file_index)
+            except HashingCancelled:
+                logger.warning("Writing manifest without checksums")
+                file_index = None
+
+            # manifest.json
+            self._write_manifest(package_folder, package_name, sg_project, sg_rfq, manifest,
+                                 entities, active_versions, data_types, file_index)
+            if file_index is None:
+                raise PackageBuildCancelled()
+            report("manifest", 1.0, "Manifest written")
+
+            # Zip
+            if create_zip:
+                result["zip_path"] = str(self._write_zip(package_folder, report))
+
+        except (PackageBuildCancelled, HashingCancelled, ZipCancelled):
+            logger.info(f"Build of package {package_name} cancelled")
+            result["cancelled"] = True
+        except Exception as e:
+            logger.error(f"Error building package {package_name}: {e}", exc_info=True)
+            result["error"] = str(e)
+        finally:
+            if engine is not None:
+                with self._lock:
+                    self._engines.remove(engine)
+
+        result["elapsed"] = round(time.monotonic() - started_at, 2)
+        return result
+
+    def _check_cancelled(self):
+        """Raise PackageBuildCancelled once cancel() was called."""
+        if self._cancelled.is_set():
+            raise PackageBuildCancelled()
+
+    def _prepare_downloads(self, package_folder, manifest, sg_package_id):
+        """Create the folder structure and queue the package's downloads.
+
+        A version assigned to several folders is downloaded once and
+        linked/copied into the other folders; files unchanged since the last
+        build (per the download manifest) are not downloaded again.
+
+        Returns:
+            PackageDownloadEngine with the downloads queued
+        """
+        package_folder.mkdir(parents=True, exist_ok=True)
+
+        # Create folder structure from manifest
+        for folder_path in manifest["folders"].keys():
+            # Remove leading slash and create folder
+            clean_path = folder_path.lstrip("/")
+            if clean_path:
+                (package_folder / clean_path).mkdir(parents=True, exist_ok=True)
+
+        engine = PackageDownloadEngine(
+            self.sg_session,
+            max_workers=self.download_workers,
+            manifest=DownloadManifest(package_folder),
+            store=self.media_store
+        )
+        with self._lock:
+            self._engines.append(engine)
+            if self._cancelled.is_set():
+                engine.cancel()
+
+        for folder_path, folder_data in manifest["folders"].items():
+            clean_folder_path = folder_path.lstrip("/")
+            target_folder = package_folder / clean_folder_path if clean_folder_path else package_folder
+            for file_info in folder_data.get("files", []):
+                version_id = file_info.get("id")
+                if version_id:
+                    engine.add(version_id, target_folder)
+
+        # Root-level files (files without folder assignment)
+        for file_info in manifest.get("root_files", []):
+            version_id = file_info.get("id")
+            if version_id:
+                engine.add(version_id, package_folder)
+
+        # Bid tracker files go to the bid_tracker folder
+        if sg_package_id:
+            bid_tracker_versions = self.sg_session.find_bid_tracker_versions_in_package(sg_package_id)
+            if bid_tracker_versions:
+                bid_tracker_folder = package_folder / "bid_tracker"
+                bid_tracker_folder.mkdir(parents=True, exist_ok=True)
+                for bt_version in bid_tracker_versions:
+                    if bt_version.get("id"):
+                        engine.add(bt_version["id"], bid_tracker_folder)
+
+        return engine
+
+    @staticmethod
+    def _remove_obsolete_files(package_folder, placed):
+        """Remove files and empty folders that are no longer part of the package.
+
+        Args:
+            package_folder: Root folder of the package
+            placed: {version_id: [paths]} placed by the download engine, plus
+                the previous copies of versions whose download failed
+
+        Returns:
+            Number of removed files
+        """
+        # Every file placed by the download engine (including linked copies)
+        valid_files = {Path(path).resolve() for paths in placed.values() for path in paths}
+        protected_files = {(package_folder / name).resolve() for name in PROTECTED_FILES}
+
+        files_removed = 0
+        for file_path in package_folder.rglob("*"):
+            if file_path.is_file():
+                resolved_path = file_path.resolve()
+                if resolved_path not in valid_files and resolved_path not in protected_files:
+                    try:
+                        file_path.unlink()
+                        files_removed += 1
+                        logger.info(f"Removed obsolete file: {file_path}")
+                    except Exception as e:
+                        logger.error(f"Failed to remove file {file_path}: {e}")
+
+        # Remove empty folders (walk bottom-up)
+        folders_removed = 0
+        for folder_path in sorted(package_folder.rglob("*"), key=lambda p: len(p.parts), reverse=True):
+            if folder_path.is_dir():
+                try:
+                    if not any(folder_path.iterdir()):
+                        folder_path.rmdir()
+                        folders_removed += 1
+                except Exception as e:
+                    logger.error(f"Failed to remove folder {folder_path}: {e}")
+
+        if files_removed > 0 or folders_removed > 0:
+            logger.info(f"Cleanup: removed {files_removed} files and {folders_removed} empty folders")
+        return files_removed
+
+    def _hash_files(self, package_folder, is_update, report):
+        """Compute the checksum index of the package folder.
+
+        Hashes from the previous manifest.json are reused for files whose
+        size and modification time didn't change.
+        """
+        previous_index = None
+        manifest_path = package_folder / "manifest.json"
+        if is_update and manifest_path.exists():
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    previous_index = load_file_index(json.load(f))
+            except Exception as e:
+                logger.warning(f"Could not read previous manifest for cached checksums: {e}")
+
+        report("hash", 0.0, "Computing checksums...")
+        return build_file_index(
+            package_folder,
+            previous_index=previous_index,
+            progress_callback=lambda done, total: report(
+                "hash", done / max(total, 1), f"Computing checksums... ({done}/{total})",
+                files_done=done, files_total=total
+            ),
+            is_cancelled=self.is_cancelled
+        )
+
+    @staticmethod
+    def _write_manifest(package_folder, package_name, sg_project, sg_rfq, manifest,
+                        entities, active_versions, data_types, file_index):
+        """Write manifest.json inside the package folder.
+
+        file_index is left out when None (checksums cancelled).
+        """
+        package_data = {
+            "metadata": {
+                "source": "Shotgrid",
+                "sg_project_id": sg_project["id"],
+                "sg_project_code": sg_project["code"],
+                "sg_rfq_id": sg_rfq["id"],
+                "sg_rfq_code": sg_rfq["code"],
+                "created_by": "FF Package Manager",
+                "package_name": package_name,
+                "data_types": data_types,
+                "active_versions_count": len(active_versions),
+                "active_version_ids": [v.get("id") for v in active_versions if v.get("id")]
+            },
+            "project": sg_project,
+            "rfq": sg_rfq,
+            "fetched_at": datetime.now().isoformat(),
+            "entities": entities,
+            "manifest": manifest
+        }
+        if file_index is not None:
+            package_data[FILE_INDEX_KEY] = file_index
+
+        manifest_path = package_folder / "manifest.json"
+        logger.info(f"Writing manifest to: {manifest_path}")
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(serialize_for_json(package_data), f, indent=2)
+
+    def _write_zip(self, package_folder, report):
+        """Archive the package folder as <package>.zip next to it."""
+        zip_path = package_folder.with_suffix('.zip')
+        members = collect_files(package_folder, EXCLUDED_FILES)
+
+        report("zip", 0.0, f"Zipping {package_folder.name}...")
+        try:
+            with open(zip_path, 'wb') as f:
+                summary = write_zip(
+                    members, f,
+                    progress_callback=lambda done, total, name: report(
+                        "zip", done / max(total, 1), f"Zipping: {name}",
+                        bytes_done=done, bytes_total=total
+                    ),
+                    is_cancelled=self.is_cancelled
+                )
+        except BaseException:
+            zip_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Zipped {summary['files']} files: {summary['bytes']} -> {summary['archive_bytes']} bytes")
+        return zip_path
+
+
+def build_packages(sg_session, packages: List[Dict[str, Any]], sg_project: Dict[str, Any],
+                   sg_rfq: Dict[str, Any], output_dir, max_parallel: int = 2,
+                   download_workers: Optional[int] = None, create_zip: bool = False,
+                   progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                   result_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                   builder: Optional[PackageBuilder] = None) -> List[Dict[str, Any]]:
+    """Build several ShotGrid packages concurrently.
+
+    Args:
+        sg_session: ShotgridClient (thread-safe through its connection pool)
+        packages: Package (CustomEntity12) dicts with id and code
+        sg_project: Project dict with id and code
+        sg_rfq: RFQ dict with id and code
+        output_dir: Folder the package folders are created in
+        max_parallel: Packages built at the same time
+        download_workers: Concurrent downloads per package
+        create_zip: Also write a zip archive per package
+        progress_callback: Called with progress dicts, from worker threads
+        result_callback: Called with each build result as its package finishes
+        builder: Optional PackageBuilder to use, e.g. to cancel() from
+            another thread
+
+    Returns:
+        List of build result dicts, in the order of packages
+    """
+    builder = builder or PackageBuilder(sg_session, output_dir, download_workers)
+    max_parallel = max(1, min(int(max_parallel), len(packages) or 1))
+    results = [None] * len(packages)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel,
+                                               thread_name_prefix="package-build") as pool:
+        futures = {
+            pool.submit(builder.build_from_shotgrid, package, sg_project, sg_rfq,
+                        create_zip, progress_callback): index
+            for index, package in enumerate(packages)
+        }
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # build() reports its own errors; this covers failures before it starts
+                    logger.error(f"Error building package {packages[index].get('code')}: {e}", exc_info=True)
+                    result = {
+                        "package_name": sanitize_package_name(packages[index].get("code", "")),
+                        "cancelled": False,
+                        "error": str(e),
+                    }
+                results[index] = result
+                if result_callback:
+                    result_callback(result)
+        except BaseException:
+            # e.g. KeyboardInterrupt: stop the running builds instead of waiting for them
+            builder.cancel()
+            for future in futures:
+                future.cancel()
+            raise
+    return results
@@ -0,0 +1,215 @@
+"""File-level deltas between delivered packages.
+
+When an updated package goes to a vendor that already received an earlier
+version, only the files that were added or changed need to be sent. Every
+shared package records a file index in its manifest.json:
+
+    "files": {"<relative/posix/path>": {"size": 123, "mtime_ns": ..., "sha256": "..."}}
+
+and a snapshot of it is attached to each PackageTracking record at share
+time, so the index of what a vendor actually received is known even after
+the package folder changes. compute_delta() compares that snapshot with the
+current index, and delta_members() turns the result into zip
+members: the added/changed files plus DELETED_FILES.txt (files to remove
+from the previous delivery) and DELTA_MANIFEST.json (machine-readable
+summary).
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from .download_manifest import DownloadManifest
+    from .file_hashing import hash_files
+    from .zip_writer import collect_files
+except ImportError:
+    from download_manifest import DownloadManifest
+    from file_hashing import hash_files
+    from zip_writer import collect_files
+
+logger = logging.getLogger(__name__)
+
+# Key of the file index in manifest.json
+FILE_INDEX_KEY = "files"
+
+# Files kept in the package folder but not delivered to vendors
+EXCLUDED_FILES = {"manifest.json", DownloadManifest.FILENAME}
+
+DELETIONS_FILENAME = "DELETED_FILES.txt"
+DELTA_MANIFEST_FILENAME = "DELTA_MANIFEST.json"
+
+
+def _posix(arcname: str) -> str:
+    """Return an archive name with forward slashes."""
+    return arcname.replace(os.sep, "/")
+
+
+def build_file_index(package_dir, excluded: Iterable[str] = EXCLUDED_FILES,
+                     download_manifest: Optional[DownloadManifest] = None,
+                     previous_index: Optional[Dict[str, Dict[str, Any]]] = None,
+                     max_workers: Optional[int] = None,
+                     progress_callback: Optional[Callable[[int, int], None]] = None,
+                     is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Dict[str, Any]]:
+    """Index the files of a package folder by relative path.
+
+    Hashes are reused instead of recomputed when
+    - previous_index has the file with the same size and modification time, or
+    - the download manifest recorded a hash for the file and its size and
+      modification time still match (the download engine hashes files while
+      downloading them).
+    All other files are hashed in parallel.
+
+    Args:
+        package_dir: Root folder of the package
+        excluded: File names to leave out (as in the delivered archive)
+        download_manifest: DownloadManifest of the package folder. Loaded
+            from the folder when omitted
+        previous_index: File index of the last build of this package folder
+        max_workers: Hashing threads
+        progress_callback: Called with (files_done, files_total) while hashing
+        is_cancelled: Callable checked while hashing; see file_hashing.hash_files
+
+    Returns:
+        dict: {relative posix path: {"size", "mtime_ns", "sha256"}}
+    """
+    package_dir = Path(package_dir)
+    if download_manifest is None:
+        download_manifest = DownloadManifest(package_dir)
+    previous_index = previous_index or {}
+
+    known_hashes = {}
+    for entry in download_manifest.entries():
+        if entry.get("sha256"):
+            mtimes = entry.get("mtime_ns") or {}
+            for rel_path in entry.get("paths", []):
+                known_hashes[rel_path] = (entry.get("size"), mtimes.get(rel_path), entry["sha256"])
+
+    index = {}
+    to_hash = {}
+    for member in collect_files(package_dir, excluded):
+        rel_path = _posix(member["arcname"])
+        try:
+            mtime_ns = os.stat(member["path"]).st_mtime_ns
+        except OSError:
+            continue
+        entry = {"size": member["size"], "mtime_ns": mtime_ns, "sha256": None}
+
+        previous = previous_index.get(rel_path) or {}
+        size, known_mtime_ns, sha256 = known_hashes.get(rel_path, (None, None, None))
+        if previous.get("sha256") and previous.get("size") == entry["size"] \
+                and previous.get("mtime_ns") == mtime_ns:
+            entry["sha256"] = previous["sha256"]
+        elif sha256 and size == entry["size"] and known_mtime_ns == mtime_ns:
+            entry["sha256"] = sha256
+        else:
+            to_hash[member["path"]] = rel_path
+        index[rel_path] = entry
+
+    if to_hash:
+        logger.info(f"Hashing {len(to_hash)} of {len(index)} package file(s)")
+        hashes = hash_files(to_hash.keys(), max_workers=max_workers,
+                            progress_callback=progress_callback, is_cancelled=is_cancelled)
+        for path, rel_path in to_hash.items():
+            if path in hashes:
+                index[rel_path]["sha256"] = hashes[path]
+            else:
+                # Unreadable file; leave it out rather than record a wrong hash
+                index.pop(rel_path)
+    return index
+
+
+def compute_delta(previous_index: Dict[str, Dict[str, Any]],
+                  current_index: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Compare two file indexes.
+
+    Args:
+        previous_index: Index of the package the vendor already has
+        current_index: Index of the package being delivered
+
+    Returns:
+        dict with sorted "added", "changed", "removed" and "unchanged" path lists
+    """
+    delta = {"added": [], "changed": [], "removed": [], "unchanged": []}
+    for rel_path, info in current_index.items():
+        previous = previous_index.get(rel_path)
+        if previous is None:
+            delta["added"].append(rel_path)
+        elif previous.get("sha256") != info.get("sha256") or previous.get("size") != info.get("size"):
+            delta["changed"].append(rel_path)
+        else:
+            delta["unchanged"].append(rel_path)
+    delta["removed"] = [rel_path for rel_path in previous_index if rel_path not in current_index]
+    for paths in delta.values():
+        paths.sort()
+    return delta
+
+
+def delta_size(delta: Dict[str, List[str]], current_index: Dict[str, Dict[str, Any]]) -> int:
+    """Return the number of source bytes a delta package contains."""
+    return sum(current_index[rel_path]["size"] for rel_path in delta["added"] + delta["changed"])
+
+
+def delta_members(package_dir, delta: Dict[str, List[str]], staging_dir,
+                  base_package: str, package_name: str,
+                  excluded: Iterable[str] = ()) -> List[Dict[str, Any]]:
+    """Build the zip members of a delta package.
+
+    Args:
+        package_dir: Root folder of the package being delivered
+        delta: Result of compute_delta
+        staging_dir: Existing folder DELETED_FILES.txt and DELTA_MANIFEST.json
+            are written to; the caller removes it after archiving
+        base_package: Name of the package the delta applies to
+        package_name: Name of the package being delivered
+        excluded: File names to leave out (as in the delivered archive)
+
+    Returns:
+        List of member dicts for zip_writer.write_zip
+    """
+    staging_dir = Path(staging_dir)
+    wanted = set(delta["added"]) | set(delta["changed"])
+    members = [
+        member for member in collect_files(package_dir, excluded)
+        if _posix(member["arcname"]) in wanted
+    ]
+
+    deletions_path = staging_dir / DELETIONS_FILENAME
+    lines = [
+        f"Files to delete from {base_package} when updating it to {package_name}.",
+        "Paths are relative to the package root.",
+        "",
+    ]
+    lines.extend(delta["removed"] or ["(none)"])
+    deletions_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    delta_manifest_path = staging_dir / DELTA_MANIFEST_FILENAME
+    with open(delta_manifest_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "package_name": package_name,
+            "base_package": base_package,
+            "created_at": datetime.now().isoformat(),
+            "added": delta["added"],
+            "changed": delta["changed"],
+            "removed": delta["removed"],
+        }, f, indent=2)
+
+    for path in (deletions_path, delta_manifest_path):
+        members.append({
+            "path": str(path),
+            "arcname": path.name,
+            "size": path.stat().st_size,
+            "stored": False,
+        })
+    return members
+
+
+def load_file_index(manifest_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return the file index stored in a package manifest, or None if it has none."""
+    if not isinstance(manifest_data, dict):
+        return None
+    index = manifest_data.get(FILE_INDEX_KEY)
+    return index if isinstance(index, dict) else None
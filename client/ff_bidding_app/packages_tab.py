@@ -14,6 +14,7 @@ try:
     from .image_viewer_widget import ImageViewerWidget
     from .document_viewer_widget import DocumentViewerWidget
     from .sliding_overlay_panel import SlidingOverlayPanelWithBackground
+    from .package_builder import PackageBuilder, sanitize_package_name
 except ImportError:
     from package_data_treeview import PackageTreeView, CustomCheckBox
     from bid_selector_widget import CollapsibleGroupBox
@@ -22,9 +23,38 @@ except ImportError:
     from image_viewer_widget import ImageViewerWidget
     from document_viewer_widget import DocumentViewerWidget
     from sliding_overlay_panel import SlidingOverlayPanelWithBackground
+    from package_builder import PackageBuilder, sanitize_package_name
     logger = logging.getLogger("FFPackageManager")
 
 
+class PackageBuildWorker(QtCore.QThread):
+    """Worker thread running PackageBuilder.build."""
+
+    progress = QtCore.Signal(dict)  # builder progress event
+    completed = QtCore.Signal(dict)  # builder result
+
+    def __init__(self, builder, build_kwargs, parent=None):
+        """Initialize the build worker.
+
+        Args:
+            builder: PackageBuilder
+            build_kwargs: Keyword arguments for PackageBuilder.build
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.builder = builder
+        self.build_kwargs = build_kwargs
+
+    def cancel(self):
+        """Ask the builder to stop; completed is still emitted."""
+        self.builder.cancel()
+
+    def run(self):
+        """Build the package."""
+        result = self.builder.build(progress_callback=self.progress.emit, **self.build_kwargs)
+        self.completed.emit(result)
+
+
 class PackagesTab(QtWidgets.QWidget):
     """Packages tab widget for managing data packages."""
 
@@ -66,6 +96,9 @@ class PackagesTab(QtWidgets.QWidget):
         self.delete_package_btn = None
         self.rename_package_btn = None
 
+        # Background build of the package being created
+        self._build_worker = None
+
         self._build_ui()
         self._load_field_schema()
 
@@ -272,7 +305,7 @@ class PackagesTab(QtWidgets.QWidget):
     def _load_field_schema(self):
         """Load field schema for CustomEntity02 (Bidding Scenes)."""
         try:
-            raw_schema = self.sg_session.sg.schema_field_read("CustomEntity02")
+            raw_schema = self.sg_session.get_entity_schema("CustomEntity02")
             self.field_schema = {}
             display_names = {}
 
@@ -542,26 +575,6 @@ class PackagesTab(QtWidgets.QWidget):
             self.output_path_input.setText(directory)
             logger.info(f"Output directory changed to: {directory}")
 
-    def _serialize_for_json(self, obj):
-        """
-        Recursively convert objects to JSON-serializable format.
-        Handles datetime objects and other non-serializable types.
-
-        Args:
-            obj: Object to serialize
-
-        Returns:
-            JSON-serializable object
-        """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {key: self._serialize_for_json(value) for key, value in obj.items()}
-        elif isinstance(obj, (list, tuple)):
-            return [self._serialize_for_json(item) for item in obj]
-        else:
-            return obj
-
     def _get_next_package_version(self, output_dir, base_name):
         """
         Find the next available version number for a package.
@@ -612,6 +625,13 @@ class PackagesTab(QtWidgets.QWidget):
 
         logger.info("_create_package() called")
 
+        if self._build_worker is not None and self._build_worker.isRunning():
+            QtWidgets.QMessageBox.information(
+                self, "Package In Progress",
+                "A package is already being created. Please wait for it to finish."
+            )
+            return
+
         # Get selected project and RFQ from parent app
         current_project_index = self.parent_app.sg_project_combo.currentIndex()
         sg_project = self.parent_app.sg_project_combo.itemData(current_project_index)
@@ -688,7 +708,7 @@ class PackagesTab(QtWidgets.QWidget):
             return
 
         # Use current package name, sanitize for filesystem (use hyphens)
-        package_name = self.current_package_name.replace(' ', '-').replace('_', '-')
+        package_name = sanitize_package_name(self.current_package_name)
         logger.info(f"Package name: {package_name}")
 
         # Check if package folder already exists
@@ -698,8 +718,9 @@ class PackagesTab(QtWidgets.QWidget):
             result = QtWidgets.QMessageBox.question(
                 self, "Package Already Exists",
                 f"The package folder already exists:\n{package_folder}\n\n"
-                f"Do you want to update it? This will overwrite existing files\n"
-                f"and remove files no longer in the package.",
+                f"Do you want to update it? Unchanged files are kept, new and\n"
+                f"changed files are downloaded and files no longer in the\n"
+                f"package are removed.",
                 QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
             )
             if result == QtWidgets.QMessageBox.No:
@@ -707,491 +728,158 @@ class PackagesTab(QtWidgets.QWidget):
                 return
             logger.info(f"User chose to update existing package: {package_folder}")
 
-        progress = QtWidgets.QProgressDialog(
-            "Creating data package...", "Cancel", 0, 100, self
-        )
-        progress.setWindowTitle("Creating Package")
-        progress.setWindowModality(QtCore.Qt.WindowModal)
-        progress.show()
-
-        try:
-            progress.setValue(20)
-            QtCore.QCoreApplication.processEvents()
-
-            # Collect selected data types based on visible categories
-            data_types = []
-            for category, checkbox in self.entity_type_checkboxes.items():
-                if checkbox.isChecked():
-                    # Convert category name to internal type name
-                    type_name = category.lower().replace(" ", "_")
-                    data_types.append(type_name)
-
-            logger.info(f"Data types to include: {data_types}")
-
-            progress.setValue(40)
-            QtCore.QCoreApplication.processEvents()
-
-            # Organize active versions by category
-            entities = {
-                "vfx_breakdown": [],
-                "script": [],
-                "concept_art": [],
-                "storyboard": []
-            }
-
-            # Categorize active versions
-            for version_data in active_versions:
-                sg_version_type = version_data.get('sg_version_type', '')
-
-                # Determine category based on version type
-                if isinstance(sg_version_type, dict):
-                    version_type_name = sg_version_type.get('name', '').lower()
-                else:
-                    version_type_name = str(sg_version_type).lower()
-
-                # Categorize the version
-                if 'vfx' in version_type_name or 'breakdown' in version_type_name:
-                    entities["vfx_breakdown"].append(version_data)
-                elif 'script' in version_type_name:
-                    entities["script"].append(version_data)
-                elif 'concept' in version_type_name or 'art' in version_type_name:
-                    entities["concept_art"].append(version_data)
-                elif 'storyboard' in version_type_name:
-                    entities["storyboard"].append(version_data)
-                else:
-                    # Fallback: try to categorize by code/task
-                    code = version_data.get('code', '').lower()
-                    if 'script' in code:
-                        entities["script"].append(version_data)
-                    elif 'concept' in code:
-                        entities["concept_art"].append(version_data)
-                    elif 'storyboard' in code:
-                        entities["storyboard"].append(version_data)
-                    else:
-                        # Default to vfx_breakdown if unsure
-                        entities["vfx_breakdown"].append(version_data)
-
-            progress.setValue(70)
-            QtCore.QCoreApplication.processEvents()
-
-            # Get manifest of package structure from the tree view
-            manifest = self.package_data_tree.get_package_manifest()
-            logger.info(f"Package manifest: {manifest['summary']['total_folders']} folders, "
-                        f"{manifest['summary']['total_files']} files")
-
-            # Create package folder
-            package_folder = output_dir / package_name
-            package_folder.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created package folder: {package_folder}")
-
-            # Create folder structure from manifest
-            for folder_path in manifest["folders"].keys():
-                # Remove leading slash and create folder
-                clean_path = folder_path.lstrip("/")
-                if clean_path:
-                    folder_full_path = package_folder / clean_path
-                    folder_full_path.mkdir(parents=True, exist_ok=True)
-                    logger.info(f"Created folder: {folder_full_path}")
-
-            progress.setValue(50)
-            QtCore.QCoreApplication.processEvents()
-
-            # Download files and copy to their assigned folders
-            # Track downloaded files to avoid re-downloading for multiple folder assignments
-            downloaded_files = {}  # version_id -> local file path
-            files_copied = 0
-            files_failed = 0
-
-            # Calculate total files for progress
-            total_files = manifest["summary"]["total_files"]
-            files_processed = 0
-
-            # Process files in folders
-            for folder_path, folder_data in manifest["folders"].items():
-                clean_folder_path = folder_path.lstrip("/")
-                target_folder = package_folder / clean_folder_path if clean_folder_path else package_folder
-
-                for file_info in folder_data.get("files", []):
-                    if progress.wasCanceled():
-                        logger.info("Package creation cancelled by user")
-                        return
+        # Collect selected data types based on visible categories
+        data_types = []
+        for category, checkbox in self.entity_type_checkboxes.items():
+            if checkbox.isChecked():
+                # Convert category name to internal type name
+                type_name = category.lower().replace(" ", "_")
+                data_types.append(type_name)
 
-                    version_id = file_info.get("id")
-                    if not version_id:
-                        continue
+        logger.info(f"Data types to include: {data_types}")
 
-                    files_processed += 1
-                    progress_value = 50 + int((files_processed / max(total_files, 1)) * 40)
-                    progress.setValue(progress_value)
-                    progress.setLabelText(f"Downloading files... ({files_processed}/{total_files})")
-                    QtCore.QCoreApplication.processEvents()
+        # Get manifest of package structure from the tree view
+        manifest = self.package_data_tree.get_package_manifest()
+        current_package_data = self.packages.get(self.current_package_name, {})
 
-                    try:
-                        # Check if file was already downloaded
-                        if version_id in downloaded_files:
-                            # Copy from already downloaded file
-                            source_file = downloaded_files[version_id]
-                            if source_file and Path(source_file).exists():
-                                dest_file = target_folder / Path(source_file).name
-                                if not dest_file.exists():
-                                    shutil.copy2(source_file, dest_file)
-                                    logger.info(f"Copied file to: {dest_file}")
-                                files_copied += 1
-                        else:
-                            # Download the file
-                            downloaded_path = self.sg_session.download_version_movie(
-                                version_id, str(target_folder)
-                            )
-                            if downloaded_path:
-                                downloaded_files[version_id] = downloaded_path
-                                files_copied += 1
-                                logger.info(f"Downloaded: {downloaded_path}")
-                            else:
-                                logger.warning(f"Failed to download version {version_id}")
-                                files_failed += 1
-                    except Exception as e:
-                        logger.error(f"Error processing file {version_id}: {e}")
-                        files_failed += 1
-
-            # Process root-level files (files without folder assignment)
-            for file_info in manifest.get("root_files", []):
-                if progress.wasCanceled():
-                    logger.info("Package creation cancelled by user")
-                    return
-
-                version_id = file_info.get("id")
-                if not version_id:
-                    continue
-
-                files_processed += 1
-                progress_value = 50 + int((files_processed / max(total_files, 1)) * 40)
-                progress.setValue(progress_value)
-                progress.setLabelText(f"Downloading files... ({files_processed}/{total_files})")
-                QtCore.QCoreApplication.processEvents()
-
-                try:
-                    if version_id not in downloaded_files:
-                        downloaded_path = self.sg_session.download_version_movie(
-                            version_id, str(package_folder)
-                        )
-                        if downloaded_path:
-                            downloaded_files[version_id] = downloaded_path
-                            files_copied += 1
-                            logger.info(f"Downloaded root file: {downloaded_path}")
-                        else:
-                            logger.warning(f"Failed to download root version {version_id}")
-                            files_failed += 1
-                except Exception as e:
-                    logger.error(f"Error processing root file {version_id}: {e}")
-                    files_failed += 1
+        builder = PackageBuilder(
+            self.sg_session, output_dir,
+            download_workers=self.app_settings.get_download_max_workers()
+        )
+        build_kwargs = {
+            "package_name": package_name,
+            "sg_project": sg_project,
+            "sg_rfq": sg_rfq,
+            "manifest": manifest,
+            "active_versions": active_versions,
+            "data_types": data_types,
+            "sg_package_id": current_package_data.get("sg_package_id"),
+        }
 
-            # Download bid tracker files to bid_tracker folder
-            current_package_data = self.packages.get(self.current_package_name, {})
-            sg_package_id = current_package_data.get("sg_package_id")
+        progress = QtWidgets.QProgressDialog(
+            "Downloading files...", "Cancel", 0, 100, self
+        )
+        progress.setWindowTitle("Creating Package")
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
 
-            if sg_package_id:
-                progress.setLabelText("Downloading bid tracker...")
-                QtCore.QCoreApplication.processEvents()
-
-                bid_tracker_versions = self.sg_session.find_bid_tracker_versions_in_package(sg_package_id)
-
-                if bid_tracker_versions:
-                    # Create bid_tracker folder
-                    bid_tracker_folder = package_folder / "bid_tracker"
-                    bid_tracker_folder.mkdir(parents=True, exist_ok=True)
-                    logger.info(f"Created bid_tracker folder: {bid_tracker_folder}")
-
-                    for bt_version in bid_tracker_versions:
-                        if progress.wasCanceled():
-                            logger.info("Package creation cancelled by user")
-                            return
-
-                        bt_version_id = bt_version.get("id")
-                        bt_code = bt_version.get("code", "bid_tracker")
-
-                        if bt_version_id:
-                            try:
-                                downloaded_path = self.sg_session.download_version_movie(
-                                    bt_version_id, str(bid_tracker_folder)
-                                )
-                                if downloaded_path:
-                                    files_copied += 1
-                                    logger.info(f"Downloaded bid tracker: {downloaded_path}")
-                                else:
-                                    logger.warning(f"Failed to download bid tracker {bt_code}")
-                                    files_failed += 1
-                            except Exception as e:
-                                logger.error(f"Error downloading bid tracker {bt_code}: {e}")
-                                files_failed += 1
-
-            # Clean up removed files and empty folders if updating existing package
-            files_removed = 0
-            if is_update:
-                progress.setLabelText("Cleaning up removed files...")
-                QtCore.QCoreApplication.processEvents()
-
-                # Build set of all valid file paths (files that should exist)
-                valid_files = set()
-
-                # Add all downloaded/copied files
-                for file_path in downloaded_files.values():
-                    if file_path:
-                        valid_files.add(Path(file_path).resolve())
-
-                # Also add files that exist in target folders (from copy operations)
-                for folder_path, folder_data in manifest["folders"].items():
-                    clean_folder_path = folder_path.lstrip("/")
-                    target_folder = package_folder / clean_folder_path if clean_folder_path else package_folder
-
-                    for file_info in folder_data.get("files", []):
-                        version_id = file_info.get("id")
-                        if version_id and version_id in downloaded_files:
-                            source_file = downloaded_files[version_id]
-                            if source_file:
-                                dest_file = target_folder / Path(source_file).name
-                                valid_files.add(dest_file.resolve())
-
-                # Add bid tracker files
-                bid_tracker_folder = package_folder / "bid_tracker"
-                if bid_tracker_folder.exists():
-                    for bt_file in bid_tracker_folder.iterdir():
-                        if bt_file.is_file():
-                            valid_files.add(bt_file.resolve())
-
-                # Protected files (manifest files)
-                protected_files = {
-                    (package_folder / "manifest.json").resolve(),
-                    (package_folder / "README.txt").resolve()
-                }
-
-                # Walk the package folder and remove files not in valid_files
-                for file_path in package_folder.rglob("*"):
-                    if file_path.is_file():
-                        resolved_path = file_path.resolve()
-                        if resolved_path not in valid_files and resolved_path not in protected_files:
-                            try:
-                                file_path.unlink()
-                                files_removed += 1
-                                logger.info(f"Removed obsolete file: {file_path}")
-                            except Exception as e:
-                                logger.error(f"Failed to remove file {file_path}: {e}")
-
-                # Remove empty folders (walk bottom-up)
-                folders_removed = 0
-                for folder_path in sorted(package_folder.rglob("*"), key=lambda p: len(p.parts), reverse=True):
-                    if folder_path.is_dir():
-                        try:
-                            # Check if folder is empty
-                            if not any(folder_path.iterdir()):
-                                folder_path.rmdir()
-                                folders_removed += 1
-                                logger.info(f"Removed empty folder: {folder_path}")
-                        except Exception as e:
-                            logger.error(f"Failed to remove folder {folder_path}: {e}")
-
-                if files_removed > 0 or folders_removed > 0:
-                    logger.info(f"Cleanup: removed {files_removed} files and {folders_removed} empty folders")
-
-            progress.setValue(95)
-            progress.setLabelText("Writing manifest...")
-            QtCore.QCoreApplication.processEvents()
-
-            package_data = {
-                "metadata": {
-                    "source": "Shotgrid",
-                    "sg_project_id": sg_project["id"],
-                    "sg_project_code": sg_project["code"],
-                    "sg_rfq_id": sg_rfq["id"],
-                    "sg_rfq_code": sg_rfq["code"],
-                    "created_by": "FF Package Manager",
-                    "package_name": package_name,
-                    "data_types": data_types,
-                    "active_versions_count": len(active_versions),
-                    "active_version_ids": active_version_ids
-                },
-                "project": sg_project,
-                "rfq": sg_rfq,
-                "fetched_at": datetime.now().isoformat(),
-                "entities": entities,
-                "manifest": manifest
-            }
-
-            # Write manifest JSON file inside package folder
-            manifest_filename = "manifest.json"
-            manifest_path = package_folder / manifest_filename
-
-            logger.info(f"Writing manifest to: {manifest_path}")
-
-            # Serialize the package data to handle datetime objects
-            serialized_package_data = self._serialize_for_json(package_data)
-
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(serialized_package_data, f, indent=2)
-
-            # Write plain text manifest for vendors
-            text_manifest_path = package_folder / "README.txt"
-            self._write_text_manifest(
-                text_manifest_path,
-                package_name,
-                sg_project,
-                sg_rfq,
-                manifest,
-                downloaded_files
-            )
-            logger.info(f"Writing text manifest to: {text_manifest_path}")
+        worker = PackageBuildWorker(builder, build_kwargs, self)
+        worker.progress.connect(
+            lambda event: self._on_package_build_progress(progress, event)
+        )
+        worker.completed.connect(
+            lambda result: self._finish_package_creation(result, sg_project, sg_rfq,
+                                                         manifest, len(active_versions), progress)
+        )
+        progress.canceled.connect(worker.cancel)
+        self._build_worker = worker
 
-            progress.setValue(100)
+        progress.show()
+        worker.start()
 
-            # Count total entities by category
-            entity_counts = {k: len(v) for k, v in entities.items() if isinstance(v, list) and len(v) > 0}
-            entity_summary = "\n".join([f"  {k}: {v}" for k, v in entity_counts.items()])
+    def _on_package_build_progress(self, progress, event):
+        """Update the package progress dialog from a PackageBuilder progress event.
 
-            logger.info("Package created successfully")
+        Args:
+            progress: QProgressDialog showing the package creation
+            event: Progress dict from PackageBuilder.build
+        """
+        if progress.wasCanceled():
+            return
 
-            # Build file stats message
-            file_stats = f"  Downloaded: {files_copied}"
-            if files_failed > 0:
-                file_stats += f"\n  Failed: {files_failed}"
-            if files_removed > 0:
-                file_stats += f"\n  Removed: {files_removed}"
+        progress.setValue(min(int(event.get("percent", 0)), 99))
+
+        label = event.get("message", "")
+        if event.get("stage") == "download":
+            rate = event.get("bytes_per_sec") or 0
+            if rate:
+                label += f"\n{rate / (1024 * 1024):.1f} MB/s"
+                eta = event.get("eta_seconds")
+                if eta is not None:
+                    minutes, seconds = divmod(int(eta), 60)
+                    label += f", about {minutes}m {seconds:02d}s remaining"
+            if event.get("current_file"):
+                label += f"\n{event['current_file']}"
+        progress.setLabelText(label)
+
+    def _finish_package_creation(self, result, sg_project, sg_rfq, manifest,
+                                 active_versions_count, progress):
+        """Report the created package.
 
-            QtWidgets.QMessageBox.information(
-                self, "Success",
-                f"Package created successfully!\n\n"
-                f"Package: {package_name}\n"
-                f"Project: {sg_project['code']}\n"
-                f"RFQ: {sg_rfq.get('code', 'N/A')}\n"
-                f"Active Versions: {len(active_versions)}\n"
-                f"\nManifest:\n"
-                f"  Folders: {manifest['summary']['total_folders']}\n"
-                f"  Files: {manifest['summary']['total_files']}\n"
-                f"\nFiles:\n{file_stats}\n"
-                f"\nVersions by category:\n{entity_summary if entity_summary else '  (none)'}\n\n"
-                f"Location:\n{package_folder}"
-            )
+        Args:
+            result: Result dict from PackageBuilder.build
+            sg_project: Project the package was built for
+            sg_rfq: RFQ the package was built for
+            manifest: Package manifest the package was built from
+            active_versions_count: Number of active versions in the package
+            progress: QProgressDialog showing the package creation
+        """
+        self._build_worker = None
+        progress.close()
 
-            # Refresh the Delivery tab's package list so the new package appears in the dropdown
-            if self.parent_app and hasattr(self.parent_app, 'delivery_tab'):
-                self.parent_app.delivery_tab._load_packages_for_rfq(sg_rfq)
-                logger.info("Refreshed Delivery tab package list")
+        if result.get("cancelled"):
+            logger.info("Package creation cancelled by user")
+            return
 
-        except Exception as e:
-            logger.error(f"Error creating package: {e}", exc_info=True)
+        if result.get("error"):
+            logger.error(f"Error creating package: {result['error']}")
             QtWidgets.QMessageBox.critical(
                 self, "Error",
-                f"Failed to create package:\n{str(e)}"
+                f"Failed to create package:\n{result['error']}"
             )
-        finally:
-            progress.close()
-
-    def _write_text_manifest(self, file_path, package_name,
-                              sg_project, sg_rfq, manifest, downloaded_files):
-        """Write a plain text manifest file for vendors.
+            return
 
-        Args:
-            file_path: Path to write the text file
-            package_name: Name of the package
-            sg_project: ShotGrid project data
-            sg_rfq: ShotGrid RFQ data
-            manifest: Package manifest dictionary
-            downloaded_files: Dict mapping version_id to downloaded file path
-        """
-        lines = []
-
-        # Header
-        lines.append("=" * 70)
-        lines.append(f"DATA PACKAGE: {package_name}")
-        lines.append("=" * 70)
-        lines.append("")
-
-        # Package Information
-        lines.append("PACKAGE INFORMATION")
-        lines.append("-" * 70)
-        lines.append(f"  Package Name:    {package_name}")
-        lines.append(f"  Project:         {sg_project.get('code', 'N/A')}")
-        lines.append(f"  RFQ:             {sg_rfq.get('code', 'N/A')}")
-        lines.append(f"  Created:         {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"  Created By:      FF Package Manager")
-        lines.append("")
-
-        # Summary
-        lines.append("SUMMARY")
-        lines.append("-" * 70)
-        lines.append(f"  Total Folders:   {manifest['summary']['total_folders']}")
-        lines.append(f"  Total Files:     {manifest['summary']['total_files']}")
-        lines.append("")
-
-        # Contents by Section (Folders)
-        lines.append("CONTENTS")
-        lines.append("-" * 70)
-
-        # Sort folders for consistent output - only include folders with files
-        sorted_folders = sorted(
-            [fp for fp, fd in manifest["folders"].items() if fd.get("files")]
+        # Build file stats message
+        file_stats = f"  Downloaded: {result['downloaded']}"
+        if result["unchanged"] > 0:
+            file_stats += f"\n  Unchanged: {result['unchanged']}"
+        if result["from_store"] > 0:
+            file_stats += f"\n  From media store: {result['from_store']}"
+        if result["failed"]:
+            file_stats += f"\n  Failed: {len(result['failed'])}"
+        if result["removed"] > 0:
+            file_stats += f"\n  Removed: {result['removed']}"
+
+        entity_summary = "\n".join([f"  {k}: {v}" for k, v in result["entities"].items()])
+
+        if result["failed"]:
+            failed_versions = "\n".join(
+                f"  Version {failure['version_id']}: {failure['error']}"
+                for failure in result["failed"]
+            )
+            logger.warning(f"Package created with {len(result['failed'])} failed download(s)")
+            title = "Package Incomplete"
+            headline = (
+                f"Package created, but {len(result['failed'])} file(s) could not be downloaded:\n"
+                f"{failed_versions}\n\nCreate the package again to retry them."
+            )
+            show_message = QtWidgets.QMessageBox.warning
+        else:
+            logger.info("Package created successfully")
+            title = "Success"
+            headline = "Package created successfully!"
+            show_message = QtWidgets.QMessageBox.information
+
+        show_message(
+            self, title,
+            f"{headline}\n\n"
+            f"Package: {result['package_name']}\n"
+            f"Project: {sg_project['code']}\n"
+            f"RFQ: {sg_rfq.get('code', 'N/A')}\n"
+            f"Active Versions: {active_versions_count}\n"
+            f"\nManifest:\n"
+            f"  Folders: {manifest['summary']['total_folders']}\n"
+            f"  Files: {manifest['summary']['total_files']}\n"
+            f"\nFiles:\n{file_stats}\n"
+            f"\nVersions by category:\n{entity_summary if entity_summary else '  (none)'}\n\n"
+            f"Location:\n{result['package_folder']}"
         )
 
-        for folder_path in sorted_folders:
-            folder_data = manifest["folders"][folder_path]
-            files = folder_data.get("files", [])
-
-            # Section header with folder path
-            clean_path = folder_path.lstrip("/") or "(Root)"
-            lines.append("")
-            lines.append(f"  [{clean_path}]")
-            lines.append(f"  " + "~" * (len(clean_path) + 2))
-
-            for file_info in files:
-                file_name = file_info.get("code", "Unknown")
-                status = file_info.get("status", "")
-                description = file_info.get("description", "")
-
-                # Get actual downloaded filename if available
-                version_id = file_info.get("id")
-                if version_id and version_id in downloaded_files:
-                    actual_file = Path(downloaded_files[version_id]).name
-                    lines.append(f"    - {actual_file}")
-                else:
-                    lines.append(f"    - {file_name}")
-
-                # Add status if available
-                if status:
-                    lines.append(f"      Status: {status}")
-
-                # Add description if available (truncate if too long)
-                if description:
-                    desc = description[:100] + "..." if len(description) > 100 else description
-                    lines.append(f"      Description: {desc}")
-
-        # Root files section
-        root_files = manifest.get("root_files", [])
-        if root_files:
-            lines.append("")
-            lines.append("  [Root Level Files]")
-            lines.append("  " + "~" * 18)
-
-            for file_info in root_files:
-                file_name = file_info.get("code", "Unknown")
-                status = file_info.get("status", "")
-
-                version_id = file_info.get("id")
-                if version_id and version_id in downloaded_files:
-                    actual_file = Path(downloaded_files[version_id]).name
-                    lines.append(f"    - {actual_file}")
-                else:
-                    lines.append(f"    - {file_name}")
-
-                if status:
-                    lines.append(f"      Status: {status}")
-
-        # Footer
-        lines.append("")
-        lines.append("=" * 70)
-        lines.append("END OF MANIFEST")
-        lines.append("=" * 70)
-
-        # Write to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+        # Refresh the Delivery tab's package list so the new package appears in the dropdown
+        if self.parent_app and hasattr(self.parent_app, 'delivery_tab'):
+            self.parent_app.delivery_tab._load_packages_for_rfq(sg_rfq)
+            logger.info("Refreshed Delivery tab package list")
 
     def _export_to_excel(self):
         """Export selected bidding scenes to Excel file."""
@@ -689,9 +689,9 @@ class RatesTab(QtWidgets.QWidget):
     def _fetch_price_list_data(self, price_list_id):
         """Fetch full price list data including linked entities."""
         try:
-            price_list_data = self.sg_session.sg.find_one(
+            price_list_data = self.sg_session.get_entity_by_id(
                 "CustomEntity10",
-                [["id", "is", price_list_id]],
+                price_list_id,
                 ["code", "sg_rate_card", "sg_line_items"]
             )
             self.current_price_list_data = price_list_data
@@ -764,9 +764,9 @@ class RatesTab(QtWidgets.QWidget):
 
             # Query the Rate Card data
             fields = self.rate_card_field_allowlist.copy()
-            rate_card_data = self.sg_session.sg.find_one(
+            rate_card_data = self.sg_session.get_entity_by_id(
                 "CustomNonProjectEntity01",
-                [["id", "is", rate_card_id]],
+                rate_card_id,
                 fields
             )
 
@@ -809,7 +809,7 @@ class RatesTab(QtWidgets.QWidget):
     def _fetch_rate_card_schema(self):
         """Fetch the schema for CustomNonProjectEntity01 (Rate Cards) and build field allowlist."""
         try:
-            schema = self.sg_session.sg.schema_field_read("CustomNonProjectEntity01")
+            schema = self.sg_session.get_entity_schema("CustomNonProjectEntity01")
 
             # Build field allowlist: start with basic fields, then add all fields ending with "_rate"
             self.rate_card_field_allowlist = ["id", "code"]
@@ -1429,7 +1429,7 @@ class RatesTab(QtWidgets.QWidget):
     def _fetch_line_items_schema(self):
         """Fetch the schema for CustomEntity03 (Line Items) and build field allowlist."""
         try:
-            schema = self.sg_session.sg.schema_field_read("CustomEntity03")
+            schema = self.sg_session.get_entity_schema("CustomEntity03")
 
             # Build field allowlist: start with basic fields, then add all fields ending with "_mandays"
             self.line_items_field_allowlist = ["id", "code"]
@@ -1812,9 +1812,9 @@ class RateCardDialog(QtWidgets.QDialog):
     def _fetch_price_list_data(self):
         """Fetch full price list data including linked entities."""
         try:
-            price_list_data = self.sg_session.sg.find_one(
+            price_list_data = self.sg_session.get_entity_by_id(
                 "CustomEntity10",
-                [["id", "is", self.current_price_list_id]],
+                self.current_price_list_id,
                 ["code", "sg_rate_card"]
             )
             self.current_price_list_data = price_list_data
@@ -1933,7 +1933,7 @@ class RateCardDialog(QtWidgets.QDialog):
     def _fetch_rate_card_schema(self):
         """Fetch the schema for CustomNonProjectEntity01 (Rate Cards) and build field allowlist."""
         try:
-            schema = self.sg_session.sg.schema_field_read("CustomNonProjectEntity01")
+            schema = self.sg_session.get_entity_schema("CustomNonProjectEntity01")
 
             # Build field allowlist: start with basic fields, then add all fields ending with "_rate"
             self.rate_card_field_allowlist = ["id", "code"]
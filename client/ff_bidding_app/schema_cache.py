@@ -0,0 +1,143 @@
+"""Persistent on-disk cache for ShotGrid field schemas.
+
+Field schemas rarely change but are large and slow to download. This module
+keeps the result of schema_field_read() per site URL and entity type (and
+optionally project) on disk so that opening a bid or restarting the app does
+not download them again.
+
+An entry is considered stale when it is older than the TTL or when the
+ShotGrid server version differs from the one it was read from; both checks
+are local and cost no extra API call.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaCache:
+    """Thread-safe, persisted cache of ShotGrid field schemas for one site."""
+
+    # Entries older than this are re-read from ShotGrid
+    DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(self, site_url: str, cache_dir: Optional[Path] = None,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """Initialize the schema cache.
+
+        Args:
+            site_url: ShotGrid site URL; each site gets its own cache file
+            cache_dir: Directory for cache files. Defaults to ~/.ff_bidding_app/schema_cache/
+            ttl_seconds: Maximum age of an entry before it is considered stale
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".ff_bidding_app" / "schema_cache"
+
+        self.cache_dir = Path(cache_dir)
+        self.site_url = (site_url or "").rstrip("/")
+        self.ttl_seconds = ttl_seconds
+
+        site_hash = hashlib.md5(self.site_url.encode("utf-8")).hexdigest()[:12]
+        self.cache_file = self.cache_dir / f"schema_{site_hash}.json"
+
+        self._lock = threading.RLock()
+        # {cache_key: {"schema": {...}, "fetched_at": float, "server_version": str}}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._load_from_disk()
+
+    @staticmethod
+    def make_key(entity_type: str, project_id: Optional[int] = None) -> str:
+        """Create the cache key for an entity type, optionally project-specific."""
+        if project_id:
+            return f"{entity_type}@{int(project_id)}"
+        return entity_type
+
+    def get(self, entity_type: str, project_id: Optional[int] = None,
+            server_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the cached schema, or None if missing or stale.
+
+        Args:
+            entity_type: ShotGrid entity type
+            project_id: Optional project for project-specific schemas
+            server_version: Current server version; entries read from another
+                version are stale
+
+        Returns:
+            Field schema dict as returned by schema_field_read(), or None
+        """
+        key = self.make_key(entity_type, project_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry.get("fetched_at", 0) > self.ttl_seconds:
+                return None
+            if server_version and entry.get("server_version") != server_version:
+                return None
+            return entry["schema"]
+
+    def set(self, entity_type: str, schema: Dict[str, Any], project_id: Optional[int] = None,
+            server_version: Optional[str] = None):
+        """Store a schema and persist the cache.
+
+        Args:
+            entity_type: ShotGrid entity type
+            schema: Field schema dict as returned by schema_field_read()
+            project_id: Optional project for project-specific schemas
+            server_version: Server version the schema was read from
+        """
+        key = self.make_key(entity_type, project_id)
+        with self._lock:
+            self._entries[key] = {
+                "schema": schema,
+                "fetched_at": time.time(),
+                "server_version": server_version,
+            }
+            self._save_to_disk()
+
+    def invalidate(self, entity_type: Optional[str] = None):
+        """Drop cached schemas for one entity type (all projects), or everything.
+
+        Args:
+            entity_type: Entity type to drop, or None to clear the whole cache
+        """
+        with self._lock:
+            if entity_type is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k.split("@")[0] == entity_type]:
+                    del self._entries[key]
+            self._save_to_disk()
+
+    def _load_from_disk(self):
+        """Load cached schemas from disk."""
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("site_url") == self.site_url:
+                self._entries = data.get("entries", {})
+                logger.debug(f"Loaded {len(self._entries)} cached schemas from {self.cache_file}")
+        except Exception as e:
+            logger.warning(f"Failed to load schema cache: {e}")
+            self._entries = {}
+
+    def _save_to_disk(self):
+        """Persist cached schemas, replacing the cache file atomically."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"site_url": self.site_url, "entries": self._entries}, f, default=str)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to save schema cache: {e}")
@@ -402,6 +402,122 @@ class AppSettings:
         """
         self.set("thumbnail_cache_max_age_days", days)
 
+    def get_media_store_path(self):
+        """Get the folder of the shared media store (see media_store).
+
+        Returns:
+            Path: Path to media store folder
+        """
+        default_store = Path.home() / ".ff_bidding_app" / "media_store"
+        store_path = self.get("media_store_path")
+        if store_path:
+            return Path(store_path)
+        return default_store
+
+    def set_media_store_path(self, path):
+        """Set the folder of the shared media store.
+
+        Args:
+            path: Path to store folder (string or Path object)
+        """
+        self.set("media_store_path", str(path))
+
+    def get_media_store_max_gb(self):
+        """Get the size budget of the shared media store in GB.
+
+        Returns:
+            float: Budget in GB (default: 50, 0 for unlimited)
+        """
+        return self.get("media_store_max_gb", 50)
+
+    def set_media_store_max_gb(self, size_gb):
+        """Set the size budget of the shared media store in GB.
+
+        Args:
+            size_gb: Budget in GB, 0 for unlimited
+        """
+        self.set("media_store_max_gb", size_gb)
+
+    def get_thumbnail_cache_max_mb(self):
+        """Get the disk budget of the thumbnail cache in MB.
+
+        Returns:
+            int: Budget in MB (default: 500, 0 for unlimited)
+        """
+        return self.get("thumbnail_cache_max_mb", 500)
+
+    def set_thumbnail_cache_max_mb(self, size_mb):
+        """Set the disk budget of the thumbnail cache in MB.
+
+        Args:
+            size_mb: Budget in MB, 0 for unlimited
+        """
+        self.set("thumbnail_cache_max_mb", size_mb)
+
+    def get_thumbnail_memory_cache_mb(self):
+        """Get the budget of decoded thumbnails kept in memory, in MB.
+
+        Returns:
+            int: Budget in MB (default: 64)
+        """
+        return self.get("thumbnail_memory_cache_mb", 64)
+
+    def set_thumbnail_memory_cache_mb(self, size_mb):
+        """Set the budget of decoded thumbnails kept in memory, in MB.
+
+        Args:
+            size_mb: Budget in MB
+        """
+        self.set("thumbnail_memory_cache_mb", size_mb)
+
+    def get_download_max_workers(self):
+        """Get the number of concurrent package downloads.
+
+        Returns:
+            int: Number of download workers (default: 4)
+        """
+        return self.get("download_max_workers", 4)
+
+    def set_download_max_workers(self, workers):
+        """Set the number of concurrent package downloads.
+
+        Args:
+            workers: Number of download workers
+        """
+        self.set("download_max_workers", workers)
+
+    def get_upload_chunk_size_mb(self):
+        """Get the Google Drive upload chunk size in MB.
+
+        Returns:
+            int: Chunk size in MB (default: 8)
+        """
+        return self.get("upload_chunk_size_mb", 8)
+
+    def set_upload_chunk_size_mb(self, size_mb):
+        """Set the Google Drive upload chunk size in MB.
+
+        Args:
+            size_mb: Chunk size in MB
+        """
+        self.set("upload_chunk_size_mb", size_mb)
+
+    def get_upload_max_concurrent(self):
+        """Get the number of Google Drive uploads that may run at once.
+
+        Returns:
+            int: Concurrent uploads (default: 2)
+        """
+        return self.get("upload_max_concurrent", 2)
+
+    def set_upload_max_concurrent(self, count):
+        """Set the number of Google Drive uploads that may run at once.
+
+        Args:
+            count: Concurrent uploads
+        """
+        self.set("upload_max_concurrent", count)
+
     def get_last_selected_rfq_id(self):
         """Get the last selected RFQ ID.
 
@@ -0,0 +1,105 @@
+"""Single-blob storage format for custom spreadsheets.
+
+A whole sheet (cell values, formulas, formats, cell metadata and sheet
+metadata) is serialized as one zlib-compressed, versioned JSON payload that is
+stored in a single text field on the Spreadsheet (CustomEntity15) record.
+Loading or saving a sheet then costs a constant number of ShotGrid calls
+instead of one record per cell.
+
+Payload layout:
+    "<PREFIX><version>:" + base64(zlib(json))
+"""
+
+import base64
+import json
+import logging
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# Marker at the start of every encoded payload
+PAYLOAD_PREFIX = "ffsheet"
+
+# Current payload version. Bump when the JSON layout changes and keep a
+# reader for every older version in _decode_cells.
+PAYLOAD_VERSION = 1
+
+
+def is_sheet_payload(text):
+    """Return True if text looks like an encoded sheet payload."""
+    return isinstance(text, str) and text.startswith(PAYLOAD_PREFIX)
+
+
+def encode_sheet_payload(data_dict, cell_meta_dict=None, sheet_meta=None):
+    """Encode a sheet into a compressed, versioned text payload.
+
+    Args:
+        data_dict: {(row, col): {'value': ..., 'formula': ..., 'format': ...}, ...}
+        cell_meta_dict: Optional cell metadata {'row,col': {...}, ...}
+        sheet_meta: Optional sheet-level metadata dict
+
+    Returns:
+        Payload string suitable for a ShotGrid text field
+    """
+    cells = []
+    for (row, col), cell_data in sorted(data_dict.items()):
+        cells.append([
+            int(row),
+            int(col),
+            cell_data.get('value'),
+            cell_data.get('formula'),
+            cell_data.get('format'),
+        ])
+
+    document = {
+        "cells": cells,
+        "cell_meta": cell_meta_dict or {},
+        "sheet_meta": sheet_meta or {},
+    }
+    raw = json.dumps(document, separators=(",", ":"), default=str).encode("utf-8")
+    encoded = base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+    return f"{PAYLOAD_PREFIX}{PAYLOAD_VERSION}:{encoded}"
+
+
+def decode_sheet_payload(text):
+    """Decode a payload produced by encode_sheet_payload.
+
+    Args:
+        text: Payload string
+
+    Returns:
+        Tuple of (data_dict, cell_meta_dict, sheet_meta), in the same format as
+        ShotgridClient.load_spreadsheet_by_name
+
+    Raises:
+        ValueError: If the payload is malformed or has an unsupported version
+    """
+    if not is_sheet_payload(text):
+        raise ValueError("Not a sheet payload")
+
+    header, _, body = text.partition(":")
+    try:
+        version = int(header[len(PAYLOAD_PREFIX):])
+    except ValueError:
+        raise ValueError(f"Invalid sheet payload header: {header!r}")
+    if version > PAYLOAD_VERSION:
+        raise ValueError(f"Unsupported sheet payload version {version}")
+
+    try:
+        document = json.loads(zlib.decompress(base64.b64decode(body)).decode("utf-8"))
+    except (ValueError, zlib.error) as e:
+        raise ValueError(f"Corrupt sheet payload: {e}")
+
+    data_dict = _decode_cells(document.get("cells", []), version)
+    return data_dict, document.get("cell_meta") or {}, document.get("sheet_meta") or {}
+
+
+def _decode_cells(cells, version):
+    """Convert the stored cell list back into a data_dict."""
+    data_dict = {}
+    for row, col, value, formula, cell_format in cells:
+        cell_data = {'value': value, 'formula': formula}
+        if cell_format:
+            cell_data['format'] = cell_format
+        data_dict[(row, col)] = cell_data
+    return data_dict
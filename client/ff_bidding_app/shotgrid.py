@@ -3,12 +3,26 @@ import logging
 import os
 import re
 import threading
+from contextlib import contextmanager
+
+try:
+    from .sheet_storage import encode_sheet_payload, decode_sheet_payload, is_sheet_payload
+    from .schema_cache import SchemaCache
+    from .entity_cache import EntityCache, CacheInvalidatingConnection
+    from .connection_pool import ShotgunConnectionPool, PooledConnection
+except ImportError:
+    from sheet_storage import encode_sheet_payload, decode_sheet_payload, is_sheet_payload
+    from schema_cache import SchemaCache
+    from entity_cache import EntityCache, CacheInvalidatingConnection
+    from connection_pool import ShotgunConnectionPool, PooledConnection
 
 try:
     from shotgun_api3 import Shotgun
     from shotgun_api3 import Fault  # at top with other imports
+    from shotgun_api3 import ShotgunError
 except ImportError:
     Shotgun = None
+    ShotgunError = None
     print("Warning: shotgun_api3 not installed. Using simulated data.")
 
 logger = logging.getLogger(__name__)
@@ -38,7 +52,7 @@ class ShotgridClient:
         rfqs = client.get_rfqs(project_id=123)
     """
 
-    def __init__(self, site_url=None, script_name=None, api_key=None):
+    def __init__(self, site_url=None, script_name=None, api_key=None, max_connections=None):
         """
         Initialize Shotgrid client.
 
@@ -46,26 +60,49 @@ class ShotgridClient:
             site_url: SG URL (or use SG_URL env var)
             script_name: Script name (or use SG_SCRIPT env var)
             api_key: API key (or use SG_KEY env var)
+            max_connections: Maximum number of live ShotGrid sessions
+                (or use FF_SG_MAX_CONNECTIONS env var, default 4)
         """
         self.site_url = site_url or os.getenv("SG_URL", "")
         self.script_name = script_name or os.getenv("SG_SCRIPT", "")
         self.api_key = api_key or os.getenv("SG_KEY", "")
 
-        # Thread-local connections: each thread gets its own ShotGrid connection
-        # This solves the SSL connection thread-safety issue
-        self._connections = {}
-        self._connections_lock = threading.Lock()
-
-        # Thread-safe schema caches with RLock for re-entrant access
+        # Bounded connection pool: shotgun_api3 connections are not thread-safe,
+        # so every API call checks out a connection for its own exclusive use
+        # (see connection_pool). The pool is created on first connect().
+        self.max_connections = int(
+            max_connections or os.getenv("FF_SG_MAX_CONNECTIONS", ShotgunConnectionPool.DEFAULT_MAX_SIZE)
+        )
+        self._pool = None
+        self._pooled_sg = None
+        self._pool_lock = threading.Lock()
+        # Session token for direct attachment downloads (see get_download_cookies)
+        self._download_session_token = None
+
+        # Persistent schema cache shared by every schema read in the app,
+        # keyed by site URL + entity type (see schema_cache)
         self._schema_lock = threading.RLock()
-        self._field_schema_cache = {}
-        self._entity_schema_cache = {}
+        self._schema_cache = SchemaCache(self.site_url)
+
+        # Read-through cache for get_entity_by_id(); connections invalidate it on writes
+        self._entity_cache = EntityCache()
+
+        # Custom spreadsheet storage: "blob" stores a whole sheet in one field on
+        # the Spreadsheet record (see sheet_storage), "cells" keeps one
+        # SpreadsheetItem per cell. "blob" falls back to "cells" when the site
+        # has no SHEET_DATA_FIELD. Sheets stored as a blob are read from it
+        # in either mode.
+        self.spreadsheet_storage = os.getenv("FF_SPREADSHEET_STORAGE", "blob")
+        # Whether the site has SHEET_DATA_FIELD; None until the schema was read
+        self._has_sheet_data_field = None
 
     def connect(self):
         """Connect to Shotgrid.
 
-        Returns a thread-local connection. Each thread gets its own ShotGrid
-        connection to avoid SSL connection thread-safety issues.
+        Returns a connection proxy backed by the client's bounded connection
+        pool. Each call made through it runs on a pooled connection that no
+        other thread uses at the same time, which avoids SSL connection
+        thread-safety issues without one session per thread.
         """
         if Shotgun is None:
             raise RuntimeError(
@@ -79,27 +116,56 @@ class ShotgridClient:
                 "or set SG_URL, SG_SCRIPT, SG_KEY environment variables."
             )
 
-        thread_id = threading.current_thread().ident
-
-        # Fast path: check if connection exists without lock
-        if thread_id in self._connections:
-            return self._connections[thread_id]
-
-        # Slow path: create new connection with lock
-        with self._connections_lock:
-            # Double-check after acquiring lock
-            if thread_id not in self._connections:
-                logger.debug(f"Creating new ShotGrid connection for thread {thread_id}")
-                self._connections[thread_id] = Shotgun(
-                    base_url=self.site_url,
-                    script_name=self.script_name,
-                    api_key=self.api_key
+        # Fast path: pool already created
+        if self._pooled_sg is not None:
+            return self._pooled_sg
+
+        with self._pool_lock:
+            if self._pooled_sg is None:
+                self._pool = ShotgunConnectionPool(
+                    self._create_connection,
+                    max_size=self.max_connections,
+                    # Server-side faults and argument errors leave the connection usable
+                    recoverable_errors=(ShotgunError, ValueError, TypeError, KeyError),
                 )
-            return self._connections[thread_id]
+                self._pooled_sg = PooledConnection(self._pool)
+            return self._pooled_sg
+
+    def _create_connection(self):
+        """Create a new ShotGrid connection for the pool."""
+        logger.debug("Creating new ShotGrid connection")
+        return CacheInvalidatingConnection(
+            Shotgun(
+                base_url=self.site_url,
+                script_name=self.script_name,
+                api_key=self.api_key
+            ),
+            self._entity_cache
+        )
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Check out one pooled connection for a sequence of calls.
+
+        Usage:
+            with client.connection() as sg:
+                sg.find(...)
+                sg.update(...)
+
+        Args:
+            timeout: Seconds to wait for a free connection (None waits forever)
+        """
+        self.connect()
+        with self._pool.connection(timeout) as connection:
+            yield connection
+
+    def get_connection_pool_stats(self):
+        """Return connection pool counters, or {} before the first connection."""
+        return self._pool.get_stats() if self._pool else {}
 
     @property
     def sg(self):
-        """Get or create Shotgrid connection for the current thread."""
+        """Get the pooled Shotgrid connection proxy."""
         return self.connect()
 
     def get_projects(self, fields=None, status=None):
@@ -273,26 +339,61 @@ class ShotgridClient:
     # ------------------------------------------------------------------
 
     def get_field_schema(self, entity_type, field_name):
-        """Read schema information for a specific field and cache the result.
+        """Read schema information for a specific field.
 
-        Thread-safe: Uses RLock to protect cache access.
+        Served from the entity schema cache, see get_entity_schema().
+
+        Returns:
+            Field schema dict, or {} if the field does not exist
         """
-        cache_key = (entity_type, field_name)
-        with self._schema_lock:
-            if cache_key not in self._field_schema_cache:
-                schema = self.sg.schema_field_read(entity_type, field_name)
-                self._field_schema_cache[cache_key] = schema.get(field_name, {})
-            return self._field_schema_cache[cache_key]
+        return self.get_entity_schema(entity_type).get(field_name, {})
+
+    def get_entity_schema(self, entity_type, project_id=None):
+        """Read the field schema of an entity type through the persistent schema cache.
+
+        Equivalent to sg.schema_field_read(entity_type[, project_entity]), but
+        only hits ShotGrid when the cached copy is missing, older than the
+        cache TTL, or was read from a different server version.
 
-    def get_entity_schema(self, entity_type):
-        """Read and cache the schema for an entity type.
+        Thread-safe: Uses RLock so concurrent callers download a schema once.
 
-        Thread-safe: Uses RLock to protect cache access.
+        Args:
+            entity_type: ShotGrid entity type
+            project_id: Optional project ID for project-specific field settings
+
+        Returns:
+            dict: {field_name: field_schema, ...}
         """
         with self._schema_lock:
-            if entity_type not in self._entity_schema_cache:
-                self._entity_schema_cache[entity_type] = self.sg.schema_read(entity_type)
-            return self._entity_schema_cache[entity_type]
+            server_version = self._server_version()
+            schema = self._schema_cache.get(entity_type, project_id, server_version)
+            if schema is None:
+                if project_id:
+                    schema = self.sg.schema_field_read(
+                        entity_type,
+                        project_entity={"type": "Project", "id": int(project_id)}
+                    )
+                else:
+                    schema = self.sg.schema_field_read(entity_type)
+                self._schema_cache.set(entity_type, schema, project_id, server_version)
+            return schema
+
+    def invalidate_schema_cache(self, entity_type=None):
+        """Force the next schema read of entity_type (or of every entity) to hit ShotGrid."""
+        with self._schema_lock:
+            self._schema_cache.invalidate(entity_type)
+
+    def _server_version(self):
+        """Return the ShotGrid server version as a string, or None if unknown.
+
+        The version is fetched once per connection by shotgun_api3, so this is
+        a cheap staleness check for cached schemas.
+        """
+        try:
+            version = self.sg.server_info.get("version")
+        except Exception:
+            return None
+        return ".".join(str(v) for v in version) if version else None
 
     def get_bidding_scenes_for_vfx_breakdown(self, vfx_breakdown_id, fields=None, order=None):
         """
@@ -547,16 +648,123 @@ class ShotgridClient:
         result = self.sg.delete("CustomEntity07", int(asset_id))
         return result
 
-    def delete_rfq_and_related(self, rfq_id):
+    # Deletion order for delete_rfq_and_related: children before parents
+    RFQ_DELETE_STEPS = (
+        ("bidding_scenes", "CustomEntity02"),
+        ("bid_assets", "CustomEntity08"),
+        ("bids", "CustomEntity06"),
+        ("vfx_breakdowns", "CustomEntity01"),
+        ("rfq", "CustomEntity04"),
+    )
+
+    @staticmethod
+    def _link_ids(value):
+        """Return the entity IDs of a single- or multi-entity link field value."""
+        if isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            return []
+        return [int(link["id"]) for link in value if isinstance(link, dict) and link.get("id")]
+
+    def _rfq_delete_journal_path(self, rfq_id):
+        """Return the journal file used to resume an interrupted delete_rfq_and_related."""
+        from pathlib import Path
+        return Path.home() / ".ff_bidding_app" / "delete_journals" / f"rfq_{int(rfq_id)}.json"
+
+    def plan_rfq_delete(self, rfq_id):
+        """
+        Collect everything delete_rfq_and_related would remove for an RFQ.
+
+        The graph RFQ -> Bids -> VFX Breakdowns -> Bidding Scenes / Bid Assets is
+        read with one query per level using "in" filters.
+
+        Args:
+            rfq_id: RFQ ID
+
+        Returns:
+            dict: {"rfq_id": int, "steps": [{"key", "entity_type", "ids"}, ...]} in
+                  deletion order, or None if the RFQ does not exist
+        """
+        rfq = self.sg.find_one(
+            "CustomEntity04",
+            [["id", "is", int(rfq_id)]],
+            ["id", "code", "sg_early_bid", "sg_turnover_bid", "sg_vfx_breakdown"]
+        )
+        if not rfq:
+            return None
+
+        bid_ids = list(dict.fromkeys(
+            self._link_ids(rfq.get("sg_early_bid")) + self._link_ids(rfq.get("sg_turnover_bid"))
+        ))
+        breakdown_ids = self._link_ids(rfq.get("sg_vfx_breakdown"))
+        bid_assets_ids = []
+
+        if bid_ids:
+            bids = self.sg.find(
+                "CustomEntity06",
+                [["id", "in", bid_ids]],
+                ["id", "sg_vfx_breakdown", "sg_bid_assets"]
+            )
+            for bid in bids:
+                breakdown_ids.extend(self._link_ids(bid.get("sg_vfx_breakdown")))
+                bid_assets_ids.extend(self._link_ids(bid.get("sg_bid_assets")))
+        breakdown_ids = list(dict.fromkeys(breakdown_ids))
+        bid_assets_ids = list(dict.fromkeys(bid_assets_ids))
+
+        scene_ids = []
+        if breakdown_ids:
+            scenes = self.sg.find(
+                "CustomEntity02",
+                [["sg_parent", "in", [{"type": "CustomEntity01", "id": b} for b in breakdown_ids]]],
+                ["id"]
+            )
+            scene_ids = [scene["id"] for scene in scenes]
+
+        ids_by_key = {
+            "bidding_scenes": scene_ids,
+            "bid_assets": bid_assets_ids,
+            "bids": bid_ids,
+            "vfx_breakdowns": breakdown_ids,
+            "rfq": [int(rfq_id)],
+        }
+        return {
+            "rfq_id": int(rfq_id),
+            "steps": [
+                {"key": key, "entity_type": entity_type, "ids": ids_by_key[key]}
+                for key, entity_type in self.RFQ_DELETE_STEPS
+            ],
+        }
+
+    def delete_rfq_and_related(self, rfq_id, dry_run=False, resume=True, chunk_size=None,
+                               progress_callback=None):
         """
         Delete an RFQ and all related elements (Bids, VFX Breakdowns, Bidding Scenes, Bid Assets).
 
+        Runs in two phases: the dependency graph is collected first (see
+        plan_rfq_delete), then deleted children-first in batched requests. The
+        plan and progress are journaled to disk after every batch, so a run
+        that was interrupted resumes where it stopped instead of re-collecting
+        a half-deleted graph.
+
+        When deletes of a step fail, the run stops before the parent steps and
+        keeps the journal with the failed IDs; the next run retries those
+        first and then carries on with the remaining steps.
+
         Args:
             rfq_id: RFQ ID
+            dry_run: Only collect the plan and return the counts, delete nothing
+            resume: Continue from an existing journal for this RFQ (if any)
+            chunk_size: Optional number of deletes per batch request
+            progress_callback: Optional callback(current, total, message) called after each batch
 
         Returns:
-            dict: Summary of deleted items
+            dict: Summary of deleted items (or of items that would be deleted on a
+                  dry run). Also holds "plan", "failed" (one dict per failed
+                  delete, see batch_write) and "pending" (deletes not attempted
+                  because an earlier step failed)
         """
+        import json
+
         log = logging.getLogger(__name__)
         deleted_summary = {
             "rfq": 0,
@@ -564,125 +772,124 @@ class ShotgridClient:
             "vfx_breakdowns": 0,
             "bidding_scenes": 0,
             "bid_assets": 0,
-            "assets": 0
+            "assets": 0,
+            "failed": [],
+            "pending": 0,
+            "plan": None,
         }
 
-        try:
-            # First, get the RFQ with all its linked data
-            rfq = self.sg.find_one(
-                "CustomEntity04",
-                [["id", "is", int(rfq_id)]],
-                ["id", "code", "sg_early_bid", "sg_turnover_bid", "sg_vfx_breakdown"]
-            )
+        journal_path = self._rfq_delete_journal_path(rfq_id)
+        journal = None
+        if resume and not dry_run and journal_path.exists():
+            try:
+                with open(journal_path, 'r', encoding='utf-8') as f:
+                    journal = json.load(f)
+                log.info(f"Resuming deletion of RFQ {rfq_id} from journal "
+                         f"({journal['completed']} delete(s) already done)")
+            except Exception as e:
+                log.warning(f"Ignoring unreadable delete journal {journal_path}: {e}")
+                journal = None
 
-            if not rfq:
-                log.warning(f"RFQ {rfq_id} not found")
+        try:
+            if journal is None:
+                plan = self.plan_rfq_delete(rfq_id)
+                if not plan:
+                    log.warning(f"RFQ {rfq_id} not found")
+                    return deleted_summary
+                journal = {"plan": plan, "completed": 0, "failed": []}
+            plan = journal["plan"]
+            deleted_summary["plan"] = plan
+
+            requests = []
+            labels = []
+            for step in plan["steps"]:
+                for entity_id in step["ids"]:
+                    requests.append({
+                        "request_type": "delete",
+                        "entity_type": step["entity_type"],
+                        "entity_id": int(entity_id),
+                    })
+                    labels.append(step["key"])
+
+            if dry_run:
+                for step in plan["steps"]:
+                    deleted_summary[step["key"]] = len(step["ids"])
                 return deleted_summary
 
-            # Collect all bids linked to this RFQ
-            bids_to_delete = []
-            if rfq.get("sg_early_bid"):
-                bid = rfq["sg_early_bid"]
-                if isinstance(bid, dict) and bid.get("id"):
-                    bids_to_delete.append(bid["id"])
-                elif isinstance(bid, list):
-                    bids_to_delete.extend([b["id"] for b in bid if isinstance(b, dict) and b.get("id")])
-
-            if rfq.get("sg_turnover_bid"):
-                bid = rfq["sg_turnover_bid"]
-                if isinstance(bid, dict) and bid.get("id"):
-                    bids_to_delete.append(bid["id"])
-                elif isinstance(bid, list):
-                    bids_to_delete.extend([b["id"] for b in bid if isinstance(b, dict) and b.get("id")])
-
-            # Collect all VFX breakdowns linked to this RFQ
-            vfx_breakdowns_to_delete = []
-            if rfq.get("sg_vfx_breakdown"):
-                breakdown = rfq["sg_vfx_breakdown"]
-                if isinstance(breakdown, dict) and breakdown.get("id"):
-                    vfx_breakdowns_to_delete.append(breakdown["id"])
-                elif isinstance(breakdown, list):
-                    vfx_breakdowns_to_delete.extend([b["id"] for b in breakdown if isinstance(b, dict) and b.get("id")])
-
-            # For each bid, get its linked VFX breakdown and bid assets
-            for bid_id in bids_to_delete:
-                try:
-                    bid_data = self.sg.find_one(
-                        "CustomEntity06",
-                        [["id", "is", int(bid_id)]],
-                        ["id", "sg_vfx_breakdown", "sg_bid_assets"]
-                    )
+            def write_journal():
+                journal_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(journal_path, 'w', encoding='utf-8') as f:
+                    json.dump(journal, f)
 
-                    if bid_data:
-                        # Add VFX breakdown from bid (if not already in list)
-                        if bid_data.get("sg_vfx_breakdown"):
-                            breakdown = bid_data["sg_vfx_breakdown"]
-                            if isinstance(breakdown, dict) and breakdown.get("id"):
-                                if breakdown["id"] not in vfx_breakdowns_to_delete:
-                                    vfx_breakdowns_to_delete.append(breakdown["id"])
-                            elif isinstance(breakdown, list):
-                                for b in breakdown:
-                                    if isinstance(b, dict) and b.get("id") and b["id"] not in vfx_breakdowns_to_delete:
-                                        vfx_breakdowns_to_delete.append(b["id"])
-
-                        # Delete bid assets linked to this bid
-                        if bid_data.get("sg_bid_assets"):
-                            bid_assets = bid_data["sg_bid_assets"]
-                            if isinstance(bid_assets, dict) and bid_assets.get("id"):
-                                try:
-                                    self.delete_bid_assets(bid_assets["id"])
-                                    deleted_summary["bid_assets"] += 1
-                                    log.info(f"Deleted Bid Assets {bid_assets['id']}")
-                                except Exception as e:
-                                    log.error(f"Failed to delete Bid Assets {bid_assets['id']}: {e}")
-                            elif isinstance(bid_assets, list):
-                                for ba in bid_assets:
-                                    if isinstance(ba, dict) and ba.get("id"):
-                                        try:
-                                            self.delete_bid_assets(ba["id"])
-                                            deleted_summary["bid_assets"] += 1
-                                            log.info(f"Deleted Bid Assets {ba['id']}")
-                                        except Exception as e:
-                                            log.error(f"Failed to delete Bid Assets {ba['id']}: {e}")
-
-                    # Delete the bid
-                    self.delete_bid(bid_id)
-                    deleted_summary["bids"] += 1
-                    log.info(f"Deleted Bid {bid_id}")
-
-                except Exception as e:
-                    log.error(f"Failed to delete Bid {bid_id}: {e}")
-
-            # For each VFX breakdown, delete all linked bidding scenes
-            for breakdown_id in vfx_breakdowns_to_delete:
-                try:
-                    # Get all bidding scenes linked to this breakdown
-                    bidding_scenes = self.get_bidding_scenes_for_vfx_breakdown(
-                        breakdown_id,
-                        fields=["id"]
-                    )
+            write_journal()
 
-                    # Delete all bidding scenes
-                    for scene in bidding_scenes:
-                        try:
-                            self.delete_bidding_scene(scene["id"])
-                            deleted_summary["bidding_scenes"] += 1
-                            log.info(f"Deleted Bidding Scene {scene['id']}")
-                        except Exception as e:
-                            log.error(f"Failed to delete Bidding Scene {scene['id']}: {e}")
-
-                    # Delete the VFX breakdown
-                    self.delete_vfx_breakdown(breakdown_id)
-                    deleted_summary["vfx_breakdowns"] += 1
-                    log.info(f"Deleted VFX Breakdown {breakdown_id}")
-
-                except Exception as e:
-                    log.error(f"Failed to delete VFX Breakdown {breakdown_id}: {e}")
-
-            # Finally, delete the RFQ
-            self.delete_rfq(rfq_id)
-            deleted_summary["rfq"] = 1
-            log.info(f"Deleted RFQ {rfq_id}")
+            def run_deletes(batch_requests, batch_labels, on_batch=None):
+                result = self.batch_write(
+                    batch_requests, chunk_size=chunk_size,
+                    labels=batch_labels, progress_callback=on_batch
+                )
+                return [{
+                    "key": failure["label"],
+                    "entity_type": failure["request"]["entity_type"],
+                    "entity_id": failure["request"]["entity_id"],
+                    "error": failure["error"],
+                } for failure in result["failed"]]
+
+            # Retry what failed last time before touching any parent
+            if journal["failed"]:
+                log.info(f"Retrying {len(journal['failed'])} failed delete(s) of RFQ {rfq_id}")
+                journal["failed"] = run_deletes(
+                    [{"request_type": "delete", "entity_type": failure["entity_type"],
+                      "entity_id": int(failure["entity_id"])} for failure in journal["failed"]],
+                    [failure["key"] for failure in journal["failed"]]
+                )
+                write_journal()
+
+            step_start = 0
+            for step in plan["steps"]:
+                step_end = step_start + len(step["ids"])
+                start = max(step_start, journal["completed"])
+                step_start = step_end
+                if start >= step_end:
+                    continue
+                if journal["failed"]:
+                    # Children still exist; deleting their parents would orphan them
+                    log.warning(f"Stopping before {step['key']}: {len(journal['failed'])} "
+                                f"delete(s) of RFQ {rfq_id} failed")
+                    break
+
+                def on_batch(current, total, message, start=start):
+                    journal["completed"] = start + current
+                    write_journal()
+                    if progress_callback:
+                        progress_callback(journal["completed"], len(requests),
+                                          f"Deleted {journal['completed']} of {len(requests)} items...")
+
+                journal["failed"] = run_deletes(
+                    requests[start:step_end], labels[start:step_end], on_batch
+                )
+                write_journal()
+
+            failed_counts = {}
+            for failure in journal["failed"]:
+                failed_counts[failure["key"]] = failed_counts.get(failure["key"], 0) + 1
+            step_start = 0
+            for step in plan["steps"]:
+                attempted = min(len(step["ids"]), max(0, journal["completed"] - step_start))
+                step_start += len(step["ids"])
+                deleted_summary[step["key"]] = attempted - failed_counts.get(step["key"], 0)
+            deleted_summary["failed"] = journal["failed"]
+            deleted_summary["pending"] = len(requests) - journal["completed"]
+
+            for failure in journal["failed"]:
+                log.error(f"Failed to delete {failure['entity_type']} {failure['entity_id']}: {failure['error']}")
+            counts = ", ".join(f"{step['key']}={deleted_summary[step['key']]}" for step in plan["steps"])
+            log.info(f"Deleted RFQ {rfq_id} and related items: {counts}")
+
+            if journal["failed"]:
+                log.warning(f"Kept delete journal {journal_path}; run the delete again to retry")
+            else:
+                journal_path.unlink()
 
         except Exception as e:
             log.error(f"Error in delete_rfq_and_related: {e}", exc_info=True)
@@ -918,11 +1125,39 @@ class ShotgridClient:
 
         return field_names, display_labels
 
-    def get_entity_by_id(self, entity_type, entity_id, fields=None):
-        """Retrieve a single entity by id."""
+    def get_entity_by_id(self, entity_type, entity_id, fields=None, use_cache=True):
+        """Retrieve a single entity by id.
 
-        filters = [["id", "is", entity_id]]
-        return self.sg.find_one(entity_type, filters, fields)
+        Reads go through the entity cache, keyed by (entity type, id, fields).
+        Any create/update/delete sent through this client's connections
+        invalidates the affected entries.
+
+        Args:
+            entity_type: ShotGrid entity type
+            entity_id: Entity ID
+            fields: List of fields to return
+            use_cache: Set to False to always query ShotGrid
+
+        Returns:
+            Entity dictionary or None if not found
+        """
+        if use_cache:
+            cached = self._entity_cache.get(entity_type, entity_id, fields)
+            if cached is not None:
+                return cached
+
+        filters = [["id", "is", int(entity_id)]]
+        result = self.sg.find_one(entity_type, filters, fields)
+        self._entity_cache.put(entity_type, entity_id, fields, result)
+        return result
+
+    def get_entity_cache_stats(self):
+        """Return entity cache counters (entries, hits, misses, hit_rate, evictions, invalidations)."""
+        return self._entity_cache.get_stats()
+
+    def clear_entity_cache(self):
+        """Drop all cached entity reads."""
+        self._entity_cache.clear()
 
     def get_rfq_versions(self, rfq_id, fields=None):
         """
@@ -1147,6 +1382,82 @@ class ShotgridClient:
         """
         return self.download_version_attachment(version_id, "sg_uploaded_movie_mp4", download_path)
 
+    def get_version_attachments(self, version_ids, field_name="sg_uploaded_movie", with_details=False):
+        """
+        Fetch an attachment field for many versions with a single query.
+
+        Args:
+            version_ids: List of Version IDs
+            field_name: Attachment field name (e.g., "sg_uploaded_movie")
+            with_details: Also read the Attachment records (one more query) and
+                add their "size" and "updated_at" to each attachment dict
+
+        Returns:
+            Dict mapping version_id to the attachment dict (None if empty)
+        """
+        version_ids = list(version_ids)
+        if not version_ids:
+            return {}
+        versions = self.sg.find(
+            "Version",
+            [["id", "in", version_ids]],
+            [field_name]
+        )
+        attachments = {version["id"]: version.get(field_name) for version in versions}
+
+        if with_details:
+            attachment_ids = [
+                attachment["id"] for attachment in attachments.values()
+                if isinstance(attachment, dict) and attachment.get("id")
+            ]
+            if attachment_ids:
+                records = self.sg.find(
+                    "Attachment",
+                    [["id", "in", attachment_ids]],
+                    ["file_size", "updated_at"]
+                )
+                details = {record["id"]: record for record in records}
+                for attachment in attachments.values():
+                    record = details.get((attachment or {}).get("id"))
+                    if record:
+                        attachment["size"] = record.get("file_size")
+                        attachment["updated_at"] = record.get("updated_at")
+        return attachments
+
+    def get_attachment_download_url(self, attachment):
+        """
+        Get a direct download URL for an attachment.
+
+        Args:
+            attachment: Attachment dict as returned in an attachment field
+
+        Returns:
+            URL string, or None if the attachment has no downloadable URL
+        """
+        try:
+            return self.sg.get_attachment_download_url(attachment)
+        except (TypeError, ValueError, KeyError) as e:
+            logger.debug(f"No download URL for attachment: {e}")
+            return None
+
+    def get_download_cookies(self):
+        """
+        Get cookies that authenticate plain HTTP downloads from the site.
+
+        Lets callers stream attachments (with Range requests) instead of going
+        through Shotgun.download_attachment, which always fetches whole files.
+
+        Returns:
+            Dict of cookie name to value
+        """
+        with self._pool_lock:
+            token = self._download_session_token
+        if token is None:
+            token = self.sg.get_session_token()
+            with self._pool_lock:
+                self._download_session_token = token
+        return {"_session_id": token}
+
     def download_thumbnail(self, entity_type, entity_id, download_path=None):
         """
         Download a thumbnail image for an entity.
@@ -2412,7 +2723,8 @@ class ShotgridClient:
     # PackageTracking Management (CustomEntity14)
     # ------------------------------------------------------------------
 
-    def create_package_tracking(self, project_id, package_name, share_link, vendor, rfq, status="dlvr"):
+    def create_package_tracking(self, project_id, package_name, share_link, vendor, rfq, status="dlvr",
+                                file_index=None):
         """
         Create a new PackageTracking (CustomEntity14) entity in ShotGrid.
 
@@ -2423,10 +2735,129 @@ class ShotgridClient:
             vendor: Vendor entity dict or ID (sg_recipient)
             rfq: RFQ entity dict or ID (sg_rfq)
             status: Status code (default: "dlvr" for Delivered). Valid: 'dlvr', 'dwnld'
+            file_index: File index of the delivered package (optional, uploaded
+                to sg_file_index; see package_delta)
 
         Returns:
             Created PackageTracking entity dictionary
         """
+        data = self._package_tracking_data(project_id, package_name, share_link, vendor, rfq, status)
+
+        result = self.sg.create("CustomEntity14", data)
+        logger.info(f"Created PackageTracking: {result.get('id')} for vendor {data['sg_recipient']['id']}, "
+                    f"RFQ {data['sg_rfq']['id']}")
+        if result and file_index is not None:
+            self.upload_package_tracking_file_index(result["id"], file_index)
+        return result
+
+    def create_package_trackings(self, project_id, package_name, share_link, vendors, rfq, status="dlvr",
+                                 file_index=None):
+        """
+        Create PackageTracking (CustomEntity14) entities for several vendors in one batch.
+
+        Args:
+            project_id: ID of the project
+            package_name: Name/code for the tracking records
+            share_link: Google Drive share link (sg_share_link) - string URL
+            vendors: List of vendor entity dicts or IDs (sg_recipient)
+            rfq: RFQ entity dict or ID (sg_rfq)
+            status: Status code (default: "dlvr" for Delivered). Valid: 'dlvr', 'dwnld'
+            file_index: File index of the delivered package (optional, uploaded
+                to the sg_file_index field of every created record)
+
+        Returns:
+            dict: batch_write result; results are aligned with vendors
+        """
+        requests = [
+            {
+                "request_type": "create",
+                "entity_type": "CustomEntity14",
+                "data": self._package_tracking_data(project_id, package_name, share_link, vendor, rfq, status),
+            }
+            for vendor in vendors
+        ]
+        labels = [
+            vendor.get("code") if isinstance(vendor, dict) else str(vendor)
+            for vendor in vendors
+        ]
+        outcome = self.batch_write(requests, labels=labels)
+        created = len(requests) - len(outcome["failed"])
+        logger.info(f"Created {created} PackageTracking record(s) for package '{package_name}'")
+        if file_index is not None:
+            for tracking in outcome["results"]:
+                if tracking:
+                    self.upload_package_tracking_file_index(tracking["id"], file_index)
+        return outcome
+
+    def upload_package_tracking_file_index(self, tracking_id, file_index):
+        """
+        Upload the file index of a delivered package to a PackageTracking record.
+
+        The index is the snapshot later delta packages to the same vendor are
+        compared against (see get_package_tracking_file_index).
+
+        Args:
+            tracking_id: ID of the PackageTracking (CustomEntity14)
+            file_index: {relative path: {"size", "mtime_ns", "sha256"}}
+
+        Returns:
+            True if the index was uploaded, False otherwise
+        """
+        import json
+        import tempfile
+
+        temp_file = None
+        try:
+            temp_file = tempfile.NamedTemporaryFile(
+                mode='w',
+                suffix='.json',
+                prefix='file_index_',
+                delete=False
+            )
+            json.dump(file_index, temp_file)
+            temp_file.close()
+
+            self.sg.upload(
+                "CustomEntity14",
+                int(tracking_id),
+                temp_file.name,
+                field_name="sg_file_index",
+                display_name="file_index.json"
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Could not upload file index to PackageTracking {tracking_id}: {e}")
+            return False
+        finally:
+            if temp_file and os.path.exists(temp_file.name):
+                os.unlink(temp_file.name)
+
+    def get_package_tracking_file_index(self, tracking):
+        """
+        Download the file index recorded on a PackageTracking record.
+
+        Args:
+            tracking: PackageTracking dict fetched with the sg_file_index field
+
+        Returns:
+            dict: {relative path: {"size", "mtime_ns", "sha256"}}, or None if the
+            record has no readable index
+        """
+        import json
+
+        attachment = (tracking or {}).get("sg_file_index")
+        if not attachment:
+            return None
+
+        try:
+            index = json.loads(self.sg.download_attachment(attachment))
+        except Exception as e:
+            logger.warning(f"Could not read file index of PackageTracking {tracking.get('id')}: {e}")
+            return None
+        return index if isinstance(index, dict) else None
+
+    def _package_tracking_data(self, project_id, package_name, share_link, vendor, rfq, status):
+        """Build the field data of a PackageTracking entity (see create_package_tracking)."""
         # Normalize vendor link
         if isinstance(vendor, int):
             vendor_link = {"type": "CustomEntity05", "id": int(vendor)}
@@ -2463,9 +2894,7 @@ class ShotgridClient:
         if share_link_data:
             data["sg_share_link"] = share_link_data
 
-        result = self.sg.create("CustomEntity14", data)
-        logger.info(f"Created PackageTracking: {result.get('id')} for vendor {vendor_link['id']}, RFQ {rfq_link['id']}")
-        return result
+        return data
 
     def get_package_tracking_for_rfq(self, rfq_id, fields=None):
         """
@@ -2577,17 +3006,212 @@ class ShotgridClient:
         result = self.sg.delete("CustomEntity14", int(tracking_id))
         return result
 
+    # ------------------------------------------------------------------
+    # Batched writes
+    # ------------------------------------------------------------------
+
+    # Default number of requests sent per sg.batch() round-trip
+    BATCH_CHUNK_SIZE = 200
+
+    def batch_write(self, requests, chunk_size=None, labels=None, progress_callback=None):
+        """
+        Execute create/update/delete requests in chunked sg.batch() round-trips.
+
+        ShotGrid runs each batch as a single transaction, so when a chunk fails
+        its requests are replayed one at a time to find the failing ones; the
+        rest of the chunk is still applied.
+
+        Args:
+            requests: List of sg.batch() request dicts, e.g.
+                      {"request_type": "update", "entity_type": "CustomEntity16",
+                       "entity_id": 123, "data": {...}}
+            chunk_size: Requests per round-trip (default: BATCH_CHUNK_SIZE)
+            labels: Optional list of labels (e.g. cell references) aligned with
+                    requests, used in failure reports
+            progress_callback: Optional callback(current, total, message) called after each chunk
+
+        Returns:
+            dict: {"results": [...], "failed": [...]} where results is aligned with
+                  requests (None for failed requests) and failed holds one
+                  {"index", "label", "request", "error"} dict per failed request
+        """
+        chunk_size = max(1, int(chunk_size or self.BATCH_CHUNK_SIZE))
+        total = len(requests)
+        results = [None] * total
+        failed = []
+
+        for start in range(0, total, chunk_size):
+            chunk = requests[start:start + chunk_size]
+            try:
+                results[start:start + len(chunk)] = self.sg.batch(chunk)
+            except Exception as e:
+                logger.warning(f"Batch of {len(chunk)} request(s) failed, retrying individually: {e}")
+                for offset, request in enumerate(chunk):
+                    index = start + offset
+                    label = labels[index] if labels else None
+                    try:
+                        results[index] = self._run_batch_request(request)
+                    except Exception as request_error:
+                        logger.error(
+                            f"{request['request_type']} {request['entity_type']} "
+                            f"({label or request.get('entity_id', index)}) failed: {request_error}"
+                        )
+                        failed.append({
+                            "index": index,
+                            "label": label,
+                            "request": request,
+                            "error": str(request_error),
+                        })
+
+            done = start + len(chunk)
+            if progress_callback:
+                progress_callback(done, total, f"Saved {done} of {total} changes...")
+
+        return {"results": results, "failed": failed}
+
+    def _run_batch_request(self, request):
+        """Execute a single sg.batch() request dict with the matching non-batched call."""
+        request_type = request["request_type"]
+        if request_type == "create":
+            return self.sg.create(request["entity_type"], request["data"], request.get("return_fields"))
+        if request_type == "update":
+            return self.sg.update(request["entity_type"], int(request["entity_id"]), request["data"])
+        if request_type == "delete":
+            return self.sg.delete(request["entity_type"], int(request["entity_id"]))
+        raise ValueError(f"Unsupported batch request type: {request_type}")
+
     # ------------------------------------------------------------------
     # Spreadsheet Management (CustomEntity15) and SpreadsheetItem (CustomEntity16)
     # ------------------------------------------------------------------
 
-    def get_spreadsheet_for_bid(self, bid_id, spreadsheet_type):
+    # Text field on CustomEntity15 holding the single-blob sheet payload
+    SHEET_DATA_FIELD = "sg_sheet_data"
+
+    def _spreadsheet_fields(self, include_data=False):
+        """Return the CustomEntity15 fields to query, optionally with the sheet payload.
+
+        The payload is queried whenever the site has SHEET_DATA_FIELD, whatever
+        spreadsheet_storage says, so sheets already stored as a blob are never
+        read from their (deleted) per-cell items.
+        """
+        fields = ["id", "code", "sg_type", "sg_parent_bid", "sg_sheet_meta"]
+        if include_data and self._sheet_data_field_exists():
+            fields.append(self.SHEET_DATA_FIELD)
+        return fields
+
+    def _sheet_data_field_exists(self):
+        """Return True if the site has SHEET_DATA_FIELD.
+
+        Only a schema that was read and lacks the field counts as missing.
+
+        Raises:
+            Exception: If the schema can't be read (e.g. a network error); the
+                caller must not fall back to per-cell storage because of it
+        """
+        if self._has_sheet_data_field is None:
+            self._has_sheet_data_field = bool(
+                self.get_field_schema("CustomEntity15", self.SHEET_DATA_FIELD)
+            )
+            if not self._has_sheet_data_field:
+                logger.warning(f"CustomEntity15 has no {self.SHEET_DATA_FIELD} field, "
+                               f"using per-cell sheet storage")
+        return self._has_sheet_data_field
+
+    def _sheet_blob_enabled(self):
+        """Return True if sheets are saved as a single blob (see _sheet_data_field_exists)."""
+        return self.spreadsheet_storage == "blob" and self._sheet_data_field_exists()
+
+    def _clear_sheet_blob(self, spreadsheet):
+        """
+        Remove the single-blob payload of a sheet about to be saved per cell.
+
+        The payload takes priority over per-cell items when loading, so it
+        must not outlive a per-cell save.
+
+        Args:
+            spreadsheet: Spreadsheet entity dict queried with include_data=True
+        """
+        if not is_sheet_payload(spreadsheet.get(self.SHEET_DATA_FIELD)):
+            return
+        self.sg.update("CustomEntity15", int(spreadsheet["id"]), {self.SHEET_DATA_FIELD: None})
+        spreadsheet[self.SHEET_DATA_FIELD] = None
+        logger.info(f"Cleared single-blob payload of Spreadsheet {spreadsheet['id']} "
+                    f"before saving it per cell")
+
+    def _read_sheet_blob(self, spreadsheet):
+        """
+        Decode the single-blob payload of a Spreadsheet entity.
+
+        Args:
+            spreadsheet: Spreadsheet entity dict queried with include_data=True
+
+        Returns:
+            Tuple of (data_dict, cell_meta_dict, sheet_meta), or None if the
+            sheet is still stored per cell
+        """
+        payload = spreadsheet.get(self.SHEET_DATA_FIELD)
+        if not is_sheet_payload(payload):
+            return None
+        try:
+            return decode_sheet_payload(payload)
+        except ValueError as e:
+            logger.warning(f"Failed to decode sheet payload for spreadsheet {spreadsheet['id']}, "
+                           f"falling back to per-cell items: {e}")
+            return None
+
+    def _write_sheet_blob(self, spreadsheet, data_dict, cell_meta_dict=None, sheet_meta=None,
+                          progress_callback=None):
+        """
+        Save a whole sheet as one payload on its Spreadsheet entity.
+
+        Sheets still stored per cell are migrated: their SpreadsheetItems are
+        deleted once the payload has been written. Freshly created entities
+        (which lack SHEET_DATA_FIELD) have no items and skip that step.
+
+        Args:
+            spreadsheet: Spreadsheet entity dict queried with include_data=True
+            data_dict: {(row, col): {'value': ..., 'formula': ..., 'format': ...}, ...}
+            cell_meta_dict: Optional cell metadata
+            sheet_meta: Optional sheet-level metadata dict
+            progress_callback: Optional callback(current, total, message)
+        """
+        import json
+
+        spreadsheet_id = int(spreadsheet["id"])
+        migrating = (self.SHEET_DATA_FIELD in spreadsheet
+                     and not is_sheet_payload(spreadsheet[self.SHEET_DATA_FIELD]))
+
+        update_data = {
+            self.SHEET_DATA_FIELD: encode_sheet_payload(data_dict, cell_meta_dict, sheet_meta),
+        }
+        if sheet_meta:
+            update_data["sg_sheet_meta"] = json.dumps(sheet_meta)
+        self.sg.update("CustomEntity15", spreadsheet_id, update_data)
+
+        if migrating:
+            legacy_items = self.get_spreadsheet_items(spreadsheet_id)
+            if legacy_items:
+                result = self.batch_write([
+                    {"request_type": "delete", "entity_type": "CustomEntity16", "entity_id": int(item["id"])}
+                    for item in legacy_items
+                ])
+                if result["failed"]:
+                    logger.warning(f"{len(result['failed'])} legacy cell record(s) of Spreadsheet "
+                                   f"{spreadsheet_id} could not be removed")
+                logger.info(f"Migrated Spreadsheet {spreadsheet_id} to single-blob storage "
+                            f"({len(legacy_items)} cell records removed)")
+
+        if progress_callback:
+            progress_callback(len(data_dict), len(data_dict), "Saved sheet")
+
+    def get_spreadsheet_for_bid(self, bid_id, spreadsheet_type, include_data=False):
         """
         Get a Spreadsheet (CustomEntity15) for a bid by type.
 
         Args:
             bid_id: Bid ID (CustomEntity06)
             spreadsheet_type: Type of spreadsheet (stored in sg_type field)
+            include_data: Also return the single-blob sheet payload (SHEET_DATA_FIELD)
 
         Returns:
             Spreadsheet entity dictionary or None if not found
@@ -2600,17 +3224,18 @@ class ShotgridClient:
         result = self.sg.find_one(
             "CustomEntity15",
             filters,
-            ["id", "code", "sg_type", "sg_parent_bid", "sg_sheet_meta"]
+            self._spreadsheet_fields(include_data)
         )
         return result
 
-    def get_spreadsheet_by_name(self, bid_id, spreadsheet_name):
+    def get_spreadsheet_by_name(self, bid_id, spreadsheet_name, include_data=False):
         """
         Get a Spreadsheet (CustomEntity15) for a bid by name (code field).
 
         Args:
             bid_id: Bid ID (CustomEntity06)
             spreadsheet_name: Name of the spreadsheet (e.g., 'Sheet1', 'Sheet2')
+            include_data: Also return the single-blob sheet payload (SHEET_DATA_FIELD)
 
         Returns:
             Spreadsheet entity dictionary or None if not found
@@ -2623,7 +3248,7 @@ class ShotgridClient:
         result = self.sg.find_one(
             "CustomEntity15",
             filters,
-            ["id", "code", "sg_type", "sg_parent_bid", "sg_sheet_meta"]
+            self._spreadsheet_fields(include_data)
         )
         return result
 
@@ -2721,8 +3346,10 @@ class ShotgridClient:
         """
         # First delete all SpreadsheetItems linked to this Spreadsheet
         items = self.get_spreadsheet_items(spreadsheet_id)
-        for item in items:
-            self.sg.delete("CustomEntity16", int(item["id"]))
+        self.batch_write([
+            {"request_type": "delete", "entity_type": "CustomEntity16", "entity_id": int(item["id"])}
+            for item in items
+        ])
 
         # Then delete the Spreadsheet itself
         result = self.sg.delete("CustomEntity15", int(spreadsheet_id))
@@ -2745,7 +3372,7 @@ class ShotgridClient:
         results = self.sg.find(
             "CustomEntity16",
             filters,
-            ["id", "sg_cell", "sg_formula", "sg_format", "sg_parent"]
+            ["id", "sg_cell", "sg_formula", "sg_format", "sg_cell_meta", "sg_parent"]
         )
         return results
 
@@ -2827,13 +3454,15 @@ class ShotgridClient:
         return result
 
     def save_spreadsheet_data(self, project_id, bid_id, spreadsheet_type, data_dict,
-                              cell_meta_dict=None, sheet_meta=None):
+                              cell_meta_dict=None, sheet_meta=None, progress_callback=None,
+                              chunk_size=None):
         """
         Save spreadsheet data to ShotGrid including formatting metadata.
 
         This method handles the full save workflow with optimized updates:
         1. Gets or creates the Spreadsheet entity
         2. Updates existing items, creates new ones, deletes removed ones
+           (sent as chunked batch requests, see batch_write)
         3. Saves cell-level and sheet-level metadata
 
         Args:
@@ -2844,18 +3473,29 @@ class ShotgridClient:
                        Format: {(row, col): {'value': ..., 'formula': ..., 'format': ...}, ...}
             cell_meta_dict: Optional cell metadata {'row,col': {...formatting...}, ...}
             sheet_meta: Optional sheet-level metadata dict
+            progress_callback: Optional callback(current, total, message) called after each batch
+            chunk_size: Optional number of cell changes per batch request
 
         Returns:
             Spreadsheet entity dictionary
+
+        Raises:
+            RuntimeError: If some cells could not be written. All other cells are saved.
         """
         import json
 
         # Get or create Spreadsheet
-        spreadsheet = self.get_spreadsheet_for_bid(bid_id, spreadsheet_type)
+        spreadsheet = self.get_spreadsheet_for_bid(bid_id, spreadsheet_type, include_data=True)
         if not spreadsheet:
             spreadsheet = self.create_spreadsheet(project_id, bid_id, spreadsheet_type)
         spreadsheet_id = spreadsheet["id"]
 
+        if self._sheet_blob_enabled():
+            self._write_sheet_blob(spreadsheet, data_dict, cell_meta_dict, sheet_meta, progress_callback)
+            logger.info(f"Saved Spreadsheet {spreadsheet_id}: {len(data_dict)} cells (single blob)")
+            return spreadsheet
+        self._clear_sheet_blob(spreadsheet)
+
         # Save sheet-level metadata (column widths, row heights, merged cells, frozen panes)
         if sheet_meta:
             try:
@@ -2866,81 +3506,12 @@ class ShotgridClient:
             except Exception as e:
                 logger.warning(f"Failed to save sheet metadata: {e}")
 
-        # Get existing items and build a map by cell reference
-        existing_items = self.get_spreadsheet_items(spreadsheet_id)
-        existing_by_cell = {item.get("sg_cell", ""): item for item in existing_items}
-
-        # Track which cells we've processed
-        processed_cells = set()
-        created_count = 0
-        updated_count = 0
-        deleted_count = 0
-
-        # Update or create items for each cell in data_dict
-        for (row, col), cell_data in data_dict.items():
-            # Convert row/col to cell reference (e.g., A1, B2)
-            col_letter = chr(ord('A') + col) if col < 26 else f"A{chr(ord('A') + col - 26)}"
-            cell_ref = f"{col_letter}{row + 1}"
-            processed_cells.add(cell_ref)
-
-            formula = cell_data.get('formula')
-            value = cell_data.get('value')
-            cell_format = cell_data.get('format')
-
-            # Get cell metadata for this cell
-            meta_key = f"{row},{col}"
-            cell_meta = cell_meta_dict.get(meta_key) if cell_meta_dict else None
-
-            # Determine what to store in sg_formula
-            sg_formula_value = formula if formula else (str(value) if value is not None else "")
-
-            if cell_ref in existing_by_cell:
-                # Update existing item if value, format, or metadata changed
-                existing_item = existing_by_cell[cell_ref]
-                update_data = {}
-
-                if existing_item.get("sg_formula") != sg_formula_value:
-                    update_data["sg_formula"] = sg_formula_value
-
-                if cell_format and existing_item.get("sg_format") != cell_format:
-                    update_data["sg_format"] = cell_format
-
-                # Update cell metadata
-                if cell_meta:
-                    new_meta_json = json.dumps(cell_meta)
-                    if existing_item.get("sg_cell_meta") != new_meta_json:
-                        update_data["sg_cell_meta"] = new_meta_json
-                elif existing_item.get("sg_cell_meta"):
-                    # Clear cell metadata if no longer present
-                    update_data["sg_cell_meta"] = ""
-
-                if update_data:
-                    self.sg.update("CustomEntity16", int(existing_item["id"]), update_data)
-                    updated_count += 1
-            else:
-                # Create new item with metadata
-                create_data = {
-                    "code": cell_ref,
-                    "project": {"type": "Project", "id": int(project_id)},
-                    "sg_parent": {"type": "CustomEntity15", "id": int(spreadsheet_id)},
-                    "sg_cell": cell_ref,
-                    "sg_formula": sg_formula_value
-                }
-                if cell_format:
-                    create_data["sg_format"] = cell_format
-                if cell_meta:
-                    create_data["sg_cell_meta"] = json.dumps(cell_meta)
-
-                self.sg.create("CustomEntity16", create_data)
-                created_count += 1
-
-        # Delete items for cells that no longer exist in data_dict
-        for cell_ref, item in existing_by_cell.items():
-            if cell_ref not in processed_cells:
-                self.sg.delete("CustomEntity16", int(item["id"]))
-                deleted_count += 1
+        counts = self._save_spreadsheet_items(
+            project_id, spreadsheet_id, data_dict, cell_meta_dict,
+            progress_callback=progress_callback, chunk_size=chunk_size
+        )
 
-        logger.info(f"Saved Spreadsheet {spreadsheet_id}: {created_count} created, {updated_count} updated, {deleted_count} deleted")
+        logger.info(f"Saved Spreadsheet {spreadsheet_id}: {counts['created']} created, {counts['updated']} updated, {counts['deleted']} deleted")
         return spreadsheet
 
     def load_spreadsheet_data(self, bid_id, spreadsheet_type):
@@ -2960,10 +3531,16 @@ class ShotgridClient:
         """
         import json
 
-        spreadsheet = self.get_spreadsheet_for_bid(bid_id, spreadsheet_type)
+        spreadsheet = self.get_spreadsheet_for_bid(bid_id, spreadsheet_type, include_data=True)
         if not spreadsheet:
             return {}, {}, {}
 
+        # Single-blob sheets load in one call; older sheets fall through to per-cell items
+        blob = self._read_sheet_blob(spreadsheet)
+        if blob is not None:
+            logger.info(f"Loaded {len(blob[0])} cells from single-blob Spreadsheet for bid {bid_id}, type={spreadsheet_type}")
+            return blob
+
         # Load sheet-level metadata
         sheet_meta = {}
         sg_sheet_meta = spreadsheet.get("sg_sheet_meta", "")
@@ -3038,7 +3615,8 @@ class ShotgridClient:
         return data_dict, cell_meta_dict, sheet_meta
 
     def save_spreadsheet_by_name(self, project_id, bid_id, spreadsheet_name, data_dict,
-                                  cell_meta_dict=None, sheet_meta=None, progress_callback=None):
+                                  cell_meta_dict=None, sheet_meta=None, progress_callback=None,
+                                  chunk_size=None):
         """
         Save spreadsheet data to ShotGrid using the spreadsheet name (code field).
 
@@ -3049,17 +3627,21 @@ class ShotgridClient:
             data_dict: Dictionary from SpreadsheetWidget.get_data_as_dict()
             cell_meta_dict: Optional cell metadata
             sheet_meta: Optional sheet-level metadata dict
-            progress_callback: Optional callback(current, total, message) for progress updates
+            progress_callback: Optional callback(current, total, message) called after each batch
+            chunk_size: Optional number of cell changes per batch request
 
         Returns:
             Spreadsheet entity dictionary
+
+        Raises:
+            RuntimeError: If some cells could not be written. All other cells are saved.
         """
         import json
 
         logger.debug(f"save_spreadsheet_by_name called: project={project_id}, bid={bid_id}, name='{spreadsheet_name}', cells={len(data_dict)}")
 
         # Get or create Spreadsheet by name
-        spreadsheet = self.get_spreadsheet_by_name(bid_id, spreadsheet_name)
+        spreadsheet = self.get_spreadsheet_by_name(bid_id, spreadsheet_name, include_data=True)
         if not spreadsheet:
             # Create new spreadsheet with the given name (no sg_type for custom sheets)
             logger.info(f"Creating new CustomEntity15 spreadsheet '{spreadsheet_name}' for bid {bid_id}")
@@ -3071,6 +3653,12 @@ class ShotgridClient:
             logger.debug(f"Found existing CustomEntity15 spreadsheet '{spreadsheet_name}' (ID: {spreadsheet.get('id')}) for bid {bid_id}")
         spreadsheet_id = spreadsheet["id"]
 
+        if self._sheet_blob_enabled():
+            self._write_sheet_blob(spreadsheet, data_dict, cell_meta_dict, sheet_meta, progress_callback)
+            logger.info(f"Saved Spreadsheet '{spreadsheet_name}' (ID {spreadsheet_id}): {len(data_dict)} cells (single blob)")
+            return spreadsheet
+        self._clear_sheet_blob(spreadsheet)
+
         # Save sheet-level metadata
         if sheet_meta:
             try:
@@ -3080,27 +3668,54 @@ class ShotgridClient:
             except Exception as e:
                 logger.warning(f"Failed to save sheet metadata: {e}")
 
+        counts = self._save_spreadsheet_items(
+            project_id, spreadsheet_id, data_dict, cell_meta_dict,
+            progress_callback=progress_callback, chunk_size=chunk_size
+        )
+
+        logger.info(f"Saved Spreadsheet '{spreadsheet_name}' (ID {spreadsheet_id}): {counts['created']} created, {counts['updated']} updated, {counts['deleted']} deleted")
+        return spreadsheet
+
+    @staticmethod
+    def _spreadsheet_cell_ref(row, col):
+        """Convert a 0-indexed (row, col) pair to the cell reference stored in sg_cell."""
+        col_letter = chr(ord('A') + col) if col < 26 else f"A{chr(ord('A') + col - 26)}"
+        return f"{col_letter}{row + 1}"
+
+    def _save_spreadsheet_items(self, project_id, spreadsheet_id, data_dict, cell_meta_dict=None,
+                                progress_callback=None, chunk_size=None):
+        """
+        Diff data_dict against the stored SpreadsheetItems (CustomEntity16) and
+        write the creates/updates/deletes as chunked batch requests.
+
+        Args:
+            project_id: Project ID
+            spreadsheet_id: Parent Spreadsheet ID (CustomEntity15)
+            data_dict: {(row, col): {'value': ..., 'formula': ..., 'format': ...}, ...}
+            cell_meta_dict: Optional cell metadata {'row,col': {...}, ...}
+            progress_callback: Optional callback(current, total, message)
+            chunk_size: Optional number of requests per batch
+
+        Returns:
+            dict: Counts of created, updated and deleted items
+
+        Raises:
+            RuntimeError: If any item could not be written
+        """
+        import json
+
         # Get existing items and build a map by cell reference
         existing_items = self.get_spreadsheet_items(spreadsheet_id)
         existing_by_cell = {item.get("sg_cell", ""): item for item in existing_items}
 
+        requests = []
+        labels = []
         processed_cells = set()
-        created_count = 0
-        updated_count = 0
-        deleted_count = 0
-
-        # Calculate cells to delete for progress tracking
-        cells_to_process = list(data_dict.items())
-        cells_to_delete = [cell_ref for cell_ref in existing_by_cell.keys()
-                          if cell_ref not in {f"{chr(ord('A') + c) if c < 26 else 'A' + chr(ord('A') + c - 26)}{r + 1}"
-                                              for (r, c) in data_dict.keys()}]
-        total_operations = len(cells_to_process) + len(cells_to_delete)
-        current_operation = 0
+        counts = {"created": 0, "updated": 0, "deleted": 0}
 
         # Update or create items for each cell
-        for (row, col), cell_data in cells_to_process:
-            col_letter = chr(ord('A') + col) if col < 26 else f"A{chr(ord('A') + col - 26)}"
-            cell_ref = f"{col_letter}{row + 1}"
+        for (row, col), cell_data in data_dict.items():
+            cell_ref = self._spreadsheet_cell_ref(row, col)
             processed_cells.add(cell_ref)
 
             formula = cell_data.get('formula')
@@ -3110,6 +3725,7 @@ class ShotgridClient:
             meta_key = f"{row},{col}"
             cell_meta = cell_meta_dict.get(meta_key) if cell_meta_dict else None
 
+            # sg_formula stores both formulas and plain values
             sg_formula_value = formula if formula else (str(value) if value is not None else "")
 
             if cell_ref in existing_by_cell:
@@ -3127,11 +3743,18 @@ class ShotgridClient:
                     if existing_item.get("sg_cell_meta") != new_meta_json:
                         update_data["sg_cell_meta"] = new_meta_json
                 elif existing_item.get("sg_cell_meta"):
+                    # Clear cell metadata if no longer present
                     update_data["sg_cell_meta"] = ""
 
                 if update_data:
-                    self.sg.update("CustomEntity16", int(existing_item["id"]), update_data)
-                    updated_count += 1
+                    requests.append({
+                        "request_type": "update",
+                        "entity_type": "CustomEntity16",
+                        "entity_id": int(existing_item["id"]),
+                        "data": update_data,
+                    })
+                    labels.append(cell_ref)
+                    counts["updated"] += 1
             else:
                 create_data = {
                     "code": cell_ref,
@@ -3145,27 +3768,43 @@ class ShotgridClient:
                 if cell_meta:
                     create_data["sg_cell_meta"] = json.dumps(cell_meta)
 
-                self.sg.create("CustomEntity16", create_data)
-                created_count += 1
-
-            # Report progress
-            current_operation += 1
-            if progress_callback and total_operations > 0:
-                progress_callback(current_operation, total_operations, f"Saving {cell_ref}...")
+                requests.append({
+                    "request_type": "create",
+                    "entity_type": "CustomEntity16",
+                    "data": create_data,
+                })
+                labels.append(cell_ref)
+                counts["created"] += 1
 
         # Delete items for cells that no longer exist
         for cell_ref, item in existing_by_cell.items():
             if cell_ref not in processed_cells:
-                self.sg.delete("CustomEntity16", int(item["id"]))
-                deleted_count += 1
+                requests.append({
+                    "request_type": "delete",
+                    "entity_type": "CustomEntity16",
+                    "entity_id": int(item["id"]),
+                })
+                labels.append(cell_ref)
+                counts["deleted"] += 1
 
-                # Report progress
-                current_operation += 1
-                if progress_callback and total_operations > 0:
-                    progress_callback(current_operation, total_operations, f"Removing {cell_ref}...")
+        if not requests:
+            if progress_callback:
+                progress_callback(0, 0, "No changes to save")
+            return counts
 
-        logger.info(f"Saved Spreadsheet '{spreadsheet_name}' (ID {spreadsheet_id}): {created_count} created, {updated_count} updated, {deleted_count} deleted")
-        return spreadsheet
+        result = self.batch_write(
+            requests, chunk_size=chunk_size, labels=labels,
+            progress_callback=progress_callback
+        )
+
+        if result["failed"]:
+            failed_cells = [failure["label"] for failure in result["failed"]]
+            raise RuntimeError(
+                f"Failed to save {len(failed_cells)} of {len(requests)} cell change(s) "
+                f"in Spreadsheet {spreadsheet_id}: {', '.join(failed_cells[:20])}"
+            )
+
+        return counts
 
     def load_spreadsheet_by_name(self, bid_id, spreadsheet_name):
         """
@@ -3181,10 +3820,16 @@ class ShotgridClient:
         """
         import json
 
-        spreadsheet = self.get_spreadsheet_by_name(bid_id, spreadsheet_name)
+        spreadsheet = self.get_spreadsheet_by_name(bid_id, spreadsheet_name, include_data=True)
         if not spreadsheet:
             return {}, {}, {}
 
+        # Single-blob sheets load in one call; older sheets fall through to per-cell items
+        blob = self._read_sheet_blob(spreadsheet)
+        if blob is not None:
+            logger.info(f"Loaded {len(blob[0])} cells from single-blob Spreadsheet '{spreadsheet_name}' for bid {bid_id}")
+            return blob
+
         # Load sheet-level metadata
         sheet_meta = {}
         sg_sheet_meta = spreadsheet.get("sg_sheet_meta", "")
@@ -3247,28 +3892,21 @@ class ShotgridClient:
         return data_dict, cell_meta_dict, sheet_meta
 
     def close_connection(self, thread_id=None):
-        """Close the ShotGrid connection for a specific thread or current thread.
+        """Close idle pooled ShotGrid connections.
+
+        Connections are no longer bound to threads; this is kept for callers
+        of the old per-thread API and closes every connection not in use.
 
         Args:
-            thread_id: Thread ID to close connection for. If None, uses current thread.
+            thread_id: Ignored
         """
-        if thread_id is None:
-            thread_id = threading.current_thread().ident
-
-        with self._connections_lock:
-            if thread_id in self._connections:
-                # shotgun_api3 connections don't have an explicit close method,
-                # but we can remove the reference to allow garbage collection
-                del self._connections[thread_id]
-                logger.debug(f"Closed ShotGrid connection for thread {thread_id}")
+        if self._pool is not None:
+            closed = self._pool.close_idle()
+            logger.debug(f"Closed {closed} idle ShotGrid connection(s)")
 
     def close_all_connections(self):
-        """Close all ShotGrid connections across all threads."""
-        with self._connections_lock:
-            thread_ids = list(self._connections.keys())
-            for thread_id in thread_ids:
-                del self._connections[thread_id]
-            logger.debug(f"Closed {len(thread_ids)} ShotGrid connection(s)")
+        """Close all idle ShotGrid connections in the pool."""
+        self.close_connection()
 
     def __enter__(self):
         """Context manager entry."""
@@ -3276,7 +3914,7 @@ class ShotgridClient:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - closes connection for current thread."""
+        """Context manager exit - closes idle pooled connections."""
         self.close_connection()
 
 
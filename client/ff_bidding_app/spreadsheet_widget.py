@@ -2084,8 +2084,8 @@ class SpreadsheetTableView(QtWidgets.QTableView):
             model.undo_stack.append(command)
             model.redo_stack.clear()
 
-            # Clear dependent cache
-            model._clear_dependent_cache()
+            # Recalculate dependent formulas
+            model._clear_dependent_cache(command.cells)
 
             logger.info(f"Pasted {len(changes)} cells")
 
@@ -2201,7 +2201,7 @@ class SpreadsheetTableView(QtWidgets.QTableView):
 
             model.undo_stack.append(command)
             model.redo_stack.clear()
-            model._clear_dependent_cache()
+            model._clear_dependent_cache(command.cells)
 
             logger.info(f"Pasted values only for {len(changes)} cells")
 
@@ -2312,7 +2312,7 @@ class SpreadsheetTableView(QtWidgets.QTableView):
 
             model.undo_stack.append(command)
             model.redo_stack.clear()
-            model._clear_dependent_cache()
+            model._clear_dependent_cache(command.cells)
 
             logger.info(f"Pasted format only for {len(changes)} cells")
 
@@ -2357,8 +2357,8 @@ class SpreadsheetTableView(QtWidgets.QTableView):
         model.undo_stack.append(command)
         model.redo_stack.clear()
 
-        # Clear dependent cache
-        model._clear_dependent_cache()
+        # Recalculate dependent formulas
+        model._clear_dependent_cache(command.cells)
 
         logger.info(f"Deleted {len(deletions)} cells")
 
@@ -2435,6 +2435,7 @@ class SpreadsheetEditCommand:
         self.model = model
         self.row = row
         self.col = col
+        self.cells = [(row, col)]
         self.old_value = old_value
         self.new_value = new_value
         self.old_formula = old_formula
@@ -2465,8 +2466,7 @@ class SpreadsheetEditCommand:
                 self.model._data.pop((self.row, self.col), None)
             self.model._formulas.pop((self.row, self.col), None)
 
-        # Clear dependent cache and emit change
-        self.model._clear_dependent_cache()
+        # Emit change (SpreadsheetModel.undo/redo recalculate the dependents)
         index = self.model.index(self.row, self.col)
         self.model.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
 
@@ -2485,6 +2485,7 @@ class SpreadsheetPasteCommand:
         """
         self.changes = changes
         self.model = model
+        self.cells = [(change['row'], change['col']) for change in changes]
 
     def undo(self):
         """Undo all paste changes."""
@@ -2550,6 +2551,7 @@ class SpreadsheetDeleteCommand:
         """
         self.deletions = deletions
         self.model = model
+        self.cells = [(deletion['row'], deletion['col']) for deletion in deletions]
 
     def undo(self):
         """Undo deletions - restore old values."""
@@ -2600,6 +2602,11 @@ class SpreadsheetModel(QtCore.QAbstractTableModel):
     # Special marker for text values that should be detected in numeric columns
     TEXT_VALUE_MARKER = "__TEXT_VALUE__"
 
+    # Edits are reported to the other sheets' formula evaluators through
+    # cells_changed (see _notify_dependent_sheets), so they don't need to
+    # watch dataChanged
+    reports_cell_changes = True
+
     # Excel-compatible format codes
     FORMAT_GENERAL = "General"
     FORMAT_NUMBER = "#,##0.00"
@@ -2999,19 +3006,93 @@ class SpreadsheetModel(QtCore.QAbstractTableModel):
                     self.undo_stack.append(command)
                     self.redo_stack.clear()  # Clear redo stack on new edit
 
-            # Clear cache for dependent cells
-            self._clear_dependent_cache()
-
             self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+
+            # Recalculate dependent cells
+            self._clear_dependent_cache([(row, col)])
             return True
 
         return False
 
-    def _clear_dependent_cache(self):
-        """Clear the evaluation cache for cells that depend on changed cells."""
-        # For simplicity, clear the entire cache
-        # A more sophisticated implementation would track dependencies
-        self._evaluated_cache.clear()
+    def _clear_dependent_cache(self, changed_cells=None):
+        """Recalculate the formulas that depend on changed cells.
+
+        Uses the formula evaluator's dependency graph to invalidate only the
+        formulas downstream of the changed cells, recalculates them in
+        dependency order and notifies other sheets that reference them.
+
+        Args:
+            changed_cells: (row, col) of the changed cells. None for bulk
+                changes (row/column inserts, loads), which clear the whole
+                cache and the dependency graph.
+        """
+        if changed_cells is None or not self.formula_evaluator:
+            self._evaluated_cache.clear()
+            if self.formula_evaluator:
+                self.formula_evaluator.invalidate_dependencies()
+            return
+
+        changed_cells = list(changed_cells)
+        order, _ = self.formula_evaluator.cells_changed(changed_cells)
+        for cell in changed_cells:
+            self._evaluated_cache.pop(cell, None)
+
+        # Drop every affected cached value, in this and the other sheets,
+        # before recalculating any of them: a formula reading a stale cached
+        # value of another sheet would hide a cycle running through both
+        # sheets from the evaluator's cycle guard
+        dirty = [(self, order)]
+        self._notify_dependent_sheets(changed_cells + order, set(), dirty)
+        for model, cells in dirty:
+            for cell in cells:
+                model._evaluated_cache.pop(cell, None)
+        for model, cells in dirty:
+            model._recalculate_cells(cells)
+
+    def _recalculate_cells(self, cells):
+        """Re-evaluate formula cells, in the given (dependency) order.
+
+        The caller drops their cached values first (see _clear_dependent_cache).
+        """
+        for row, col in cells:
+            formula = self._formulas.get((row, col))
+            if formula:
+                self._get_evaluated_value(row, col, formula)
+        if cells:
+            rows = [row for row, _ in cells]
+            cols = [col for _, col in cells]
+            self.dataChanged.emit(
+                self.index(min(rows), min(cols)),
+                self.index(max(rows), max(cols)),
+                [Qt.DisplayRole]
+            )
+
+    def _notify_dependent_sheets(self, cells, notified, dirty):
+        """Find the formulas in other sheets that read the given cells.
+
+        Args:
+            cells: (row, col) of changed or recalculated cells of this sheet
+            notified: (source id, target id) pairs of the models already
+                notified for this change. Pairs rather than models, so a
+                sheet reading both this sheet and a sheet downstream of it
+                hears about both.
+            dirty: List of (model, cells) extended with the formula cells of
+                other sheets to recalculate, each in dependency order
+        """
+        if not self.formula_evaluator:
+            return
+        for model in list(self.formula_evaluator.sheet_models.values()):
+            if model is self or not isinstance(model, SpreadsheetModel):
+                continue
+            if (id(self), id(model)) in notified:
+                continue
+            notified.add((id(self), id(model)))
+            if not model.formula_evaluator:
+                continue
+            order, _ = model.formula_evaluator.cells_changed(cells, model=self)
+            if order:
+                dirty.append((model, order))
+                model._notify_dependent_sheets(order, notified, dirty)
 
     def flags(self, index):
         """Return item flags for the given index."""
@@ -3293,8 +3374,8 @@ class SpreadsheetModel(QtCore.QAbstractTableModel):
 
         self.redo_stack.append(command)
 
-        # Clear cache after undo
-        self._clear_dependent_cache()
+        # Recalculate formulas affected by the undone change
+        self._clear_dependent_cache(getattr(command, 'cells', None))
 
         self.statusMessageChanged.emit("Undone", False)
         return True
@@ -3313,8 +3394,8 @@ class SpreadsheetModel(QtCore.QAbstractTableModel):
 
         self.undo_stack.append(command)
 
-        # Clear cache after redo
-        self._clear_dependent_cache()
+        # Recalculate formulas affected by the redone change
+        self._clear_dependent_cache(getattr(command, 'cells', None))
 
         self.statusMessageChanged.emit("Redone", False)
         return True
@@ -4560,7 +4641,7 @@ class SpreadsheetWidget(QtWidgets.QWidget):
 
             self.model.undo_stack.append(command)
             self.model.redo_stack.clear()
-            self.model._clear_dependent_cache()
+            self.model._clear_dependent_cache(command.cells)
 
             logger.info(f"Cleared format for {len(changes)} cells")
 
@@ -4598,7 +4679,7 @@ class SpreadsheetWidget(QtWidgets.QWidget):
         self.model._data = new_data
         self.model._formulas = new_formulas
         self.model._formats = new_formats
-        self.model._evaluated_cache.clear()
+        self.model._clear_dependent_cache()
 
         self.model.endInsertRows()
 
@@ -4660,7 +4741,7 @@ class SpreadsheetWidget(QtWidgets.QWidget):
         self.model._data = new_data
         self.model._formulas = new_formulas
         self.model._formats = new_formats
-        self.model._evaluated_cache.clear()
+        self.model._clear_dependent_cache()
 
         self.model.endRemoveRows()
 
@@ -4718,7 +4799,7 @@ class SpreadsheetWidget(QtWidgets.QWidget):
         self.model._data = new_data
         self.model._formulas = new_formulas
         self.model._formats = new_formats
-        self.model._evaluated_cache.clear()
+        self.model._clear_dependent_cache()
 
         self.model.endRemoveColumns()
 
@@ -4764,7 +4845,7 @@ class SpreadsheetWidget(QtWidgets.QWidget):
         self.model._data = new_data
         self.model._formulas = new_formulas
         self.model._formats = new_formats
-        self.model._evaluated_cache.clear()
+        self.model._clear_dependent_cache()
 
         self.model.endInsertColumns()
 
@@ -4958,7 +5039,7 @@ class SpreadsheetWidget(QtWidgets.QWidget):
         self.model._data.clear()
         self.model._formulas.clear()
         self.model._formats.clear()
-        self.model._evaluated_cache.clear()
+        self.model._clear_dependent_cache()
 
         for (row, col), cell_data in data.items():
             if cell_data.get('formula'):
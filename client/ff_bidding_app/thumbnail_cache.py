@@ -1,128 +1,278 @@
-"""Thumbnail caching system for faster image loading."""
-
+"""Thumbnail caching system for faster image loading.
+
+Two tiers:
+- Memory: an LRU of decoded images (e.g. QPixmaps) bounded in MB, so
+  widgets showing the same thumbnail don't decode it again.
+- Disk: image files in the cache folder plus a small index file
+  (filename -> size, mtime, last access). Lookups are served from the
+  index without touching the file system, and the folder is kept under a
+  byte budget by evicting the least recently used files.
+
+Cache keys come from the entity's identity (entity type, id) plus a version
+token (see entity_version_token), never from the URL: ShotGrid image URLs
+are signed and change on every query, so URLs are only used for fetching.
+
+    cache = get_thumbnail_cache()
+    token = entity_version_token(version)
+    data = cache.get_cached_data(version["id"], version=token)
+    if data is None:
+        data = cache.download_and_cache(version["id"], version["image"], version=token)
+"""
+
+import atexit
 import hashlib
+import json
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 
 import requests
 
+try:
+    from .settings import AppSettings
+except ImportError:
+    from settings import AppSettings
+
 logger = logging.getLogger(__name__)
 
+KIND_THUMBNAIL = "thumbnail"
+# Full-size image shown in the image viewer
+KIND_FULL = "full"
+
+
+def entity_version_token(entity):
+    """Return a token that changes when an entity's image changes.
+
+    Uses updated_at when the entity was queried with it. Otherwise the image
+    URL without its query string: the path of a signed ShotGrid URL names
+    the stored file, only the signature in the query changes between queries.
+
+    Args:
+        entity: Entity dict (e.g. a Version with 'image' and 'updated_at')
+
+    Returns:
+        str or None: Version token, or None if the entity has neither
+    """
+    updated_at = entity.get('updated_at')
+    if isinstance(updated_at, datetime):
+        return updated_at.isoformat()
+    if updated_at:
+        return str(updated_at)
+
+    image = entity.get('image')
+    if isinstance(image, dict):
+        image = image.get('url')
+    if isinstance(image, str) and image:
+        parts = urlsplit(image)
+        return f"{parts.netloc}{parts.path}"
+    return None
+
+
+
+def thumbnail_pixmap_key(entity, url, width, height):
+    """Return the key of a scaled thumbnail in a widget's in-memory pixmap cache.
+
+    Uses the entity's identity rather than its signed URL when possible, so
+    the pixmap stays cached when the entity is queried again.
+
+    Args:
+        entity: Entity dict the thumbnail belongs to
+        url: Thumbnail URL (fallback for entities without an id)
+        width: Target width
+        height: Target height
+
+    Returns:
+        str: Cache key
+    """
+    if entity.get('id'):
+        return f"{entity.get('type', 'Version')}:{entity['id']}:{entity_version_token(entity)}_{width}x{height}"
+    return f"{url}_{width}x{height}"
 
 class ThumbnailCache:
     """Manages local caching of thumbnail images."""
 
-    def __init__(self, cache_path, max_age_days=7):
+    INDEX_FILENAME = "thumbnail_index.json"
+    INDEX_VERSION = 1
+    # Minimum delay between index writes; pending changes are flushed at exit
+    INDEX_SAVE_INTERVAL = 5.0
+
+    def __init__(self, cache_path, max_age_days=7, max_disk_mb=500, max_memory_mb=64):
         """Initialize the thumbnail cache.
 
         Args:
             cache_path: Path to cache folder
             max_age_days: Maximum age of cached files in days
+            max_disk_mb: Byte budget of the cache folder in MB (0 for unlimited)
+            max_memory_mb: Budget of the decoded image tier in MB
         """
         self.cache_path = Path(cache_path)
         self.max_age_days = max_age_days
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024) if max_disk_mb else None
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.index_path = self.cache_path / self.INDEX_FILENAME
+
+        self._lock = threading.RLock()
+        # Disk tier: {filename: {"size", "mtime", "last_access"}}
+        self._index = {}
+        self._disk_bytes = 0
+        self._removed = set()
+        self._index_dirty = False
+        self._last_index_save = 0.0
+        # Memory tier: {(cache filename, variant): (image, nbytes)}, least recently used first
+        self._images = OrderedDict()
+        self._memory_bytes = 0
+
         self._ensure_cache_dir()
+        self._load_index()
+        atexit.register(self.flush)
 
     def _ensure_cache_dir(self):
         """Ensure cache directory exists."""
         self.cache_path.mkdir(parents=True, exist_ok=True)
 
-    def _get_cache_key(self, version_id, url=None):
-        """Generate a cache key for a version.
+    def _get_cache_key(self, entity_id, version=None, kind=KIND_THUMBNAIL, entity_type="Version"):
+        """Generate a cache key for an entity image.
 
         Args:
-            version_id: ShotGrid version ID
-            url: Optional URL to include in hash for cache busting
+            entity_id: ShotGrid entity ID
+            version: Version token of the image (see entity_version_token)
+            kind: KIND_THUMBNAIL or KIND_FULL
+            entity_type: ShotGrid entity type
 
         Returns:
             str: Cache filename
         """
-        # Use version ID as primary key, with optional URL hash
-        if url:
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-            return f"thumb_{version_id}_{url_hash}.png"
-        return f"thumb_{version_id}.png"
+        key = f"{self._entity_prefix(entity_id, entity_type)}{kind}"
+        if version:
+            key += "_" + hashlib.md5(str(version).encode()).hexdigest()[:12]
+        return f"{key}.png"
+
+    @staticmethod
+    def _entity_prefix(entity_id, entity_type="Version"):
+        """Return the filename prefix shared by every key of an entity."""
+        return f"thumb_{entity_type}_{entity_id}_"
 
-    def get_cache_path(self, version_id, url=None):
+    def get_cache_path(self, entity_id, version=None, kind=KIND_THUMBNAIL, entity_type="Version"):
         """Get the full path for a cached thumbnail.
 
         Args:
-            version_id: ShotGrid version ID
-            url: Optional URL for cache key
+            entity_id: ShotGrid entity ID
+            version: Version token of the image
+            kind: KIND_THUMBNAIL or KIND_FULL
+            entity_type: ShotGrid entity type
 
         Returns:
             Path: Full path to cached file
         """
-        return self.cache_path / self._get_cache_key(version_id, url)
+        return self.cache_path / self._get_cache_key(entity_id, version, kind, entity_type)
 
-    def is_cached(self, version_id, url=None):
+    def is_cached(self, entity_id, version=None, kind=KIND_THUMBNAIL, entity_type="Version"):
         """Check if a valid cached thumbnail exists.
 
+        Answered from the index; no file system access.
+
         Args:
-            version_id: ShotGrid version ID
-            url: Optional URL for cache key
+            entity_id: ShotGrid entity ID
+            version: Version token of the image
+            kind: KIND_THUMBNAIL or KIND_FULL
+            entity_type: ShotGrid entity type
 
         Returns:
             bool: True if valid cache exists
         """
-        cache_file = self.get_cache_path(version_id, url)
-        if not cache_file.exists():
-            return False
-
-        # Check age
-        file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-        if file_age > timedelta(days=self.max_age_days):
-            return False
+        key = self._get_cache_key(entity_id, version, kind, entity_type)
+        with self._lock:
+            entry = self._index.get(key)
+            return entry is not None and not self._is_expired(entry)
 
-        return True
-
-    def get_cached_data(self, version_id, url=None):
+    def get_cached_data(self, entity_id, version=None, kind=KIND_THUMBNAIL, entity_type="Version"):
         """Get cached thumbnail data if available.
 
         Args:
-            version_id: ShotGrid version ID
-            url: Optional URL for cache key
+            entity_id: ShotGrid entity ID
+            version: Version token of the image
+            kind: KIND_THUMBNAIL or KIND_FULL
+            entity_type: ShotGrid entity type
 
         Returns:
             bytes or None: Cached image data, or None if not cached
         """
-        if not self.is_cached(version_id, url):
-            return None
+        key = self._get_cache_key(entity_id, version, kind, entity_type)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if self._is_expired(entry):
+                self._remove_file(key)
+                return None
+            entry["last_access"] = time.time()
+            self._index_dirty = True
 
-        cache_file = self.get_cache_path(version_id, url)
         try:
-            with open(cache_file, 'rb') as f:
+            with open(self.cache_path / key, 'rb') as f:
                 return f.read()
+        except FileNotFoundError:
+            # Deleted behind our back (e.g. "Clear Cache" in the settings)
+            with self._lock:
+                self._forget(key)
+            return None
         except Exception as e:
             logger.error(f"Failed to read cached thumbnail: {e}")
             return None
 
-    def cache_thumbnail(self, version_id, image_data, url=None):
+    def cache_thumbnail(self, entity_id, image_data, version=None, kind=KIND_THUMBNAIL,
+                        entity_type="Version"):
         """Save thumbnail data to cache.
 
         Args:
-            version_id: ShotGrid version ID
+            entity_id: ShotGrid entity ID
             image_data: Image bytes to cache
-            url: Optional URL for cache key
+            version: Version token of the image
+            kind: KIND_THUMBNAIL or KIND_FULL
+            entity_type: ShotGrid entity type
         """
         self._ensure_cache_dir()
-        cache_file = self.get_cache_path(version_id, url)
+        key = self._get_cache_key(entity_id, version, kind, entity_type)
+        cache_file = self.cache_path / key
         try:
-            with open(cache_file, 'wb') as f:
+            tmp_file = cache_file.with_name(f"{key}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'wb') as f:
                 f.write(image_data)
+            os.replace(tmp_file, cache_file)
         except Exception as e:
             logger.error(f"Failed to cache thumbnail: {e}")
+            return
 
-    def download_and_cache(self, version_id, url, timeout=10):
+        now = time.time()
+        with self._lock:
+            # Older versions of this image are obsolete
+            prefix = key[:-len(".png")].rsplit("_", 1)[0] if version else key[:-len(".png")]
+            for old_key in [k for k in self._index if k != key and k.startswith(prefix)]:
+                self._remove_file(old_key)
+            self._forget(key)
+            self._index[key] = {"size": len(image_data), "mtime": now, "last_access": now}
+            self._disk_bytes += len(image_data)
+            self._removed.discard(key)
+            self._index_dirty = True
+            self._enforce_disk_budget()
+        self._save_index()
+
+    def download_and_cache(self, entity_id, url, timeout=10, version=None, kind=KIND_THUMBNAIL,
+                           entity_type="Version"):
         """Download thumbnail from URL and cache it.
 
         Args:
-            version_id: ShotGrid version ID
-            url: URL to download from
+            entity_id: ShotGrid entity ID
+            url: URL to download from (not part of the cache key)
             timeout: Request timeout in seconds
+            version: Version token of the image
+            kind: KIND_THUMBNAIL or KIND_FULL
+            entity_type: ShotGrid entity type
 
         Returns:
             bytes or None: Image data, or None if download failed
@@ -131,7 +281,7 @@ class ThumbnailCache:
             response = requests.get(url, timeout=timeout)
             if response.status_code == 200:
                 image_data = response.content
-                self.cache_thumbnail(version_id, image_data, url)
+                self.cache_thumbnail(entity_id, image_data, version, kind, entity_type)
                 return image_data
             else:
                 logger.error(f"Failed to download thumbnail: HTTP {response.status_code}")
@@ -140,52 +290,107 @@ class ThumbnailCache:
             logger.error(f"Failed to download thumbnail: {e}")
             return None
 
-    def invalidate(self, version_id):
-        """Invalidate cached thumbnails for a version.
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def get_image(self, entity_id, variant=None, version=None, kind=KIND_THUMBNAIL,
+                  entity_type="Version"):
+        """Get a decoded image from the memory tier.
 
         Args:
-            version_id: ShotGrid version ID
+            entity_id: ShotGrid entity ID
+            variant: Distinguishes several decoded images of one file, e.g.
+                a scaled size
+            version: Version token of the image
+            kind: KIND_THUMBNAIL or KIND_FULL
+            entity_type: ShotGrid entity type
+
+        Returns:
+            The image stored with put_image, or None
         """
-        # Find and delete all cached files for this version
-        pattern = f"thumb_{version_id}*.png"
-        for cache_file in self.cache_path.glob(pattern):
-            try:
-                cache_file.unlink()
-            except Exception as e:
-                logger.error(f"Failed to invalidate cache: {e}")
+        key = (self._get_cache_key(entity_id, version, kind, entity_type), variant)
+        with self._lock:
+            item = self._images.get(key)
+            if item is None:
+                return None
+            self._images.move_to_end(key)
+            return item[0]
 
-    def clear_all(self):
-        """Clear all cached thumbnails."""
-        if not self.cache_path.exists():
+    def put_image(self, entity_id, image, nbytes, variant=None, version=None, kind=KIND_THUMBNAIL,
+                  entity_type="Version"):
+        """Keep a decoded image in the memory tier.
+
+        Args:
+            entity_id: ShotGrid entity ID
+            image: Decoded image (e.g. QPixmap); stored as is
+            nbytes: Memory used by the image
+            variant, version, kind, entity_type: See get_image
+        """
+        if nbytes > self.max_memory_bytes:
             return
+        key = (self._get_cache_key(entity_id, version, kind, entity_type), variant)
+        with self._lock:
+            self._drop_image(key)
+            self._images[key] = (image, nbytes)
+            self._memory_bytes += nbytes
+            while self._memory_bytes > self.max_memory_bytes:
+                _, (_, evicted_bytes) = self._images.popitem(last=False)
+                self._memory_bytes -= evicted_bytes
+
+    def _drop_image(self, key):
+        """Remove an image from the memory tier. Caller holds the lock."""
+        item = self._images.pop(key, None)
+        if item is not None:
+            self._memory_bytes -= item[1]
+
+    # ------------------------------------------------------------------
+    # Invalidation and maintenance
+    # ------------------------------------------------------------------
+
+    def invalidate(self, entity_id, entity_type="Version"):
+        """Invalidate cached images of an entity.
 
-        for cache_file in self.cache_path.glob("thumb_*.png"):
-            try:
-                cache_file.unlink()
-            except Exception as e:
-                logger.error(f"Failed to delete cache file: {e}")
+        Args:
+            entity_id: ShotGrid entity ID
+            entity_type: ShotGrid entity type
+        """
+        prefix = self._entity_prefix(entity_id, entity_type)
+        with self._lock:
+            for key in [key for key in self._index if key.startswith(prefix)]:
+                self._remove_file(key)
+            for image_key in [image_key for image_key in self._images if image_key[0].startswith(prefix)]:
+                self._drop_image(image_key)
+        self._save_index(force=True)
+
+    def clear_all(self):
+        """Clear all cached thumbnails."""
+        with self._lock:
+            self._images.clear()
+            self._memory_bytes = 0
+            for key in list(self._index):
+                self._remove_file(key)
+        # Files the index doesn't know about
+        if self.cache_path.exists():
+            for cache_file in self.cache_path.glob("thumb_*.png"):
+                try:
+                    cache_file.unlink()
+                except Exception as e:
+                    logger.error(f"Failed to delete cache file: {e}")
+        self._save_index(force=True)
 
         logger.info("Cleared all cached thumbnails")
 
     def cleanup_expired(self):
         """Remove expired cache files."""
-        if not self.cache_path.exists():
-            return
+        with self._lock:
+            expired = [key for key, entry in self._index.items() if self._is_expired(entry)]
+            for key in expired:
+                self._remove_file(key)
+        self._save_index(force=True)
 
-        now = datetime.now()
-        expired_count = 0
-
-        for cache_file in self.cache_path.glob("thumb_*.png"):
-            try:
-                file_age = now - datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if file_age > timedelta(days=self.max_age_days):
-                    cache_file.unlink()
-                    expired_count += 1
-            except Exception as e:
-                logger.error(f"Failed to check/remove cache file: {e}")
-
-        if expired_count:
-            logger.info(f"Removed {expired_count} expired cache files")
+        if expired:
+            logger.info(f"Removed {len(expired)} expired cache files")
 
     def get_stats(self):
         """Get cache statistics.
@@ -193,14 +398,146 @@ class ThumbnailCache:
         Returns:
             dict: Statistics about the cache
         """
-        if not self.cache_path.exists():
-            return {"file_count": 0, "total_size": 0}
+        with self._lock:
+            return {
+                "file_count": len(self._index),
+                "total_size": self._disk_bytes,
+                "max_size": self.max_disk_bytes,
+                "memory_count": len(self._images),
+                "memory_size": self._memory_bytes,
+                "cache_path": str(self.cache_path)
+            }
+
+    def flush(self):
+        """Write pending index changes to disk."""
+        self._save_index(force=True)
+
+    def _is_expired(self, entry):
+        """Return True if an index entry is older than max_age_days."""
+        return time.time() - entry["mtime"] > self.max_age_days * 86400
+
+    def _enforce_disk_budget(self):
+        """Evict least recently used files over the byte budget. Caller holds the lock."""
+        if self.max_disk_bytes is None or self._disk_bytes <= self.max_disk_bytes:
+            return
+        evicted = 0
+        for key, _ in sorted(self._index.items(), key=lambda item: item[1]["last_access"]):
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            self._remove_file(key)
+            evicted += 1
+        logger.debug(f"Evicted {evicted} cached thumbnail(s) over the disk budget")
+
+    def _remove_file(self, key):
+        """Delete a cached file, its index entry and its decoded images. Caller holds the lock."""
+        for image_key in [image_key for image_key in self._images if image_key[0] == key]:
+            self._drop_image(image_key)
+        try:
+            (self.cache_path / key).unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to remove cache file: {e}")
+        self._forget(key)
+
+    def _forget(self, key):
+        """Drop an index entry. Caller holds the lock."""
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._disk_bytes -= entry["size"]
+            self._removed.add(key)
+            self._index_dirty = True
+
+    # ------------------------------------------------------------------
+    # Index persistence
+    # ------------------------------------------------------------------
+
+    def _load_index(self):
+        """Load the index, or build it with one scan of the cache folder."""
+        index = self._read_index()
+        if index is None:
+            index = {}
+            for cache_file in self.cache_path.glob("thumb_*.png"):
+                try:
+                    st = cache_file.stat()
+                except OSError:
+                    continue
+                index[cache_file.name] = {"size": st.st_size, "mtime": st.st_mtime,
+                                          "last_access": st.st_mtime}
+            self._index_dirty = bool(index)
+            logger.debug(f"Built thumbnail index from {len(index)} cached file(s)")
+        with self._lock:
+            self._index = index
+            self._disk_bytes = sum(entry["size"] for entry in index.values())
+            self._enforce_disk_budget()
+        self._save_index(force=True)
+
+    def _read_index(self):
+        """Read the index file; None if missing or invalid."""
+        if not self.index_path.exists():
+            return None
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            if document.get("version") == self.INDEX_VERSION:
+                return document.get("files", {})
+        except Exception as e:
+            logger.warning(f"Failed to load thumbnail index: {e}")
+        return None
 
-        files = list(self.cache_path.glob("thumb_*.png"))
-        total_size = sum(f.stat().st_size for f in files if f.exists())
+    def _save_index(self, force=False):
+        """Write the index, at most every INDEX_SAVE_INTERVAL unless forced.
 
-        return {
-            "file_count": len(files),
-            "total_size": total_size,
-            "cache_path": str(self.cache_path)
-        }
+        Entries written by another cache instance on the same folder are
+        merged in rather than overwritten.
+        """
+        with self._lock:
+            if not self._index_dirty:
+                return
+            now = time.monotonic()
+            if not force and now - self._last_index_save < self.INDEX_SAVE_INTERVAL:
+                return
+
+            for key, entry in (self._read_index() or {}).items():
+                if key not in self._index and key not in self._removed:
+                    self._index[key] = entry
+                    self._disk_bytes += entry["size"]
+
+            try:
+                self._ensure_cache_dir()
+                tmp_path = self.index_path.with_name(f"{self.INDEX_FILENAME}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"version": self.INDEX_VERSION, "files": self._index}, f)
+                os.replace(tmp_path, self.index_path)
+                self._index_dirty = False
+                self._removed.clear()
+                self._last_index_save = now
+            except Exception as e:
+                logger.warning(f"Failed to save thumbnail index: {e}")
+
+
+# Global thumbnail cache instance (shared across all widgets)
+_thumbnail_cache = None
+_thumbnail_cache_lock = threading.Lock()
+
+
+def get_thumbnail_cache():
+    """Get or create the global thumbnail cache instance."""
+    global _thumbnail_cache
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is None:
+            settings = AppSettings()
+            _thumbnail_cache = ThumbnailCache(
+                settings.get_thumbnail_cache_path(),
+                settings.get_thumbnail_cache_max_age_days(),
+                max_disk_mb=settings.get_thumbnail_cache_max_mb(),
+                max_memory_mb=settings.get_thumbnail_memory_cache_mb()
+            )
+        return _thumbnail_cache
+
+
+def reset_thumbnail_cache():
+    """Reset the global thumbnail cache instance (e.g., after settings change)."""
+    global _thumbnail_cache
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is not None:
+            _thumbnail_cache.flush()
+        _thumbnail_cache = None
@@ -0,0 +1,213 @@
+"""Background Google Drive upload manager for package sharing.
+
+Runs GoogleDriveService.upload_file (chunked, resumable sessions) followed by
+share_file on a small thread pool, so sharing never blocks the GUI and
+several vendor shares can upload at the same time:
+
+    manager = get_upload_manager()
+    manager.progress.connect(on_progress)   # (job_id, sent, total, bytes_per_sec)
+    manager.finished.connect(on_finished)   # (job_id, file dict with webViewLink)
+    manager.failed.connect(on_failed)       # (job_id, error message)
+    job_id = manager.submit(zip_path, email="vendor@example.com")
+
+    # Upload once, then share with every vendor in parallel
+    job_id = manager.submit(zip_path, emails=["a@vendor-a.com", "b@vendor-b.com"])
+
+Upload session URIs are persisted by GoogleDriveService, so an upload that
+was interrupted (network loss, cancel, closing the app) continues from the
+last acknowledged chunk when the user shares the same file again.
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from PySide6 import QtCore
+
+try:
+    from .gdrive_service import get_gdrive_service, DEFAULT_UPLOAD_CHUNK_SIZE
+    from .settings import AppSettings
+except ImportError:
+    from gdrive_service import get_gdrive_service, DEFAULT_UPLOAD_CHUNK_SIZE
+    from settings import AppSettings
+
+logger = logging.getLogger(__name__)
+
+
+class DriveUploadManager(QtCore.QObject):
+    """Queues uploads and shares on worker threads and reports them with signals.
+
+    Signals are emitted from worker threads; connected GUI slots receive
+    them through queued connections.
+    """
+
+    progress = QtCore.Signal(str, object, object, float)  # (job_id, bytes_sent, bytes_total, bytes_per_sec)
+    finished = QtCore.Signal(str, dict)  # (job_id, file info with 'webViewLink')
+    failed = QtCore.Signal(str, str)  # (job_id, error message)
+
+    DEFAULT_MAX_CONCURRENT = 2
+    # Minimum interval between two progress signals of a job
+    PROGRESS_INTERVAL = 0.25
+
+    def __init__(self, gdrive=None, max_concurrent=None, chunk_size=None, parent=None):
+        """Initialize the manager.
+
+        Args:
+            gdrive: GoogleDriveService. Defaults to the shared instance
+            max_concurrent: Uploads running at the same time
+            chunk_size: Bytes per upload request
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.gdrive = gdrive or get_gdrive_service()
+        self.max_concurrent = max(1, int(max_concurrent or self.DEFAULT_MAX_CONCURRENT))
+        self.chunk_size = chunk_size or DEFAULT_UPLOAD_CHUNK_SIZE
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrent,
+            thread_name_prefix="drive-upload"
+        )
+        self._lock = threading.Lock()
+        # The Drive API client is not thread-safe; share calls are serialized
+        self._share_lock = threading.Lock()
+        # {job_id: {"future", "cancelled", "file_path", "bytes_sent", "bytes_total"}}
+        self._jobs = {}
+
+    def submit(self, file_path, email=None, role='reader', link_sharing=True, folder_id=None,
+               emails=None):
+        """Queue a file for upload and sharing.
+
+        Must be called from the GUI thread: it authenticates first, which may
+        open the OAuth consent page.
+
+        Args:
+            file_path: Path to the file to upload
+            email: Email address to share with (optional)
+            role: Permission role ('reader', 'commenter', 'writer')
+            link_sharing: If True, enable "anyone with link" sharing
+            folder_id: Optional Google Drive folder ID to upload to
+            emails: Several email addresses to share with; their permissions are
+                granted in parallel and failures are reported in the result's
+                'share_failures' ({email: error message})
+
+        Returns:
+            Job ID used in the progress/finished/failed signals
+
+        Raises:
+            RuntimeError: If Google Drive authentication fails
+        """
+        if self.gdrive.get_service() is None:
+            raise RuntimeError("Google Drive authentication failed")
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "future": None,
+            "cancelled": False,
+            "file_path": str(file_path),
+            "bytes_sent": 0,
+            "bytes_total": 0,
+        }
+        with self._lock:
+            self._jobs[job_id] = job
+            job["future"] = self._executor.submit(
+                self._run_job, job_id, Path(file_path), email, role, link_sharing, folder_id, emails
+            )
+        logger.info(f"Queued upload {job_id} for {file_path}")
+        return job_id
+
+    def cancel(self, job_id):
+        """Stop an upload after its current chunk. It can be resumed by sharing again."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return
+            job["cancelled"] = True
+            not_started = job["future"].cancel()
+            if not_started:
+                self._jobs.pop(job_id, None)
+        if not_started:
+            self.failed.emit(job_id, "Cancelled")
+
+    def shutdown(self):
+        """Stop all uploads after their current chunk."""
+        with self._lock:
+            for job in self._jobs.values():
+                job["cancelled"] = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_job(self, job_id, file_path, email, role, link_sharing, folder_id, emails=None):
+        """Upload and share one file (worker thread)."""
+        job = self._jobs[job_id]
+        started_at = time.monotonic()
+        last_emit = [0.0]
+        # Bytes already on Drive from an earlier session don't count towards throughput
+        resumed_from = [None]
+
+        def on_progress(bytes_sent, bytes_total):
+            if resumed_from[0] is None:
+                resumed_from[0] = bytes_sent
+            job["bytes_sent"], job["bytes_total"] = bytes_sent, bytes_total
+            now = time.monotonic()
+            if bytes_sent < bytes_total and now - last_emit[0] < self.PROGRESS_INTERVAL:
+                return
+            last_emit[0] = now
+            rate = (bytes_sent - resumed_from[0]) / max(now - started_at, 1e-6)
+            self.progress.emit(job_id, bytes_sent, bytes_total, rate)
+
+        try:
+            result = self.gdrive.upload_file(
+                file_path,
+                folder_id=folder_id,
+                chunk_size=self.chunk_size,
+                progress_callback=on_progress,
+                is_cancelled=lambda: job["cancelled"]
+            )
+            if job["cancelled"]:
+                self.failed.emit(job_id, "Cancelled")
+                return
+            if not result:
+                self.failed.emit(job_id, "Failed to upload file to Google Drive. Check the logs for details.")
+                return
+
+            with self._share_lock:
+                if emails:
+                    share_result = self.gdrive.share_file_with_many(
+                        result.get('id'), emails, role=role, link_sharing=link_sharing
+                    )
+                else:
+                    share_result = self.gdrive.share_file(
+                        result.get('id'), email=email, role=role, link_sharing=link_sharing
+                    )
+            if share_result:
+                result['webViewLink'] = share_result.get('webViewLink')
+                if emails:
+                    result['share_failures'] = share_result.get('failed', {})
+
+            elapsed = time.monotonic() - started_at
+            logger.info(f"Upload {job_id} of {file_path.name} finished in {elapsed:.1f}s")
+            self.finished.emit(job_id, result)
+
+        except Exception as e:
+            logger.error(f"Upload {job_id} failed: {e}", exc_info=True)
+            self.failed.emit(job_id, str(e))
+        finally:
+            with self._lock:
+                self._jobs.pop(job_id, None)
+
+
+# Singleton instance
+_upload_manager = None
+
+
+def get_upload_manager():
+    """Get the shared DriveUploadManager, configured from AppSettings."""
+    global _upload_manager
+    if _upload_manager is None:
+        settings = AppSettings()
+        _upload_manager = DriveUploadManager(
+            max_concurrent=settings.get_upload_max_concurrent(),
+            chunk_size=settings.get_upload_chunk_size_mb() * 1024 * 1024
+        )
+    return _upload_manager
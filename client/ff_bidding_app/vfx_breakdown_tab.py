@@ -2192,7 +2192,7 @@ class VFXBreakdownTab(QtWidgets.QWidget):
     def _fetch_beats_schema(self):
         """Fetch schema information for Bidding Scene entity (CustomEntity02)."""
         try:
-            schema = self.sg_session.sg.schema_field_read("CustomEntity02")
+            schema = self.sg_session.get_entity_schema("CustomEntity02")
 
             # Build display names dictionary
             display_names = {}
@@ -3137,9 +3137,9 @@ class VFXBreakdownTab(QtWidgets.QWidget):
         try:
             bid_id = current_bid['id']
             # Query the Bid to get its Price List (sg_price_list)
-            bid_data = self.sg_session.sg.find_one(
+            bid_data = self.sg_session.get_entity_by_id(
                 "CustomEntity06",
-                [["id", "is", bid_id]],
+                bid_id,
                 ["sg_price_list"]
             )
 
@@ -3151,9 +3151,9 @@ class VFXBreakdownTab(QtWidgets.QWidget):
 
             # Query the Price List to get its linked Line Items
             # Line Items are linked via the Price List's sg_line_items field (multi-entity)
-            price_list_data = self.sg_session.sg.find_one(
+            price_list_data = self.sg_session.get_entity_by_id(
                 "CustomEntity10",
-                [["id", "is", price_list_id]],
+                price_list_id,
                 ["sg_line_items"]
             )
 
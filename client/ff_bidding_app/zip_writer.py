@@ -0,0 +1,414 @@
+"""Fast ZIP archiving for package delivery.
+
+zipfile.ZipFile deflates every member on one thread, including media that
+does not compress at all. This module writes archives that:
+
+- store already-compressed files (MP4/MOV/JPG/PNG/EXR/..., detected by
+  extension or magic bytes) with ZIP_STORED, costing no CPU,
+- deflate the remaining small files on a thread pool (zlib releases the GIL)
+  and write the pre-compressed members in their original order,
+- stream large members straight to the output in fixed-size chunks, and
+- report progress in source bytes rather than in files.
+
+ZipStreamWriter only ever calls write() on its output, so it can target a
+regular file as well as a pipe or network upload stream. Archives use
+data descriptors and ZIP64 records where needed and open with any standard
+unzip tool.
+"""
+
+import collections
+import concurrent.futures
+import logging
+import os
+import stat
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+
+ZIP64_LIMIT = (1 << 31) - 1
+CHUNK_SIZE = 1024 * 1024
+
+# Extensions of formats that are already compressed
+STORED_EXTENSIONS = {
+    ".mp4", ".m4v", ".mov", ".mkv", ".webm", ".avi", ".mxf", ".mpg", ".mpeg",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".exr", ".jp2",
+    ".mp3", ".aac", ".m4a", ".ogg", ".flac",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+    ".docx", ".xlsx", ".pptx",
+}
+
+# (offset, signature) of already-compressed formats, for files without a known extension
+STORED_SIGNATURES = (
+    (0, b"\x89PNG\r\n\x1a\n"),
+    (0, b"\xff\xd8\xff"),                # JPEG
+    (0, b"GIF8"),
+    (0, b"PK\x03\x04"),                  # ZIP and Office documents
+    (0, b"\x1f\x8b"),                    # gzip
+    (0, b"BZh"),
+    (0, b"\xfd7zXZ\x00"),
+    (0, b"7z\xbc\xaf\x27\x1c"),
+    (0, b"Rar!"),
+    (0, b"\x76\x2f\x31\x01"),            # OpenEXR
+    (0, b"\x1a\x45\xdf\xa3"),            # Matroska / WebM
+    (4, b"ftyp"),                        # MP4 / MOV / HEIC
+    (4, b"moov"),
+    (4, b"mdat"),
+)
+
+# Compressible files up to this size are deflated in parallel, in memory;
+# larger ones are streamed by the writer thread
+PARALLEL_MAX_FILE_SIZE = 32 * 1024 * 1024
+
+
+class ZipCancelled(RuntimeError):
+    """Raised when archiving is cancelled."""
+
+
+def is_precompressed(path) -> bool:
+    """Return True if a file is already compressed and should be stored as-is.
+
+    Checks the extension first and falls back to sniffing the first bytes.
+    """
+    path = Path(path)
+    if path.suffix.lower() in STORED_EXTENSIONS:
+        return True
+    try:
+        with open(path, "rb") as f:
+            head = f.read(16)
+    except OSError:
+        return False
+    return any(head[offset:offset + len(signature)] == signature
+               for offset, signature in STORED_SIGNATURES)
+
+
+def compress_file(path, compresslevel: int = 6):
+    """Deflate a whole file in memory.
+
+    Falls back to storing the file if deflating does not make it smaller.
+
+    Returns:
+        Tuple of (data, crc, file_size, compress_type)
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    crc = 0
+    size = 0
+    raw_chunks = []
+    out_chunks = []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            raw_chunks.append(chunk)
+            out_chunks.append(compressor.compress(chunk))
+    out_chunks.append(compressor.flush())
+    data = b"".join(out_chunks)
+    if len(data) >= size:
+        return b"".join(raw_chunks), crc, size, ZIP_STORED
+    return data, crc, size, ZIP_DEFLATED
+
+
+def _dos_datetime(mtime: float):
+    """Convert a timestamp to (dos_time, dos_date)."""
+    t = time.localtime(mtime)
+    year = max(t.tm_year, 1980)
+    dos_date = (year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday
+    dos_time = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    return dos_time, dos_date
+
+
+class ZipStreamWriter:
+    """Write-only ZIP archive writer for files and non-seekable streams."""
+
+    def __init__(self, fileobj):
+        """Initialize the writer.
+
+        Args:
+            fileobj: Object with a write(bytes) method
+        """
+        self._fp = fileobj
+        self._offset = 0
+        self._entries: List[Dict[str, Any]] = []
+        self._closed = False
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of archive bytes written so far."""
+        return self._offset
+
+    def write_file(self, path, arcname: str, compress_type: int = ZIP_DEFLATED,
+                   compresslevel: int = 6,
+                   progress_callback: Optional[Callable[[int], None]] = None,
+                   is_cancelled: Optional[Callable[[], bool]] = None):
+        """Stream a file into the archive chunk by chunk.
+
+        Args:
+            path: Source file
+            arcname: Name inside the archive
+            compress_type: ZIP_STORED or ZIP_DEFLATED
+            compresslevel: zlib level for ZIP_DEFLATED
+            progress_callback: Called with the number of source bytes read
+                after every chunk
+            is_cancelled: Callable checked between chunks
+        """
+        st = os.stat(path)
+        zip64 = st.st_size * 1.05 > ZIP64_LIMIT
+        entry = self._start_entry(arcname, st, compress_type, zip64)
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15) if compress_type == ZIP_DEFLATED else None
+
+        crc = 0
+        size = 0
+        compress_size = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                if is_cancelled and is_cancelled():
+                    raise ZipCancelled()
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                data = compressor.compress(chunk) if compressor else chunk
+                compress_size += len(data)
+                self._write(data)
+                if progress_callback:
+                    progress_callback(len(chunk))
+        if compressor:
+            data = compressor.flush()
+            compress_size += len(data)
+            self._write(data)
+
+        entry.update(crc=crc, file_size=size, compress_size=compress_size)
+        if zip64:
+            self._write(struct.pack("<IIQQ", 0x08074b50, crc, compress_size, size))
+        else:
+            self._write(struct.pack("<IIII", 0x08074b50, crc, compress_size, size))
+
+    def write_compressed(self, arcname: str, data: bytes, crc: int, file_size: int,
+                         compress_type: int, st: os.stat_result):
+        """Write a member whose data was already compressed (see compress_file).
+
+        Args:
+            arcname: Name inside the archive
+            data: Member data, deflated or stored according to compress_type
+            crc: CRC-32 of the uncompressed data
+            file_size: Uncompressed size
+            compress_type: ZIP_STORED or ZIP_DEFLATED
+            st: os.stat_result of the source file (mtime and mode)
+        """
+        zip64 = max(file_size, len(data)) > ZIP64_LIMIT
+        entry = self._start_entry(arcname, st, compress_type, zip64,
+                                  crc=crc, file_size=file_size, compress_size=len(data))
+        self._write(data)
+        entry.update(crc=crc, file_size=file_size, compress_size=len(data))
+
+    def close(self):
+        """Write the central directory. The output stream is not closed."""
+        if self._closed:
+            return
+        self._closed = True
+
+        cd_offset = self._offset
+        for entry in self._entries:
+            extra_values = []
+            file_size, compress_size, header_offset = entry["file_size"], entry["compress_size"], entry["offset"]
+            if file_size > ZIP64_LIMIT:
+                extra_values.append(file_size)
+                file_size = 0xFFFFFFFF
+            if compress_size > ZIP64_LIMIT:
+                extra_values.append(compress_size)
+                compress_size = 0xFFFFFFFF
+            if header_offset > ZIP64_LIMIT:
+                extra_values.append(header_offset)
+                header_offset = 0xFFFFFFFF
+            extra = b""
+            if extra_values:
+                extra = struct.pack(f"<HH{len(extra_values)}Q", 0x0001, 8 * len(extra_values), *extra_values)
+            version = 45 if extra_values or entry["zip64"] else 20
+            name = entry["name"]
+            self._write(struct.pack(
+                "<IHHHHHHIIIHHHHHII",
+                0x02014b50, (3 << 8) | version, version, entry["flags"], entry["compress_type"],
+                entry["dos_time"], entry["dos_date"], entry["crc"], compress_size, file_size,
+                len(name), len(extra), 0, 0, 0, entry["external_attr"], header_offset
+            ))
+            self._write(name)
+            self._write(extra)
+        cd_size = self._offset - cd_offset
+
+        count = len(self._entries)
+        if count >= 0xFFFF or cd_size > ZIP64_LIMIT or cd_offset > ZIP64_LIMIT:
+            zip64_eocd_offset = self._offset
+            self._write(struct.pack(
+                "<IQHHIIQQQQ", 0x06064b50, 44, 45, 45, 0, 0, count, count, cd_size, cd_offset
+            ))
+            self._write(struct.pack("<IIQI", 0x07064b50, 0, zip64_eocd_offset, 1))
+            self._write(struct.pack(
+                "<IHHHHIIH", 0x06054b50, 0, 0, min(count, 0xFFFF), min(count, 0xFFFF),
+                min(cd_size, 0xFFFFFFFF), min(cd_offset, 0xFFFFFFFF), 0
+            ))
+        else:
+            self._write(struct.pack("<IHHHHIIH", 0x06054b50, 0, 0, count, count, cd_size, cd_offset, 0))
+
+    def _start_entry(self, arcname: str, st: os.stat_result, compress_type: int, zip64: bool,
+                     crc: Optional[int] = None, file_size: int = 0, compress_size: int = 0):
+        """Write a local file header and register the entry.
+
+        Without a crc the sizes are unknown and follow in a data descriptor.
+        """
+        name = arcname.replace(os.sep, "/").encode("utf-8")
+        dos_time, dos_date = _dos_datetime(st.st_mtime)
+        streamed = crc is None
+        # UTF-8 names; bit 3 = sizes/crc in data descriptor
+        flags = 0x800 | (0x08 if streamed else 0)
+
+        if zip64:
+            extra = struct.pack("<HHQQ", 0x0001, 16, file_size, compress_size)
+            header_sizes = (0xFFFFFFFF, 0xFFFFFFFF)
+        else:
+            extra = b""
+            header_sizes = (compress_size, file_size)
+
+        entry = {
+            "name": name,
+            "offset": self._offset,
+            "flags": flags,
+            "compress_type": compress_type,
+            "dos_time": dos_time,
+            "dos_date": dos_date,
+            "zip64": zip64,
+            "external_attr": (stat.S_IMODE(st.st_mode) | stat.S_IFREG) << 16,
+            "crc": crc or 0,
+            "file_size": file_size,
+            "compress_size": compress_size,
+        }
+        self._write(struct.pack(
+            "<IHHHHHIIIHH",
+            0x04034b50, 45 if zip64 else 20, flags, compress_type, dos_time, dos_date,
+            0 if streamed else crc, *header_sizes, len(name), len(extra)
+        ))
+        self._write(name)
+        self._write(extra)
+        self._entries.append(entry)
+        return entry
+
+    def _write(self, data: bytes):
+        if data:
+            self._fp.write(data)
+            self._offset += len(data)
+
+
+def collect_files(source_dir, excluded: Iterable[str] = ()) -> List[Dict[str, Any]]:
+    """List the files of a directory tree as archive members.
+
+    Args:
+        source_dir: Directory to archive
+        excluded: File names to leave out
+
+    Returns:
+        List of member dicts (path, arcname, size, stored), in archive order
+    """
+    source_dir = Path(source_dir)
+    excluded = set(excluded)
+    members = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        for file in sorted(files):
+            if file in excluded:
+                continue
+            file_path = os.path.join(root, file)
+            members.append({
+                "path": file_path,
+                "arcname": os.path.relpath(file_path, source_dir),
+                "size": os.path.getsize(file_path),
+                "stored": is_precompressed(file_path),
+            })
+    return members
+
+
+def write_zip(members: List[Dict[str, Any]], fileobj, compresslevel: int = 6,
+              max_workers: Optional[int] = None,
+              progress_callback: Optional[Callable[[int, int, str], None]] = None,
+              is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """Write members (from collect_files) as a ZIP archive to fileobj.
+
+    Args:
+        members: Member dicts from collect_files
+        fileobj: Output object with a write(bytes) method
+        compresslevel: zlib level for deflated members
+        max_workers: Threads used to deflate small members. Defaults to the
+            number of CPUs
+        progress_callback: Called with (bytes_done, bytes_total, current_file)
+            in source bytes
+        is_cancelled: Callable checked between chunks; archiving stops with
+            ZipCancelled when it returns True
+
+    Returns:
+        dict with files, bytes, archive_bytes, stored and deflated counts
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    bytes_total = sum(member["size"] for member in members)
+    bytes_done = 0
+    summary = {"files": len(members), "bytes": bytes_total, "archive_bytes": 0,
+               "stored": 0, "deflated": 0}
+
+    def advance(count, name):
+        nonlocal bytes_done
+        bytes_done += count
+        if progress_callback:
+            progress_callback(bytes_done, bytes_total, name)
+
+    writer = ZipStreamWriter(fileobj)
+    # Limits how many pre-compressed members are held in memory at once
+    window = max_workers * 2
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                               thread_name_prefix="zip-deflate") as pool:
+        queue = collections.deque()
+        members_iter = iter(members)
+        in_flight = 0
+
+        def refill():
+            nonlocal in_flight
+            while in_flight < window:
+                member = next(members_iter, None)
+                if member is None:
+                    return
+                future = None
+                if not member["stored"] and member["size"] <= PARALLEL_MAX_FILE_SIZE:
+                    future = pool.submit(compress_file, member["path"], compresslevel)
+                    in_flight += 1
+                queue.append((member, future))
+
+        try:
+            refill()
+            while queue:
+                if is_cancelled and is_cancelled():
+                    raise ZipCancelled()
+                member, future = queue.popleft()
+                name = os.path.basename(member["path"])
+                if future is not None:
+                    data, crc, size, compress_type = future.result()
+                    in_flight -= 1
+                    writer.write_compressed(member["arcname"], data, crc, size, compress_type,
+                                            os.stat(member["path"]))
+                    advance(size, name)
+                else:
+                    compress_type = ZIP_STORED if member["stored"] else ZIP_DEFLATED
+                    writer.write_file(member["path"], member["arcname"], compress_type, compresslevel,
+                                      progress_callback=lambda count, n=name: advance(count, n),
+                                      is_cancelled=is_cancelled)
+                summary["stored" if compress_type == ZIP_STORED else "deflated"] += 1
+                refill()
+        except BaseException:
+            for _, future in queue:
+                if future is not None:
+                    future.cancel()
+            raise
+
+    writer.close()
+    summary["archive_bytes"] = writer.bytes_written
+    return summary
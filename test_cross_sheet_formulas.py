@@ -0,0 +1,96 @@
+"""
+Test cross-sheet recalculation of spreadsheet formulas.
+Edits cells of two linked SpreadsheetModels one at a time, the way a user
+does, and checks the values each sheet shows after incremental
+recalculation.
+
+Usage:
+    python test_cross_sheet_formulas.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add the package directory to path
+sys.path.insert(0, str(Path(__file__).parent / "client" / "ff_bidding_app"))
+
+from PySide6 import QtCore
+from formula_evaluator import FormulaEvaluator
+from spreadsheet_widget import SpreadsheetModel
+
+
+def create_sheets():
+    """Create two sheets, A and B, whose evaluators see each other."""
+    sheets = {"A": SpreadsheetModel(rows=20, cols=5), "B": SpreadsheetModel(rows=20, cols=5)}
+    for model in sheets.values():
+        model.set_formula_evaluator(FormulaEvaluator(model, sheets))
+    return sheets
+
+
+def set_cell(model, ref, value):
+    """Edit a cell like the table view does."""
+    row = int(ref[1:]) - 1
+    col = ord(ref[0]) - ord("A")
+    model.setData(model.index(row, col), value, QtCore.Qt.EditRole)
+
+
+def show(model, ref):
+    """Return the value a cell displays."""
+    row = int(ref[1:]) - 1
+    col = ord(ref[0]) - ord("A")
+    return model.data(model.index(row, col), QtCore.Qt.DisplayRole)
+
+
+# (steps, checks): steps are (sheet, cell, value) edits applied in order,
+# checks are (sheet, cell, displayed text) after the last edit
+CASES = [
+    (
+        [("A", "A1", "5"), ("B", "A1", "=A!A1*2")],
+        [("B", "A1", "10.00")],
+    ),
+    (
+        [("A", "A1", "5"), ("B", "A1", "=A!A1*2"), ("A", "A1", "7")],
+        [("B", "A1", "14.00")],
+    ),
+    # A cycle closed through another sheet, with both values already cached
+    (
+        [("A", "A11", "=B!A11+1"), ("B", "A11", "=A!A11+1")],
+        [("A", "A11", "#CIRCULAR!"), ("B", "A11", "#CIRCULAR!")],
+    ),
+    # Breaking the cycle again recalculates both sheets
+    (
+        [("A", "A11", "=B!A11+1"), ("B", "A11", "=A!A11+1"), ("B", "A11", "4")],
+        [("A", "A11", "5.00")],
+    ),
+]
+
+
+def main():
+    """Run the cases and report mismatches."""
+    failures = 0
+
+    for steps, checks in CASES:
+        sheets = create_sheets()
+        for sheet, ref, value in steps:
+            # Display every formula cell, so values are cached between edits
+            set_cell(sheets[sheet], ref, value)
+            for other_sheet, other_ref, _ in steps:
+                show(sheets[other_sheet], other_ref)
+        description = " then ".join(f"{sheet}!{ref}={value}" for sheet, ref, value in steps)
+        for sheet, ref, expected in checks:
+            shown = show(sheets[sheet], ref)
+            if str(shown) != expected:
+                print(f"   ✗ {description}: {sheet}!{ref} shows {shown!r}, expected {expected!r}")
+                failures += 1
+            else:
+                print(f"   ✓ {description}: {sheet}!{ref} = {shown!r}")
+
+    print()
+    if failures:
+        print(f"{failures} mismatches")
+        sys.exit(1)
+    print("All cases match")
+
+
+if __name__ == "__main__":
+    main()
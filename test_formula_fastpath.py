@@ -0,0 +1,185 @@
+"""
+Conformance test for the native formula fast path.
+Evaluates the same formulas with the native evaluator (formula_fastpath) and
+with the 'formulas' library, and reports every formula where they disagree.
+
+Usage:
+    python test_formula_fastpath.py
+"""
+
+import math
+import sys
+from pathlib import Path
+
+# Add the package directory to path
+sys.path.insert(0, str(Path(__file__).parent / "client" / "ff_bidding_app"))
+
+from PySide6 import QtCore
+from formula_evaluator import FormulaEvaluator
+
+
+class SampleModel(QtCore.QAbstractTableModel):
+    """Minimal table model with field names, like the bid sheets."""
+
+    def __init__(self, column_fields, rows):
+        super().__init__()
+        self.column_fields = column_fields
+        self.rows = rows
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.column_fields)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role not in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return None
+        return self.rows[index.row()][index.column()]
+
+
+def create_models():
+    """Create a line-item sheet and a cross-sheet cost table."""
+    items = SampleModel(
+        ["name", "sg_qty", "sg_rate", "sg_discount", "category"],
+        [
+            ["Modeling", 4, 250.5, "10%", "VFX"],
+            ["Lighting", 2.5, 300, "", "vfx"],
+            ["Comp", 12, "1,200", "5%", "Post"],
+            ["Roto", 0, 95.25, "0", ""],
+        ],
+    )
+    costs = SampleModel(
+        ["name", "amount"],
+        [["Shots", 1000], ["Assets", "2500.75"], ["Notes", "TBD"], ["Misc", ""]],
+    )
+    return items, {"Items": items, "Shot Costs": costs, "Misc": costs}
+
+
+# (formula, row, col[, expected]) evaluated on the Items sheet; both paths
+# must agree. Where the formulas path can't give Excel's answer, the native
+# result is checked against expected instead.
+CASES = [
+    ("=1+2*3", 0, 5),
+    ("=(1+2)*3-4/8", 0, 5),
+    ("=-2^2", 0, 5),
+    ("=2^3^2", 0, 5),
+    ("=50%*B1", 0, 5),
+    ("=0.1+0.2", 0, 5),
+    ("=B1*C1", 0, 5),
+    ("=$B$1*C2+B3", 0, 5),
+    ("=sg_qty*sg_rate", 0, 5),
+    ("=sg_qty*sg_rate", 2, 5),
+    ("=sg_qty*sg_rate*(1-sg_discount)", 0, 5),
+    ("=sg_qty.2*sg_rate.3", 3, 5),
+    ("=SUM(B1:B4)", 0, 5),
+    ("=SUM(B1:C4)", 0, 5),
+    ("=SUM(B1:B4, 10, C1)", 0, 5),
+    ("=AVERAGE(C1:C4)", 0, 5),
+    ("=MIN(B1:B4)", 0, 5),
+    ("=MAX(B1:C4)", 0, 5),
+    ("=COUNT(B1:B4)", 0, 5),
+    ("=ROUND(C1*1.175, 2)", 0, 5),
+    ("=ROUND(2.5, 0)", 0, 5),
+    ("=ROUND(-2.5, 0)", 0, 5),
+    ("=ROUND(1234.567, -2)", 0, 5),
+    ("=IF(B1>B2, 1, 2)", 0, 5),
+    ("=IF(sg_qty=0, 0, sg_rate/sg_qty)", 3, 5),
+    ("=IF(sg_qty=0, 0, sg_rate/sg_qty)", 0, 5),
+    ('=IF(category="vfx", sg_rate, 0)', 0, 5),
+    ('=IF(E1="Post", "yes", "no")', 0, 5),
+    ("=B1<>B2", 0, 5),
+    ("=B1>=4", 0, 5),
+    ("='Shot Costs'!amount.1+'Shot Costs'!amount.2", 0, 5),
+    ("='Shot Costs'!B1*sg_qty", 0, 5),
+    ("=Misc!B1/4", 0, 5),
+    ("=SUM('Shot Costs'!B1:B4)", 0, 5),
+    ("=MAX('Shot Costs'!B:B)", 0, 5),
+    # Numeric keys only: the formulas path reads text in ranges as 0
+    ("=VLOOKUP(12, B1:C4, 2, FALSE)", 0, 5),
+    ("=VLOOKUP(2.5, B2:C3, 2, FALSE)*sg_qty", 0, 5),
+    ("=MATCH(0, B1:B4, 0)", 0, 5),
+    ("=INDEX(C1:C4, 2)", 0, 5),
+    ("=INDEX(B1:C4, MATCH(12, B1:B4, 0), 2)", 0, 5),
+    # Text keys: the formulas path reads the "Modeling" key column as 0
+    ("=VLOOKUP(A1, A1:C4, 2, FALSE)", 0, 5, 4),
+]
+
+# Formulas the fast path must leave to the formulas library
+FALLBACK_CASES = [
+    ("=A1&B1", 0, 5),
+    ("=A1+1", 0, 5),
+    ("=1/0", 0, 5),
+    ("='Shot Costs'!amount.3*2", 0, 5),
+    ("=no_such_field*2", 0, 5),
+    ("=AVERAGE(A1)", 0, 5),
+    ("=ROUND(2.5)", 0, 5),
+    ("=VLOOKUP(7, B1:C4, 2, FALSE)", 0, 5),
+    ('=VLOOKUP("Co*", A1:C4, 2, FALSE)', 0, 5),
+    ("=VLOOKUP(3, B1:C4, 2, TRUE)", 0, 5),
+]
+
+
+def scalar(result):
+    """Unwrap an array result to its first value, like FormulaEvaluator.evaluate."""
+    while True:
+        if hasattr(result, 'tolist'):
+            result = result.tolist()
+        if not isinstance(result, list):
+            return result
+        result = result[0] if result else 0
+
+
+def values_match(native, reference):
+    """Compare two results, allowing float rounding differences."""
+    if isinstance(native, bool) or isinstance(reference, bool):
+        return bool(native) == bool(reference) and type(native) == type(reference)
+    if isinstance(native, (int, float)) and isinstance(reference, (int, float)):
+        return math.isclose(native, reference, rel_tol=1e-9, abs_tol=1e-9)
+    return native == reference
+
+
+def main():
+    """Run both evaluators over the cases and report mismatches."""
+    items, sheet_models = create_models()
+
+    native = FormulaEvaluator(items, sheet_models)
+    reference = FormulaEvaluator(items, sheet_models)
+    reference._evaluate_native = lambda formula, row=None: None
+
+    failures = 0
+
+    print("Comparing native and formulas results...")
+    for formula, row, col, *expected in CASES:
+        native_result = native._evaluate_native(formula, row)
+        if expected:
+            reference_result, source = expected[0], "expected"
+        else:
+            reference_result, source = scalar(reference.evaluate(formula, row, col)), "formulas"
+        if native_result is None:
+            print(f"   ✗ {formula}: not evaluated natively ({source} {reference_result!r})")
+            failures += 1
+        elif not values_match(native_result, reference_result):
+            print(f"   ✗ {formula}: native {native_result!r} != {source} {reference_result!r}")
+            failures += 1
+        else:
+            print(f"   ✓ {formula} = {native_result!r}")
+
+    print("\nChecking fallbacks...")
+    for formula, row, col in FALLBACK_CASES:
+        native_result = native._evaluate_native(formula, row)
+        if native_result is not None:
+            print(f"   ✗ {formula}: evaluated natively as {native_result!r}")
+            failures += 1
+        else:
+            print(f"   ✓ {formula} -> {native.evaluate(formula, row, col)!r}")
+
+    print()
+    if failures:
+        print(f"{failures} mismatches")
+        sys.exit(1)
+    print(f"All {len(CASES) + len(FALLBACK_CASES)} cases match")
+
+
+if __name__ == "__main__":
+    main()